@@ -0,0 +1,102 @@
+"""
+Benchmark: cross-camera batched ONNX inference vs one session call per camera.
+
+Runs N camera threads that share one OnnxTracker, as process_synchronized_recording
+does, each tracking the same number of frames. Compares:
+1. per-camera: max_batch=1, every thread calls the session with a batch of one
+2. batched: the tracker's InferenceBroker combines concurrent calls (needs a
+   model with a dynamic batch axis)
+
+Frames are random noise at the tracker's preferred resolution, so after the
+first frame every call takes the same tier-2/tier-3 path; the point is the
+inference cost, not detection quality.
+
+Usage:
+    uv run python scripts/benchmark_batched_inference.py [model_card.toml] [--models-dir DIR]
+        [--cameras N] [--frames N] [--max-batch N]
+
+If no card is given, uses the tiny constant-output test model, which measures
+broker overhead rather than any batching gain. Point it at a downloaded
+RTMPose card for real numbers, e.g.
+    src/caliscope/trackers/model_cards/rtmpose_t_halpe26.toml --models-dir ~/.caliscope/models
+"""
+
+import argparse
+import dataclasses
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from caliscope.trackers.model_card import ModelCard
+from caliscope.trackers.onnx_tracker import OnnxTracker
+
+FIXTURE_DIR = Path(__file__).parent.parent / "tests/fixtures/onnx"
+DEFAULT_CARD = FIXTURE_DIR / "simcc_3pt_batched.toml"
+
+
+def benchmark(tracker: OnnxTracker, n_cameras: int, n_frames: int) -> float:
+    """Seconds for n_cameras threads to each track n_frames frames."""
+    width, height = tracker.preferred_resolution
+    rng = np.random.default_rng(42)  # Reproducible
+    frames = [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(n_cameras)]
+    for cam_id in range(n_cameras):
+        tracker.reset(cam_id)
+    barrier = threading.Barrier(n_cameras + 1)
+
+    def track(cam_id: int) -> None:
+        barrier.wait()
+        for _ in range(n_frames):
+            tracker.get_points(frames[cam_id], cam_id=cam_id)
+
+    threads = [threading.Thread(target=track, args=(cam_id,)) for cam_id in range(n_cameras)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("card", nargs="?", type=Path, default=DEFAULT_CARD)
+    parser.add_argument("--models-dir", type=Path, default=None, help="directory for relative model_path values")
+    parser.add_argument("--cameras", type=int, default=4)
+    parser.add_argument("--frames", type=int, default=50, help="frames per camera")
+    parser.add_argument("--max-batch", type=int, default=None, help="override the card's max_batch")
+    args = parser.parse_args()
+
+    models_dir = args.models_dir or (args.card.parent if args.card == DEFAULT_CARD else None)
+    card = ModelCard.from_toml(args.card, models_dir=models_dir)
+    if not card.onnx_exists:
+        raise SystemExit(f"Error: ONNX model not found: {card.model_path}")
+
+    per_camera = OnnxTracker(dataclasses.replace(card, max_batch=1))
+    batched = OnnxTracker(card if args.max_batch is None else dataclasses.replace(card, max_batch=args.max_batch))
+    if batched._broker is None:
+        raise SystemExit(f"Error: {card.name} has a fixed batch axis; nothing to batch")
+
+    n_calls = args.cameras * args.frames
+    print(f"Model: {card.name} ({card.model_path.name}), input {card.input_width}x{card.input_height}")
+    print(f"Cameras: {args.cameras}, frames per camera: {args.frames}, max_batch: {batched.max_batch}")
+
+    benchmark(per_camera, args.cameras, 2)  # warm up both sessions
+    benchmark(batched, args.cameras, 2)
+    batches_before, items_before = batched._broker.batches_run, batched._broker.items_run
+
+    t_single = benchmark(per_camera, args.cameras, args.frames)
+    t_batched = benchmark(batched, args.cameras, args.frames)
+    batches = batched._broker.batches_run - batches_before
+    items = batched._broker.items_run - items_before
+
+    print()
+    print(f"  Per-camera: {t_single:.2f}s ({n_calls / t_single:.1f} frames/s)")
+    print(f"  Batched:    {t_batched:.2f}s ({n_calls / t_batched:.1f} frames/s)  {t_single / t_batched:.2f}x")
+    print(f"  Mean batch: {items / max(batches, 1):.2f} crops per session call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark: ChessboardTracker with and without the fast-check prefilter.
+
+Per-frame cost on two sets of footage:
+1. board present: each chessboard_intrinsic test frame (9x6 inner corners)
+   repeated --hold times as one camera, like a board held in view
+2. board absent: the boardless chessboard_intrinsic frame plus frames sampled
+   from recordings of a ChArUco board, which looks chessboard-like but is not
+   the 9x6 pattern, tracked as one camera
+
+Each set is tracked with fast_check=False (exhaustive search on every frame)
+and fast_check=True. With the fast check, the first frame of each board-present
+view pays for the check and the normal search, and a frame the check rejects is
+not searched at all; the detected count shows whether any board was lost.
+
+--upscale resizes every frame (e.g. 3 for 3840x2160 from 1280x720) to show the
+downscaled fast check on high-resolution footage.
+
+Usage:
+    uv run python scripts/benchmark_chessboard_fast_check.py [--upscale F] [--hold N] [--absent-frames N]
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from caliscope.core.chessboard import Chessboard
+from caliscope.trackers.chessboard_tracker import ChessboardTracker
+
+SESSIONS = Path(__file__).parent.parent / "tests/sessions"
+BOARD_FRAMES = SESSIONS / "chessboard_intrinsic"
+BOARDLESS_FRAME = "cam_0_frame_000.jpg"
+BOARDLESS_VIDEOS = [
+    SESSIONS / "4_cam_recording/calibration/extrinsic/cam_1.mp4",
+    SESSIONS / "prerecorded_calibration/calibration/intrinsic/cam_0.mp4",
+]
+
+
+def gray(frame: np.ndarray, upscale: float) -> np.ndarray:
+    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    if upscale != 1.0:
+        frame = cv2.resize(frame, None, fx=upscale, fy=upscale, interpolation=cv2.INTER_CUBIC)
+    return frame
+
+
+def sample_video(path: Path, n_frames: int, step: int = 5) -> list[np.ndarray]:
+    capture = cv2.VideoCapture(str(path))
+    frames = []
+    index = 0
+    while len(frames) < n_frames:
+        success, frame = capture.read()
+        if not success:
+            break
+        if index % step == 0:
+            frames.append(frame)
+        index += 1
+    capture.release()
+    return frames
+
+
+def run(tracker: ChessboardTracker, cameras: list[list[np.ndarray]]) -> tuple[float, int]:
+    """(ms per frame, frames with a detection) over each camera's frames in order."""
+    detected = 0
+    n_frames = 0
+    start = time.perf_counter()
+    for cam_id, frames in enumerate(cameras):
+        tracker.reset(cam_id)
+        for frame in frames:
+            detected += len(tracker.get_points(frame, cam_id=cam_id).keypoint_id) > 0
+            n_frames += 1
+    return 1000 * (time.perf_counter() - start) / n_frames, detected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--upscale", type=float, default=1.0)
+    parser.add_argument("--hold", type=int, default=5, help="frames each board-present view is held for")
+    parser.add_argument("--absent-frames", type=int, default=10, help="frames sampled from each boardless video")
+    args = parser.parse_args()
+
+    present, absent = [], []
+    for path in sorted(BOARD_FRAMES.glob("cam_*_frame_*.jpg")):
+        (absent if path.name == BOARDLESS_FRAME else present).append(gray(cv2.imread(str(path)), args.upscale))
+    for video in BOARDLESS_VIDEOS:
+        absent.extend(gray(frame, args.upscale) for frame in sample_video(video, args.absent_frames))
+    if not present:
+        raise SystemExit(f"No test frames found in {BOARD_FRAMES}")
+
+    chessboard = Chessboard(rows=6, columns=9)
+    height, width = present[0].shape
+    n_present = len(present) * args.hold
+    print(f"Frames at {width}x{height}: {n_present} with the board ({len(present)} views), {len(absent)} without")
+    print(f"{'':22s}{'present ms':>12s}{'detected':>10s}{'absent ms':>11s}{'false hits':>12s}")
+
+    results = {}
+    for label, fast_check in (("exhaustive", False), ("fast check", True)):
+        tracker = ChessboardTracker(chessboard, fast_check=fast_check)
+        run(tracker, [present[:1]])  # warm up
+        present_ms, detected = run(tracker, [[frame] * args.hold for frame in present])
+        absent_ms, false_hits = run(tracker, [absent])
+        results[label] = (present_ms, absent_ms)
+        print(f"{label:22s}{present_ms:>12.1f}{detected:>6d}/{n_present:<3d}{absent_ms:>11.1f}{false_hits:>12d}")
+
+    (present_before, absent_before), (present_after, absent_after) = results.values()
+    print(f"\nBoard absent: {absent_before / absent_after:.2f}x speedup")
+    print(f"Board present: {present_before / present_after:.2f}x speedup")
+
+
+if __name__ == "__main__":
+    main()
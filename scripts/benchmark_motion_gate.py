@@ -0,0 +1,102 @@
+"""
+Benchmark: MotionGatedTracker on static-heavy footage vs the plain tracker.
+
+Builds a recording with pauses from a calibration video: every --step-th
+frame is held for --hold frames, each copy with fresh sensor noise (sigma 2
+grey levels), like a board posed in front of a tripod camera. Tracks it with:
+1. plain: CharucoTracker on every frame
+2. gated: MotionGatedTracker(CharucoTracker), reusing points on unchanged frames
+3. gated + flow: the same, following reused points with optical flow
+
+Reports time per frame, the share of frames whose detection was skipped, the
+share of frames reporting the same corner IDs as the plain tracker (noise alone
+changes which corners it finds), and the largest distance from the plain
+tracker's point for corners both report.
+
+Usage:
+    uv run python scripts/benchmark_motion_gate.py [--video PATH] [--hold N] [--step N]
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from caliscope.core.charuco import Charuco
+from caliscope.packets import PointPacket
+from caliscope.tracker import Tracker
+from caliscope.trackers.charuco_tracker import CharucoTracker
+from caliscope.trackers.motion_gated_tracker import MotionGatedTracker
+
+SESSION = Path(__file__).parent.parent / "tests/sessions/prerecorded_calibration"
+DEFAULT_VIDEO = SESSION / "calibration/intrinsic/cam_0.mp4"
+
+
+def paused_recording(video: Path, hold: int, step: int) -> list[np.ndarray]:
+    """Gray frames: every step-th frame of video, each repeated hold times with independent noise."""
+    rng = np.random.default_rng(0)
+    capture = cv2.VideoCapture(str(video))
+    frames = []
+    index = 0
+    while True:
+        success, frame = capture.read()
+        if not success:
+            break
+        if index % step == 0:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY).astype(np.float64)
+            for _ in range(hold):
+                frames.append(np.clip(gray + rng.normal(0.0, 2.0, gray.shape), 0, 255).astype(np.uint8))
+        index += 1
+    capture.release()
+    return frames
+
+
+def track(tracker: Tracker, frames: list[np.ndarray]) -> tuple[float, list[PointPacket]]:
+    """(ms per frame, packets) for frames tracked in order as camera 0."""
+    tracker.reset(0)
+    start = time.perf_counter()
+    packets = [tracker.get_points(frame) for frame in frames]
+    return 1000 * (time.perf_counter() - start) / len(frames), packets
+
+
+def compare(packets: list[PointPacket], reference: list[PointPacket]) -> tuple[float, float]:
+    """(share of frames with the reference's point IDs, largest distance from reference over shared IDs)."""
+    same_ids = 0
+    largest = 0.0
+    for packet, expected in zip(packets, reference):
+        same_ids += np.array_equal(packet.keypoint_id, expected.keypoint_id)
+        _, i, j = np.intersect1d(packet.keypoint_id, expected.keypoint_id, return_indices=True)
+        if len(i):
+            largest = max(largest, float(np.linalg.norm(packet.img_loc[i] - expected.img_loc[j], axis=1).max()))
+    return same_ids / len(packets), largest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", type=Path, default=DEFAULT_VIDEO)
+    parser.add_argument("--hold", type=int, default=10, help="frames each pose is held for")
+    parser.add_argument("--step", type=int, default=4, help="use every step-th frame of the video as a pose")
+    args = parser.parse_args()
+
+    charuco = Charuco.from_toml(SESSION / "charuco.toml")
+    frames = paused_recording(args.video, args.hold, args.step)
+    height, width = frames[0].shape
+    print(f"Frames: {len(frames)} at {width}x{height}, {len(frames) // args.hold} poses held {args.hold} frames each")
+    print(f"{'':16s}{'ms/frame':>10s}{'skipped':>10s}{'same ids':>10s}{'max diff px':>13s}")
+
+    plain_ms, reference = track(CharucoTracker(charuco), frames)
+    print(f"{'plain':16s}{plain_ms:>10.2f}{0:>10.0%}{1:>10.0%}{0:>13.3f}")
+    for label, optical_flow in (("gated", False), ("gated + flow", True)):
+        tracker = MotionGatedTracker(CharucoTracker(charuco), optical_flow=optical_flow)
+        gated_ms, packets = track(tracker, frames)
+        skipped = tracker.frames_reused.get(0, 0) / len(frames)
+        same_ids, diff = compare(packets, reference)
+        print(
+            f"{label:16s}{gated_ms:>10.2f}{skipped:>10.0%}{same_ids:>10.0%}{diff:>13.3f}  ({plain_ms / gated_ms:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark: OnnxTracker crops placed by motion prediction vs the previous frame's box.
+
+Renders a synthetic subject (three coloured squares, found by the localizing
+blob_3pt test model) moving along a fast figure-of-eight path with abrupt
+changes of pace, and tracks it with:
+1. previous box: predict_motion = false, every crop is the last frame's box
+2. predicted: predict_motion = true, crops follow each camera's BoxMotion filter
+
+Reports how often tier 1 (the crop) missed and a full-frame search ran, how
+often all three points were found, the mean point error, and throughput.
+
+Usage:
+    uv run python scripts/benchmark_motion_prediction.py [--frames N] [--speed PX_PER_FRAME]
+"""
+
+import argparse
+import dataclasses
+import time
+from pathlib import Path
+
+import numpy as np
+
+from caliscope.trackers.model_card import ModelCard
+from caliscope.trackers.onnx_tracker import OnnxTracker
+
+FIXTURE_DIR = Path(__file__).parent.parent / "tests/fixtures/onnx"
+CARD = FIXTURE_DIR / "blob_3pt.toml"
+
+FRAME_W, FRAME_H = 960, 540
+SQUARE = 24
+# Square offsets from the subject's position, in (x, y); BGR channel 2/1/0 = head/left/right
+OFFSETS = np.array([[0, -80], [-70, 40], [70, 40]])
+
+
+class _CountingTracker(OnnxTracker):
+    """OnnxTracker that counts full-frame searches (tier 2 runs)."""
+
+    full_frame_searches = 0
+
+    def _detect_in_region(self, frame, x1, y1, x2, y2):
+        if (x1, y1, x2, y2) == (0, 0, frame.shape[1], frame.shape[0]):
+            self.full_frame_searches += 1
+        return super()._detect_in_region(frame, x1, y1, x2, y2)
+
+
+def trajectory(n_frames: int, speed: float, seed: int = 0) -> np.ndarray:
+    """(n_frames, 2) subject positions: a figure of eight whose pace changes every 20 frames."""
+    rng = np.random.default_rng(seed)
+    pace = np.repeat(rng.uniform(0.3, 1.7, n_frames // 20 + 1), 20)[:n_frames]
+    radius_x, radius_y = FRAME_W / 2 - 120, FRAME_H / 2 - 110
+    # Phase step giving about `speed` px/frame at average pace
+    phase = np.cumsum(pace * speed / radius_x)
+    x = FRAME_W / 2 + radius_x * np.sin(phase)
+    y = FRAME_H / 2 + radius_y * np.sin(2 * phase) / 1.2
+    return np.stack([x, y], axis=1)
+
+
+def render(position: np.ndarray) -> np.ndarray:
+    frame = np.zeros((FRAME_H, FRAME_W, 3), dtype=np.uint8)
+    for channel, (dx, dy) in zip((2, 1, 0), OFFSETS):
+        x, y = int(position[0] + dx), int(position[1] + dy)
+        frame[y : y + SQUARE, x : x + SQUARE, channel] = 255
+    return frame
+
+
+def benchmark(tracker: _CountingTracker, positions: np.ndarray) -> dict[str, float]:
+    frames = [render(position) for position in positions]
+    tracker.reset(0)
+    tracker.get_points(frames[0])  # cold start is a full-frame search either way
+    tracker.full_frame_searches = 0
+
+    complete = 0
+    errors = []
+    start = time.perf_counter()
+    for position, frame in zip(positions[1:], frames[1:]):
+        packet = tracker.get_points(frame)
+        complete += len(packet.keypoint_id) == len(OFFSETS)
+        truth = position + OFFSETS[packet.keypoint_id]
+        errors.extend(np.linalg.norm(packet.img_loc - truth, axis=1))
+    elapsed = time.perf_counter() - start
+
+    n = len(frames) - 1
+    return {
+        "fallback": tracker.full_frame_searches / n,
+        "complete": complete / n,
+        "error": float(np.mean(errors)) if errors else float("nan"),
+        "fps": n / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--speed", type=float, default=30.0, help="mean subject speed in px/frame")
+    args = parser.parse_args()
+
+    card = ModelCard.from_toml(CARD, models_dir=FIXTURE_DIR)
+    positions = trajectory(args.frames, args.speed)
+    print(f"Frames: {args.frames} at {FRAME_W}x{FRAME_H}, mean speed {args.speed:.0f} px/frame")
+    print(f"{'':14s}{'full-frame':>12s}{'all points':>12s}{'error px':>10s}{'frames/s':>10s}")
+
+    results = {}
+    for label, predict in (("previous box", False), ("predicted", True)):
+        tracker = _CountingTracker(dataclasses.replace(card, predict_motion=predict))
+        benchmark(tracker, positions[:20])  # warm up the session
+        results[label] = benchmark(tracker, positions)
+        r = results[label]
+        print(f"{label:14s}{r['fallback']:>11.1%} {r['complete']:>11.1%} {r['error']:>10.2f}{r['fps']:>10.1f}")
+
+    before, after = results["previous box"], results["predicted"]
+    print(f"\nThroughput: {after['fps'] / before['fps']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
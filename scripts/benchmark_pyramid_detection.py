@@ -0,0 +1,113 @@
+"""
+Benchmark: pyramid (downscale, detect, refine at full resolution) vs full-resolution board detection.
+
+Renders a ChArUco board, a chessboard and a sheet of ArUco markers into
+frames of the given size under a mild perspective warp, and tracks each with
+pyramid=False and pyramid=True. Reports time per frame, the detection scale the
+pyramid tracker settled on, and the largest corner difference from the
+full-resolution detection. For ArUco that difference is the cornerSubPix
+refinement itself, which the full-resolution path skips.
+
+Usage:
+    uv run python scripts/benchmark_pyramid_detection.py [--width W] [--height H] [--frames N]
+"""
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from caliscope.core.charuco import Charuco
+from caliscope.core.chessboard import Chessboard
+from caliscope.tracker import Tracker
+from caliscope.trackers.aruco_tracker import ArucoTracker
+from caliscope.trackers.charuco_tracker import CharucoTracker
+from caliscope.trackers.chessboard_tracker import ChessboardTracker
+
+
+def place(image: np.ndarray, width: int, height: int, coverage: float = 0.6) -> np.ndarray:
+    """Gray image warped into a white width x height frame, spanning about coverage of its height."""
+    h, w = image.shape[:2]
+    target_h = coverage * height
+    target_w = target_h * w / h
+    x0, y0 = (width - target_w) / 2, (height - target_h) / 2
+    src = np.array([[0, 0], [w, 0], [w, h], [0, h]], dtype=np.float32)
+    dst = np.array(
+        [
+            [x0, y0],
+            [x0 + target_w, y0 + 0.05 * target_h],
+            [x0 + 0.95 * target_w, y0 + target_h],
+            [x0 - 0.02 * target_w, y0 + 0.92 * target_h],
+        ],
+        dtype=np.float32,
+    )
+    frame = cv2.warpPerspective(image, cv2.getPerspectiveTransform(src, dst), (width, height), borderValue=255)
+    return cv2.GaussianBlur(frame, (3, 3), 0.8)
+
+
+def marker_sheet() -> np.ndarray:
+    dictionary = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_100)
+    sheet = np.full((900, 1300), 255, dtype=np.uint8)
+    for i in range(6):
+        row, col = divmod(i, 3)
+        y, x = 100 + row * 400, 100 + col * 400
+        sheet[y : y + 300, x : x + 300] = cv2.aruco.generateImageMarker(dictionary, i, 300)
+    return sheet
+
+
+def chessboard_image(columns: int, rows: int, square: int = 100) -> np.ndarray:
+    image = np.full(((rows + 3) * square, (columns + 3) * square), 255, dtype=np.uint8)
+    for r in range(rows + 1):
+        for c in range(columns + 1):
+            if (r + c) % 2 == 0:
+                y, x = (r + 1) * square, (c + 1) * square
+                image[y : y + square, x : x + square] = 0
+    return image
+
+
+def time_tracker(tracker: Tracker, frame: np.ndarray, n_frames: int):
+    """(ms per frame, last packet) after one warm-up frame that sets per-camera state."""
+    tracker.get_points(frame)
+    start = time.perf_counter()
+    for _ in range(n_frames):
+        packet = tracker.get_points(frame)
+    return 1000 * (time.perf_counter() - start) / n_frames, packet
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, default=3840)
+    parser.add_argument("--height", type=int, default=2160)
+    parser.add_argument("--frames", type=int, default=10)
+    args = parser.parse_args()
+
+    charuco = Charuco.from_squares(columns=5, rows=7, square_size_cm=5.0)
+    chessboard = Chessboard(rows=6, columns=9)
+    cases = [
+        ("charuco", lambda pyramid: CharucoTracker(charuco, pyramid=pyramid), charuco.board_img(pixmap_scale=1000)),
+        ("chessboard", lambda pyramid: ChessboardTracker(chessboard, pyramid=pyramid), chessboard_image(9, 6)),
+        ("aruco", lambda pyramid: ArucoTracker(pyramid=pyramid), marker_sheet()),
+    ]
+
+    print(f"Frame: {args.width}x{args.height}, {args.frames} frames per run")
+    print(f"{'':12s}{'full ms':>10s}{'pyramid ms':>12s}{'speedup':>9s}{'scale':>7s}{'points':>8s}{'max diff px':>13s}")
+    for label, make, image in cases:
+        frame = place(image, args.width, args.height)
+        full_ms, expected = time_tracker(make(False), frame, args.frames)
+        tracker = make(True)
+        pyramid_ms, packet = time_tracker(tracker, frame, args.frames)
+
+        scale = tracker._pyramid_scale(0, frame.shape)
+        same = np.array_equal(packet.keypoint_id, expected.keypoint_id) and np.array_equal(
+            packet.object_id, expected.object_id
+        )
+        diff = np.abs(packet.img_loc - expected.img_loc).max() if same and len(packet.img_loc) else float("nan")
+        print(
+            f"{label:12s}{full_ms:>10.1f}{pyramid_ms:>12.1f}{full_ms / pyramid_ms:>8.1f}x"
+            f"{scale:>7.3g}{len(packet.img_loc):>8d}{diff:>13.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
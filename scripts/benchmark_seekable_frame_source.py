@@ -0,0 +1,117 @@
+"""
+Benchmark: SeekableFrameSource vs forward-only FrameSource.
+
+Measures the access patterns that motivated the keyframe index:
+1. Keyframe index build (cold, demux only) vs sidecar load (warm)
+2. Scrubbing: fetching random single frames
+   - forward: a fresh FrameSource with wanted_indices={i} per request
+   - seekable: one SeekableFrameSource, get_frame(i) per request
+3. Sparse sampling: a handful of frames spread over the whole video
+   - forward: FrameSource(wanted_indices=...) decodes every frame up to the last sample
+   - seekable: SeekableFrameSource(wanted_indices=...) seeks past intervening keyframes
+
+The video is copied to a temporary directory so the sidecar never lands next
+to the original.
+
+Usage:
+    uv run python scripts/benchmark_seekable_frame_source.py [video_path] [--scrub N] [--samples N]
+
+If no video provided, uses a test session video.
+"""
+
+import argparse
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from caliscope.recording.frame_source import FrameSource
+from caliscope.recording.seekable_frame_source import KeyframeIndex, SeekableFrameSource, keyframe_index_path
+
+DEFAULT_VIDEO = Path(__file__).parent.parent / "tests/sessions/4_cam_recording/calibration/extrinsic/cam_0.mp4"
+
+
+def benchmark_index(video_path: Path) -> tuple[float, float, KeyframeIndex]:
+    """Return (cold build seconds, warm load seconds, index)."""
+    keyframe_index_path(video_path).unlink(missing_ok=True)
+
+    start = time.perf_counter()
+    KeyframeIndex.load_or_build(video_path)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = KeyframeIndex.load_or_build(video_path)
+    warm = time.perf_counter() - start
+    return cold, warm, index
+
+
+def benchmark_forward_scrub(video_path: Path, frame_indices: list[int]) -> float:
+    start = time.perf_counter()
+    for i in frame_indices:
+        with FrameSource.from_path(video_path, cam_id=0, wanted_indices={i}) as source:
+            source.next_frame()
+    return time.perf_counter() - start
+
+
+def benchmark_seekable_scrub(video_path: Path, frame_indices: list[int]) -> float:
+    start = time.perf_counter()
+    with SeekableFrameSource.from_path(video_path, cam_id=0) as source:
+        for i in frame_indices:
+            source.get_frame(i)
+    return time.perf_counter() - start
+
+
+def benchmark_sampling(source_type: type[FrameSource], video_path: Path, frame_indices: list[int]) -> float:
+    start = time.perf_counter()
+    with source_type.from_path(video_path, cam_id=0, wanted_indices=set(frame_indices)) as source:
+        while source.next_frame() is not None:
+            pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("video", nargs="?", type=Path, default=DEFAULT_VIDEO)
+    parser.add_argument("--scrub", type=int, default=50, help="random single-frame requests")
+    parser.add_argument("--samples", type=int, default=12, help="evenly spaced frames for sparse sampling")
+    args = parser.parse_args()
+
+    if not args.video.exists():
+        raise SystemExit(f"Error: Video not found: {args.video}")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        video_path = Path(temp_dir) / args.video.name
+        shutil.copy(args.video, video_path)
+
+        cold, warm, index = benchmark_index(video_path)
+        frame_count = index.frame_count
+        gop = frame_count / max(len(index.keyframes), 1)
+        print(f"Video: {args.video}")
+        print(f"Frames: {frame_count}, keyframes: {len(index.keyframes)} (mean GOP {gop:.1f})")
+        print()
+        print("Keyframe index:")
+        print(f"  Build (demux): {cold * 1000:.1f} ms")
+        print(f"  Sidecar load:  {warm * 1000:.1f} ms")
+
+        random.seed(42)  # Reproducible
+        scrub_indices = [random.randrange(frame_count) for _ in range(args.scrub)]
+        t_forward = benchmark_forward_scrub(video_path, scrub_indices)
+        t_seek = benchmark_seekable_scrub(video_path, scrub_indices)
+        print()
+        print(f"Scrub ({args.scrub} random frames):")
+        print(f"  Forward:  {t_forward:.2f}s ({args.scrub / t_forward:.1f} frames/s)")
+        print(f"  Seekable: {t_seek:.2f}s ({args.scrub / t_seek:.1f} frames/s)  {t_forward / t_seek:.1f}x")
+
+        step = max(frame_count // args.samples, 1)
+        sample_indices = list(range(step // 2, frame_count, step))[: args.samples]
+        t_forward = benchmark_sampling(FrameSource, video_path, sample_indices)
+        t_seek = benchmark_sampling(SeekableFrameSource, video_path, sample_indices)
+        print()
+        print(f"Sparse sampling ({len(sample_indices)} frames):")
+        print(f"  Forward:  {t_forward:.2f}s")
+        print(f"  Seekable: {t_seek:.2f}s  {t_forward / t_seek:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
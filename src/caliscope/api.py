@@ -40,10 +40,14 @@ calibration), and ``caliscope.reporting`` (terminal output).
 
 from __future__ import annotations
 
+import os
 from collections.abc import Mapping
 from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Generator
+from typing import TYPE_CHECKING, Any, Generator, Literal
+
+import numpy as np
+import pandas as pd
 
 from caliscope.cameras.camera_array import CameraArray, CameraData
 from caliscope.core.aruco_marker import ArucoMarkerSet
@@ -68,8 +72,10 @@ from caliscope.tracker import Tracker
 from caliscope.trackers.aruco_tracker import ArucoTracker
 from caliscope.trackers.charuco_tracker import CharucoTracker
 from caliscope.trackers.chessboard_tracker import ChessboardTracker
+from caliscope.trackers.motion_gated_tracker import MotionGatedTracker
 
 if TYPE_CHECKING:
+    from caliscope.core.extraction_checkpoint import ExtractionCheckpoint
     from caliscope.reporting import ProgressCallback
 
 # Sentinel meaning "create a RichProgressBar automatically for this call".
@@ -103,6 +109,7 @@ __all__ = [
     "ArucoTracker",
     "Chessboard",
     "ChessboardTracker",
+    "MotionGatedTracker",
     "Tracker",
     "ConstraintSet",
     # Domain classes
@@ -138,7 +145,11 @@ def extract_image_points(
     *,
     frame_step: int = 1,
     rotation_count: int = 0,
+    reduced_resolution: bool = False,
     progress: ProgressCallback | None = _AUTO,
+    segments: int = 1,
+    backend: Literal["thread", "process"] = "thread",
+    checkpoint: Path | str | None = None,
 ) -> ImagePoints:
     """Extract 2D landmark observations from a single camera video.
 
@@ -159,33 +170,52 @@ def extract_image_points(
             Charuco, ArUco, and chessboard trackers ignore this because their
             detectors are already rotation-invariant; ONNX pose trackers use
             it to put an upright body in front of a model trained on one.
+        reduced_resolution: Decode at ``tracker.frame_scale()`` of the native
+            size for trackers that declare a ``preferred_resolution`` (ONNX
+            pose trackers). Returned image coordinates are still in native
+            pixels. No effect for calibration-board trackers.
         progress: Callback invoked per-frame for progress reporting.
             Defaults to a Rich progress bar.  Pass ``None`` to suppress output.
+        segments: Split the video into up to this many keyframe-aligned
+            segments and track them concurrently, to spread one long video
+            over many cores. Points match an unsplit run, except that tracker
+            state carried between frames (an ONNX tracker's previous bounding
+            box) starts afresh at each segment (``Tracker.reset``). Fewer
+            segments are used when the video has too few keyframes.
+        backend: ``"thread"`` (default) tracks segments in threads, each with
+            its own copy of the tracker. ``"process"`` uses worker processes,
+            which also scales for trackers that hold the GIL; the tracker must
+            be picklable. See ``extract_image_points_multicam``.
+        checkpoint: Directory to save points in as extraction proceeds (every
+            ``CHECKPOINT_INTERVAL`` seconds, and if extraction is interrupted).
+            Calling again with the same directory and arguments resumes after
+            the last saved frame instead of starting over. Deleted once the
+            video is done. Not available with ``segments`` or the process backend.
 
     Raises:
         CalibrationError: If no points are detected in the video.
         FileNotFoundError: If the video path does not exist.
-        ValueError: If frame_step < 1.
+        ValueError: If frame_step or segments < 1, backend is unknown, or
+            checkpoint is combined with segments or the process backend.
     """
-    import pandas as pd
-
-    from caliscope.recording.frame_source import FrameSource
     from caliscope.recording.video_utils import read_video_properties
 
     if frame_step < 1:
         raise ValueError(f"frame_step must be >= 1, got {frame_step}")
+    if segments < 1:
+        raise ValueError(f"segments must be >= 1, got {segments}")
+    if backend not in ("thread", "process"):
+        raise ValueError(f"backend must be 'thread' or 'process', got {backend!r}")
+    if checkpoint is not None and (segments > 1 or backend == "process"):
+        raise ValueError("checkpoint requires segments=1 and the thread backend")
 
     video_path = Path(video_path)
     if not video_path.exists():
         raise FileNotFoundError(f"Video file not found: {video_path}")
 
     with _auto_progress(progress) as progress:
-        all_rows: list[dict] = []
-
         props = read_video_properties(video_path)
         frame_count = props["frame_count"]
-
-        wanted = set(range(0, frame_count, frame_step)) if frame_step > 1 else None
         progress_total = (frame_count + frame_step - 1) // frame_step if frame_step > 1 else frame_count
 
         if frame_step > 1 and progress is not None:
@@ -194,24 +224,143 @@ def extract_image_points(
         if progress is not None:
             progress.on_video_start(cam_id, progress_total)
 
-        frame_source = FrameSource.from_path(
-            video_path,
-            cam_id=cam_id,
-            wanted_indices=wanted,
-            pixel_format=tracker.pixel_format,
-        )
-        try:
-            progress_index = 0
-            while (raw := frame_source.next_frame()) is not None:
-                point_packet = tracker.get_points(raw.frame, cam_id=cam_id, rotation_count=rotation_count)
-
-                n_points = len(point_packet.keypoint_id)
-                if n_points > 0:
-                    n = n_points
-                    row = {
-                        "sync_index": [raw.frame_index] * n,
-                        "cam_id": [cam_id] * n,
-                        "frame_time": [raw.frame_time] * n,
+        scale = tracker.frame_scale(props["size"]) if reduced_resolution else 1.0
+
+        if segments > 1 or backend == "process":
+            table = _track_segments(
+                video_path, cam_id, tracker, frame_step, rotation_count, scale, segments, backend, progress
+            )
+        else:
+            saved = (
+                _open_checkpoint(
+                    Path(checkpoint), video_path, cam_id, tracker, frame_step, rotation_count, reduced_resolution
+                )
+                if checkpoint is not None
+                else None
+            )
+            table = _track_video(
+                video_path, cam_id, tracker, frame_count, frame_step, rotation_count, scale, saved, progress
+            )
+
+        if table.empty:
+            raise CalibrationError(
+                "No landmarks detected in the video. Check that:\n"
+                "  1. The calibration target is visible in the video\n"
+                "  2. The correct tracker is being used\n"
+                "  3. The video file is not corrupted"
+            )
+
+        return ImagePoints(table)
+
+
+def _track_segments(
+    video_path: Path,
+    cam_id: int,
+    tracker: Tracker,
+    frame_step: int,
+    rotation_count: int,
+    scale: float,
+    segments: int,
+    backend: Literal["thread", "process"],
+    progress: ProgressCallback | None,
+) -> pd.DataFrame:
+    """Points of one video tracked as keyframe-aligned segments in threads or processes."""
+    from caliscope.core.process_tracking import (
+        CameraJob,
+        track_in_processes,
+        track_in_threads,
+        tracked_points_table,
+    )
+    from caliscope.recording.seekable_frame_source import KeyframeIndex
+
+    keyframe_index = KeyframeIndex.load_or_build(video_path)
+    runs = keyframe_index.split(np.arange(0, keyframe_index.frame_count, frame_step), segments)
+    if len(runs) < segments and progress is not None:
+        progress.on_info(f"Video has keyframes for {len(runs)} of {segments} segments")
+    decode_threads = max(1, (os.cpu_count() or 4) // max(1, len(runs)))
+    jobs = [CameraJob(video_path, cam_id, run, run, rotation_count, scale, decode_threads) for run in runs]
+    track = track_in_processes if backend == "process" else track_in_threads
+    results = track(
+        jobs,
+        tracker,
+        on_frame=progress.on_frame if progress is not None else None,
+        on_complete=progress.on_video_complete if progress is not None else None,
+    )
+    # Single-video points use the frame index as sync index and carry no frame_index column.
+    return tracked_points_table(results).drop(columns="frame_index")
+
+
+def _open_checkpoint(
+    directory: Path,
+    video_path: Path,
+    cam_id: int,
+    tracker: Tracker,
+    frame_step: int,
+    rotation_count: int,
+    reduced_resolution: bool,
+) -> ExtractionCheckpoint:
+    """The checkpoint in directory for this extraction, discarded if it was saved under other arguments."""
+    from caliscope.core.extraction_checkpoint import ExtractionCheckpoint, extraction_fingerprint
+
+    fingerprint = extraction_fingerprint(
+        [video_path],
+        tracker,
+        cam_id=cam_id,
+        frame_step=frame_step,
+        rotation_count=rotation_count,
+        reduced_resolution=reduced_resolution,
+    )
+    return ExtractionCheckpoint(directory, fingerprint)
+
+
+def _track_video(
+    video_path: Path,
+    cam_id: int,
+    tracker: Tracker,
+    frame_count: int,
+    frame_step: int,
+    rotation_count: int,
+    scale: float,
+    saved: ExtractionCheckpoint | None,
+    progress: ProgressCallback | None,
+) -> pd.DataFrame:
+    """Points of one video tracked front to back, resuming from and saving to saved when given."""
+    from caliscope.recording.seekable_frame_source import SeekableFrameSource
+
+    start = 0
+    resumed = pd.DataFrame()
+    if saved is not None and saved.resuming:
+        resumed = saved.points()
+        start = saved.completed_through + 1
+        start += -start % frame_step  # next frame on the frame_step grid
+    wanted = set(range(start, frame_count, frame_step)) if frame_step > 1 or start > 0 else None
+    progress_index = start // frame_step
+
+    frame_source = SeekableFrameSource.from_path(
+        video_path,
+        cam_id=cam_id,
+        wanted_indices=wanted,
+        pixel_format=tracker.pixel_format,
+        scale=scale,
+    )
+    # rows[:flushed_rows] are already in the checkpoint; rows covers frames through last_frame.
+    rows: list[dict] = []
+    flushed_rows = 0
+    last_frame = start - 1
+    finished = False
+    try:
+        while (raw := frame_source.next_frame()) is not None:
+            point_packet = tracker.get_points(
+                raw.frame, cam_id=cam_id, rotation_count=rotation_count, native_size=raw.native_size
+            )
+
+            n_points = len(point_packet.keypoint_id)
+            if n_points > 0:
+                rows.append(
+                    {
+                        "sync_index": [raw.frame_index] * n_points,
+                        "cam_id": [cam_id] * n_points,
+                        "frame_time": [raw.frame_time] * n_points,
                         "object_id": point_packet.object_id.tolist(),
                         "keypoint_id": point_packet.keypoint_id.tolist(),
                         "img_loc_x": point_packet.img_loc[:, 0].tolist(),
@@ -220,31 +369,39 @@ def extract_image_points(
                         "obj_loc_y": point_packet.obj_loc_list[1],
                         "obj_loc_z": point_packet.obj_loc_list[2],
                     }
-                    all_rows.append(row)
+                )
+            last_frame = raw.frame_index
 
-                progress_index += 1
-                if progress is not None:
-                    progress.on_frame(cam_id, progress_index, n_points)
-        finally:
-            frame_source.close()
+            progress_index += 1
+            if progress is not None:
+                progress.on_frame(cam_id, progress_index, n_points)
 
-        if progress is not None:
-            progress.on_video_complete(cam_id)
+            if saved is not None and saved.due():
+                saved.save(_rows_to_table(rows[flushed_rows:]), last_frame)
+                flushed_rows = len(rows)
+        finished = True
+    finally:
+        frame_source.close()
+        if saved is not None:
+            if finished:
+                saved.clear()
+            elif last_frame > saved.completed_through:
+                saved.save(_rows_to_table(rows[flushed_rows:]), last_frame)
 
-        if not all_rows:
-            raise CalibrationError(
-                "No landmarks detected in the video. Check that:\n"
-                "  1. The calibration target is visible in the video\n"
-                "  2. The correct tracker is being used\n"
-                "  3. The video file is not corrupted"
-            )
+    if progress is not None:
+        progress.on_video_complete(cam_id)
 
-        flat_rows: dict[str, list] = {k: [] for k in all_rows[0].keys()}
-        for row in all_rows:
-            for k, v in row.items():
-                flat_rows[k].extend(v)
+    table = _rows_to_table(rows)
+    return pd.concat([resumed, table], ignore_index=True) if len(resumed) else table
 
-        return ImagePoints(pd.DataFrame(flat_rows))
+
+def _rows_to_table(rows: list[dict]) -> pd.DataFrame:
+    """One DataFrame from per-frame dicts of equal-length column lists."""
+    columns: dict[str, list] = {k: [] for k in rows[0].keys()} if rows else {}
+    for row in rows:
+        for k, v in row.items():
+            columns[k].extend(v)
+    return pd.DataFrame(columns)
 
 
 def extract_image_points_multicam(
@@ -254,7 +411,9 @@ def extract_image_points_multicam(
     frame_step: int = 1,
     timestamps: Path | str | None = None,
     rotation_counts: Mapping[int, int] | None = None,
+    reduced_resolution: bool = False,
     progress: ProgressCallback | None = _AUTO,
+    backend: Literal["thread", "process"] = "thread",
 ) -> ImagePoints:
     """Extract synchronized 2D landmark observations from multiple camera videos.
 
@@ -283,10 +442,17 @@ def extract_image_points_multicam(
         rotation_counts: Optional cam_id to quarter-turn mapping, matching
             ``CameraData.rotation_count``. Cameras left out default to 0. See
             ``extract_image_points`` for what rotation does and does not change.
+        reduced_resolution: Decode each camera at ``tracker.frame_scale()`` of
+            its native size. See ``extract_image_points``.
         progress: Callback invoked per-frame for progress reporting.
             Defaults to a Rich progress bar.  Pass ``None`` to suppress output.
             A single instance is shared across all camera threads (safe because
             ``RichProgressBar`` uses a threading lock internally).
+        backend: ``"thread"`` (default) tracks each camera in a thread.
+            ``"process"`` tracks each camera in its own worker process, which
+            scales with cores for trackers that hold the GIL and needs no
+            thread-safety from the tracker. The tracker must be picklable, and
+            each worker pays a start-up cost. Progress is reported the same way.
 
     Returns:
         ImagePoints containing columns: sync_index, cam_id, frame_index,
@@ -296,18 +462,19 @@ def extract_image_points_multicam(
     Raises:
         CalibrationError: If no landmarks detected across all videos.
         FileNotFoundError: If any video paths (or the timestamps CSV) do not exist.
-        ValueError: If frame_step < 1.
+        ValueError: If frame_step < 1 or backend is unknown.
     """
     import concurrent.futures
-    import os
-    import pandas as pd
     from concurrent.futures import ThreadPoolExecutor
 
     from caliscope.recording.frame_source import FrameSource
     from caliscope.recording.synchronized_timestamps import SynchronizedTimestamps
+    from caliscope.recording.video_utils import read_video_properties
 
     if frame_step < 1:
         raise ValueError(f"frame_step must be >= 1, got {frame_step}")
+    if backend not in ("thread", "process"):
+        raise ValueError(f"backend must be 'thread' or 'process', got {backend!r}")
 
     # Normalize all video paths upfront
     video_paths: dict[int, Path] = {cam_id: Path(p) for cam_id, p in videos.items()}
@@ -342,22 +509,22 @@ def extract_image_points_multicam(
         # Per-camera work list: (sync_index, frame_index) pairs where the camera
         # has a valid (non-dropped) frame for that sync index.
         def _build_work_list(cam_id: int) -> list[tuple[int, int]]:
-            work: list[tuple[int, int]] = []
-            for sync_index in selected_sync_indices:
-                frame_index = synced.frame_for(sync_index, cam_id)
-                if frame_index is not None:
-                    work.append((sync_index, frame_index))
-            return work
+            selected = np.asarray(selected_sync_indices, dtype=np.int64)
+            frame_indices = synced.frames_for(cam_id, selected)
+            present = frame_indices >= 0
+            return list(zip(selected[present].tolist(), frame_indices[present].tolist()))
 
         def _process_camera(cam_id: int, work_list: list[tuple[int, int]], video_path: Path) -> list[dict]:
             sync_for: dict[int, int] = {frame_index: sync_index for sync_index, frame_index in work_list}
 
+            scale = tracker.frame_scale(read_video_properties(video_path)["size"]) if reduced_resolution else 1.0
             frame_source = FrameSource.from_path(
                 video_path,
                 cam_id=cam_id,
                 decode_threads=decode_threads,
                 wanted_indices=set(sync_for),
                 pixel_format=tracker.pixel_format,
+                scale=scale,
             )
             try:
                 if progress is not None:
@@ -366,7 +533,12 @@ def extract_image_points_multicam(
                 rows: list[dict] = []
                 processed = 0
                 while (raw := frame_source.next_frame()) is not None:
-                    point_packet = tracker.get_points(raw.frame, cam_id=cam_id, rotation_count=rotations.get(cam_id, 0))
+                    point_packet = tracker.get_points(
+                        raw.frame,
+                        cam_id=cam_id,
+                        rotation_count=rotations.get(cam_id, 0),
+                        native_size=raw.native_size,
+                    )
                     n_points = len(point_packet.keypoint_id)
                     sync_index = sync_for[raw.frame_index]
                     frame_time = synced.time_for(cam_id, raw.frame_index)
@@ -399,25 +571,56 @@ def extract_image_points_multicam(
 
         # Process cameras concurrently
         max_workers = min(len(video_paths), 8)
-        all_camera_rows: list[list[dict]] = []
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(_process_camera, cam_id, _build_work_list(cam_id), video_paths[cam_id]): cam_id
-                for cam_id in video_paths
-            }
-            try:
-                for future in concurrent.futures.as_completed(futures):
-                    all_camera_rows.append(future.result())
-            except Exception:
-                for f in futures:
-                    f.cancel()
-                raise
-
-        # Flatten per-camera row lists
-        all_rows: list[dict] = [row for camera_rows in all_camera_rows for row in camera_rows]
+        if backend == "process":
+            from caliscope.core.process_tracking import CameraJob, track_in_processes, tracked_points_table
+
+            jobs = []
+            for cam_id, video_path in video_paths.items():
+                work_list = _build_work_list(cam_id)
+                jobs.append(
+                    CameraJob(
+                        video_path=video_path,
+                        cam_id=cam_id,
+                        frame_indices=[frame_index for _, frame_index in work_list],
+                        sync_indices=[sync_index for sync_index, _ in work_list],
+                        rotation_count=rotations.get(cam_id, 0),
+                        scale=tracker.frame_scale(read_video_properties(video_path)["size"])
+                        if reduced_resolution
+                        else 1.0,
+                        decode_threads=decode_threads,
+                    )
+                )
+                if progress is not None:
+                    progress.on_video_start(cam_id, len(work_list))
 
-        if not all_rows:
+            results = track_in_processes(
+                jobs,
+                tracker,
+                max_workers=max_workers,
+                on_frame=progress.on_frame if progress is not None else None,
+                on_complete=progress.on_video_complete if progress is not None else None,
+            )
+            table = tracked_points_table(results, synced)
+        else:
+            all_camera_rows: list[list[dict]] = []
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_process_camera, cam_id, _build_work_list(cam_id), video_paths[cam_id]): cam_id
+                    for cam_id in video_paths
+                }
+                try:
+                    for future in concurrent.futures.as_completed(futures):
+                        all_camera_rows.append(future.result())
+                except Exception:
+                    for f in futures:
+                        f.cancel()
+                    raise
+
+            table = _rows_to_table([row for camera_rows in all_camera_rows for row in camera_rows])
+
+        if table.empty:
             raise CalibrationError(
                 "No landmarks detected in any video. Check that:\n"
                 "  1. The calibration target is visible in the videos\n"
@@ -425,12 +628,7 @@ def extract_image_points_multicam(
                 "  3. Video files are not corrupted"
             )
 
-        flat_rows: dict[str, list] = {k: [] for k in all_rows[0].keys()}
-        for row in all_rows:
-            for k, v in row.items():
-                flat_rows[k].extend(v)
-
-        return ImagePoints(pd.DataFrame(flat_rows))
+        return ImagePoints(table)
 
 
 def calibrate_intrinsics(
@@ -176,9 +176,9 @@ def apply_similarity_transform(
     transformed_points = transform.apply(points_3d)
 
     # Create new WorldPoints instance
-    world_df = world_points.df.copy()
+    world_df = world_points.df
     world_df[["x_coord", "y_coord", "z_coord"]] = transformed_points
-    new_world_points = WorldPoints(world_df)
+    new_world_points = WorldPoints._from_validated(world_df)
 
     # Transform camera extrinsics
     #
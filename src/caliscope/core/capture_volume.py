@@ -90,8 +90,8 @@ class CaptureVolume:
 
     def _validate_geometry(self):
         """Ensure data counts make geometric sense."""
-        n_img = len(self.image_points.df)
-        n_world = len(self.world_points.df)
+        n_img = len(self.image_points.view)
+        n_world = len(self.world_points.view)
         n_cams = len(self.camera_array.posed_cameras)
 
         if n_img == 0:
@@ -118,12 +118,12 @@ class CaptureVolume:
 
     def _compute_img_to_obj_map(self) -> np.ndarray:
         """Map each image observation to its world point index. Returns -1 for unmatched."""
-        world_df = self.world_points.df.reset_index().rename(columns={"index": "world_idx"})
+        world_df = self.world_points.view.reset_index().rename(columns={"index": "world_idx"})
         mapping = world_df.set_index(["sync_index", "object_id", "keypoint_id"])["world_idx"].to_dict()
 
         static_ids = self.constraints.static_object_ids if self.constraints else frozenset()
 
-        img_df = self.image_points.df
+        img_df = self.image_points.view
         keys = []
         for sync_idx, obj_id, kp_id in zip(img_df["sync_index"], img_df["object_id"], img_df["keypoint_id"]):
             if int(obj_id) in static_ids:
@@ -156,7 +156,7 @@ class CaptureVolume:
         # 1. Filter to matched observations from posed cameras only
         matched_mask = self.img_to_obj_map >= 0
         posed_cam_ids = set(self.camera_array.posed_cam_id_to_index.keys())
-        posed_mask: np.ndarray = self.image_points.df["cam_id"].isin(posed_cam_ids).to_numpy()
+        posed_mask: np.ndarray = self.image_points.view["cam_id"].isin(posed_cam_ids).to_numpy()
         combined_mask = matched_mask & posed_mask
 
         n_total = len(self.img_to_obj_map)
@@ -166,14 +166,14 @@ class CaptureVolume:
         if n_matched == 0:
             raise ValueError("No matched observations for reprojection error calculation")
 
-        matched_img_df = self.image_points.df[combined_mask]
+        matched_img_df = self.image_points.view[combined_mask]
         matched_obj_indices = self.img_to_obj_map[combined_mask]
 
         # 2. Prepare arrays for core function
         camera_indices: CameraIndices = np.array(
             [self.camera_array.posed_cam_id_to_index[cam_id] for cam_id in matched_img_df["cam_id"]], dtype=np.int16
         )
-        image_coords: ImageCoords = matched_img_df[["img_loc_x", "img_loc_y"]].values
+        image_coords: ImageCoords = matched_img_df[["img_loc_x", "img_loc_y"]].to_numpy(dtype=np.float64)
         world_coords: WorldCoords = self.world_points.points[matched_obj_indices]
 
         # 3. Compute reprojection errors
@@ -212,9 +212,10 @@ class CaptureVolume:
 
         # 6. Count unmatched by camera (only count for posed cameras)
         unmatched_by_camera = {}
+        img_cam_ids = self.image_points.view["cam_id"]
         for cam_id in self.camera_array.cameras.keys():
-            cam_total = (self.image_points.df["cam_id"] == cam_id).sum()
-            cam_matched = ((self.image_points.df["cam_id"] == cam_id) & combined_mask).sum()
+            cam_total = (img_cam_ids == cam_id).sum()
+            cam_matched = ((img_cam_ids == cam_id) & combined_mask).sum()
             unmatched_by_camera[cam_id] = int(cam_total - cam_matched)
 
         # 7. Create and cache report
@@ -289,7 +290,7 @@ class CaptureVolume:
         )
 
         # Validate: cam_id mismatch
-        point_cam_ids = set(image_points.df["cam_id"].unique())
+        point_cam_ids = set(image_points.view["cam_id"].unique())
         array_cam_ids = set(camera_array.cameras.keys())
         missing_cameras = point_cam_ids - array_cam_ids
         if missing_cameras:
@@ -345,16 +346,16 @@ class CaptureVolume:
 
         matched_mask = self.img_to_obj_map >= 0
         posed_cam_ids = set(self.camera_array.posed_cam_id_to_index.keys())
-        posed_mask: np.ndarray = self.image_points.df["cam_id"].isin(posed_cam_ids).to_numpy()
+        posed_mask: np.ndarray = self.image_points.view["cam_id"].isin(posed_cam_ids).to_numpy()
         combined_mask = matched_mask & posed_mask
 
-        matched_img_df = self.image_points.df[combined_mask]
+        matched_img_df = self.image_points.view[combined_mask]
 
         camera_indices: CameraIndices = np.array(
             [self.camera_array.posed_cam_id_to_index[cam_id] for cam_id in matched_img_df["cam_id"]], dtype=np.int16
         )
 
-        image_coords: ImageCoords = matched_img_df[["img_loc_x", "img_loc_y"]].values
+        image_coords: ImageCoords = matched_img_df[["img_loc_x", "img_loc_y"]].to_numpy(dtype=np.float64)
         image_to_world_indices = self.img_to_obj_map[combined_mask]
 
         new_camera_array = deepcopy(self.camera_array)
@@ -432,13 +433,13 @@ class CaptureVolume:
             bound_warnings=bound_warnings,
         )
 
-        new_world_df = self.world_points.df.copy()
+        new_world_df = self.world_points.df
         new_world_df[["x_coord", "y_coord", "z_coord"]] = new_points_xyz
 
         return CaptureVolume(
             camera_array=new_camera_array,
             image_points=self.image_points,
-            world_points=WorldPoints(new_world_df),
+            world_points=WorldPoints._from_validated(new_world_df),
             constraints=self.constraints,
             _optimization_status=optimization_status,
         )
@@ -459,7 +460,7 @@ class CaptureVolume:
 
         from collections import defaultdict
 
-        world_df = self.world_points.df
+        world_df = self.world_points.view
         static_ids = self.constraints.static_object_ids
 
         # (object_id, keypoint_id) -> {sync_index: row_idx}
@@ -541,7 +542,7 @@ class CaptureVolume:
 
         from collections import defaultdict
 
-        world_df = self.world_points.df
+        world_df = self.world_points.view
         static_ids = self.constraints.static_object_ids
         coords = self.world_points.points
 
@@ -649,14 +650,14 @@ class CaptureVolume:
         keep_keys = raw_errors[keep_mask][["sync_index", "cam_id", "object_id", "keypoint_id"]]
 
         # Filter image points by merging with keep keys
-        filtered_img_df = self.image_points.df.merge(
+        filtered_img_df = self.image_points.view.merge(
             keep_keys, on=["sync_index", "cam_id", "object_id", "keypoint_id"], how="inner"
         )
-        filtered_image_points = ImagePoints(filtered_img_df)
+        filtered_image_points = ImagePoints._from_validated(filtered_img_df)
 
         # Prune orphaned world points (3D points with no observations)
         remaining_3d_keys = filtered_img_df[["sync_index", "object_id", "keypoint_id"]].drop_duplicates()
-        filtered_world_df = self.world_points.df.merge(
+        filtered_world_df = self.world_points.view.merge(
             remaining_3d_keys, on=["sync_index", "object_id", "keypoint_id"], how="inner"
         )
 
@@ -664,14 +665,15 @@ class CaptureVolume:
         # Static points live at STATIC_SYNC_INDEX but their observations carry real sync_indices,
         # so the merge above drops them. Re-attach any static rows whose (object_id, keypoint_id)
         # still appears in the filtered observations.
-        static_world_df = self.world_points.df[self.world_points.df["sync_index"] == STATIC_SYNC_INDEX]
+        world_view = self.world_points.view
+        static_world_df = world_view[world_view["sync_index"] == STATIC_SYNC_INDEX]
         if not static_world_df.empty:
             static_obs_keys = filtered_img_df[["object_id", "keypoint_id"]].drop_duplicates()
             static_to_keep = static_world_df.merge(static_obs_keys, on=["object_id", "keypoint_id"], how="inner")
             if not static_to_keep.empty:
                 filtered_world_df = pd.concat([filtered_world_df, static_to_keep], ignore_index=True)
 
-        filtered_world_points = WorldPoints(filtered_world_df)
+        filtered_world_points = WorldPoints._from_validated(filtered_world_df)
 
         return CaptureVolume(
             camera_array=self.camera_array,
@@ -763,8 +765,8 @@ class CaptureVolume:
             VolumetricScaleReport containing per-frame-per-object errors and aggregate metrics.
             Returns empty report if no valid frames exist (normal pre-alignment state).
         """
-        img_df = self.image_points.df
-        world_df = self.world_points.df
+        img_df = self.image_points.view
+        world_df = self.world_points.view
 
         obj_loc_cols = ["obj_loc_x", "obj_loc_y", "obj_loc_z"]
         if not all(col in img_df.columns for col in obj_loc_cols):
@@ -778,39 +780,47 @@ class CaptureVolume:
 
         static_ids = self.constraints.static_object_ids if self.constraints else frozenset()
 
+        # Locate every observation's world point in one lookup, keeping float64 coordinates.
+        # Static markers: world points live at STATIC_SYNC_INDEX.
+        world_keys = world_df[["sync_index", "object_id", "keypoint_id"]].drop_duplicates()
+        world_xyz = world_df.loc[world_keys.index, ["x_coord", "y_coord", "z_coord"]].to_numpy(dtype=np.float64)
+        is_static = img_with_obj["object_id"].isin(list(static_ids)).to_numpy()
+        world_si = np.where(is_static, STATIC_SYNC_INDEX, img_with_obj["sync_index"].to_numpy(dtype=np.int64))
+        world_row = pd.MultiIndex.from_frame(world_keys).get_indexer(
+            pd.MultiIndex.from_arrays(
+                [world_si, img_with_obj["object_id"].to_numpy(dtype=np.int64), img_with_obj["keypoint_id"].to_numpy()]
+            )
+        )
+        img_with_obj = img_with_obj.assign(world_row=world_row)
+
         frame_errors: list[FrameScaleError] = []
 
         for (sync_index_raw, object_id_raw), img_group in img_with_obj.groupby(["sync_index", "object_id"]):
             sync_index = int(sync_index_raw)  # type: ignore[arg-type]
             object_id = int(object_id_raw)  # type: ignore[arg-type]
 
-            # Static markers: world points live at STATIC_SYNC_INDEX
-            world_si = STATIC_SYNC_INDEX if object_id in static_ids else sync_index
-            world_subset = world_df[(world_df["sync_index"] == world_si) & (world_df["object_id"] == object_id)]
-
-            if world_subset.empty:
+            obj_points_df = img_group[["keypoint_id", "obj_loc_x", "obj_loc_y", "obj_loc_z", "world_row"]]
+            obj_points_df = obj_points_df.drop_duplicates(subset="keypoint_id")
+            rows = obj_points_df["world_row"].to_numpy()
+            triangulated = rows >= 0
+            if not triangulated.any():
                 continue
 
-            obj_points_df = img_group[
-                ["object_id", "keypoint_id", "obj_loc_x", "obj_loc_y", "obj_loc_z"]
-            ].drop_duplicates(subset=["object_id", "keypoint_id"])
-
-            merged = world_subset.merge(obj_points_df, on=["object_id", "keypoint_id"], how="inner")
-
-            if merged["obj_loc_z"].isna().all():
-                merged = merged.copy()
-                merged["obj_loc_z"] = 0.0
+            object_points = obj_points_df[["obj_loc_x", "obj_loc_y", "obj_loc_z"]].to_numpy(dtype=np.float64)
+            world_points = np.full((len(rows), 3), np.nan)
+            world_points[triangulated] = world_xyz[rows[triangulated]]
 
-            valid_mask = ~merged[["obj_loc_x", "obj_loc_y", "obj_loc_z"]].isna().any(axis=1)
-            merged = merged[valid_mask]
+            if np.isnan(object_points[triangulated, 2]).all():
+                object_points[:, 2] = 0.0
 
-            if len(merged) < 3:
+            valid = ~np.isnan(world_points).any(axis=1) & ~np.isnan(object_points).any(axis=1)
+            if valid.sum() < 3:
                 continue
 
             n_cameras_contributing = int(img_group["cam_id"].nunique())
 
-            world_points = merged[["x_coord", "y_coord", "z_coord"]].to_numpy()
-            object_points = merged[["obj_loc_x", "obj_loc_y", "obj_loc_z"]].to_numpy()
+            world_points = world_points[valid]
+            object_points = object_points[valid]
 
             try:
                 frame_error = compute_frame_scale_error(
@@ -845,8 +855,8 @@ class CaptureVolume:
         sync_index=None is valid only for static markers (world points at
         STATIC_SYNC_INDEX). Raises for non-static markers.
         """
-        img_df = self.image_points.df
-        world_df = self.world_points.df
+        img_df = self.image_points.view
+        world_df = self.world_points.view
         static_ids = self.constraints.static_object_ids if self.constraints else frozenset()
 
         # Resolve sync_index for static markers
@@ -937,7 +947,7 @@ class CaptureVolume:
 
         Used for slider range in visualization widgets.
         """
-        indices = self.world_points.df["sync_index"].unique()
+        indices = self.world_points.view["sync_index"].unique()
         return np.sort(indices)
 
     def rotate(self, axis: Literal["x", "y", "z"], angle_degrees: float) -> "CaptureVolume":
@@ -1166,7 +1176,7 @@ class CaptureVolume:
                 raise ValueError(f"Cameras {cue.cam_a} and {cue.cam_b} coincide; distance cue is degenerate.")
             return d_arb, float(cue.meters), float(cue.sigma_m)
 
-        world_df = self.world_points.df
+        world_df = self.world_points.view
 
         if isinstance(cue, SegmentLength):
             coords = ["x_coord", "y_coord", "z_coord"]
@@ -1197,7 +1207,7 @@ class CaptureVolume:
         if cam is None or cam.rotation is None or cam.translation is None:
             return "unposed camera"
 
-        world_df = self.world_points.df
+        world_df = self.world_points.view
         match = world_df[(world_df["sync_index"] == cue.sync_index) & (world_df["keypoint_id"] == cue.keypoint_id)]
         if match.empty:
             return "no world point"
@@ -1308,7 +1318,7 @@ class CaptureVolume:
         if mode != "lowest_point":
             raise ValueError(f"grounded() only supports mode='lowest_point', got {mode!r}.")
 
-        min_z = float(np.percentile(self.world_points.df["z_coord"].to_numpy(), 1.0, method="lower"))
+        min_z = float(np.percentile(self.world_points.view["z_coord"].to_numpy(), 1.0, method="lower"))
         anchor_center = self._camera_center(self._anchor_cam_id())
 
         return self.translate(
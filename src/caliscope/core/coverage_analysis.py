@@ -105,7 +105,7 @@ def compute_coverage_matrix(
     Returns:
         (n_cameras, n_cameras) symmetric matrix of observation counts
     """
-    df = image_points.df
+    df = image_points.view
     n_cameras = len(cam_id_to_index)
     coverage = np.zeros((n_cameras, n_cameras), dtype=np.int64)
 
@@ -206,7 +206,7 @@ def analyze_multi_camera_coverage(
     Returns:
         ExtrinsicCoverageReport with coverage analysis
     """
-    df = image_points.df
+    df = image_points.view
 
     # Build cam_id-to-index mapping from actual data
     actual_cam_ids = sorted(df["cam_id"].unique()) if len(df) > 0 else []
@@ -0,0 +1,152 @@
+"""Checkpoints that let an interrupted 2D extraction resume where it stopped.
+
+Tracking a multi-hour recording keeps its points in memory until the end, so
+a cancel or crash used to cost the whole run. An ExtractionCheckpoint is a
+directory the extraction flushes its points into as it goes: numbered chunk
+files of ImagePoints columns plus a manifest listing them and the last sync
+index completed. A rerun with the same checkpoint directory loads the saved
+points and starts after that sync index; the sync mapping, which is part of
+the fingerprint, gives each camera's frame to resume from.
+
+Each chunk is written before the manifest that lists it, and both are replaced
+atomically, so an interruption at any moment leaves a consistent checkpoint
+(at worst an unlisted chunk that the next save overwrites). The manifest
+carries a fingerprint of the videos, tracker and extraction settings; a
+checkpoint written under a different fingerprint is discarded.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from caliscope.tracker import Tracker
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+# Seconds of tracking between flushes: the most work an interruption can cost.
+CHECKPOINT_INTERVAL = 30.0
+
+_MANIFEST = "manifest.json"
+
+
+def extraction_fingerprint(paths: Iterable[Path], tracker: Tracker, **settings: object) -> str:
+    """Hash of what determines an extraction's points: input files, tracker, and settings.
+
+    Files are identified by name, size and mtime rather than content so the
+    check stays a few syscalls even for multi-gigabyte recordings.
+    """
+    files = []
+    for path in paths:
+        stat = Path(path).stat()
+        files.append([Path(path).name, stat.st_size, stat.st_mtime_ns])
+
+    payload = {"files": files, "tracker": tracker.name, "config": tracker.config, "settings": settings}
+    encoded = json.dumps(payload, sort_keys=True, default=repr).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ExtractionCheckpoint:
+    """The saved part of one extraction, resumed from or added to as tracking proceeds.
+
+    completed_through is the last sync index whose points are all saved (-1
+    when starting fresh).
+    """
+
+    def __init__(self, directory: Path, fingerprint: str, interval: float = CHECKPOINT_INTERVAL) -> None:
+        self.directory = Path(directory)
+        self.fingerprint = fingerprint
+        self.interval = interval
+        self.completed_through = -1
+        self._chunks: list[str] = []
+        self._last_save = time.monotonic()
+        self._load()
+
+    @property
+    def resuming(self) -> bool:
+        return self.completed_through >= 0
+
+    def points(self) -> pd.DataFrame:
+        """Every saved point, in the order saved. Empty (no columns) when nothing is saved."""
+        frames = []
+        for name in self._chunks:
+            with np.load(self.directory / name) as stored:
+                frames.append(pd.DataFrame({column: stored[column] for column in stored.files}))
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def due(self) -> bool:
+        """True once interval seconds have passed since the last save."""
+        return time.monotonic() - self._last_save >= self.interval
+
+    def save(self, points: pd.DataFrame, completed_through: int) -> None:
+        """Append points (found since the previous save) and advance the resume position."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        chunks = list(self._chunks)
+        if len(points) > 0:
+            name = f"chunk_{len(chunks):06d}.npz"
+            temp_path = self.directory / f"{name}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                np.savez(f, **{column: _storable(points[column]) for column in points.columns})
+            os.replace(temp_path, self.directory / name)
+            chunks.append(name)
+
+        manifest = {
+            "version": CHECKPOINT_VERSION,
+            "fingerprint": self.fingerprint,
+            "completed_through": int(completed_through),
+            "chunks": chunks,
+        }
+        temp_path = self.directory / f"{_MANIFEST}.{os.getpid()}.tmp"
+        temp_path.write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+        os.replace(temp_path, self.directory / _MANIFEST)
+
+        self._chunks = chunks
+        self.completed_through = int(completed_through)
+        self._last_save = time.monotonic()
+        logger.debug(f"Checkpoint {self.directory.name}: through sync index {completed_through}, {len(chunks)} chunks")
+
+    def clear(self) -> None:
+        """Delete the checkpoint (once its extraction has finished)."""
+        self._chunks = []
+        self.completed_through = -1
+        if not self.directory.exists():
+            return
+        for path in self.directory.iterdir():
+            if path.name.startswith(_MANIFEST) or path.name.startswith("chunk_"):
+                path.unlink(missing_ok=True)
+        try:
+            self.directory.rmdir()
+        except OSError:
+            pass  # something else lives here; leave the directory
+
+    def _load(self) -> None:
+        manifest_path = self.directory / _MANIFEST
+        if not manifest_path.exists():
+            return
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            current = manifest["version"] == CHECKPOINT_VERSION and manifest["fingerprint"] == self.fingerprint
+            if current and all((self.directory / name).exists() for name in manifest["chunks"]):
+                self._chunks = list(manifest["chunks"])
+                self.completed_through = int(manifest["completed_through"])
+                logger.info(f"Resuming extraction after sync index {self.completed_through} from {self.directory}")
+                return
+            logger.info(f"Checkpoint {self.directory} is from a different extraction, starting over")
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not read checkpoint {self.directory}, starting over: {e}")
+        self.clear()
+
+
+def _storable(column: pd.Series) -> np.ndarray:
+    """Plain NumPy array for a points column; None (untracked obj_loc) is stored as NaN."""
+    if column.dtype == object:
+        return column.to_numpy(dtype=np.float64, na_value=np.nan)
+    return column.to_numpy()
@@ -9,9 +9,10 @@ import numpy as np
 from numpy.typing import NDArray
 import pandas as pd
 from collections import defaultdict
+from functools import cached_property
 from scipy.signal import butter, filtfilt
 from caliscope.cameras.camera_array import CameraArray
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
@@ -229,6 +230,92 @@ def triangulate_image_points(
     )
 
 
+class SyncIndexTriangulator:
+    """Incremental triangulation, one completed sync index at a time.
+
+    Online counterpart to ImagePoints.triangulate for use while a recording is
+    still being tracked. Normalized projection matrices are built once up front;
+    each call to add() undistorts and triangulates a single sync index with
+    triangulate_sync_index, and the results accumulate until world_points() is
+    requested. Future frames are not yet available, so no 2D gap filling is
+    applied, and static objects (triangulated across all frames) are not supported.
+
+    Not thread-safe: call add() from a single consumer thread.
+    """
+
+    def __init__(self, camera_array: CameraArray):
+        self._projection_matrices = camera_array.normalized_projection_matrices
+        self._cameras = {cam_id: camera_array.cameras[cam_id] for cam_id in self._projection_matrices}
+
+        self._sync: list[np.ndarray] = []
+        self._obj: list[np.ndarray] = []
+        self._kp: list[np.ndarray] = []
+        self._xyz: list[np.ndarray] = []
+        self._frame_time: list[np.ndarray] = []
+
+    @property
+    def n_points(self) -> int:
+        return sum(len(kp) for kp in self._kp)
+
+    def add(
+        self,
+        sync_index: int,
+        camera_ids: np.ndarray,
+        object_ids: np.ndarray,
+        keypoint_ids: np.ndarray,
+        img_xy: np.ndarray,
+        frame_time: float = np.nan,
+    ) -> int:
+        """Triangulate the pixel observations of one sync index. Returns the number of 3D points added."""
+        posed = np.isin(camera_ids, list(self._projection_matrices))
+        if np.count_nonzero(posed) < 2:
+            return 0
+
+        camera_ids = camera_ids[posed]
+        undistorted = np.empty((len(camera_ids), 2), dtype=np.float64)
+        for cam_id in np.unique(camera_ids):
+            cam_mask = camera_ids == cam_id
+            undistorted[cam_mask] = self._cameras[int(cam_id)].undistort_points(
+                img_xy[posed][cam_mask], output="normalized"
+            )
+
+        out_obj, out_kp, out_xyz = triangulate_sync_index(
+            self._projection_matrices,
+            camera_ids,
+            object_ids[posed],
+            keypoint_ids[posed],
+            undistorted,
+        )
+        if len(out_kp) == 0:
+            return 0
+
+        self._sync.append(np.full(len(out_kp), sync_index, dtype=np.int64))
+        self._obj.append(out_obj)
+        self._kp.append(out_kp)
+        self._xyz.append(out_xyz)
+        self._frame_time.append(np.full(len(out_kp), frame_time, dtype=np.float64))
+        return len(out_kp)
+
+    def world_points(self) -> WorldPoints:
+        """Snapshot of everything triangulated so far."""
+        if not self._kp:
+            return WorldPoints(pd.DataFrame(columns=list(WORLD_POINT_COLUMNS.keys())))
+
+        xyz = np.vstack(self._xyz)
+        df = pd.DataFrame(
+            {
+                "sync_index": np.concatenate(self._sync),
+                "object_id": np.concatenate(self._obj),
+                "keypoint_id": np.concatenate(self._kp),
+                "x_coord": xyz[:, 0],
+                "y_coord": xyz[:, 1],
+                "z_coord": xyz[:, 2],
+                "frame_time": np.concatenate(self._frame_time),
+            }
+        )
+        return WorldPoints._from_validated(df)
+
+
 ############################################################################################
 
 
@@ -238,7 +325,7 @@ def _undistort_batch(xy_df: pd.DataFrame, camera_array: CameraArray) -> pd.DataF
     for cam_id, camera in camera_array.cameras.items():
         subset_xy = xy_df.query(f"cam_id == {cam_id}").copy()
         if not subset_xy.empty:
-            points = np.vstack([subset_xy["img_loc_x"], subset_xy["img_loc_y"]]).T
+            points = subset_xy[["img_loc_x", "img_loc_y"]].to_numpy(dtype=np.float64)
             undistorted_xy = camera.undistort_points(points, output="normalized")
             subset_xy["img_loc_undistort_x"] = undistorted_xy[:, 0]
             subset_xy["img_loc_undistort_y"] = undistorted_xy[:, 1]
@@ -276,6 +363,29 @@ WORLD_POINT_COLUMNS: dict[str, dict] = {
 }
 
 
+# Opt-in narrow layout for ImagePoints (see ImagePoints.compact). Tracker output
+# never needs more than float32 pixel precision and ids fit in 16/32 bits, which
+# roughly halves memory for large sessions. frame_time stays float64: float32
+# loses sub-millisecond resolution within the first hour of a recording.
+COMPACT_IMAGE_POINT_DTYPES: dict[str, str] = {
+    "sync_index": "int32",
+    "cam_id": "int16",
+    "frame_index": "int32",
+    "object_id": "int32",
+    "keypoint_id": "int32",
+    "img_loc_x": "float32",
+    "img_loc_y": "float32",
+    "obj_loc_x": "float32",
+    "obj_loc_y": "float32",
+    "obj_loc_z": "float32",
+}
+
+
+def _is_numpy_dtype(series: pd.Series, kind: type[np.generic]) -> bool:
+    """True if the series is backed by a plain numpy dtype of the given kind (not an extension type)."""
+    return isinstance(series.dtype, np.dtype) and np.issubdtype(series.dtype, kind)
+
+
 def _validate_dataframe(
     df: pd.DataFrame,
     schema: dict[str, dict],
@@ -296,12 +406,16 @@ def _validate_dataframe(
             f"{schema_name} validation failed: column(s) {missing} not in dataframe. Columns found: {list(df.columns)}"
         )
 
-    # 2. Coerce types
+    # 2. Coerce types. Plain numpy integer/float columns of any width already
+    # satisfy the schema and are left alone, so compact (int32/float32) tables
+    # validate without being widened back to 64 bits.
     for col, spec in schema.items():
         if spec["dtype"] == "int":
-            df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
+            if not _is_numpy_dtype(df[col], np.integer):
+                df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
         elif spec["dtype"] == "float":
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+            if not _is_numpy_dtype(df[col], np.floating):
+                df[col] = pd.to_numeric(df[col], errors="coerce")
 
     # 3. Check nullability
     for col, spec in schema.items():
@@ -315,7 +429,7 @@ def _validate_dataframe(
     # Int64 (nullable extension type) produces object arrays from .to_numpy().
     # After confirming no nulls, downcast to standard int64 for clean numpy interop.
     for col, spec in schema.items():
-        if spec["dtype"] == "int" and not spec["nullable"]:
+        if spec["dtype"] == "int" and not spec["nullable"] and not _is_numpy_dtype(df[col], np.integer):
             df[col] = df[col].astype("int64")
 
     return df
@@ -330,6 +444,18 @@ class ImagePoints:
     def df(self) -> pd.DataFrame:
         return self._df.copy()
 
+    @property
+    def view(self) -> pd.DataFrame:
+        """Zero-copy access to the underlying DataFrame.
+
+        Returns a shallow frame whose columns are this container's own buffers,
+        so large point tables can be filtered and aggregated without an O(n)
+        copy. Adding or dropping columns on it is safe, but values must not be
+        written in place: without pandas copy-on-write (pandas < 3) such writes
+        land in the container. Use `df` when a mutable copy is needed.
+        """
+        return self._df.copy(deep=False)
+
     def __init__(self, df: pd.DataFrame):
         # Ensure optional columns exist even if not in source data
         df = df.copy()  # Don't modify the original DataFrame
@@ -350,11 +476,53 @@ class ImagePoints:
             )
 
     @classmethod
-    def from_csv(cls, path: str | Path) -> ImagePoints:
+    def _from_validated(cls, df: pd.DataFrame) -> ImagePoints:
+        """Wrap a DataFrame that already satisfies IMAGE_POINT_COLUMNS.
+
+        Trusted internal path: skips the defensive copy, type coercion and
+        duplicate check. Only use with frames derived from another ImagePoints
+        (row filters, merges on key columns) that the caller will not mutate.
+        """
+        instance = cls.__new__(cls)
+        instance._df = df
+        return instance
+
+    @classmethod
+    def from_csv(cls, path: str | Path, compact: bool = False) -> ImagePoints:
+        """Load image points from CSV.
+
+        With compact=True, columns are parsed directly into the narrow dtypes of
+        COMPACT_IMAGE_POINT_DTYPES instead of being read as 64-bit and narrowed later.
+        """
+        if compact:
+            header = pd.read_csv(path, nrows=0).columns
+            dtypes = {col: dtype for col, dtype in COMPACT_IMAGE_POINT_DTYPES.items() if col in header}
+            df = pd.read_csv(path, dtype=dtypes)  # type: ignore[arg-type]
+            # Constructor handles adding missing optional columns
+            return cls(df).compact()
+
         df = pd.read_csv(path)
         # Constructor handles adding missing optional columns
         return cls(df)
 
+    @property
+    def is_compact(self) -> bool:
+        """True if every column covered by COMPACT_IMAGE_POINT_DTYPES already uses its narrow dtype."""
+        return all(
+            self._df[col].dtype == dtype for col, dtype in COMPACT_IMAGE_POINT_DTYPES.items() if col in self._df.columns
+        )
+
+    def compact(self) -> ImagePoints:
+        """Return a copy stored with the narrow dtypes of COMPACT_IMAGE_POINT_DTYPES.
+
+        Consumers that need full precision (triangulation, bundle adjustment)
+        upcast the columns they use, so a compact table is a drop-in replacement.
+        """
+        if self.is_compact:
+            return self
+        dtypes = {col: dtype for col, dtype in COMPACT_IMAGE_POINT_DTYPES.items() if col in self._df.columns}
+        return ImagePoints._from_validated(self._df.astype(dtypes))
+
     def to_csv(self, path: str | Path) -> None:
         """Save image points to CSV file.
 
@@ -376,7 +544,7 @@ class ImagePoints:
         xy_filled = pd.DataFrame()
         index_key = "sync_index"
         last_cam_id = -1
-        base_df = self.df
+        base_df = self.view
         for (cam_id, object_id, keypoint_id), group in base_df.groupby(["cam_id", "object_id", "keypoint_id"]):
             if last_cam_id != cam_id:
                 logger.info(
@@ -399,7 +567,8 @@ class ImagePoints:
                     merged[col] = merged[col].interpolate(method="linear", limit=max_gap_size)
             xy_filled = pd.concat([xy_filled, merged])
         logger.info("(x,y) gap filling complete")
-        return ImagePoints(xy_filled.dropna(subset=["img_loc_x"]))
+        filled = ImagePoints(xy_filled.dropna(subset=["img_loc_x"]))
+        return filled.compact() if self.is_compact else filled
 
     def filter_to_objects(self, object_ids: Iterable[int]) -> ImagePoints:
         """Return a copy containing only rows whose object_id is in object_ids."""
@@ -411,7 +580,7 @@ class ImagePoints:
             for oid in dropped_ids:
                 n = int((dropped["object_id"] == oid).sum())
                 logger.info(f"filter_to_objects: dropped object_id={oid} ({n} rows)")
-        return ImagePoints(self._df[mask].copy())
+        return ImagePoints._from_validated(self._df[mask])
 
     def triangulate(
         self,
@@ -425,7 +594,7 @@ class ImagePoints:
         of a given (object_id, keypoint_id) are triangulated together into one 3D point,
         stored under STATIC_SYNC_INDEX.
         """
-        xy_df = self.df
+        xy_df = self.view
         if xy_df.empty:
             return WorldPoints(pd.DataFrame(columns=list(WORLD_POINT_COLUMNS.keys())))
 
@@ -471,12 +640,8 @@ class ImagePoints:
             cam_arr = mobile_data["cam_id"].to_numpy()
             obj_arr = mobile_data["object_id"].to_numpy()
             kp_arr = mobile_data["keypoint_id"].to_numpy()
-            xy_arr = np.column_stack(
-                [
-                    mobile_data["img_loc_undistort_x"].to_numpy(),
-                    mobile_data["img_loc_undistort_y"].to_numpy(),
-                ]
-            )
+            # Build DLT rows in float64 regardless of the source column width
+            xy_arr = mobile_data[["img_loc_undistort_x", "img_loc_undistort_y"]].to_numpy(dtype=np.float64)
 
             out_sync, out_obj, out_kp, out_xyz = triangulate_image_points(
                 normalized_projection_matrices,
@@ -510,12 +675,8 @@ class ImagePoints:
             cam_arr = static_data["cam_id"].to_numpy()
             obj_arr = static_data["object_id"].to_numpy()
             kp_arr = static_data["keypoint_id"].to_numpy()
-            xy_arr = np.column_stack(
-                [
-                    static_data["img_loc_undistort_x"].to_numpy(),
-                    static_data["img_loc_undistort_y"].to_numpy(),
-                ]
-            )
+            # Build DLT rows in float64 regardless of the source column width
+            xy_arr = static_data[["img_loc_undistort_x", "img_loc_undistort_y"]].to_numpy(dtype=np.float64)
 
             out_sync, out_obj, out_kp, out_xyz = triangulate_image_points(
                 normalized_projection_matrices,
@@ -556,7 +717,67 @@ class ImagePoints:
             f"{n_mobile_sync} sync indices (+{n_static} static) in {elapsed:.2f}s"
         )
 
-        return WorldPoints(xyz_df)
+        return WorldPoints._from_validated(xyz_df)
+
+
+@dataclass(frozen=True)
+class DenseWorldPoints:
+    """Dense (n_sync, n_points, 3) float32 layout of WorldPoints.
+
+    Rows follow the sorted unique sync indices (STATIC_SYNC_INDEX first when
+    static points are present); columns follow the sorted unique
+    (object_id, keypoint_id) pairs. Unobserved cells are NaN.
+    """
+
+    xyz: NDArray[np.float32]
+    sync_indices: NDArray[np.int64]  # (n_sync,) row -> sync_index
+    point_keys: NDArray[np.int64]  # (n_points, 2) column -> (object_id, keypoint_id)
+    sync_to_row: dict[int, int] = field(repr=False)
+    key_to_column: dict[tuple[int, int], int] = field(repr=False)
+
+    @classmethod
+    def from_long(cls, df: pd.DataFrame) -> DenseWorldPoints:
+        """Scatter a long-format WorldPoints frame into the dense layout."""
+        sync = df["sync_index"].to_numpy(dtype=np.int64)
+        keys = np.column_stack(
+            [df["object_id"].to_numpy(dtype=np.int64), df["keypoint_id"].to_numpy(dtype=np.int64)]
+        ).reshape(-1, 2)
+
+        sync_indices, rows = np.unique(sync, return_inverse=True)
+        point_keys, cols = np.unique(keys, axis=0, return_inverse=True)
+
+        xyz = np.full((len(sync_indices), len(point_keys), 3), np.nan, dtype=np.float32)
+        xyz[rows, cols.reshape(-1)] = df[["x_coord", "y_coord", "z_coord"]].to_numpy(dtype=np.float32)
+
+        return cls(
+            xyz=xyz,
+            sync_indices=sync_indices,
+            point_keys=point_keys,
+            sync_to_row={int(s): i for i, s in enumerate(sync_indices)},
+            key_to_column={(int(o), int(k)): i for i, (o, k) in enumerate(point_keys)},
+        )
+
+    @property
+    def n_points(self) -> int:
+        return len(self.point_keys)
+
+    @property
+    def dynamic_sync_indices(self) -> NDArray[np.int64]:
+        """Sorted sync indices with per-frame data (STATIC_SYNC_INDEX excluded)."""
+        return self.sync_indices[self.sync_indices != STATIC_SYNC_INDEX]
+
+    @property
+    def static_xyz(self) -> NDArray[np.float32] | None:
+        """(n_points, 3) positions of static points, or None if there are none."""
+        row = self.sync_to_row.get(STATIC_SYNC_INDEX)
+        return None if row is None else self.xyz[row]
+
+    def frame(self, sync_index: int) -> NDArray[np.float32]:
+        """Return a (n_points, 3) copy for one sync index, all NaN when absent."""
+        row = self.sync_to_row.get(sync_index)
+        if row is None:
+            return np.full((self.n_points, 3), np.nan, dtype=np.float32)
+        return self.xyz[row].copy()
 
 
 @dataclass(frozen=True)
@@ -582,7 +803,10 @@ class WorldPoints:
                 f"Duplicates may cause incorrect results."
             )
 
-        # calculate start and stop index, excluding static points (sentinel sync_index)
+        self._set_index_range()
+
+    def _set_index_range(self) -> None:
+        """Calculate start and stop index, excluding static points (sentinel sync_index)."""
         non_static = self._df["sync_index"] != STATIC_SYNC_INDEX
         if non_static.any():
             min_index = int(self._df.loc[non_static, "sync_index"].min())
@@ -593,20 +817,51 @@ class WorldPoints:
         object.__setattr__(self, "min_index", min_index)
         object.__setattr__(self, "max_index", max_index)
 
+    @classmethod
+    def _from_validated(cls, df: pd.DataFrame) -> WorldPoints:
+        """Wrap a DataFrame that already satisfies WORLD_POINT_COLUMNS.
+
+        Trusted internal path: skips the defensive copy, type coercion and
+        duplicate check. Only use with frames derived from another WorldPoints
+        (row filters, coordinate replacement) that the caller will not mutate.
+        """
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "_df", df)
+        instance._set_index_range()
+        return instance
+
     @property
     def df(self) -> pd.DataFrame:
         """Return a copy of the underlying DataFrame to maintain immutability."""
         return self._df.copy()
 
+    @property
+    def view(self) -> pd.DataFrame:
+        """Zero-copy access to the underlying DataFrame.
+
+        Returns a shallow frame whose columns are this container's own buffers.
+        Values must not be written in place (see ImagePoints.view); use `df`
+        when a mutable copy is needed.
+        """
+        return self._df.copy(deep=False)
+
     @property
     def points(self) -> NDArray:
         """Return Nx3 numpy array of coordinates."""
         return self._df[["x_coord", "y_coord", "z_coord"]].values
 
+    @cached_property
+    def dense(self) -> DenseWorldPoints:
+        """Dense (n_sync, n_points, 3) float32 layout, built once on first access.
+
+        The container is immutable, so the cache can never drift from the long form.
+        """
+        return DenseWorldPoints.from_long(self._df)
+
     def fill_gaps(self, max_gap_size: int = 3) -> WorldPoints:
         """Fill gaps in 3D point trajectories."""
         xyz_filled = pd.DataFrame()
-        base_df = self.df
+        base_df = self.view
 
         for (object_id, keypoint_id), group in base_df.groupby(["object_id", "keypoint_id"]):
             group = group.sort_values("sync_index")
@@ -637,7 +892,7 @@ class WorldPoints:
         """Apply Butterworth filter to smooth 3D trajectories."""
         # output="ba" returns (b, a) coefficients; scipy stubs don't narrow this
         b, a = butter(order, cutoff_freq, btype="low", fs=fps, output="ba")  # type: ignore[assignment]
-        base_df = self.df
+        base_df = self.view
         xyz_filtered = base_df.copy()
 
         for (object_id, keypoint_id), group in base_df.groupby(["object_id", "keypoint_id"]):
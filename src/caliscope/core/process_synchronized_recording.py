@@ -4,22 +4,27 @@ Pure function that extracts 2D landmarks from synchronized video streams.
 Uses batch synchronization from SynchronizedTimestamps -- no real-time streaming.
 """
 
+import hashlib
 import logging
 import os
 from dataclasses import dataclass
 from pathlib import Path
 from queue import Queue
 from threading import Thread
-from typing import Callable
+from typing import Callable, Literal
 
 import numpy as np
 import pandas as pd
 from numpy.typing import NDArray
 
 from caliscope.cameras.camera_array import CameraData
-from caliscope.core.point_data import ImagePoints
+from caliscope.core.extraction_checkpoint import ExtractionCheckpoint, extraction_fingerprint
+from caliscope.core.point_data import ImagePoints, SyncIndexTriangulator
+from caliscope.core.process_tracking import CameraJob, track_in_processes, tracked_points_table
 from caliscope.packets import PointPacket
+from caliscope.recording.frame_ring import FrameSlot
 from caliscope.recording.frame_source import FrameSource
+from caliscope.recording.seekable_frame_source import SeekableFrameSource
 from caliscope.recording.synchronized_timestamps import SynchronizedTimestamps
 from caliscope.task_manager.cancellation import CancellationToken
 from caliscope.tracker import Tracker
@@ -29,11 +34,22 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class FrameData:
-    """Frame data for a single camera at a sync index."""
+    """Frame data for a single camera at a sync index.
+
+    frame is borrowed from the camera's decode ring (frame_slot) and is reused
+    once the on_frame_data callback returns; copy it to keep it.
+    """
 
     frame: NDArray[np.uint8]
     points: PointPacket | None
     frame_index: int
+    native_size: tuple[int, int] | None = None  # set when frame is reduced; points stay in native pixels
+    frame_slot: FrameSlot | None = None
+
+    def release(self) -> None:
+        """Return frame's buffer to the decode ring. No-op for an ordinary frame."""
+        if self.frame_slot is not None:
+            self.frame_slot.release()
 
 
 def process_synchronized_recording(
@@ -47,14 +63,52 @@ def process_synchronized_recording(
     on_progress: Callable[[int, int], None] | None = None,
     on_frame_data: Callable[[int, dict[int, FrameData]], None] | None = None,
     token: CancellationToken | None = None,
+    triangulator: SyncIndexTriangulator | None = None,
+    reduced_resolution: bool = False,
+    backend: Literal["thread", "process"] = "thread",
+    checkpoint: Path | None = None,
 ) -> ImagePoints:
     """Process synchronized video recordings to extract 2D landmarks.
 
     Each camera decodes forward in its own thread, yielding only the frames
     aligned by SynchronizedTimestamps. A single consumer thread walks sync
     indices in order and assembles cross-camera packets for the live display
-    callback. Bounded queues provide backpressure so memory stays flat.
+    callback. Each camera decodes into a fixed ring of frame buffers that the
+    consumer returns once on_frame_data has seen them, so a slow callback
+    throttles decoding and memory stays flat. FrameData.frame is only valid
+    during the callback.
+
+    When a triangulator is given, each sync index is triangulated as soon as
+    every camera has reported for it, overlapping triangulation with tracking.
+    Read the accumulated 3D result from triangulator.world_points() afterwards.
+
+    With reduced_resolution, each camera decodes at tracker.frame_scale() of
+    its native size. Image points are still reported in native pixels;
+    FrameData.frame is the reduced frame and carries native_size.
+
+    backend="process" tracks each camera in its own worker process instead of a
+    thread, for trackers that hold the GIL. Frames never leave the workers, so
+    on_frame_data is not supported; on_progress, token and triangulator are.
+    The tracker must pickle, and on_progress counts frames tracked across all
+    cameras, scaled to sync indices.
+
+    With a checkpoint directory, points are flushed there every
+    CHECKPOINT_INTERVAL seconds and when processing stops early (see
+    ExtractionCheckpoint). Rerunning with the same directory, recording,
+    tracker and settings resumes after the last saved sync index, seeking to
+    it rather than decoding up to it, and returns the saved points along with
+    the new ones. on_frame_data sees only the sync indices tracked in this run,
+    so an overlay video recorded through it starts where the run resumed. The
+    checkpoint is deleted once every sync index is done. Checkpoints require
+    the thread backend.
     """
+    if backend not in ("thread", "process"):
+        raise ValueError(f"backend must be 'thread' or 'process', got {backend!r}")
+    if backend == "process" and on_frame_data is not None:
+        raise ValueError("on_frame_data needs decoded frames, which the process backend does not return")
+    if backend == "process" and checkpoint is not None:
+        raise ValueError("checkpoint requires the thread backend")
+
     all_sync_indices = synced_timestamps.sync_indices[::subsample]
     total = len(all_sync_indices)
     cam_ids = [c for c in synced_timestamps.cam_ids if (recording_dir / f"cam_{c}.mp4").exists()]
@@ -64,18 +118,58 @@ def process_synchronized_recording(
         f"(subsample={subsample}, total available={len(synced_timestamps.sync_indices)})"
     )
 
+    saved: ExtractionCheckpoint | None = None
+    resumed = pd.DataFrame()
+    done_before = 0
+    if checkpoint is not None:
+        fingerprint = extraction_fingerprint(
+            [recording_dir / f"cam_{cam_id}.mp4" for cam_id in cam_ids],
+            tracker,
+            subsample=subsample,
+            reduced_resolution=reduced_resolution,
+            sync_table=hashlib.sha256(synced_timestamps.frame_table.tobytes()).hexdigest(),
+        )
+        saved = ExtractionCheckpoint(checkpoint, fingerprint)
+        if saved.resuming:
+            if on_frame_data is not None:
+                logger.warning(
+                    f"Resuming after sync index {saved.completed_through}: "
+                    "frame data (e.g. an overlay video) covers only the sync indices after it"
+                )
+            resumed = saved.points()
+            done_before = int(np.searchsorted(all_sync_indices, saved.completed_through, side="right"))
+            all_sync_indices = all_sync_indices[done_before:]
+            if triangulator is not None and len(resumed) > 0:
+                _triangulate_table(triangulator, resumed)
+
     # Build per-camera work: sync_index -> frame_index mapping and wanted set.
     cam_work: dict[int, dict[int, int]] = {}  # cam_id -> {frame_index: sync_index}
+    selected = np.asarray(all_sync_indices, dtype=np.int64)
     for cam_id in cam_ids:
-        frame_to_sync: dict[int, int] = {}
-        for sync_index in all_sync_indices:
-            frame_index = synced_timestamps.frame_for(sync_index, cam_id)
-            if frame_index is not None:
-                frame_to_sync[frame_index] = sync_index
-        cam_work[cam_id] = frame_to_sync
+        frame_indices = synced_timestamps.frames_for(cam_id, selected)
+        present = frame_indices >= 0
+        cam_work[cam_id] = dict(zip(frame_indices[present].tolist(), selected[present].tolist()))
 
     decode_threads = max(1, (os.cpu_count() or 4) // max(1, len(cam_ids)))
+
+    if backend == "process":
+        jobs = [
+            CameraJob(
+                video_path=recording_dir / f"cam_{cam_id}.mp4",
+                cam_id=cam_id,
+                frame_indices=list(cam_work[cam_id]),
+                sync_indices=list(cam_work[cam_id].values()),
+                rotation_count=cameras[cam_id].rotation_count,
+                scale=tracker.frame_scale(cameras[cam_id].size) if reduced_resolution else 1.0,
+                decode_threads=decode_threads,
+            )
+            for cam_id in cam_ids
+        ]
+        return _process_in_workers(jobs, tracker, synced_timestamps, total, on_progress, token, triangulator)
+
     QUEUE_DEPTH = 8
+    # Queued frames, plus the one the consumer buffers ahead and the one being decoded.
+    RING_SLOTS = QUEUE_DEPTH + 2
 
     # Per-camera bounded queue: producer thread decodes + tracks, pushes results.
     cam_queues: dict[int, Queue[tuple[int, FrameData] | None]] = {
@@ -88,12 +182,16 @@ def process_synchronized_recording(
         camera = cameras[cam_id]
         q = cam_queues[cam_id]
 
-        source = FrameSource(
+        # A resumed run starts mid-video; seek there instead of decoding up to it.
+        source_type = SeekableFrameSource if done_before else FrameSource
+        source = source_type(
             recording_dir,
             cam_id,
             decode_threads=decode_threads,
             wanted_indices=set(frame_to_sync),
             pixel_format=tracker.pixel_format,
+            scale=tracker.frame_scale(camera.size) if reduced_resolution else 1.0,
+            ring_slots=RING_SLOTS,
         )
         try:
             while True:
@@ -101,14 +199,22 @@ def process_synchronized_recording(
                     break
                 raw = source.next_frame()
                 if raw is None:
+                    cam_exhausted.add(cam_id)
                     break
                 sync_index = frame_to_sync[raw.frame_index]
-                points = tracker.get_points(raw.frame, cam_id, camera.rotation_count)
-                q.put((sync_index, FrameData(raw.frame, points, raw.frame_index)))
+                try:
+                    points = tracker.get_points(raw.frame, cam_id, camera.rotation_count, native_size=raw.native_size)
+                except BaseException:
+                    raw.release()
+                    raise
+                q.put((sync_index, FrameData(raw.frame, points, raw.frame_index, raw.native_size, raw.frame_slot)))
         finally:
             source.close()
             q.put(None)  # sentinel
 
+    # Cameras whose worker ran out of frames, as opposed to stopping early.
+    cam_exhausted: set[int] = set()
+
     # Start per-camera decode threads.
     threads: list[Thread] = []
     for cam_id in cam_ids:
@@ -123,6 +229,18 @@ def process_synchronized_recording(
     cam_buffers: dict[int, tuple[int, FrameData] | None] = {cam_id: None for cam_id in cam_ids}
     cam_done: set[int] = set()
 
+    # Checkpoint bookkeeping: point_rows[:complete_rows] covers every sync index
+    # up to completed_through, of which point_rows[:flushed_rows] is saved.
+    completed_through = saved.completed_through if saved is not None else -1
+    complete_rows = flushed_rows = 0
+    finished = False
+
+    def _flush() -> None:
+        nonlocal flushed_rows
+        assert saved is not None
+        saved.save(pd.DataFrame(point_rows[flushed_rows:complete_rows]), completed_through)
+        flushed_rows = complete_rows
+
     def _pull(cam_id: int) -> tuple[int, FrameData] | None:
         """Get the next result for a camera, buffering one-ahead."""
         if cam_buffers[cam_id] is not None:
@@ -141,6 +259,7 @@ def process_synchronized_recording(
                 break
 
             frame_data: dict[int, FrameData] = {}
+            frame_times: dict[int, float] = {}
 
             for cam_id in cam_ids:
                 if cam_id in cam_done:
@@ -152,26 +271,90 @@ def process_synchronized_recording(
                 if item_sync == sync_index:
                     frame_data[cam_id] = fd
                     frame_time = synced_timestamps.time_for(cam_id, fd.frame_index)
+                    frame_times[cam_id] = frame_time
                     _accumulate_points(point_rows, sync_index, cam_id, fd.frame_index, frame_time, fd.points)
                     cam_buffers[cam_id] = None  # consumed
 
-            if on_frame_data is not None:
-                on_frame_data(sync_index, frame_data)
+            try:
+                # Every camera has reported for this sync index; triangulate it now.
+                if triangulator is not None:
+                    _triangulate_frame(triangulator, sync_index, frame_data, frame_times)
+
+                if on_frame_data is not None:
+                    on_frame_data(sync_index, frame_data)
+            finally:
+                for fd in frame_data.values():
+                    fd.release()
             if on_progress is not None:
-                on_progress(i + 1, total)
+                on_progress(done_before + i + 1, total)
+
+            # A camera that stopped early (cancelled or failed) may be missing
+            # from this sync index, so it must not count as completed.
+            if saved is not None and not (token is not None and token.is_cancelled) and cam_done <= cam_exhausted:
+                completed_through, complete_rows = sync_index, len(point_rows)
+                if saved.due():
+                    _flush()
+        else:
+            finished = True
 
     finally:
-        # Drain queues so producer threads aren't blocked on put().
+        if saved is not None:
+            if finished and (len(all_sync_indices) == 0 or completed_through == all_sync_indices[-1]):
+                saved.clear()
+            elif complete_rows > flushed_rows or completed_through > saved.completed_through:
+                _flush()
+
+        # Return buffered frames and drain queues so producer threads aren't
+        # blocked on put() or on a full frame ring.
         for cam_id in cam_ids:
+            buffered = cam_buffers.pop(cam_id)
+            if buffered is not None:
+                buffered[1].release()
             if cam_id not in cam_done:
                 while True:
                     item = cam_queues[cam_id].get()
                     if item is None:
                         break
+                    item[1].release()
         for t in threads:
             t.join(timeout=5.0)
 
-    return _build_image_points(point_rows)
+    image_points = _build_image_points(point_rows)
+    if len(resumed) > 0:
+        return ImagePoints(pd.concat([resumed, image_points.df], ignore_index=True))
+    return image_points
+
+
+def _process_in_workers(
+    jobs: list[CameraJob],
+    tracker: Tracker,
+    synced_timestamps: SynchronizedTimestamps,
+    total: int,
+    on_progress: Callable[[int, int], None] | None,
+    token: CancellationToken | None,
+    triangulator: SyncIndexTriangulator | None,
+) -> ImagePoints:
+    """Process backend of process_synchronized_recording."""
+    total_frames = sum(len(job.frame_indices) for job in jobs)
+    frames_done = 0
+    reported = 0
+
+    def _on_frame(cam_id: int, processed: int, n_points: int) -> None:
+        nonlocal frames_done, reported
+        frames_done += 1
+        current = frames_done * total // max(total_frames, 1)
+        if on_progress is not None and current > reported:
+            reported = current
+            on_progress(current, total)
+
+    results = track_in_processes(jobs, tracker, max_workers=len(jobs), token=token, on_frame=_on_frame)
+    if token is not None and token.is_cancelled:
+        logger.info("Processing cancelled")
+
+    table = tracked_points_table(results, synced_timestamps)
+    if triangulator is not None:
+        _triangulate_table(triangulator, table)
+    return ImagePoints(table)
 
 
 def get_initial_thumbnails(
@@ -245,6 +428,55 @@ def _accumulate_points(
         )
 
 
+def _triangulate_frame(
+    triangulator: SyncIndexTriangulator,
+    sync_index: int,
+    frame_data: dict[int, FrameData],
+    frame_times: dict[int, float],
+) -> None:
+    """Hand one sync index's observations from all cameras to the triangulator.
+
+    frame_time is averaged per observation, matching ImagePoints.triangulate.
+    """
+    packets = [(cam_id, fd.points) for cam_id, fd in frame_data.items() if fd.points is not None]
+    packets = [(cam_id, points) for cam_id, points in packets if len(points.keypoint_id) > 0]
+    if len(packets) < 2:
+        return
+
+    camera_ids = np.concatenate([np.full(len(points.keypoint_id), cam_id) for cam_id, points in packets])
+    triangulator.add(
+        sync_index,
+        camera_ids=camera_ids,
+        object_ids=np.concatenate([np.asarray(points.object_id, dtype=np.int64) for _, points in packets]),
+        keypoint_ids=np.concatenate([np.asarray(points.keypoint_id, dtype=np.int64) for _, points in packets]),
+        img_xy=np.concatenate([np.asarray(points.img_loc, dtype=np.float64).reshape(-1, 2) for _, points in packets]),
+        frame_time=float(np.mean([frame_times[int(cam_id)] for cam_id in camera_ids])),
+    )
+
+
+def _triangulate_table(triangulator: SyncIndexTriangulator, table: pd.DataFrame) -> None:
+    """Triangulate a sync-index-ordered points table one sync index at a time, as _triangulate_frame does."""
+    sync_index = table["sync_index"].to_numpy()
+    cam_id = table["cam_id"].to_numpy()
+    object_id = table["object_id"].to_numpy()
+    keypoint_id = table["keypoint_id"].to_numpy()
+    img_xy = table[["img_loc_x", "img_loc_y"]].to_numpy(dtype=np.float64)
+    frame_time = table["frame_time"].to_numpy()
+
+    starts = np.flatnonzero(np.r_[True, sync_index[1:] != sync_index[:-1]])
+    for start, stop in zip(starts, np.r_[starts[1:], len(sync_index)]):
+        if len(np.unique(cam_id[start:stop])) < 2:
+            continue
+        triangulator.add(
+            int(sync_index[start]),
+            camera_ids=cam_id[start:stop],
+            object_ids=object_id[start:stop],
+            keypoint_ids=keypoint_id[start:stop],
+            img_xy=img_xy[start:stop],
+            frame_time=float(np.mean(frame_time[start:stop])),
+        )
+
+
 def _build_image_points(point_rows: list[dict]) -> ImagePoints:
     """Construct ImagePoints from accumulated point data."""
     if not point_rows:
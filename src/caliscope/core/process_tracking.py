@@ -0,0 +1,392 @@
+"""Landmark tracking of independent camera jobs in worker threads or processes.
+
+A CameraJob is one camera's frames to track: the whole video, or one
+keyframe-aligned segment of it when a long video is split for parallelism.
+Each job decodes with its own SeekableFrameSource, resets the tracker's state
+for its camera before the first frame, and returns only the detected points,
+as flat NumPy arrays.
+
+track_in_threads suits trackers whose detection releases the GIL (OpenCV,
+onnxruntime). Trackers that hold it serialize across threads; track_in_processes
+runs each job in a worker process instead, so no frames cross the process
+boundary. Workers are started with the "spawn" method on every platform:
+forking a process that already runs decoder and Qt threads is not safe. The
+tracker is pickled once per worker (see the __reduce__ of trackers holding
+OpenCV or onnxruntime objects) and given an equal share of the cores through
+Tracker.set_thread_budget, as is each copy of the tracker made for a
+threaded segment. Progress streams back through a queue that the
+calling thread drains, and a shared event carries cancellation into the workers.
+"""
+
+import copy
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from collections import Counter
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from caliscope.recording.seekable_frame_source import SeekableFrameSource
+from caliscope.recording.synchronized_timestamps import SynchronizedTimestamps
+from caliscope.task_manager.cancellation import CancellationToken
+from caliscope.tracker import Tracker
+
+logger = logging.getLogger(__name__)
+
+# How long the coordinating thread waits on progress before re-checking
+# cancellation and worker completion.
+_POLL_INTERVAL = 0.05
+
+
+@dataclass(frozen=True)
+class CameraJob:
+    """One camera's frames to track, and how to decode them.
+
+    frame_indices (ascending) are the frames to decode; frame_indices[i] is
+    reported at sync index sync_indices[i].
+    """
+
+    video_path: Path
+    cam_id: int
+    frame_indices: Sequence[int]
+    sync_indices: Sequence[int]
+    rotation_count: int = 0
+    scale: float = 1.0
+    decode_threads: int = 1
+
+
+@dataclass(frozen=True)
+class TrackedPoints:
+    """Every point the tracker reported for one job, one row per point.
+
+    sync_index, frame_index: (n,) int64 where each point was detected
+    frame_time: (n,) float64 presentation time of that frame in the video
+    object_id, keypoint_id: (n,) int64
+    img_loc: (n, 2) float64 native pixels
+    obj_loc: (n, 3) float64, NaN where the tracker does not report it
+    frames_processed: frames tracked, fewer than requested if cancelled
+    """
+
+    cam_id: int
+    sync_index: np.ndarray
+    frame_index: np.ndarray
+    frame_time: np.ndarray
+    object_id: np.ndarray
+    keypoint_id: np.ndarray
+    img_loc: np.ndarray
+    obj_loc: np.ndarray
+    frames_processed: int
+
+    def __len__(self) -> int:
+        return len(self.keypoint_id)
+
+
+def _track_job(
+    job: CameraJob,
+    tracker: Tracker,
+    is_cancelled: Callable[[], bool],
+    report: Callable[[int], None],
+) -> TrackedPoints:
+    """Decode job's frames, track them, and return the points. report(n_points) follows each frame."""
+    sync_for = dict(zip(job.frame_indices, job.sync_indices))
+    columns: dict[str, list[np.ndarray]] = {
+        name: [] for name in ("sync_index", "frame_index", "frame_time", "object_id", "keypoint_id", "img", "obj")
+    }
+    processed = 0
+
+    tracker.reset(job.cam_id)
+    source = SeekableFrameSource.from_path(
+        job.video_path,
+        cam_id=job.cam_id,
+        decode_threads=job.decode_threads,
+        wanted_indices=set(sync_for),
+        pixel_format=tracker.pixel_format,
+        scale=job.scale,
+    )
+    try:
+        while not is_cancelled() and (raw := source.next_frame()) is not None:
+            points = tracker.get_points(raw.frame, job.cam_id, job.rotation_count, native_size=raw.native_size)
+            n_points = len(points.keypoint_id)
+            if n_points > 0:
+                columns["sync_index"].append(np.full(n_points, sync_for[raw.frame_index], dtype=np.int64))
+                columns["frame_index"].append(np.full(n_points, raw.frame_index, dtype=np.int64))
+                columns["frame_time"].append(np.full(n_points, raw.frame_time, dtype=np.float64))
+                columns["object_id"].append(np.asarray(points.object_id, dtype=np.int64))
+                columns["keypoint_id"].append(np.asarray(points.keypoint_id, dtype=np.int64))
+                columns["img"].append(np.asarray(points.img_loc, dtype=np.float64).reshape(-1, 2))
+                if points.obj_loc is None:
+                    columns["obj"].append(np.full((n_points, 3), np.nan))
+                else:
+                    columns["obj"].append(np.asarray(points.obj_loc, dtype=np.float64).reshape(-1, 3))
+            processed += 1
+            report(n_points)
+    finally:
+        source.close()
+
+    def _join(name: str, empty: np.ndarray) -> np.ndarray:
+        return np.concatenate(columns[name]) if columns[name] else empty
+
+    return TrackedPoints(
+        cam_id=job.cam_id,
+        sync_index=_join("sync_index", np.empty(0, dtype=np.int64)),
+        frame_index=_join("frame_index", np.empty(0, dtype=np.int64)),
+        frame_time=_join("frame_time", np.empty(0)),
+        object_id=_join("object_id", np.empty(0, dtype=np.int64)),
+        keypoint_id=_join("keypoint_id", np.empty(0, dtype=np.int64)),
+        img_loc=_join("img", np.empty((0, 2))),
+        obj_loc=_join("obj", np.empty((0, 3))),
+        frames_processed=processed,
+    )
+
+
+class _CameraProgress:
+    """Folds per-job progress into per-camera progress for on_frame / on_complete.
+
+    on_frame(cam_id, frames, n_points) counts frames across all of a camera's
+    jobs; on_complete(cam_id) fires once every job of the camera has finished
+    and all of its frames have been reported.
+    """
+
+    def __init__(
+        self,
+        jobs: Sequence[CameraJob],
+        on_frame: Callable[[int, int, int], None] | None,
+        on_complete: Callable[[int], None] | None,
+    ) -> None:
+        self._cam_ids = [job.cam_id for job in jobs]
+        self._jobs_left = Counter(self._cam_ids)
+        self._cam_frames = dict.fromkeys(self._cam_ids, 0)
+        self._job_frames = [0] * len(jobs)
+        self._finished: dict[int, int] = {}  # job position -> frames it processed
+        self._on_frame = on_frame
+        self._on_complete = on_complete
+        self._lock = threading.Lock()
+
+    def frame(self, position: int, n_points: int) -> None:
+        with self._lock:
+            cam_id = self._cam_ids[position]
+            self._job_frames[position] += 1
+            self._cam_frames[cam_id] += 1
+            if self._on_frame is not None:
+                self._on_frame(cam_id, self._cam_frames[cam_id], n_points)
+            self._settle(position, flush=False)
+
+    def finished(self, position: int, frames_processed: int) -> None:
+        with self._lock:
+            self._finished[position] = frames_processed
+            self._settle(position, flush=False)
+
+    def flush(self) -> None:
+        with self._lock:
+            for position in list(self._finished):
+                self._settle(position, flush=True)
+
+    def _settle(self, position: int, flush: bool) -> None:
+        # A process worker's progress and result travel through different
+        # pipes; a job only counts as done once its last frame was reported.
+        if position not in self._finished:
+            return
+        if not flush and self._job_frames[position] < self._finished[position]:
+            return
+        del self._finished[position]
+        cam_id = self._cam_ids[position]
+        self._jobs_left[cam_id] -= 1
+        if self._jobs_left[cam_id] == 0 and self._on_complete is not None:
+            self._on_complete(cam_id)
+
+
+def track_in_threads(
+    jobs: Sequence[CameraJob],
+    tracker: Tracker,
+    *,
+    max_workers: int | None = None,
+    token: CancellationToken | None = None,
+    on_frame: Callable[[int, int, int], None] | None = None,
+    on_complete: Callable[[int], None] | None = None,
+) -> list[TrackedPoints]:
+    """Run each job in a worker thread and return the tracked points in job order.
+
+    Trackers keep per-camera state keyed by cam_id, so jobs that share a
+    camera each track with their own copy of the tracker. Callbacks and
+    cancellation behave as in track_in_processes, except that callbacks are
+    invoked from the worker threads.
+    """
+    if not jobs:
+        return []
+
+    progress = _CameraProgress(jobs, on_frame, on_complete)
+    jobs_per_camera = Counter(job.cam_id for job in jobs)
+    failed = threading.Event()
+    n_workers = min(len(jobs), max_workers or len(jobs))
+
+    def _is_cancelled() -> bool:
+        return failed.is_set() or (token is not None and token.is_cancelled)
+
+    def _run(position: int, job: CameraJob) -> TrackedPoints:
+        job_tracker = tracker
+        if jobs_per_camera[job.cam_id] > 1:
+            job_tracker = copy.deepcopy(tracker)
+            job_tracker.set_thread_budget(_thread_budget(n_workers))
+        try:
+            result = _track_job(job, job_tracker, _is_cancelled, lambda n_points: progress.frame(position, n_points))
+        finally:
+            if job_tracker is not tracker:
+                job_tracker.cleanup()
+        progress.finished(position, result.frames_processed)
+        return result
+
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = [executor.submit(_run, position, job) for position, job in enumerate(jobs)]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            failed.set()
+            for future in futures:
+                future.cancel()
+            raise
+
+
+# Per-worker state, set by _init_worker when the pool starts each process.
+_worker_tracker: Tracker | None = None
+_worker_progress = None
+_worker_cancel = None
+
+
+def _thread_budget(n_workers: int) -> int:
+    """Threads each of n_workers concurrent tracker copies may use without oversubscribing the cores."""
+    return max(1, (os.cpu_count() or 1) // n_workers)
+
+
+def _init_worker(tracker: Tracker, thread_budget: int, progress_queue, cancel_event) -> None:
+    global _worker_tracker, _worker_progress, _worker_cancel
+    tracker.set_thread_budget(thread_budget)
+    _worker_tracker = tracker
+    _worker_progress = progress_queue
+    _worker_cancel = cancel_event
+
+
+def _track_in_worker(position: int, job: CameraJob) -> TrackedPoints:
+    """Process pool entry point for one job."""
+    assert _worker_tracker is not None, "worker not initialized"
+    return _track_job(
+        job,
+        _worker_tracker,
+        _worker_cancel.is_set,
+        lambda n_points: _worker_progress.put((position, n_points)),
+    )
+
+
+def track_in_processes(
+    jobs: Sequence[CameraJob],
+    tracker: Tracker,
+    *,
+    max_workers: int | None = None,
+    token: CancellationToken | None = None,
+    on_frame: Callable[[int, int, int], None] | None = None,
+    on_complete: Callable[[int], None] | None = None,
+) -> list[TrackedPoints]:
+    """Run each job in a worker process and return the tracked points in job order.
+
+    on_frame(cam_id, frames_processed, n_points) is called from the calling
+    thread as workers report each frame, counting frames across all of the
+    camera's jobs; on_complete(cam_id) once all of a camera's jobs finish.
+    Cancelling token stops every worker at its next frame; the points found up
+    to then are still returned. A worker error is re-raised here once the
+    remaining workers have been told to stop.
+    """
+    if not jobs:
+        return []
+
+    context = multiprocessing.get_context("spawn")
+    progress_queue = context.Queue()
+    cancel_event = context.Event()
+    progress = _CameraProgress(jobs, on_frame, on_complete)
+    results: list[TrackedPoints | None] = [None] * len(jobs)
+
+    def _drain(timeout: float | None) -> None:
+        try:
+            message = progress_queue.get(timeout=timeout) if timeout else progress_queue.get_nowait()
+            while True:
+                progress.frame(*message)
+                message = progress_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    n_workers = min(len(jobs), max_workers or len(jobs))
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(tracker, _thread_budget(n_workers), progress_queue, cancel_event),
+    ) as executor:
+        futures = {executor.submit(_track_in_worker, position, job): position for position, job in enumerate(jobs)}
+        pending = set(futures)
+        try:
+            while pending:
+                if token is not None and token.is_cancelled and not cancel_event.is_set():
+                    logger.info("Cancelling tracking workers")
+                    cancel_event.set()
+                _drain(_POLL_INTERVAL)
+                done, pending = wait(pending, timeout=0, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    results[futures[future]] = result
+                    progress.finished(futures[future], result.frames_processed)
+        except BaseException:
+            cancel_event.set()
+            for future in pending:
+                future.cancel()
+            raise
+
+    # Workers have exited, so everything they queued is now readable.
+    _drain(None)
+    progress.flush()
+    progress_queue.close()
+    return [result for result in results if result is not None]
+
+
+def tracked_points_table(
+    results: Sequence[TrackedPoints], synced_timestamps: SynchronizedTimestamps | None = None
+) -> pd.DataFrame:
+    """ImagePoints columns for every tracked point, ordered by sync index, then by position in results.
+
+    frame_time comes from synced_timestamps when given, otherwise from the video's own timestamps.
+    """
+
+    def _column(values: list[np.ndarray], dtype: type = np.int64) -> np.ndarray:
+        return np.concatenate(values) if values else np.empty(0, dtype=dtype)
+
+    sync_index = _column([r.sync_index for r in results])
+    img_loc = _column([r.img_loc for r in results], np.float64).reshape(-1, 2)
+    obj_loc = _column([r.obj_loc for r in results], np.float64).reshape(-1, 3)
+
+    table = pd.DataFrame(
+        {
+            "sync_index": sync_index,
+            "cam_id": _column([np.full(len(r), r.cam_id, dtype=np.int64) for r in results]),
+            "frame_index": _column([r.frame_index for r in results]),
+            "frame_time": _column(
+                [
+                    r.frame_time if synced_timestamps is None else synced_timestamps.times_for(r.cam_id, r.frame_index)
+                    for r in results
+                ],
+                np.float64,
+            ),
+            "object_id": _column([r.object_id for r in results]),
+            "keypoint_id": _column([r.keypoint_id for r in results]),
+            "img_loc_x": img_loc[:, 0],
+            "img_loc_y": img_loc[:, 1],
+            "obj_loc_x": obj_loc[:, 0],
+            "obj_loc_y": obj_loc[:, 1],
+            "obj_loc_z": obj_loc[:, 2],
+        }
+    )
+    # A stable sort keeps each camera's points in results order within a sync index.
+    return table.iloc[np.argsort(sync_index, kind="stable")].reset_index(drop=True)
@@ -215,7 +215,7 @@ def compute_depth_ratios(capture_volume: "CaptureVolume") -> dict[int, float]:
     """
     from caliscope.core.point_data import STATIC_SYNC_INDEX
 
-    world_df = capture_volume.world_points.df
+    world_df = capture_volume.world_points.view
     moving = world_df[world_df["sync_index"] != STATIC_SYNC_INDEX]
     if moving.empty:
         return {cam_id: float("nan") for cam_id in capture_volume.camera_array.posed_cameras}
@@ -35,7 +35,7 @@ from caliscope.estimators.vertical_solver import (
     fit_gravity,
     gravity_vec_from_roll_pitch,
 )
-from caliscope.recording.frame_source import FrameSource
+from caliscope.recording.seekable_frame_source import SeekableFrameSource
 from caliscope.recording.video_utils import read_video_properties
 
 logger = logging.getLogger(__name__)
@@ -186,7 +186,7 @@ def _up_vectors_for_camera(
     indices = sample_frame_indices(properties["frame_count"], frames_per_camera)
 
     ups: list[NDArray] = []
-    source = FrameSource.from_path(video_path, cam_id=cam_id, wanted_indices=set(indices))
+    source = SeekableFrameSource.from_path(video_path, cam_id=cam_id, wanted_indices=set(indices))
     try:
         while (packet := source.next_frame()) is not None:
             image, scale_x, scale_y = preprocess_frame(packet.frame)
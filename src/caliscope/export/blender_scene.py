@@ -253,25 +253,28 @@ def _keypoint_trajectories(world_points: WorldPoints) -> tuple[list[int], list[i
     Gaps are held at the nearest observed sample (display only; the source
     CSV stays honest). Keypoints never observed are dropped.
     """
-    df = world_points.df
-    df = df[df["sync_index"] != STATIC_SYNC_INDEX]
-    if df.empty:
+    dense = world_points.dense
+    dynamic_rows = dense.sync_indices != STATIC_SYNC_INDEX
+    if not dynamic_rows.any():
         raise ValueError("WorldPoints contains no dynamic observations to export.")
 
-    object_counts = df["object_id"].value_counts()
+    observed = ~np.isnan(dense.xyz[dynamic_rows, :, 0])
+    object_ids = dense.point_keys[:, 0]
+    unique_objects = np.unique(object_ids[observed.any(axis=0)])
+    object_counts = {int(o): int(observed[:, object_ids == o].sum()) for o in unique_objects}
     if len(object_counts) > 1:
-        logger.warning(f"Multiple object_ids {list(object_counts.index)}; exporting the most observed.")
-    df = df[df["object_id"] == object_counts.idxmax()]
-
-    frames = sorted(int(s) for s in df["sync_index"].unique())
-    keypoint_ids = sorted(int(k) for k in df["keypoint_id"].unique())
-    frame_pos = {f: i for i, f in enumerate(frames)}
-    keypoint_pos = {k: i for i, k in enumerate(keypoint_ids)}
-
-    positions = np.full((len(frames), len(keypoint_ids), 3), np.nan)
-    rows = df["sync_index"].map(frame_pos).to_numpy()
-    cols = df["keypoint_id"].map(keypoint_pos).to_numpy()
-    positions[rows, cols] = df[["x_coord", "y_coord", "z_coord"]].to_numpy()
+        ranked = sorted(object_counts, key=lambda o: -object_counts[o])
+        logger.warning(f"Multiple object_ids {ranked}; exporting the most observed.")
+    object_id = max(object_counts, key=lambda o: object_counts[o])
+
+    # Keep frames and keypoints of the chosen object that have at least one sample
+    columns = np.flatnonzero((object_ids == object_id) & observed.any(axis=0))
+    rows = np.flatnonzero(dynamic_rows)
+    rows = rows[observed[:, columns].any(axis=1)]
+
+    frames = [int(s) for s in dense.sync_indices[rows]]
+    keypoint_ids = [int(k) for k in dense.point_keys[columns, 1]]
+    positions = dense.xyz[np.ix_(rows, columns)].astype(np.float64)
 
     # Hold gaps at the nearest observed sample: forward fill, then backward.
     for k in range(positions.shape[1]):
@@ -26,7 +26,7 @@ from caliscope.core.frame_selector import IntrinsicCoverageReport, select_calibr
 from caliscope.core.point_data import ImagePoints
 from caliscope.packets import PointPacket, TrackedFrame
 from caliscope.recording.frame_packet_streamer import create_streamer
-from caliscope.recording.frame_source import FrameSource
+from caliscope.recording.seekable_frame_source import SeekableFrameSource
 from caliscope.task_manager.cancellation import CancellationToken
 from caliscope.task_manager.task_handle import TaskHandle
 from caliscope.task_manager.task_manager import TaskManager
@@ -35,6 +35,9 @@ from caliscope.tracker import Tracker
 
 logger = logging.getLogger(__name__)
 
+# Frame buffers the preview streamer decodes into; playback waits while all are queued.
+STREAM_RING_SLOTS = 4
+
 
 class IntrinsicCalibrationState(Enum):
     """Workflow states for intrinsic calibration.
@@ -56,8 +59,9 @@ class IntrinsicCalibrationPresenter(QObject):
     submission of calibration to TaskManager. Exposes a display_queue for
     the View's processing thread to consume directly (avoids GUI thread hop).
 
-    Collection decodes forward through the video via FrameSource.next_frame() with
-    wanted_indices filtering, skipping BGR conversion on unwanted frames.
+    Collection reads the video via SeekableFrameSource.next_frame() with
+    wanted_indices filtering, seeking past keyframes between samples and
+    skipping BGR conversion on unwanted frames.
 
     A FramePacketStreamer provides the initial frame for display.
 
@@ -144,6 +148,7 @@ class IntrinsicCalibrationPresenter(QObject):
             tracker=self._tracker,
             end_behavior="pause",  # Pause at end for interactive scrubbing
             pixel_format=self._tracker.pixel_format,
+            ring_slots=STREAM_RING_SLOTS,  # bounds frames queued ahead of a slow consumer
         )
         self._frame_queue: Queue[TrackedFrame] = Queue()
         self._streamer.subscribe(self._frame_queue)
@@ -294,15 +299,15 @@ class IntrinsicCalibrationPresenter(QObject):
         self._show_first_frame()
 
     def _run_collection(self) -> None:
-        """Batch collection loop — decodes the video once forward, sampling every Nth frame.
+        """Batch collection loop — reads the video once forward, sampling every Nth frame.
 
-        Creates a temporary FrameSource, does a single forward pass over the
-        subsampled frame indices, tracks each, accumulates detected points, and
-        emits for display.
+        Creates a temporary SeekableFrameSource, does a single forward pass over
+        the subsampled frame indices, tracks each, accumulates detected points,
+        and emits for display.
         """
         frame_skip = max(1, self._frame_skip)
         wanted = set(range(0, self._streamer.last_frame_index + 1, frame_skip))
-        frame_source = FrameSource(
+        frame_source = SeekableFrameSource(
             self._video_path.parent,
             self._cam_id,
             wanted_indices=wanted,
@@ -363,6 +368,10 @@ class IntrinsicCalibrationPresenter(QObject):
             if tracked_frame.frame_index == -1:
                 continue
 
+            # The display keeps frames past this loop, so hand it its own copy
+            # and return the ring slot to the streamer.
+            tracked_frame = tracked_frame.detached()
+
             if self._first_tracked_frame is None:
                 self._first_tracked_frame = tracked_frame
 
@@ -544,4 +553,9 @@ class IntrinsicCalibrationPresenter(QObject):
 
         # Clean up streamer
         self._streamer.unsubscribe(self._frame_queue)
+        while True:
+            try:
+                self._frame_queue.get_nowait().release()
+            except Empty:
+                break
         self._streamer.close()
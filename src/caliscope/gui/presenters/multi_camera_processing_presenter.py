@@ -474,8 +474,9 @@ class MultiCameraProcessingPresenter(QObject):
             return
         self._last_thumbnail_time = now
         for cam_id, data in frame_data.items():
-            self._thumbnails[cam_id] = data.frame
-            self.thumbnail_updated.emit(cam_id, data.frame, data.points)
+            frame = data.frame.copy()  # data.frame is a decoder buffer, reused after this callback
+            self._thumbnails[cam_id] = frame
+            self.thumbnail_updated.emit(cam_id, frame, data.points)
 
     def _on_processing_complete(self, image_points: ImagePoints) -> None:
         """Handle successful processing completion."""
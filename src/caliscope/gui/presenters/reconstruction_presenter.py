@@ -11,15 +11,18 @@ pattern. States are computed from reality (task state + file existence).
 from __future__ import annotations
 
 import logging
+import shutil
 from enum import Enum, auto
 from pathlib import Path
 
 from PySide6.QtCore import QObject, Qt, Signal
 
 from caliscope.cameras.camera_array import CameraArray
+from caliscope.core.point_data import SyncIndexTriangulator
 from caliscope.core.process_synchronized_recording import process_synchronized_recording
 from caliscope.gui.geometry.wireframe import WireframeSegment, wireframe_segments_from_view
 from caliscope.reconstruction.reconstruct_xyz import reconstruct_xyz
+from caliscope.reconstruction.xy_cache import load_cached_image_points, save_image_points, tracking_fingerprint
 from caliscope.recording.overlay_video_writer import OverlayVideoWriter
 from caliscope.recording.synchronized_timestamps import SynchronizedTimestamps
 from caliscope.repositories.project_settings_repository import ProjectSettingsRepository
@@ -292,10 +295,16 @@ class ReconstructionPresenter(QObject):
         self._emit_state_changed()
         logger.info(f"Selected tracker: {tracker}")
 
-    def start_reconstruction(self) -> None:
+    def start_reconstruction(self, force_retrack: bool = False) -> None:
         """Start the reconstruction process.
 
-        Requires both recording and tracker to be selected.
+        Requires both recording and tracker to be selected. When the stored
+        xy_{tracker}.csv was produced from the same videos with the same tracker
+        configuration, stage 1 is skipped and only triangulation reruns (the
+        common case after a recalibration). The fingerprint does not see changes
+        to tracker code or model versions, so force_retrack ignores the cache and
+        any checkpoint of an interrupted run. The cache is also bypassed when the
+        tracked-points overlay video is enabled, since only tracking renders it.
         """
         if self.state not in (ReconstructionState.IDLE, ReconstructionState.COMPLETE):
             logger.warning(f"Cannot start reconstruction in state {self.state}")
@@ -339,16 +348,36 @@ class ReconstructionPresenter(QObject):
             self._emit_state_changed()
             return
 
+        fingerprint = tracking_fingerprint(recording_path, cam_ids, tracker)
+
         save_overlay = bool(self._project_settings and self._project_settings.get_save_tracked_points_video())
         save_xy = bool(self._project_settings and self._project_settings.get_save_xy_points())
+        online = bool(self._project_settings and self._project_settings.get_online_triangulation())
+
+        use_cache = not (force_retrack or save_overlay)
 
         def worker(token, handle):
+            cached_points = load_cached_image_points(tracker_dir, tracker_name, fingerprint) if use_cache else None
+            if cached_points is not None:
+                handle.report_progress(85, "Stage 2: Triangulating 3D points (reusing cached 2D landmarks)")
+                reconstruct_xyz(cached_points, camera_array, tracker, tracker_dir)
+                handle.report_progress(100, "Complete")
+                return tracker_dir
+
             recorder = (
                 OverlayVideoWriter(tracker_dir, tracker, synced_timestamps.mean_fps, suffix=tracker_name)
                 if save_overlay
                 else None
             )
 
+            triangulator = SyncIndexTriangulator(camera_array) if online else None
+
+            # A cancelled run resumes where it stopped. The overlay video of a
+            # resumed run starts at the resume point (process_synchronized_recording logs it).
+            checkpoint = tracker_dir / f"xy_{tracker_name}.checkpoint"
+            if force_retrack:
+                shutil.rmtree(checkpoint, ignore_errors=True)
+
             last_pct = -1
 
             def on_progress(done: int, total: int) -> None:
@@ -372,6 +401,8 @@ class ReconstructionPresenter(QObject):
                     on_progress=on_progress,
                     on_frame_data=on_frame_data,
                     token=token,
+                    triangulator=triangulator,
+                    checkpoint=checkpoint,
                 )
             finally:
                 if recorder is not None:
@@ -381,11 +412,12 @@ class ReconstructionPresenter(QObject):
                 return None
 
             if save_xy:
-                image_points.to_csv(tracker_dir / f"xy_{tracker_name}.csv")
+                save_image_points(image_points, tracker_dir, tracker_name, fingerprint)
 
             # Stage 2: Triangulation (80-100%), from the in-memory points (no read-back)
             handle.report_progress(85, "Stage 2: Triangulating 3D points")
-            reconstruct_xyz(image_points, camera_array, tracker, tracker_dir)
+            world_points = triangulator.world_points() if triangulator is not None else None
+            reconstruct_xyz(image_points, camera_array, tracker, tracker_dir, world_points=world_points)
             handle.report_progress(100, "Complete")
 
             return tracker_dir
@@ -7,7 +7,7 @@ import numpy as np
 from numpy.typing import NDArray
 
 from caliscope.cameras.camera_array import CameraArray
-from caliscope.core.point_data import STATIC_SYNC_INDEX, WorldPoints
+from caliscope.core.point_data import STATIC_SYNC_INDEX, DenseWorldPoints, WorldPoints
 from caliscope.gui.geometry.camera_frustum import build_camera_geometry
 from caliscope.gui.geometry.wireframe import WireframeSegment
 
@@ -42,19 +42,19 @@ class PlaybackViewModel:
             self.id_to_index: dict[tuple[int, int], int] = {}
             self._static_lines = np.empty((0, 2), dtype=np.int32)
             self._static_line_colors = np.empty((0, 3), dtype=np.float32)
-            self._grouped_points: dict[Any, Any] = {}
+            self._dense: DenseWorldPoints | None = None
             logger.info("PlaybackViewModel initialized in camera-only mode (no points).")
             return
 
         # 1. Establish the Canonical Map (The "Superset" of all points)
-        # Build unique (object_id, keypoint_id) pairs across the full recording
-        df = world_points.df
-        unique_keys = df[["object_id", "keypoint_id"]].drop_duplicates().sort_values(["object_id", "keypoint_id"])
-        self.all_point_keys = list(zip(unique_keys["object_id"], unique_keys["keypoint_id"]))
-        self.n_points = len(self.all_point_keys)
+        # The dense layout's columns are the sorted unique (object_id, keypoint_id)
+        # pairs across the full recording, so its column map is the buffer map.
+        self._dense = world_points.dense
+        self.all_point_keys = list(self._dense.key_to_column)
+        self.n_points = self._dense.n_points
 
         # Map: (object_id, keypoint_id) -> Buffer Index (0 to N-1)
-        self.id_to_index = {key: i for i, key in enumerate(self.all_point_keys)}
+        self.id_to_index = self._dense.key_to_column
 
         logger.info(f"PlaybackViewModel initialized with {self.n_points} unique points.")
 
@@ -63,10 +63,6 @@ class PlaybackViewModel:
         # Result is (n_lines, 2) array: [index_A, index_B] per row.
         self._static_lines, self._static_line_colors = self._build_static_topology()
 
-        # 3. Pre-group data for fast lookup during playback
-        # We group by sync_index so we don't have to filter the huge dataframe every frame.
-        self._grouped_points = {idx: grp for idx, grp in world_points.df.groupby("sync_index")}
-
     @classmethod
     def from_xyz_csv(
         cls,
@@ -122,10 +118,9 @@ class PlaybackViewModel:
         that actually have data, not every frame in the min/max range.
         For sparse data (e.g., every 5th frame), this returns [0, 5, 10, ...]
         """
-        if not self._grouped_points:
+        if self._dense is None:
             return np.array([], dtype=np.int64)
-        keys = [k for k in self._grouped_points if k != STATIC_SYNC_INDEX]
-        return np.sort(np.array(keys, dtype=np.int64))
+        return self._dense.dynamic_sync_indices
 
     def get_camera_geometry(self, scale: float = 0.0005) -> dict[str, Any] | None:
         """Pass-through to the static camera builder."""
@@ -169,41 +164,21 @@ class PlaybackViewModel:
         Crucially, this returns a FIXED SIZE array (N, 3).
         Points missing in this frame are filled with NaN.
         """
-        # Initialize with NaN (invisible — Qt3D moves these off-screen)
-        # Shape is (N, 3)
-        points_buffer = np.full((self.n_points, 3), np.nan, dtype=np.float32)
-
         # Default color: Light Grey
         colors_buffer = np.full((self.n_points, 3), 0.8, dtype=np.float32)
 
-        if sync_index in self._grouped_points:
-            frame_df = self._grouped_points[sync_index]
-
-            coords = frame_df[["x_coord", "y_coord", "z_coord"]].values.astype(np.float32)
-
-            # Map each row's (object_id, keypoint_id) to its canonical buffer index
-            indices = []
-            valid_rows = []
-            for i, (oid, kid) in enumerate(zip(frame_df["object_id"].values, frame_df["keypoint_id"].values)):
-                key = (int(oid), int(kid))
-                if key in self.id_to_index:
-                    indices.append(self.id_to_index[key])
-                    valid_rows.append(i)
-
-            if indices:
-                points_buffer[indices] = coords[valid_rows]
+        if self._dense is None:
+            return FrameGeometry(points=np.full((0, 3), np.nan, dtype=np.float32), colors=colors_buffer)
 
-                # Here you could also scatter dynamic colors (e.g. confidence) if available
-                # colors_buffer[indices] = ...
+        # Row slice of the dense layout; missing points are NaN
+        # (invisible — Qt3D moves these off-screen)
+        points_buffer = self._dense.frame(sync_index)
 
         # Static points (rigid objects) are present at every frame
-        if STATIC_SYNC_INDEX in self._grouped_points and sync_index != STATIC_SYNC_INDEX:
-            static_df = self._grouped_points[STATIC_SYNC_INDEX]
-            static_coords = static_df[["x_coord", "y_coord", "z_coord"]].values.astype(np.float32)
-            for i, (oid, kid) in enumerate(zip(static_df["object_id"].values, static_df["keypoint_id"].values)):
-                key = (int(oid), int(kid))
-                if key in self.id_to_index:
-                    points_buffer[self.id_to_index[key]] = static_coords[i]
+        static_xyz = self._dense.static_xyz
+        if static_xyz is not None and sync_index != STATIC_SYNC_INDEX:
+            static_mask = ~np.isnan(static_xyz[:, 0])
+            points_buffer[static_mask] = static_xyz[static_mask]
 
         return FrameGeometry(points=points_buffer, colors=colors_buffer)
 
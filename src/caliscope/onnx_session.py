@@ -3,19 +3,65 @@
 All caliscope inference (pose trackers, GeoCalib) runs on onnxruntime.
 Sessions prefer CUDA when the installed onnxruntime build exposes it (the
 onnxruntime-gpu package on a CUDA machine) and fall back to CPU otherwise.
-No configuration: the installed package decides.
+The installed package decides the provider; SessionConfig tunes threading
+and graph optimization for callers that know how many sessions will run at
+once (e.g. one per tracking worker process).
+
+Graph optimization runs every time a session is created. With
+cache_optimized_model the basic and extended optimizations are applied once
+and the result saved beside the model as <stem>.optimized-<key>.onnx, keyed by
+onnxruntime version, provider and the model file's size and mtime; later
+sessions load that file instead. Layout optimizations ("all") are specific to
+the CPU they ran on, so they are left out of the cache and redone per session.
 
 Callers lazy-import onnxruntime themselves first so their error messages can
 name the right install extra; this module assumes it is importable.
 """
 
+import hashlib
 import logging
+import os
+import tempfile
+from dataclasses import dataclass
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+EXECUTION_MODES = ("sequential", "parallel")
+GRAPH_OPTIMIZATIONS = ("disable", "basic", "extended", "all")
+
+
+@dataclass(frozen=True, slots=True)
+class SessionConfig:
+    """onnxruntime SessionOptions that callers may tune; defaults match onnxruntime's own.
+
+    intra_op_threads: threads for parallelism within an operator (None: one per physical core)
+    inter_op_threads: threads across operators, used only in "parallel" execution mode
+    execution_mode: "sequential" or "parallel"
+    graph_optimization: "disable", "basic", "extended", or "all"
+    cache_optimized_model: save the optimized graph beside the model and reuse it
+    """
+
+    intra_op_threads: int | None = None
+    inter_op_threads: int | None = None
+    execution_mode: str = "sequential"
+    graph_optimization: str = "all"
+    cache_optimized_model: bool = False
+
+    def __post_init__(self) -> None:
+        if self.execution_mode not in EXECUTION_MODES:
+            raise ValueError(f"execution_mode must be one of {EXECUTION_MODES}, got {self.execution_mode!r}")
+        if self.graph_optimization not in GRAPH_OPTIMIZATIONS:
+            raise ValueError(
+                f"graph_optimization must be one of {GRAPH_OPTIMIZATIONS}, got {self.graph_optimization!r}"
+            )
+        for field_name in ("intra_op_threads", "inter_op_threads"):
+            threads = getattr(self, field_name)
+            if threads is not None and threads < 1:
+                raise ValueError(f"{field_name} must be >= 1, got {threads}")
 
-def create_inference_session(model_path: Path):
+
+def create_inference_session(model_path: Path, config: SessionConfig | None = None):
     """Create an onnxruntime InferenceSession on the best available provider.
 
     Prefers CUDAExecutionProvider when the installed build advertises it,
@@ -26,6 +72,8 @@ def create_inference_session(model_path: Path):
     """
     import onnxruntime as ort  # type: ignore[reportMissingImports]  # no type stubs
 
+    config = config or SessionConfig()
+
     cuda_available = "CUDAExecutionProvider" in ort.get_available_providers()
     if cuda_available and hasattr(ort, "preload_dlls"):
         ort.preload_dlls()
@@ -35,7 +83,11 @@ def create_inference_session(model_path: Path):
         providers.append(("CUDAExecutionProvider", {"device_id": 0}))
     providers.append("CPUExecutionProvider")
 
-    session = ort.InferenceSession(str(model_path), providers=providers)
+    load_path = model_path
+    if config.cache_optimized_model and config.graph_optimization in ("extended", "all"):
+        load_path = _optimized_model(model_path, providers) or model_path
+
+    session = ort.InferenceSession(str(load_path), sess_options=_session_options(config), providers=providers)
 
     active = session.get_providers()[0]
     if cuda_available and active != "CUDAExecutionProvider":
@@ -46,3 +98,70 @@ def create_inference_session(model_path: Path):
     else:
         logger.info(f"ONNX session for {model_path.name} on {active}")
     return session
+
+
+def optimized_model_path(model_path: Path, providers: list) -> Path:
+    """Cache location for model_path's optimized graph under this onnxruntime and these providers."""
+    import onnxruntime as ort  # type: ignore[reportMissingImports]  # no type stubs
+
+    stat = model_path.stat()
+    provider_names = [p[0] if isinstance(p, tuple) else p for p in providers]
+    key_source = f"{ort.__version__}|{provider_names}|{stat.st_size}|{stat.st_mtime_ns}"
+    key = hashlib.sha256(key_source.encode("utf-8")).hexdigest()[:16]
+    return model_path.with_name(f"{model_path.stem}.optimized-{key}.onnx")
+
+
+def _session_options(config: SessionConfig, graph_optimization: str | None = None):
+    import onnxruntime as ort  # type: ignore[reportMissingImports]  # no type stubs
+
+    levels = {
+        "disable": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+        "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+        "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+        "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+    }
+    options = ort.SessionOptions()
+    options.graph_optimization_level = levels[graph_optimization or config.graph_optimization]
+    options.execution_mode = (
+        ort.ExecutionMode.ORT_PARALLEL if config.execution_mode == "parallel" else ort.ExecutionMode.ORT_SEQUENTIAL
+    )
+    if config.intra_op_threads is not None:
+        options.intra_op_num_threads = config.intra_op_threads
+    if config.inter_op_threads is not None:
+        options.inter_op_num_threads = config.inter_op_threads
+    return options
+
+
+def _optimized_model(model_path: Path, providers: list) -> Path | None:
+    """model_path with basic and extended optimizations applied, built on first use.
+
+    Returns None when the cache cannot be written (read-only model directory);
+    the caller then optimizes the original as usual.
+    """
+    import onnxruntime as ort  # type: ignore[reportMissingImports]  # no type stubs
+
+    cache_path = optimized_model_path(model_path, providers)
+    if cache_path.exists():
+        logger.debug(f"Using optimized graph cache {cache_path.name}")
+        return cache_path
+
+    # Sessions in other threads or processes may be building the same cache; each writes its own temp file.
+    try:
+        fd, temp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=f"{cache_path.name}.", suffix=".tmp")
+    except OSError as e:
+        logger.warning(f"Could not cache optimized graph for {model_path.name}: {e}")
+        return None
+    os.close(fd)  # onnxruntime writes the file by path
+    temp_path = Path(temp_name)
+    options = _session_options(SessionConfig(), graph_optimization="extended")
+    options.optimized_model_filepath = str(temp_path)
+    try:
+        ort.InferenceSession(str(model_path), sess_options=options, providers=providers)
+        os.replace(temp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Could not cache optimized graph for {model_path.name}: {e}")
+        temp_path.unlink(missing_ok=True)
+        return None
+
+    logger.info(f"Cached optimized graph for {model_path.name} as {cache_path.name}")
+    return cache_path
@@ -1,9 +1,12 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import StrEnum
-from typing import Any, Callable, cast
+from typing import TYPE_CHECKING, Any, Callable, cast
 
 from numpy.typing import NDArray
 
+if TYPE_CHECKING:
+    from caliscope.recording.frame_ring import FrameSlot
+
 
 class PixelFormat(StrEnum):
     GRAY = "gray"
@@ -49,13 +52,27 @@ class PointPacket:
 
 @dataclass(frozen=True, slots=True)
 class FramePacket:
-    """Raw decode output from a single camera frame."""
+    """Raw decode output from a single camera frame.
+
+    native_size is the video's (width, height) when the frame was decoded at
+    reduced resolution, None when the frame is already native.
+
+    frame_slot is set when frame lives in a FrameRing buffer (FrameSource with
+    ring_slots). The holder must call release() once done with frame.
+    """
 
     cam_id: int
     frame_index: int
     frame_time: float
     frame: NDArray[Any]
     pixel_format: PixelFormat = PixelFormat.BGR
+    native_size: tuple[int, int] | None = None
+    frame_slot: "FrameSlot | None" = None
+
+    def release(self) -> None:
+        """Return a ring-backed frame to its ring. No-op for ordinary frames."""
+        if self.frame_slot is not None:
+            self.frame_slot.release()
 
 
 @dataclass(frozen=True, slots=True)
@@ -69,6 +86,22 @@ class TrackedFrame:
     points: PointPacket | None = None
     draw_instructions: Callable | None = None
     pixel_format: PixelFormat = PixelFormat.BGR
+    native_size: tuple[int, int] | None = None  # set when frame is reduced; points stay in native pixels
+    frame_slot: "FrameSlot | None" = None  # set when frame is borrowed from a FrameRing; see release()
+
+    def release(self) -> None:
+        """Return a ring-backed frame to its ring. No-op for ordinary frames."""
+        if self.frame_slot is not None:
+            self.frame_slot.release()
+
+    def detached(self) -> "TrackedFrame":
+        """A copy that owns its frame, releasing this one's ring slot; self if not ring-backed."""
+        if self.frame_slot is None:
+            return self
+        try:
+            return replace(self, frame=None if self.frame is None else self.frame.copy(), frame_slot=None)
+        finally:
+            self.release()
 
     def to_tidy_table(self, sync_index) -> dict | None:
         """
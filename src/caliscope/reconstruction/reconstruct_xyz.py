@@ -9,7 +9,7 @@ import logging
 from pathlib import Path
 
 from caliscope.cameras.camera_array import CameraArray
-from caliscope.core.point_data import ImagePoints
+from caliscope.core.point_data import ImagePoints, WorldPoints
 from caliscope.export import xyz_to_trc, xyz_to_wide_labelled
 from caliscope.tracker import Tracker
 
@@ -22,27 +22,35 @@ def reconstruct_xyz(
     tracker: Tracker,
     output_dir: Path,
     xy_gap_fill: int = 3,
+    world_points: WorldPoints | None = None,
 ) -> None:
     """Triangulate image points and write xyz csv / labelled csv / trc to output_dir.
 
     Writes nothing when there are no 2D points or nothing triangulates -- a no-points
     run must not leave an empty xyz file (that would flip the reconstruction tab to a
     false COMPLETE). Filenames use the tracker name: xyz_{tracker.name}.{csv,trc}.
+
+    Pass world_points when they were already triangulated online during tracking
+    (see SyncIndexTriangulator). Those were computed before 2D gaps could be
+    filled, so gaps up to xy_gap_fill frames are filled in 3D instead.
     """
-    if image_points.df.empty:
+    if image_points.view.empty:
         logger.warning("No 2D points to triangulate; skipping reconstruction output.")
         return
 
-    filled_xy = image_points.fill_gaps(max_gap_size=xy_gap_fill)
-    xyz_data = filled_xy.triangulate(camera_array)
+    if world_points is not None:
+        xyz_data = world_points.fill_gaps(max_gap_size=xy_gap_fill)
+    else:
+        filled_xy = image_points.fill_gaps(max_gap_size=xy_gap_fill)
+        xyz_data = filled_xy.triangulate(camera_array)
 
-    if xyz_data.df.empty:
+    if xyz_data.view.empty:
         logger.warning("No points were triangulated; skipping reconstruction output.")
         return
 
-    xyz_data.df.to_csv(output_dir / f"xyz_{tracker.name}.csv", index=False)
+    xyz_data.view.to_csv(output_dir / f"xyz_{tracker.name}.csv", index=False)
 
-    labelled = xyz_to_wide_labelled(xyz_data.df, tracker)
+    labelled = xyz_to_wide_labelled(xyz_data.view, tracker)
     labelled.to_csv(output_dir / f"xyz_{tracker.name}_labelled.csv", index=False)
 
-    xyz_to_trc(xyz_data.df, tracker=tracker, target_path=output_dir / f"xyz_{tracker.name}.trc")
+    xyz_to_trc(xyz_data.view, tracker=tracker, target_path=output_dir / f"xyz_{tracker.name}.trc")
@@ -0,0 +1,68 @@
+"""Reuse of stage-1 2D points across reconstruction runs.
+
+Tracking is the expensive half of reconstruction; triangulation is seconds.
+After a recalibration only the camera array changes, so the xy_{tracker}.csv
+from the previous run is still valid. A fingerprint of the recording videos
+and timestamps.csv (name, size, mtime) plus the tracker's name and config is
+stored beside the csv. A matching fingerprint means the csv can go straight to
+triangulation.
+"""
+
+import logging
+from pathlib import Path
+
+from caliscope.core.extraction_checkpoint import extraction_fingerprint
+from caliscope.core.point_data import ImagePoints
+from caliscope.tracker import Tracker
+
+logger = logging.getLogger(__name__)
+
+
+def xy_points_path(tracker_dir: Path, tracker_name: str) -> Path:
+    return tracker_dir / f"xy_{tracker_name}.csv"
+
+
+def fingerprint_path(tracker_dir: Path, tracker_name: str) -> Path:
+    return tracker_dir / f"xy_{tracker_name}.fingerprint"
+
+
+def tracking_fingerprint(recording_dir: Path, cam_ids: list[int], tracker: Tracker) -> str:
+    """Hash of everything that determines the 2D points of a recording.
+
+    timestamps.csv is included because it sets the sync index of every frame;
+    without it the mapping is inferred from the videos alone.
+    """
+    paths = [recording_dir / f"cam_{cam_id}.mp4" for cam_id in sorted(cam_ids)]
+    timestamps_path = recording_dir / "timestamps.csv"
+    if timestamps_path.exists():
+        paths.append(timestamps_path)
+    return extraction_fingerprint(paths, tracker)
+
+
+def save_image_points(image_points: ImagePoints, tracker_dir: Path, tracker_name: str, fingerprint: str) -> None:
+    """Write the xy csv, then the fingerprint it was produced under.
+
+    The old fingerprint is removed first so an interrupted write can never
+    leave a stale fingerprint vouching for a partial csv.
+    """
+    stored_path = fingerprint_path(tracker_dir, tracker_name)
+    stored_path.unlink(missing_ok=True)
+    image_points.to_csv(xy_points_path(tracker_dir, tracker_name))
+    stored_path.write_text(fingerprint + "\n", encoding="utf-8")
+
+
+def load_cached_image_points(tracker_dir: Path, tracker_name: str, fingerprint: str) -> ImagePoints | None:
+    """Return the stored 2D points if they were produced under this fingerprint, else None."""
+    xy_path = xy_points_path(tracker_dir, tracker_name)
+    stored_path = fingerprint_path(tracker_dir, tracker_name)
+    if not xy_path.exists() or not stored_path.exists():
+        return None
+
+    stored = stored_path.read_text(encoding="utf-8").strip()
+    if stored != fingerprint:
+        logger.info(f"Cached 2D points at {xy_path} are stale (recording or tracker changed)")
+        return None
+
+    # save_image_points writes the csv before its fingerprint, so a match implies a complete file.
+    logger.info(f"Reusing cached 2D points from {xy_path}")
+    return ImagePoints.from_csv(xy_path)
@@ -6,12 +6,15 @@ Import them directly from caliscope.recording.frame_packet_streamer when needed.
 
 from caliscope.recording.frame_source import FrameSource
 from caliscope.recording.frame_timestamps import FrameTimestamps
+from caliscope.recording.seekable_frame_source import KeyframeIndex, SeekableFrameSource
 from caliscope.recording.synchronized_timestamps import SynchronizedTimestamps
 from caliscope.recording.video_utils import VideoProperties, read_video_properties
 
 __all__ = [
     "FrameSource",
     "FrameTimestamps",
+    "KeyframeIndex",
+    "SeekableFrameSource",
     "SynchronizedTimestamps",
     "VideoProperties",
     "read_video_properties",
@@ -46,6 +46,12 @@ class FramePacketStreamer:
     Subscriber Interface:
         Exposes cam_id, subscribe(), unsubscribe() so consumers (e.g. the
         intrinsic calibration presenter) can pull FramePackets off a queue.
+
+    Frame Ring:
+        When the FrameSource decodes into a FrameRing (ring_slots > 0), every
+        broadcast frame is lent to each subscriber, and each must call
+        TrackedFrame.release() when done with it. Playback then waits for
+        released buffers rather than allocating new frames.
     """
 
     def __init__(
@@ -109,9 +115,14 @@ class FramePacketStreamer:
 
     @property
     def size(self) -> tuple[int, int]:
-        """Frame dimensions (width, height)."""
+        """Native frame dimensions (width, height)."""
         return self._frame_source.size
 
+    @property
+    def output_size(self) -> tuple[int, int]:
+        """Dimensions of broadcast frames; smaller than size when the source decodes at reduced scale."""
+        return self._frame_source.output_size
+
     @property
     def original_fps(self) -> float:
         """Original recording FPS from underlying video file."""
@@ -192,8 +203,11 @@ class FramePacketStreamer:
         """
         with self._subscriber_lock:
             subscribers = self._subscribers.copy()
+        if packet.frame_slot is not None:
+            packet.frame_slot.retain(len(subscribers))
         for q in subscribers:
             q.put(packet)
+        packet.release()  # the worker's own hold; subscribers keep theirs
 
     def _wait_for_subscribers(self, token: CancellationToken) -> bool:
         """Block until at least one subscriber exists or cancellation.
@@ -307,11 +321,15 @@ class FramePacketStreamer:
 
                 raw = self._frame_source.next_frame()
                 current_pixel_format = PixelFormat.BGR
+                native_size = None
+                frame_slot = None
                 if raw is not None:
                     self._frame_index = raw.frame_index
                     self._frame_time = raw.frame_time
                     current_frame = raw.frame
                     current_pixel_format = raw.pixel_format
+                    native_size = raw.native_size
+                    frame_slot = raw.frame_slot
                 else:
                     current_frame = None
 
@@ -333,8 +351,14 @@ class FramePacketStreamer:
                     tracker = self._tracker
 
                 if tracker is not None:
-                    point_data = tracker.get_points(current_frame, self.cam_id, self._rotation_count)
-                    draw_instructions = tracker.scatter_draw_instructions
+                    try:
+                        point_data = tracker.get_points(
+                            current_frame, self.cam_id, self._rotation_count, native_size=native_size
+                        )
+                        draw_instructions = tracker.scatter_draw_instructions
+                    except BaseException:
+                        raw.release()  # a failed frame must not pin its ring slot
+                        raise
                 else:
                     point_data = None
                     draw_instructions = None
@@ -347,6 +371,8 @@ class FramePacketStreamer:
                     points=point_data,
                     draw_instructions=draw_instructions,
                     pixel_format=current_pixel_format,
+                    native_size=native_size,
+                    frame_slot=frame_slot,
                 )
 
                 logger.debug(f"Broadcasting frame {self._frame_index} at cam_id {self.cam_id}")
@@ -383,6 +409,8 @@ def create_streamer(
     fps_target: float | None = None,
     end_behavior: Literal["stop", "pause"] = "stop",
     pixel_format: PixelFormat = PixelFormat.BGR,
+    scale: float = 1.0,
+    ring_slots: int = 0,
 ) -> FramePacketStreamer:
     """Factory function to create a FramePacketStreamer.
 
@@ -396,11 +424,16 @@ def create_streamer(
         fps_target: Target FPS. None = unlimited.
         end_behavior: What to do at last frame. "stop" or "pause".
         pixel_format: Pixel format for frame decoding. Explicit opt-in; default is BGR.
+        scale: Decode scale for previews (<= 1). Broadcast frames are reduced;
+            tracked points stay in native pixels (TrackedFrame.native_size is set).
+        ring_slots: Decode into a preallocated ring of this many frame buffers
+            instead of allocating per frame. Subscribers must then release()
+            every TrackedFrame they receive. 0 (default) disables the ring.
 
     Returns:
         Configured FramePacketStreamer ready to start().
     """
-    frame_source = FrameSource(video_directory, cam_id, pixel_format=pixel_format)
+    frame_source = FrameSource(video_directory, cam_id, pixel_format=pixel_format, scale=scale, ring_slots=ring_slots)
 
     timing_csv = video_directory / "timestamps.csv"
     if timing_csv.exists():
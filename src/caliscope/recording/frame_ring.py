@@ -0,0 +1,119 @@
+"""Preallocated frame buffers lent by a decoder to its consumers.
+
+FrameRing owns a fixed number of equally sized frame buffers in one
+contiguous block. A producer acquire()s a free slot, writes a frame into it
+and hands the slot to its consumers, each of whom release()s it when done.
+When every slot is out on loan, acquire() blocks: a slow consumer throttles
+the decoder instead of the decoder allocating more frames.
+
+The block is an ordinary NumPy allocation by default. Passing buffer (any
+writable buffer of at least FrameRing.nbytes_for(...) bytes, for example
+multiprocessing.shared_memory.SharedMemory.buf) places the slots in that
+memory instead, so another process can map the same frames.
+"""
+
+from collections import deque
+from threading import Condition
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+
+class FrameSlot:
+    """One buffer of a FrameRing, returned to the ring when its last holder releases it.
+
+    The producer holds the slot from acquire(). Handing it to n consumers means
+    calling retain(n) first; every holder then calls release() exactly once.
+    array must not be touched after release().
+    """
+
+    __slots__ = ("index", "array", "_ring", "_holders")
+
+    def __init__(self, ring: "FrameRing", index: int, array: np.ndarray):
+        self.index = index
+        self.array = array
+        self._ring = ring
+        self._holders = 0
+
+    def retain(self, count: int = 1) -> None:
+        """Register count additional holders."""
+        self._ring._retain(self, count)
+
+    def release(self) -> None:
+        """Drop one hold; the slot returns to the ring when none remain."""
+        self._ring._release(self)
+
+
+class FrameRing:
+    """Fixed pool of frame buffers with borrow/release and blocking backpressure."""
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        dtype: DTypeLike = np.uint8,
+        slots: int = 4,
+        buffer=None,
+    ) -> None:
+        if slots < 1:
+            raise ValueError(f"slots must be >= 1, got {slots}")
+
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        if buffer is None:
+            block = np.empty((slots, *self.shape), dtype=self.dtype)
+        else:
+            block = np.ndarray((slots, *self.shape), dtype=self.dtype, buffer=buffer)
+        self._slots = [FrameSlot(self, i, block[i]) for i in range(slots)]
+        self._free: deque[FrameSlot] = deque(self._slots)
+        self._condition = Condition()
+        self._closed = False
+
+    @staticmethod
+    def nbytes_for(shape: tuple[int, ...], dtype: DTypeLike = np.uint8, slots: int = 4) -> int:
+        """Size of the buffer needed to back a ring with these dimensions."""
+        return slots * int(np.prod(shape)) * np.dtype(dtype).itemsize
+
+    @property
+    def slot_count(self) -> int:
+        return len(self._slots)
+
+    @property
+    def free_count(self) -> int:
+        with self._condition:
+            return len(self._free)
+
+    def acquire(self, timeout: float | None = None) -> FrameSlot | None:
+        """Take a free slot, waiting while all are on loan.
+
+        Returns None if the ring is closed, or if timeout (seconds) elapses first.
+        The caller holds the slot once.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._free or self._closed, timeout=timeout):
+                return None
+            if self._closed:
+                return None
+            slot = self._free.popleft()
+            slot._holders = 1
+            return slot
+
+    def close(self) -> None:
+        """Wake any blocked acquire() with None. Slots already on loan stay valid."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def _retain(self, slot: FrameSlot, count: int) -> None:
+        with self._condition:
+            if slot._holders <= 0:
+                raise RuntimeError(f"Frame slot {slot.index} retained after it was returned to the ring")
+            slot._holders += count
+
+    def _release(self, slot: FrameSlot) -> None:
+        with self._condition:
+            if slot._holders <= 0:
+                raise RuntimeError(f"Frame slot {slot.index} released more times than it was held")
+            slot._holders -= 1
+            if slot._holders == 0:
+                self._free.append(slot)
+                self._condition.notify()
@@ -4,7 +4,8 @@ FrameSource wraps PyAV for sequential video decoding. One forward pass, no
 seeking, no random access. next_frame() returns the next frame as a FramePacket.
 When wanted_indices is set at construction,
 unwanted frames are decoded but not converted to BGR — next_frame silently
-advances past them.
+advances past them. SeekableFrameSource (seekable_frame_source.py) adds
+random access on top of the same interface.
 
 This is infrastructure (I/O), not domain logic — hence placement in recording/
 rather than core/.
@@ -16,11 +17,14 @@ from pathlib import Path
 from threading import Lock
 from typing import Iterator, Self
 
-import numpy as np
 import av
+import cv2
+import numpy as np
 from av.video.frame import VideoFrame
+from av.video.reformatter import VideoReformatter
 
 from caliscope.packets import FramePacket, PixelFormat
+from caliscope.recording.frame_ring import FrameRing
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +36,8 @@ class FrameSource:
     When wanted_indices is provided at construction, frames not
     in that set are decoded (unavoidable with video codecs) but skipped without
     the costly BGR conversion — next_frame silently advances to the next wanted
-    frame.
+    frame. For sparse wanted sets prefer SeekableFrameSource, which seeks
+    between samples instead of decoding through them.
 
     Thread-safe for concurrent next_frame calls (internal lock), but a single
     instance is meant for one owner thread.
@@ -45,6 +50,8 @@ class FrameSource:
         decode_threads: int = 0,
         wanted_indices: Set[int] | None = None,
         pixel_format: PixelFormat = PixelFormat.BGR,
+        scale: float = 1.0,
+        ring_slots: int = 0,
     ) -> None:
         """Open cam_<cam_id>.mp4 in video_directory for forward-only reading.
 
@@ -56,6 +63,16 @@ class FrameSource:
         wanted_indices, when provided, limits which frames get BGR conversion.
         next_frame silently skips unwanted frames. When None, every frame is
         wanted.
+
+        scale < 1 delivers frames at reduced resolution: BGR frames are scaled
+        by libswscale in the decoder's YUV layout before conversion, GRAY frames
+        are area-averaged from the luma plane with OpenCV. Packets then carry
+        native_size so trackers can map detections back to native pixels.
+
+        ring_slots > 0 decodes into a preallocated FrameRing of that many
+        buffers instead of a fresh array per frame. Each packet then borrows a
+        slot and must be release()d; next_frame blocks while every slot is on
+        loan, so consumers pace the decoder.
         """
         video_path = video_directory / f"cam_{cam_id}.mp4"
         self._open(
@@ -64,6 +81,8 @@ class FrameSource:
             decode_threads=decode_threads,
             wanted_indices=wanted_indices,
             pixel_format=pixel_format,
+            scale=scale,
+            ring_slots=ring_slots,
         )
 
     @classmethod
@@ -74,6 +93,8 @@ class FrameSource:
         decode_threads: int = 0,
         wanted_indices: Set[int] | None = None,
         pixel_format: PixelFormat = PixelFormat.BGR,
+        scale: float = 1.0,
+        ring_slots: int = 0,
     ) -> Self:
         """Construct from an explicit video file path instead of the cam_N.mp4 convention."""
         instance = cls.__new__(cls)
@@ -83,6 +104,8 @@ class FrameSource:
             decode_threads=decode_threads,
             wanted_indices=wanted_indices,
             pixel_format=pixel_format,
+            scale=scale,
+            ring_slots=ring_slots,
         )
         return instance
 
@@ -93,8 +116,13 @@ class FrameSource:
         decode_threads: int,
         wanted_indices: Set[int] | None,
         pixel_format: PixelFormat = PixelFormat.BGR,
+        scale: float = 1.0,
+        ring_slots: int = 0,
     ) -> None:
         """Shared initialization. Call exactly once."""
+        if not 0 < scale <= 1:
+            raise ValueError(f"scale must be in (0, 1], got {scale}")
+
         self.cam_id = cam_id
         self.video_path = video_path
         self._wanted: Set[int] | None = wanted_indices
@@ -118,6 +146,16 @@ class FrameSource:
         self._time_base = float(self._video_stream.time_base)
         self.fps = float(self._video_stream.average_rate)
         self.size = (self._video_stream.width, self._video_stream.height)
+        # Resolution of delivered frames; equals size unless decoding at reduced scale.
+        self.output_size = (max(1, round(self.size[0] * scale)), max(1, round(self.size[1] * scale)))
+        self._scaler = VideoReformatter()
+        self._converter = VideoReformatter()
+
+        self._ring: FrameRing | None = None
+        if ring_slots > 0:
+            width, height = self.output_size
+            shape = (height, width) if pixel_format == PixelFormat.GRAY else (height, width, 3)
+            self._ring = FrameRing(shape, np.uint8, slots=ring_slots)
 
         self._video_stream.thread_type = "AUTO"
         if decode_threads > 0:
@@ -167,34 +205,71 @@ class FrameSource:
                     if self._wanted is not None and i not in self._wanted:
                         continue
 
-                    frame_time = frame.pts * self._time_base if frame.pts is not None else 0.0
-
-                    if self._pixel_format == PixelFormat.GRAY:
-                        assert frame.format.name in ("yuv420p", "yuvj420p"), (
-                            f"Expected yuv420p/yuvj420p for Y-plane extraction, got {frame.format.name}"
-                        )
-                        y_plane = frame.planes[0]
-                        h = frame.height
-                        w = frame.width
-                        frame_array = np.ascontiguousarray(
-                            np.frombuffer(y_plane, dtype=np.uint8).reshape(h, y_plane.line_size)[:, :w]
-                        )
-                    else:
-                        frame_array = frame.to_ndarray(format="bgr24")
-
-                    return FramePacket(
-                        cam_id=self.cam_id,
-                        frame_index=i,
-                        frame_time=frame_time,
-                        frame=frame_array,
-                        pixel_format=self._pixel_format,
-                    )
+                    return self._to_packet(frame, i)
 
             except StopIteration:
                 return None
 
+    def _to_packet(self, frame: VideoFrame, frame_index: int) -> FramePacket | None:
+        """Convert a decoded frame to a FramePacket in the configured pixel format and size.
+
+        With a frame ring, waits for a free slot and writes into it; returns
+        None if the ring is closed while waiting (the source is being closed).
+        """
+        frame_time = frame.pts * self._time_base if frame.pts is not None else 0.0
+        reduced = self.output_size != self.size
+
+        slot = None
+        if self._ring is not None:
+            slot = self._ring.acquire()
+            if slot is None:
+                return None
+        out = slot.array if slot is not None else None
+
+        try:
+            if self._pixel_format == PixelFormat.GRAY:
+                assert frame.format.name in ("yuv420p", "yuvj420p"), (
+                    f"Expected yuv420p/yuvj420p for Y-plane extraction, got {frame.format.name}"
+                )
+                y_plane = frame.planes[0]
+                h = frame.height
+                w = frame.width
+                luma = np.frombuffer(y_plane, dtype=np.uint8).reshape(h, y_plane.line_size)[:, :w]
+                if reduced:
+                    frame_array = cv2.resize(luma, self.output_size, dst=out, interpolation=cv2.INTER_AREA)
+                else:
+                    frame_array = _copy_into(out, luma)
+            elif reduced:
+                # Scale in the decoder's YUV layout first, then convert at the reduced
+                # size. libswscale's unscaled YUV->BGR path is fast; asking it to scale
+                # and convert in a single call is slower than converting at native size.
+                width, height = self.output_size
+                scaled = self._scaler.reformat(frame, width, height, interpolation="BILINEAR")
+                frame_array = _copy_into(out, self._converter.reformat(scaled, format="bgr24").to_ndarray())
+            else:
+                # to_ndarray is a view of libav's frame; only a ring slot needs a copy.
+                bgr = frame.to_ndarray(format="bgr24")
+                frame_array = bgr if out is None else _copy_into(out, bgr)
+        except BaseException:
+            if slot is not None:
+                slot.release()
+            raise
+
+        return FramePacket(
+            cam_id=self.cam_id,
+            frame_index=frame_index,
+            frame_time=frame_time,
+            frame=frame_array,
+            pixel_format=self._pixel_format,
+            native_size=self.size if reduced else None,
+            frame_slot=slot,
+        )
+
     def close(self) -> None:
         """Release video container resources."""
+        # Wake a next_frame() blocked on a full ring before taking its lock.
+        if getattr(self, "_ring", None) is not None:
+            self._ring.close()
         with self._lock:
             self._closed = True
             if self._container is not None:
@@ -220,3 +295,11 @@ class FrameSource:
                 "Use context manager or call close() explicitly."
             )
             self.close()
+
+
+def _copy_into(out: np.ndarray | None, array: np.ndarray) -> np.ndarray:
+    """Write array into out when given, else return a C-contiguous array (copying only if needed)."""
+    if out is None:
+        return np.ascontiguousarray(array)
+    np.copyto(out, array)
+    return out
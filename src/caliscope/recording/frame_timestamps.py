@@ -4,45 +4,93 @@ FrameTimestamps maps frame indices to wall-clock timestamps recorded at capture
 This enables synchronized playback across multiple cameras.
 """
 
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from pathlib import Path
-from types import MappingProxyType
 from typing import Self
 
+import numpy as np
 import pandas as pd
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class FrameTimestamps:
     """Maps frame indices to timestamps recorded at capture time.
 
-    Frame indices may not start at 0 for synchronized recordings where
-    cameras started at different times.
+    Frame indices are contiguous: frame start_frame_index + i was captured at
+    times[i]. The start may not be 0 for synchronized recordings where cameras
+    started at different times.
 
     Attributes:
-        frame_times: Immutable mapping of frame_index -> timestamp (seconds).
+        start_frame_index: First valid frame index.
+        times: (n_frames,) float64 timestamps in seconds, read-only.
     """
 
-    frame_times: Mapping[int, float]
+    start_frame_index: int
+    times: np.ndarray
 
-    @property
-    def start_frame_index(self) -> int:
-        """First valid frame index (may not be 0 for synced recordings)."""
-        return min(self.frame_times.keys())
+    def __post_init__(self) -> None:
+        times = np.array(self.times, dtype=np.float64).reshape(-1)
+        times.flags.writeable = False
+        object.__setattr__(self, "times", times)
+        object.__setattr__(self, "start_frame_index", int(self.start_frame_index))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrameTimestamps):
+            return NotImplemented
+        return self.start_frame_index == other.start_frame_index and np.array_equal(self.times, other.times)
 
     @property
     def last_frame_index(self) -> int:
         """Last valid frame index."""
-        return max(self.frame_times.keys())
+        return self.start_frame_index + len(self.times) - 1
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.times)
+
+    @property
+    def frame_indices(self) -> np.ndarray:
+        """(n_frames,) int64 frame indices, aligned with times."""
+        return np.arange(self.start_frame_index, self.last_frame_index + 1, dtype=np.int64)
+
+    @property
+    def frame_times(self) -> Mapping[int, float]:
+        """Read-only frame_index -> timestamp view over times."""
+        return _FrameTimesView(self)
 
     def get_time(self, frame_index: int) -> float:
         """Get wall-clock timestamp for a frame index.
 
         Raises:
-            KeyError: If frame_index is not in the mapping.
+            KeyError: If frame_index is outside the recorded range.
         """
-        return self.frame_times[frame_index]
+        position = frame_index - self.start_frame_index
+        if not 0 <= position < len(self.times):
+            raise KeyError(frame_index)
+        return float(self.times[position])
+
+    def get_times(self, frame_indices: np.ndarray) -> np.ndarray:
+        """Timestamps for an array of frame indices; NaN where an index is out of range."""
+        positions = np.asarray(frame_indices, dtype=np.int64) - self.start_frame_index
+        valid = (positions >= 0) & (positions < len(self.times))
+        out = np.full(positions.shape, np.nan, dtype=np.float64)
+        out[valid] = self.times[positions[valid]]
+        return out
+
+    @classmethod
+    def from_mapping(cls, frame_times: Mapping[int, float]) -> Self:
+        """Build from a frame_index -> timestamp mapping with contiguous keys.
+
+        Raises:
+            ValueError: If the frame indices have gaps.
+        """
+        if not frame_times:
+            return cls(0, np.empty(0, dtype=np.float64))
+        start = min(frame_times)
+        if max(frame_times) - start + 1 != len(frame_times):
+            raise ValueError(f"Frame indices must be contiguous, got {len(frame_times)} frames from {start}")
+        return cls(start, np.array([frame_times[start + i] for i in range(len(frame_times))], dtype=np.float64))
 
     @classmethod
     def from_csv(cls, csv_path: Path, cam_id: int) -> Self:
@@ -51,7 +99,8 @@ class FrameTimestamps:
         Frame indices are computed via rank-ordering of frame_time within
         the cam_id's rows. This handles synchronized recordings where frames
         may not start at index 0, and ensures sequential indices even if
-        there are gaps in the recorded timestamps.
+        there are gaps in the recorded timestamps. Rows with identical
+        frame_time keep their file order.
 
         Args:
             csv_path: Path to timestamps.csv.
@@ -62,16 +111,13 @@ class FrameTimestamps:
             KeyError: If cam_id not found in CSV.
         """
         df = pd.read_csv(csv_path)
-        cam_df = df[df["cam_id"] == cam_id].copy()
+        cam_times = df.loc[df["cam_id"] == cam_id, "frame_time"].to_numpy(dtype=np.float64)
 
-        if cam_df.empty:
+        if len(cam_times) == 0:
             raise KeyError(f"cam_id {cam_id} not found in {csv_path}")
 
         # Rank-based indexing: ensures sequential indices from timestamps
-        cam_df["frame_index"] = cam_df["frame_time"].rank(method="min").astype(int) - 1
-
-        frame_times = dict(zip(cam_df["frame_index"], cam_df["frame_time"]))
-        return cls(MappingProxyType(frame_times))
+        return cls(0, np.sort(cam_times, kind="stable"))
 
     @classmethod
     def inferred(cls, fps: float, frame_count: int) -> Self:
@@ -83,5 +129,22 @@ class FrameTimestamps:
             fps: Frames per second.
             frame_count: Total number of frames.
         """
-        frame_times = {i: i / fps for i in range(frame_count)}
-        return cls(MappingProxyType(frame_times))
+        return cls(0, np.arange(frame_count, dtype=np.float64) / fps)
+
+
+class _FrameTimesView(Mapping[int, float]):
+    """Mapping interface over FrameTimestamps' arrays, for scalar consumers."""
+
+    __slots__ = ("_timestamps",)
+
+    def __init__(self, timestamps: FrameTimestamps):
+        self._timestamps = timestamps
+
+    def __getitem__(self, frame_index: int) -> float:
+        return self._timestamps.get_time(frame_index)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self._timestamps.start_frame_index, self._timestamps.last_frame_index + 1))
+
+    def __len__(self) -> int:
+        return len(self._timestamps.times)
@@ -11,6 +11,7 @@ import cv2
 from numpy.typing import NDArray
 
 from caliscope.packets import PixelFormat, PointPacket
+from caliscope.tracker import rescale_points
 
 
 def draw_scatter_overlay(
@@ -18,12 +19,15 @@ def draw_scatter_overlay(
     points: PointPacket | None,
     draw_instructions: Callable[[int], dict] | None,
     pixel_format: PixelFormat,
+    native_size: tuple[int, int] | None = None,
 ) -> NDArray[Any]:
     """Return a 3-channel BGR copy of `frame` with each tracked point drawn as a circle.
 
     A GRAY frame is converted to BGR unconditionally, so the result is always a valid
     HxWx3 array safe for a bgr24 encoder even when `points` is None and nothing is drawn.
     `draw_instructions(keypoint_id)` supplies each circle's radius, color, and thickness.
+    When `frame` was decoded at reduced resolution, `native_size` maps the native-pixel
+    points onto it.
     """
     if pixel_format == PixelFormat.GRAY:
         drawn = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
@@ -31,7 +35,10 @@ def draw_scatter_overlay(
         drawn = frame.copy()
 
     if points is not None and draw_instructions is not None:
-        for keypoint_id, coord in zip(points.keypoint_id, points.img_loc):
+        img_loc = points.img_loc
+        if native_size is not None and len(img_loc) > 0:
+            img_loc = rescale_points(img_loc, native_size, (frame.shape[1], frame.shape[0]))
+        for keypoint_id, coord in zip(points.keypoint_id, img_loc):
             x = round(coord[0])
             y = round(coord[1])
             params = draw_instructions(keypoint_id)
@@ -44,7 +44,7 @@ class OverlayVideoWriter:
     def on_frame_data(self, sync_index: int, frame_data: "dict[int, FrameData]") -> None:
         for cam_id, fd in frame_data.items():
             drawn = draw_scatter_overlay(
-                fd.frame, fd.points, self._tracker.scatter_draw_instructions, self._tracker.pixel_format
+                fd.frame, fd.points, self._tracker.scatter_draw_instructions, self._tracker.pixel_format, fd.native_size
             )
             drawn = _crop_to_even(drawn)  # yuv420p / libx264 require even dimensions
             _, stream = self._writer_for(cam_id, drawn)
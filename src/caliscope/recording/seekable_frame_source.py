@@ -0,0 +1,251 @@
+"""Random-access frame access for recorded video files.
+
+SeekableFrameSource is a drop-in FrameSource that can also jump to an
+arbitrary frame. Reaching frame N means seeking to the keyframe at or before N
+and decoding forward, so the cost is bounded by the GOP length rather than by N.
+
+Frame indices are positions in presentation (pts) order. Mapping a decoded
+frame back to its index needs the pts of every frame, which the container does
+not provide up front; KeyframeIndex gathers them with a single demux pass (no
+decoding) and persists the result beside the video as cam_N.keyframes.npz. The
+sidecar records the video's size and mtime and is rebuilt when either changes.
+"""
+
+import logging
+import os
+import tempfile
+from collections.abc import Iterator, Set
+from dataclasses import dataclass
+from pathlib import Path
+
+import av
+import numpy as np
+from av.video.frame import VideoFrame
+
+from caliscope.packets import FramePacket, PixelFormat
+from caliscope.recording.frame_source import FrameSource
+
+logger = logging.getLogger(__name__)
+
+KEYFRAME_INDEX_VERSION = 1
+
+
+def keyframe_index_path(video_path: Path) -> Path:
+    """Sidecar location for a video's keyframe index (cam_0.mp4 -> cam_0.keyframes.npz)."""
+    return video_path.with_name(f"{video_path.stem}.keyframes.npz")
+
+
+@dataclass(frozen=True)
+class KeyframeIndex:
+    """Presentation timestamps of every frame and which of them are keyframes.
+
+    pts: (n_frames,) int64, sorted ascending; pts[i] is the timestamp of frame i
+    keyframes: (n_keyframes,) int64, sorted frame indices of keyframes
+    """
+
+    pts: np.ndarray
+    keyframes: np.ndarray
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.pts)
+
+    def keyframe_for(self, frame_index: int) -> int:
+        """Frame index of the last keyframe at or before frame_index (0 if none)."""
+        position = int(np.searchsorted(self.keyframes, frame_index, side="right")) - 1
+        return int(self.keyframes[position]) if position >= 0 else 0
+
+    def frame_index_of(self, pts: int) -> int:
+        """Frame index of the frame with this pts, or -1 if the pts is unknown."""
+        position = int(np.searchsorted(self.pts, pts))
+        if position < len(self.pts) and self.pts[position] == pts:
+            return position
+        return -1
+
+    def split(self, frame_indices: np.ndarray, parts: int) -> list[np.ndarray]:
+        """Split sorted frame_indices into up to parts runs that each begin a new GOP.
+
+        Each cut lands on the keyframe at or before the equal-count split point,
+        so every run decodes from its own keyframe and no frame is decoded by two
+        runs. Fewer runs come back when keyframes are too sparse to cut finer.
+        """
+        if parts < 1:
+            raise ValueError(f"parts must be >= 1, got {parts}")
+        frame_indices = np.asarray(frame_indices, dtype=np.int64)
+        if len(frame_indices) == 0:
+            return []
+
+        targets = frame_indices[np.arange(1, parts) * len(frame_indices) // parts]
+        positions = np.searchsorted(self.keyframes, targets, side="right") - 1
+        cut_frames = self.keyframes[positions[positions >= 0]]
+        cuts = np.unique(np.searchsorted(frame_indices, cut_frames))
+        cuts = cuts[(cuts > 0) & (cuts < len(frame_indices))]
+        return np.split(frame_indices, cuts)
+
+    @classmethod
+    def build(cls, video_path: Path) -> "KeyframeIndex":
+        """Demux the video (no decoding) and record packet pts and keyframe flags."""
+        container = av.open(str(video_path))
+        try:
+            stream = container.streams.video[0]
+            pts_list: list[int] = []
+            keyframe_pts: list[int] = []
+            for packet in container.demux(stream):
+                if packet.pts is None:  # flush packet at end of stream
+                    continue
+                pts_list.append(packet.pts)
+                if packet.is_keyframe:
+                    keyframe_pts.append(packet.pts)
+        finally:
+            container.close()
+
+        # Packets arrive in decode order; frame indices follow presentation order.
+        pts = np.sort(np.asarray(pts_list, dtype=np.int64))
+        keyframes = np.searchsorted(pts, np.sort(np.asarray(keyframe_pts, dtype=np.int64))).astype(np.int64)
+        return cls(pts=pts, keyframes=keyframes)
+
+    @classmethod
+    def load_or_build(cls, video_path: Path) -> "KeyframeIndex":
+        """Load the sidecar index if it still matches the video, otherwise build and save it."""
+        sidecar = keyframe_index_path(video_path)
+        stat = video_path.stat()
+
+        if sidecar.exists():
+            try:
+                with np.load(sidecar) as stored:
+                    current = (
+                        int(stored["version"]) == KEYFRAME_INDEX_VERSION
+                        and int(stored["video_size"]) == stat.st_size
+                        and int(stored["video_mtime_ns"]) == stat.st_mtime_ns
+                    )
+                    if current:
+                        return cls(pts=stored["pts"], keyframes=stored["keyframes"])
+                logger.info(f"Keyframe index for {video_path.name} is stale, rebuilding")
+            except Exception as e:
+                logger.warning(f"Could not read keyframe index {sidecar}, rebuilding: {e}")
+
+        index = cls.build(video_path)
+        index._save(sidecar, stat.st_size, stat.st_mtime_ns)
+        return index
+
+    def _save(self, sidecar: Path, video_size: int, video_mtime_ns: int) -> None:
+        """Write atomically; an unwritable directory only costs a rebuild next time."""
+        try:
+            # A unique temp file per writer: sources opened on several threads may save at once.
+            fd, temp_name = tempfile.mkstemp(dir=sidecar.parent, prefix=f"{sidecar.name}.", suffix=".tmp")
+        except OSError as e:
+            logger.warning(f"Could not save keyframe index to {sidecar}: {e}")
+            return
+        temp_path = Path(temp_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    version=KEYFRAME_INDEX_VERSION,
+                    video_size=video_size,
+                    video_mtime_ns=video_mtime_ns,
+                    pts=self.pts,
+                    keyframes=self.keyframes,
+                )
+            os.replace(temp_path, sidecar)
+        except OSError as e:
+            logger.warning(f"Could not save keyframe index to {sidecar}: {e}")
+            temp_path.unlink(missing_ok=True)
+
+
+class SeekableFrameSource(FrameSource):
+    """FrameSource with random access via a persisted keyframe index.
+
+    get_frame(i) returns frame i and leaves the stream positioned so that
+    next_frame() continues with i + 1. When wanted_indices is set, next_frame()
+    seeks past any keyframe that lies between the current position and the
+    next wanted frame instead of decoding through it, and the decoder drops
+    non-reference frames on the way to each target. Sparse sampling therefore
+    costs the reference frames of one GOP per sample instead of a full pass.
+
+    The keyframe index is loaded (or built) on first use, so sequential
+    reading without wanted_indices costs nothing extra.
+    """
+
+    def _open(
+        self,
+        video_path: Path,
+        cam_id: int,
+        decode_threads: int,
+        wanted_indices: Set[int] | None,
+        pixel_format: PixelFormat = PixelFormat.BGR,
+        scale: float = 1.0,
+        ring_slots: int = 0,
+    ) -> None:
+        super()._open(video_path, cam_id, decode_threads, wanted_indices, pixel_format, scale, ring_slots)
+        self._wanted_sorted = np.array(sorted(wanted_indices), dtype=np.int64) if wanted_indices is not None else None
+        self._keyframe_index: KeyframeIndex | None = None
+        self._skip_before_pts: int | None = None
+        self._frame_iterator = self._decode_packets()
+
+    @property
+    def keyframe_index(self) -> KeyframeIndex:
+        if self._keyframe_index is None:
+            self._keyframe_index = KeyframeIndex.load_or_build(self.video_path)
+        return self._keyframe_index
+
+    def get_frame(self, frame_index: int) -> FramePacket | None:
+        """Return frame_index as a FramePacket, or None if it is outside the video."""
+        with self._lock:
+            if self._container is None:
+                return None
+            if frame_index < 0 or frame_index >= self.keyframe_index.frame_count:
+                return None
+            return self._decode_to(frame_index)
+
+    def next_frame(self) -> FramePacket | None:
+        """Return the next (wanted) frame, seeking ahead when that skips decoding."""
+        if self._wanted_sorted is None:
+            return super().next_frame()
+
+        with self._lock:
+            if self._container is None:
+                return None
+            position = int(np.searchsorted(self._wanted_sorted, self._frame_index, side="right"))
+            # Wanted indices are sorted, so the first one past the end means none remain.
+            if position == len(self._wanted_sorted) or self._wanted_sorted[position] >= self.keyframe_index.frame_count:
+                return None
+            return self._decode_to(int(self._wanted_sorted[position]))
+
+    def _decode_packets(self) -> Iterator[VideoFrame]:
+        """Decode from the current container position, dropping unneeded non-reference frames.
+
+        A packet presented before _skip_before_pts is never returned, and if
+        nothing references it (B-frames, typically) the decoder can drop it
+        outright. Reference frames are always decoded so later frames stay intact.
+        """
+        codec_context = self._video_stream.codec_context
+        for packet in self._container.demux(self._video_stream):
+            skippable = None not in (packet.pts, self._skip_before_pts) and packet.pts < self._skip_before_pts
+            codec_context.skip_frame = "NONREF" if skippable else "DEFAULT"
+            yield from packet.decode()
+
+    def _decode_to(self, frame_index: int) -> FramePacket | None:
+        """Position the decoder on frame_index and convert it. Caller holds the lock."""
+        index = self.keyframe_index
+        keyframe = index.keyframe_for(frame_index)
+        self._skip_before_pts = int(index.pts[frame_index])
+
+        # Decoding forward is cheaper than seeking when no keyframe lies ahead of us.
+        if not (self._frame_index < frame_index and keyframe <= self._frame_index + 1):
+            self._container.seek(int(index.pts[keyframe]), stream=self._video_stream, backward=True)
+            self._frame_iterator = self._decode_packets()
+            self._frame_index = -1
+
+        assert self._frame_iterator is not None
+        for frame in self._frame_iterator:
+            if frame.pts is not None and (located := index.frame_index_of(frame.pts)) >= 0:
+                self._frame_index = located
+            else:
+                self._frame_index += 1
+            if self._frame_index == frame_index:
+                return self._to_packet(frame, frame_index)
+            if self._frame_index > frame_index:
+                logger.warning(f"Decoder passed frame {frame_index} of {self.video_path.name} without producing it")
+                return None
+        return None
@@ -7,6 +7,7 @@ in time).
 
 import logging
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import cached_property
 from pathlib import Path
@@ -14,6 +15,7 @@ from statistics import mean
 from types import MappingProxyType
 from typing import Self
 
+import numpy as np
 import pandas as pd
 
 from caliscope.recording.frame_timestamps import FrameTimestamps
@@ -21,13 +23,13 @@ from caliscope.recording.video_utils import read_video_properties
 
 logger = logging.getLogger(__name__)
 
-# Internal type alias for the sync mapping
-_SyncMapping = dict[int, dict[int, int | None]]
-
 # Fallback rate when no camera yields a usable frame rate (e.g. single-frame recordings).
 # Used only for the overlay-video writer, a QA artifact, so a sane default is harmless.
 _DEFAULT_FPS_FALLBACK = 30.0
 
+# Upper bound on concurrent container opens when probing camera videos.
+_MAX_PROBE_WORKERS = 16
+
 
 @dataclass(frozen=True)
 class SynchronizedTimestamps:
@@ -37,8 +39,9 @@ class SynchronizedTimestamps:
     (which frames across cameras correspond to the same moment in time).
 
     Constructed via factory methods, not directly. The sync mapping is
-    computed once and cached internally. It is never exposed -- consumers
-    use frame_for() and time_for() instead.
+    computed once and cached as frame_table. frame_for() and time_for()
+    answer single lookups; frames_for() and times_for() return arrays for
+    loops over a whole recording.
 
     Usage:
         synced = SynchronizedTimestamps.load(recording_dir, cam_ids)
@@ -47,6 +50,10 @@ class SynchronizedTimestamps:
                 frame_index = synced.frame_for(sync_index, cam_id)
                 if frame_index is not None:
                     frame_time = synced.time_for(cam_id, frame_index)
+
+        # Bulk equivalent for one camera
+        frame_indices = synced.frames_for(cam_id)
+        frame_times = synced.times_for(cam_id, frame_indices)
     """
 
     _camera_timestamps: Mapping[int, FrameTimestamps]
@@ -58,7 +65,7 @@ class SynchronizedTimestamps:
     @cached_property
     def sync_indices(self) -> list[int]:
         """Sorted list of valid sync indices."""
-        return sorted(self._cache.keys())
+        return list(range(len(self.frame_table)))
 
     @property
     def cam_ids(self) -> list[int]:
@@ -67,16 +74,45 @@ class SynchronizedTimestamps:
 
     def frame_for(self, sync_index: int, cam_id: int) -> int | None:
         """Frame index for a camera at a sync index. None if dropped."""
-        return self._cache[sync_index][cam_id]
+        if not 0 <= sync_index < len(self.frame_table):
+            raise KeyError(sync_index)
+        frame_index = int(self.frame_table[sync_index, self._columns[cam_id]])
+        return frame_index if frame_index >= 0 else None
 
     def time_for(self, cam_id: int, frame_index: int) -> float:
         """Wall-clock timestamp for a camera's frame."""
-        return self._camera_timestamps[cam_id].frame_times[frame_index]
+        return self._camera_timestamps[cam_id].get_time(frame_index)
+
+    def frames_for(self, cam_id: int, sync_indices: Sequence[int] | np.ndarray | None = None) -> np.ndarray:
+        """Frame indices for one camera at many sync indices (all by default). -1 where dropped."""
+        column = self.frame_table[:, self._columns[cam_id]]
+        if sync_indices is None:
+            return column
+        return column[np.asarray(sync_indices, dtype=np.int64)]
+
+    def times_for(self, cam_id: int, frame_indices: np.ndarray) -> np.ndarray:
+        """Wall-clock timestamps for many of a camera's frames. NaN for -1 or out-of-range indices."""
+        return self._camera_timestamps[cam_id].get_times(frame_indices)
 
     def for_camera(self, cam_id: int) -> FrameTimestamps:
         """Per-camera timestamps (for streaming path consumers)."""
         return self._camera_timestamps[cam_id]
 
+    @cached_property
+    def frame_table(self) -> np.ndarray:
+        """(n_sync, n_cams) int32 frame indices, columns in cam_ids order, -1 where dropped.
+
+        Computed once from the camera timestamps by a greedy forward pass that
+        handles dropped frames and slight timing differences (see
+        _compute_sync_table). Read-only.
+        """
+        timestamps = [self._camera_timestamps[cam_id] for cam_id in self.cam_ids]
+        positions = _compute_sync_table([ft.times for ft in timestamps])
+        starts = np.array([ft.start_frame_index for ft in timestamps], dtype=np.int64)
+        table = np.where(positions >= 0, positions + starts, -1).astype(np.int32)
+        table.flags.writeable = False
+        return table
+
     @property
     def mean_fps(self) -> float:
         """Mean capture frame rate across cameras, derived from frame-time spans.
@@ -87,13 +123,12 @@ class SynchronizedTimestamps:
         """
         per_camera_fps: list[float] = []
         for ft in self._camera_timestamps.values():
-            times = sorted(ft.frame_times.values())
-            if len(times) < 2:
+            if ft.frame_count < 2:
                 continue
-            span = times[-1] - times[0]
+            span = float(ft.times.max() - ft.times.min())
             if span <= 0:
                 continue
-            per_camera_fps.append((len(times) - 1) / span)
+            per_camera_fps.append((ft.frame_count - 1) / span)
 
         if not per_camera_fps:
             return _DEFAULT_FPS_FALLBACK
@@ -101,88 +136,23 @@ class SynchronizedTimestamps:
 
     def to_csv(self, path: Path) -> None:
         """Write all camera timestamps to CSV (cam_id, frame_time format)."""
-        rows: list[dict] = []
-        for cam_id in self.cam_ids:
-            ft = self._camera_timestamps[cam_id]
-            for frame_index in sorted(ft.frame_times.keys()):
-                rows.append({"cam_id": cam_id, "frame_time": ft.frame_times[frame_index]})
-        pd.DataFrame(rows).to_csv(path, index=False)
+        timestamps = [self._camera_timestamps[cam_id] for cam_id in self.cam_ids]
+        df = pd.DataFrame(
+            {
+                "cam_id": np.repeat(self.cam_ids, [ft.frame_count for ft in timestamps]),
+                "frame_time": np.concatenate([ft.times for ft in timestamps]) if timestamps else [],
+            }
+        )
+        df.to_csv(path, index=False)
 
     # -------------------------------------------------------------------------
     # Internal
     # -------------------------------------------------------------------------
 
     @cached_property
-    def _cache(self) -> _SyncMapping:
-        """Sync mapping computed from camera timestamps. Private."""
-        return self._compute_sync_mapping()
-
-    def _compute_sync_mapping(self) -> _SyncMapping:
-        """Greedy forward-pass sync algorithm.
-
-        Reads from _camera_timestamps and computes which frame from each camera
-        belongs to each sync group, handling dropped frames and slight
-        timing differences.
-        """
-        frames_by_cam: dict[int, list[float]] = {
-            cam_id: [ft.frame_times[i] for i in sorted(ft.frame_times.keys())]
-            for cam_id, ft in self._camera_timestamps.items()
-        }
-
-        cam_ids = sorted(frames_by_cam.keys())
-        cursors = {cam_id: 0 for cam_id in cam_ids}
-
-        sync_map: _SyncMapping = {}
-        sync_index = 0
-
-        while any(cursors[c] < len(frames_by_cam[c]) for c in cam_ids):
-            candidates: dict[int, float] = {}
-            for cam_id in cam_ids:
-                if cursors[cam_id] < len(frames_by_cam[cam_id]):
-                    candidates[cam_id] = frames_by_cam[cam_id][cursors[cam_id]]
-
-            if not candidates:
-                break
-
-            earliest_next: dict[int, float] = {}
-            latest_current: dict[int, float] = {}
-
-            for cam_id in cam_ids:
-                earliest_next[cam_id] = _earliest_next_frame(cam_id, cursors, frames_by_cam)
-                latest_current[cam_id] = _latest_current_frame(cam_id, cursors, frames_by_cam)
-
-            assigned: dict[int, int | None] = {}
-            for cam_id in cam_ids:
-                if cam_id not in candidates:
-                    assigned[cam_id] = None
-                    continue
-
-                frame_time = candidates[cam_id]
-                current_frame_index = cursors[cam_id]
-
-                if frame_time > earliest_next[cam_id]:
-                    assigned[cam_id] = None
-                    continue
-
-                delta_to_next = earliest_next[cam_id] - frame_time
-                delta_to_current = frame_time - latest_current[cam_id]
-
-                if delta_to_next < delta_to_current:
-                    assigned[cam_id] = None
-                    continue
-
-                assigned[cam_id] = current_frame_index
-                cursors[cam_id] += 1
-
-            if any(v is not None for v in assigned.values()):
-                sync_map[sync_index] = assigned
-                sync_index += 1
-            else:
-                if candidates:
-                    min_cam = min(candidates.keys(), key=lambda c: candidates[c])
-                    cursors[min_cam] += 1
-
-        return sync_map
+    def _columns(self) -> dict[int, int]:
+        """cam_id -> column of frame_table."""
+        return {cam_id: column for column, cam_id in enumerate(self.cam_ids)}
 
     # -------------------------------------------------------------------------
     # Factory methods
@@ -213,9 +183,8 @@ class SynchronizedTimestamps:
         camera_timestamps: dict[int, FrameTimestamps] = {}
         for cam_key, group in df.groupby("cam_id"):
             cam_id = int(cam_key)  # type: ignore[arg-type]  # pandas groupby key is numpy.int64
-            sorted_group = group.sort_values("frame_time").reset_index(drop=True)
-            frame_times = {i: float(t) for i, t in enumerate(sorted_group["frame_time"])}
-            camera_timestamps[cam_id] = FrameTimestamps(MappingProxyType(frame_times))
+            frame_times = np.sort(group["frame_time"].to_numpy(dtype=np.float64))
+            camera_timestamps[cam_id] = FrameTimestamps(0, frame_times)
 
         logger.debug(f"Loaded timestamps from CSV for {len(camera_timestamps)} cameras")
         return cls(MappingProxyType(camera_timestamps))
@@ -231,6 +200,9 @@ class SynchronizedTimestamps:
         from_videos() is for the GUI's directory-based workflow;
         from_video_paths() is for the scripting API where callers pass explicit paths.
 
+        Videos are probed concurrently, and read_video_properties serves
+        unchanged videos from their probe sidecar.
+
         Raises:
             ValueError: If mapping is empty, frame count is 0, or FPS is missing.
             FileNotFoundError: If any video path does not exist.
@@ -238,13 +210,18 @@ class SynchronizedTimestamps:
         if not videos:
             raise ValueError("No video paths provided -- cannot infer timestamps")
 
-        props_by_cam: dict[int, tuple[int, float]] = {}  # cam_id -> (frame_count, fps)
-
-        for cam_id, video_path in videos.items():
+        for video_path in videos.values():
             if not video_path.exists():
                 raise FileNotFoundError(f"Video file not found: {video_path}")
 
-            props = read_video_properties(video_path)
+        # Probing is dominated by container open latency (and by the network on
+        # mounted workspaces), so cameras are probed concurrently.
+        with ThreadPoolExecutor(max_workers=min(len(videos), _MAX_PROBE_WORKERS)) as pool:
+            probed = dict(zip(videos.keys(), pool.map(read_video_properties, videos.values())))
+
+        props_by_cam: dict[int, tuple[int, float]] = {}  # cam_id -> (frame_count, fps)
+
+        for cam_id, props in probed.items():
             frame_count = props["frame_count"]
             fps = props["fps"]
 
@@ -290,8 +267,8 @@ class SynchronizedTimestamps:
 
         camera_timestamps: dict[int, FrameTimestamps] = {}
         for cam_id, (frame_count, _) in props_by_cam.items():
-            frame_times = {i: i * avg_duration / frame_count for i in range(frame_count)}
-            camera_timestamps[cam_id] = FrameTimestamps(MappingProxyType(frame_times))
+            frame_times = np.arange(frame_count) * avg_duration / frame_count
+            camera_timestamps[cam_id] = FrameTimestamps(0, frame_times)
 
         total_frames = sum(fc for fc, _ in props_by_cam.values())
         logger.info(
@@ -351,29 +328,149 @@ class SynchronizedTimestamps:
 
 
 # -------------------------------------------------------------------------
-# Module-level helpers (used by _compute_sync_mapping)
+# Module-level helpers (_compute_sync_table and the steps it takes)
 # -------------------------------------------------------------------------
 
+# Bounds on the block of steps tested at once by _all_assigned_run.
+_MIN_RUN_WINDOW = 64
+_MAX_RUN_WINDOW = 65_536
+# After a short run, take this many scalar steps before trying a block again.
+# Recordings with frequent drops or mixed frame rates rarely produce long runs; this keeps them
+# from paying NumPy call overhead on every step.
+_SCALAR_STEPS_AFTER_SHORT_RUN = 32
+
+
+def _compute_sync_table(frame_times: Sequence[np.ndarray]) -> np.ndarray:
+    """Assign frames to sync indices. Returns (n_sync, n_cams) int64, -1 where a camera has no frame.
+
+    frame_times[k] holds camera k's timestamps in frame order. Each camera has
+    a cursor on its next unassigned frame. At every step a camera's current
+    frame joins the sync group unless it lies beyond the earliest *next* frame
+    of the other cameras, or is closer to that next frame than to the latest
+    *current* frame of the other cameras. Assigned cameras advance; if no camera
+    is assigned, the camera with the earliest current frame skips it.
+
+    The common case is a stretch where every remaining camera is assigned at
+    every step. Such runs are detected a block at a time with array
+    operations and committed in bulk; any other step falls back to
+    _greedy_step. Both paths apply the same rule, so the result is identical
+    to stepping one sync index at a time.
+    """
+    n_cams = len(frame_times)
+    lengths = [len(t) for t in frame_times]
+    # A trailing +inf stands in for "no next frame" in the block comparisons.
+    padded = [np.append(np.asarray(t, dtype=np.float64), np.inf) for t in frame_times]
+    padded_lists = [t.tolist() for t in padded]
+    cursors = [0] * n_cams
+
+    blocks: list[np.ndarray] = []
+    pending_rows: list[list[int]] = []
+    window = _MIN_RUN_WINDOW
+    scalar_steps = 0
+
+    while any(cursors[k] < lengths[k] for k in range(n_cams)):
+        if scalar_steps == 0:
+            run, block = _all_assigned_run(padded, cursors, lengths, window)
+            if run > 0:
+                if pending_rows:
+                    blocks.append(np.array(pending_rows, dtype=np.int64))
+                    pending_rows = []
+                blocks.append(block)
+                cursors = [c + run if c < n else c for c, n in zip(cursors, lengths)]
+            if run == window:
+                window = min(2 * window, _MAX_RUN_WINDOW)
+                continue
+            window = _MIN_RUN_WINDOW
+            if run < _MIN_RUN_WINDOW:
+                scalar_steps = _SCALAR_STEPS_AFTER_SHORT_RUN
+            if not any(cursors[k] < lengths[k] for k in range(n_cams)):
+                break
+        else:
+            scalar_steps -= 1
 
-def _earliest_next_frame(cam_id: int, cursors: dict[int, int], frames_by_cam: dict[int, list[float]]) -> float:
-    """Get minimum frame_time of NEXT frames from OTHER cameras."""
-    times = []
-    for c in cursors:
-        if c == cam_id:
-            continue
-        next_index = cursors[c] + 1
-        if next_index < len(frames_by_cam[c]):
-            times.append(frames_by_cam[c][next_index])
-    return min(times) if times else float("inf")
+        row = _greedy_step(padded_lists, cursors, lengths)
+        if row is not None:
+            pending_rows.append(row)
 
+    if pending_rows:
+        blocks.append(np.array(pending_rows, dtype=np.int64))
+    if not blocks:
+        return np.empty((0, n_cams), dtype=np.int64)
+    return np.concatenate(blocks)
 
-def _latest_current_frame(cam_id: int, cursors: dict[int, int], frames_by_cam: dict[int, list[float]]) -> float:
-    """Get maximum frame_time of CURRENT frames from OTHER cameras."""
-    times = []
-    for c in cursors:
-        if c == cam_id:
+
+def _all_assigned_run(
+    padded: list[np.ndarray], cursors: list[int], lengths: list[int], window: int
+) -> tuple[int, np.ndarray]:
+    """Count leading steps (up to window) at which every remaining camera is assigned.
+
+    Returns the run length and its sync-table rows. Within such a run every
+    remaining cursor advances by one per step, so the frames under test are
+    simply the next `window` frames of each camera.
+    """
+    active = [k for k in range(len(padded)) if cursors[k] < lengths[k]]
+    span = min(window, min(lengths[k] - cursors[k] for k in active))
+
+    if len(active) > 1:
+        current = np.stack([padded[k][cursors[k] : cursors[k] + span] for k in active], axis=1)
+        upcoming = np.stack([padded[k][cursors[k] + 1 : cursors[k] + 1 + span] for k in active], axis=1)
+
+        # Min/max over the *other* cameras: the overall extreme, except for the
+        # camera holding it, which sees the runner-up. Ties make both equal.
+        lowest_two = np.partition(upcoming, 1, axis=1)
+        earliest_next = np.where(upcoming == lowest_two[:, :1], lowest_two[:, 1:2], lowest_two[:, :1])
+        highest_two = np.partition(current, -2, axis=1)
+        latest_current = np.where(current == highest_two[:, -1:], highest_two[:, -2:-1], highest_two[:, -1:])
+
+        rejected = (current > earliest_next) | (earliest_next - current < current - latest_current)
+        failed_steps = np.flatnonzero(rejected.any(axis=1))
+        run = int(failed_steps[0]) if len(failed_steps) else span
+    else:
+        # A lone camera has nothing to wait for: every frame is its own sync index.
+        run = span
+
+    block = np.full((run, len(padded)), -1, dtype=np.int64)
+    steps = np.arange(run, dtype=np.int64)
+    for k in active:
+        block[:, k] = cursors[k] + steps
+    return run, block
+
+
+def _greedy_step(times: list[list[float]], cursors: list[int], lengths: list[int]) -> list[int] | None:
+    """One step of the sync rule at arbitrary state. Advances cursors in place.
+
+    Returns the sync-table row (-1 for unassigned cameras), or None when no
+    camera was assigned and the earliest camera skipped a frame instead.
+    """
+    inf = float("inf")
+    n_cams = len(times)
+    active = [k for k in range(n_cams) if cursors[k] < lengths[k]]
+    # times carry a trailing +inf, so the frame after a camera's last one reads as "never"
+    current = {k: times[k][cursors[k]] for k in active}
+    upcoming = {k: times[k][cursors[k] + 1] for k in active}
+
+    # Two smallest upcoming and two largest current times give the extreme over the other cameras.
+    next_sorted = sorted(upcoming.values())[:2] + [inf, inf]
+    current_sorted = sorted(current.values(), reverse=True)[:2] + [-inf, -inf]
+
+    row = [-1] * n_cams
+    for k in active:
+        frame_time = current[k]
+        earliest_next = next_sorted[1] if upcoming[k] == next_sorted[0] else next_sorted[0]
+        if frame_time > earliest_next:
+            continue
+        latest_current = current_sorted[1] if frame_time == current_sorted[0] else current_sorted[0]
+        if earliest_next - frame_time < frame_time - latest_current:
             continue
-        current_index = cursors[c]
-        if current_index < len(frames_by_cam[c]):
-            times.append(frames_by_cam[c][current_index])
-    return max(times) if times else float("-inf")
+        row[k] = cursors[k]
+
+    if all(f < 0 for f in row):
+        # Skip the earliest current frame (lowest camera on ties).
+        earliest = min(active, key=lambda k: current[k])
+        cursors[earliest] += 1
+        return None
+
+    for k in active:
+        if row[k] >= 0:
+            cursors[k] += 1
+    return row
@@ -2,9 +2,16 @@
 
 Functions for reading video metadata without full frame decoding.
 Uses PyAV for container inspection -- no frames are decoded.
+
+Probe results are cached beside each video as cam_N.probe.json together with
+the video's size and mtime, so reopening an unchanged recording (slow on
+network mounts) costs a stat() per file instead of a container open.
 """
 
+import json
 import logging
+import os
+import tempfile
 from pathlib import Path
 from typing import TypedDict
 
@@ -12,6 +19,8 @@ import av
 
 logger = logging.getLogger(__name__)
 
+VIDEO_PROBE_VERSION = 1
+
 
 class VideoProperties(TypedDict):
     """Video metadata returned by read_video_properties."""
@@ -23,11 +32,18 @@ class VideoProperties(TypedDict):
     size: tuple[int, int]
 
 
-def read_video_properties(source_path: Path) -> VideoProperties:
+def video_probe_path(video_path: Path) -> Path:
+    """Sidecar location for cached video properties (cam_0.mp4 -> cam_0.probe.json)."""
+    return video_path.with_name(f"{video_path.stem}.probe.json")
+
+
+def read_video_properties(source_path: Path, use_cache: bool = True) -> VideoProperties:
     """Read video metadata (fps, frame_count, dimensions) via PyAV.
 
     Opens the video container briefly to inspect stream metadata,
-    then closes it. No frames are decoded.
+    then closes it. No frames are decoded. With use_cache, a probe sidecar
+    matching the video's current size and mtime is returned instead, and a
+    fresh probe is saved for next time.
 
     Falls back to duration-based frame count when the container
     does not report stream.frames (same logic as FrameSource.frame_count).
@@ -39,9 +55,21 @@ def read_video_properties(source_path: Path) -> VideoProperties:
             exceptions are wrapped as ValueError to preserve the caller
             contract.
     """
-    if not source_path.exists():
-        raise FileNotFoundError(f"Video file not found: {source_path}")
+    try:
+        stat = source_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Video file not found: {source_path}") from None
 
+    if use_cache and (cached := _load_probe(source_path, stat)) is not None:
+        return cached
+
+    properties = _probe_video(source_path)
+    if use_cache:
+        _save_probe(source_path, stat, properties)
+    return properties
+
+
+def _probe_video(source_path: Path) -> VideoProperties:
     logger.info(f"Reading video properties from: {source_path}")
 
     try:
@@ -92,3 +120,57 @@ def read_video_properties(source_path: Path) -> VideoProperties:
         )
     finally:
         container.close()
+
+
+def _load_probe(video_path: Path, stat: os.stat_result) -> VideoProperties | None:
+    """Cached properties if the sidecar matches the video's size and mtime, else None."""
+    sidecar = video_probe_path(video_path)
+    if not sidecar.exists():
+        return None
+    try:
+        stored = json.loads(sidecar.read_text(encoding="utf-8"))
+        if (
+            stored["version"] != VIDEO_PROBE_VERSION
+            or stored["video_size"] != stat.st_size
+            or stored["video_mtime_ns"] != stat.st_mtime_ns
+        ):
+            return None
+        width, height = int(stored["width"]), int(stored["height"])
+        return VideoProperties(
+            fps=float(stored["fps"]),
+            frame_count=int(stored["frame_count"]),
+            width=width,
+            height=height,
+            size=(width, height),
+        )
+    except Exception as e:
+        logger.warning(f"Could not read video probe cache {sidecar}, probing again: {e}")
+        return None
+
+
+def _save_probe(video_path: Path, stat: os.stat_result, properties: VideoProperties) -> None:
+    """Write atomically; an unwritable directory only costs a probe next time."""
+    sidecar = video_probe_path(video_path)
+    stored = {
+        "version": VIDEO_PROBE_VERSION,
+        "video_size": stat.st_size,
+        "video_mtime_ns": stat.st_mtime_ns,
+        "fps": properties["fps"],
+        "frame_count": properties["frame_count"],
+        "width": properties["width"],
+        "height": properties["height"],
+    }
+    try:
+        # Probes run on a thread pool; each save needs its own temp file.
+        fd, temp_name = tempfile.mkstemp(dir=sidecar.parent, prefix=f"{sidecar.name}.", suffix=".tmp")
+    except OSError as e:
+        logger.warning(f"Could not save video probe cache to {sidecar}: {e}")
+        return
+    temp_path = Path(temp_name)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps(stored, indent=2))
+        os.replace(temp_path, sidecar)
+    except OSError as e:
+        logger.warning(f"Could not save video probe cache to {sidecar}: {e}")
+        temp_path.unlink(missing_ok=True)
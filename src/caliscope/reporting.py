@@ -345,7 +345,7 @@ def print_camera_pair_coverage(
     matrix = report.pairwise_observations
 
     # Sorted cam_ids from the data (same order analyze_multi_camera_coverage uses internally)
-    df = image_points.df
+    df = image_points.view
     cam_ids = sorted(df["cam_id"].unique().tolist()) if len(df) > 0 else []
     n = len(cam_ids)
 
@@ -422,7 +422,7 @@ def print_coverage_grid(
     width, height = image_size
 
     # Filter to selected frames and camera
-    df = image_points.df
+    df = image_points.view
     mask = (df["cam_id"] == cam_id) & (df["sync_index"].isin(report.selected_frames))
     selected_df = df[mask]
 
@@ -89,6 +89,20 @@ class ProjectSettingsRepository:
         settings["save_xy_points"] = save
         self.save(settings)
 
+    def get_online_triangulation(self) -> bool:
+        """Get flag for triangulating each sync index during 2D tracking (default: False).
+
+        Overlaps triangulation with tracking instead of running it afterwards.
+        Gaps are then filled in 3D rather than 2D, so it is opt-in.
+        """
+        return bool(self._cache.get("online_triangulation", False))
+
+    def set_online_triangulation(self, online: bool) -> None:
+        """Update online triangulation flag and persist immediately."""
+        settings = self._cache.copy()
+        settings["online_triangulation"] = online
+        self.save(settings)
+
     def get_creation_date(self) -> Any:
         """Get project creation date if available."""
         return self._cache.get("creation_date")
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 import cv2
 import numpy as np
@@ -25,10 +25,57 @@ class Tracker(ABC):
     def pixel_format(self) -> PixelFormat:
         return PixelFormat.BGR
 
-    def get_points(self, frame: np.ndarray, cam_id: int = 0, rotation_count: int = 0) -> PointPacket:
-        """Enforce pixel format contract, then delegate to _detect."""
+    @property
+    def config(self) -> dict[str, object]:
+        """Settings that change this tracker's output, beyond its name.
+
+        Used to fingerprint cached 2D points (see reconstruction/xy_cache.py).
+        Override in trackers that are configurable; values are serialized with
+        repr() when they are not JSON-native.
+        """
+        return {}
+
+    @property
+    def preferred_resolution(self) -> tuple[int, int] | None:
+        """Smallest (width, height) this tracker works well at, or None to require native frames.
+
+        Pipelines that opt into reduced-resolution decoding scale larger video
+        down toward this size (see frame_scale); detections are mapped back to
+        native pixels by get_points.
+        """
+        return None
+
+    def frame_scale(self, native_size: tuple[int, int]) -> float:
+        """Decode scale (<= 1) that brings native_size down toward preferred_resolution."""
+        preferred = self.preferred_resolution
+        if preferred is None:
+            return 1.0
+        # Long side against long side so a portrait camera gets the same scale as a landscape one.
+        scale = max(max(preferred) / max(native_size), min(preferred) / min(native_size))
+        return min(1.0, scale)
+
+    def get_points(
+        self,
+        frame: np.ndarray,
+        cam_id: int = 0,
+        rotation_count: int = 0,
+        native_size: tuple[int, int] | None = None,
+    ) -> PointPacket:
+        """Enforce pixel format contract, then delegate to _detect.
+
+        native_size is the video's (width, height) when frame was decoded at
+        reduced resolution; img_loc is then rescaled to native pixels so
+        downstream ImagePoints never see the decode scale.
+        """
         frame = self._ensure_format(frame)
-        return self._detect(frame, cam_id, rotation_count)
+        points = self._detect(frame, cam_id, rotation_count)
+        if native_size is None or len(points.img_loc) == 0:
+            return points
+
+        frame_size = (frame.shape[1], frame.shape[0])
+        if frame_size == tuple(native_size):
+            return points
+        return replace(points, img_loc=rescale_points(points.img_loc, frame_size, native_size))
 
     def _ensure_format(self, frame: np.ndarray) -> np.ndarray:
         if self.pixel_format == PixelFormat.GRAY and frame.ndim == 3:
@@ -76,6 +123,25 @@ class Tracker(ABC):
         """
         return set()
 
+    def reset(self, cam_id: int) -> None:
+        """Forget state carried from one frame of cam_id to the next.
+
+        Called before a camera's frames stop following on from the previous
+        call, e.g. at the start of each segment when one video is tracked in
+        parallel pieces. Default is a no-op for trackers without such state.
+        """
+        pass
+
+    def set_thread_budget(self, threads: int) -> None:
+        """Limit the threads this tracker's own computation may use.
+
+        Called on each copy when several copies of a tracker run at once (one
+        per worker process or segment), so that together they do not
+        oversubscribe the cores. Default is a no-op for trackers that compute
+        on the calling thread only.
+        """
+        pass
+
     def cleanup(self) -> None:
         """Release tracker resources (threads, GPU memory, etc.).
 
@@ -85,6 +151,17 @@ class Tracker(ABC):
         pass
 
 
+def rescale_points(xy: np.ndarray, from_size: tuple[int, int], to_size: tuple[int, int]) -> np.ndarray:
+    """Map (N, 2) pixel coordinates between two resolutions of the same image.
+
+    Pixel centers sit at integer coordinates (OpenCV convention) and the
+    resampler aligns pixel centers, so the map is affine about the half-pixel
+    offset rather than a plain multiply.
+    """
+    scale = np.array([to_size[0] / from_size[0], to_size[1] / from_size[1]])
+    return (np.asarray(xy, dtype=np.float64) + 0.5) * scale - 0.5
+
+
 @dataclass(slots=True, frozen=True)
 class Segment:
     name: str
@@ -7,6 +7,8 @@ Design decisions:
 - obj_loc populated when ArucoMarkerSet is provided
 - Default dictionary: cv2.aruco.DICT_4X4_100
 - Default inversion: False (True only for legacy test data)
+- Optional pyramid detection: markers are found on a downscaled frame and their
+  corners refined with cornerSubPix at full resolution (trackers/pyramid.py)
 - Two-sided boards: use MirrorPair on ArucoMarkerSet (core/aruco_marker.py),
   not image-level mirror detection — a horizontally flipped ArUco pattern can
   decode as a different valid ID, so flip-and-redetect is unsafe for ArUco.
@@ -20,6 +22,7 @@ import numpy as np
 from caliscope.core.aruco_marker import ArucoMarkerSet
 from caliscope.packets import PixelFormat, PointPacket
 from caliscope.tracker import Tracker
+from caliscope.trackers.pyramid import assumed_feature_px, downscale, pyramid_scale, to_full_resolution
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +32,22 @@ CORNER_TR = 1  # Top-right
 CORNER_BR = 2  # Bottom-right
 CORNER_BL = 3  # Bottom-left
 
+# With pyramid detection, the smallest marker side (pixels) to detect at: about
+# 5 px per bit for a 4x4 dictionary plus its border.
+MIN_PYRAMID_MARKER_PX = 32
+
+# Markers assumed across the expected target before a camera's first detection.
+ASSUMED_MARKERS_ACROSS = 4
+
+# cornerSubPix termination for pyramid-detected corners
+SUBPIX_CRITERIA = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 30, 0.001)
+
+
+def _marker_sides(corners: np.ndarray) -> np.ndarray:
+    """(n_markers, 4) side lengths in pixels of markers given as (n_markers * 4, 2) corners."""
+    quads = corners.reshape(-1, 4, 2)
+    return np.linalg.norm(quads - np.roll(quads, 1, axis=1), axis=2)
+
 
 class ArucoTracker(Tracker):
     """
@@ -45,40 +64,71 @@ class ArucoTracker(Tracker):
         dictionary=cv2.aruco.DICT_4X4_100,
         inverted=False,
         marker_set: ArucoMarkerSet | None = None,
+        pyramid: bool = False,
     ):
         """
         Args:
             dictionary: OpenCV ArUco dictionary to use for detection
             inverted: Whether to invert the image before detection (for legacy test data)
             marker_set: Marker set definition for filtering and obj_loc population
+            pyramid: Detect on a downscaled frame, then refine corners at full resolution
         """
         self.dictionary = dictionary
         self.inverted = inverted
         self.marker_set = marker_set
+        self.pyramid = pyramid
+
+        # Median marker side in pixels at each camera's last detection; picks the pyramid scale
+        self._marker_px: dict[int, float] = {}
 
         # Create detector instance
         self.dictionary_object = cv2.aruco.getPredefinedDictionary(dictionary)
         self.detector = cv2.aruco.ArucoDetector(self.dictionary_object)
 
+    def __reduce__(self):
+        # OpenCV dictionary and detector objects do not pickle; rebuild them.
+        return (type(self), (self.dictionary, self.inverted, self.marker_set, self.pyramid))
+
+    def reset(self, cam_id: int) -> None:
+        self._marker_px.pop(cam_id, None)
+
     @property
     def name(self) -> str:
         """Return tracker name for file naming."""
         return "ARUCO"
 
+    @property
+    def config(self) -> dict[str, object]:
+        return {
+            "dictionary": self.dictionary,
+            "inverted": self.inverted,
+            "marker_set": self.marker_set,
+            **({"pyramid": True} if self.pyramid else {}),
+        }
+
     @property
     def pixel_format(self) -> PixelFormat:
         return PixelFormat.GRAY
 
-    def _detect_markers(self, gray_frame):
+    def _detect_markers(self, gray_frame, scale: float = 1.0):
         """Internal helper to detect markers and format results.
         Returns (object_ids, keypoint_ids, all_corners) or (None, None, None) if no markers.
+
+        With scale < 1, markers are detected on gray_frame downscaled by scale.
+        With pyramid detection on, corners are refined at full resolution at any
+        scale, so they are equally accurate whichever scale found them.
         """
-        corners, ids, rejected = self.detector.detectMarkers(gray_frame)
+        image = gray_frame if scale == 1.0 else downscale(gray_frame, scale)
+        corners, ids, rejected = self.detector.detectMarkers(image)
 
         if ids is not None and len(ids) > 0:
             # Flatten corners: each marker has 4 corners in shape (1, 4, 2)
             # We want shape (n_markers * 4, 2)
             all_corners = np.vstack(corners).reshape(-1, 2)
+            if image is not gray_frame:
+                all_corners = to_full_resolution(all_corners, image.shape, gray_frame.shape)
+            if self.pyramid:
+                all_corners = self._refine_corners(gray_frame, all_corners)
 
             # Build separate object_id (marker_id) and keypoint_id (corner 0-3) arrays
             object_ids = []
@@ -98,6 +148,26 @@ class ArucoTracker(Tracker):
 
         return None, None, None
 
+    def _refine_corners(self, gray_frame: np.ndarray, corners: np.ndarray) -> np.ndarray:
+        """(n_markers * 4, 2) upscaled marker corners refined with cornerSubPix on gray_frame.
+
+        The search window spans at most one cell of the marker's black border,
+        so the bit pattern inside does not pull the corner inward.
+        """
+        cell_px = float(_marker_sides(corners).min()) / (self.dictionary_object.markerSize + 2)
+        half_width = int(np.clip(np.floor(cell_px), 2, 11))
+        refined = cv2.cornerSubPix(
+            gray_frame, corners.reshape(-1, 1, 2), (half_width, half_width), (-1, -1), SUBPIX_CRITERIA
+        )
+        return refined.reshape(-1, 2)
+
+    def _pyramid_scale(self, cam_id: int, frame_shape: tuple[int, ...]) -> float:
+        """Detection scale for cam_id's next frame, from its last marker size (or an assumed one)."""
+        marker_px = self._marker_px.get(cam_id)
+        if marker_px is None:
+            marker_px = assumed_feature_px(frame_shape, ASSUMED_MARKERS_ACROSS)
+        return pyramid_scale(marker_px, MIN_PYRAMID_MARKER_PX)
+
     def _build_obj_loc(
         self,
         object_ids: np.ndarray,
@@ -134,7 +204,16 @@ class ArucoTracker(Tracker):
             gray_frame = cv2.bitwise_not(gray_frame)
 
         # Attempt detection on original orientation
-        object_ids, keypoint_ids, all_corners = self._detect_markers(gray_frame)
+        if self.pyramid:
+            scale = self._pyramid_scale(cam_id, gray_frame.shape)
+            object_ids, keypoint_ids, all_corners = self._detect_markers(gray_frame, scale)
+            if all_corners is None and scale < 1.0:
+                # Markers too small for the reduced frame (or absent): full resolution
+                object_ids, keypoint_ids, all_corners = self._detect_markers(gray_frame)
+            if all_corners is not None:
+                self._marker_px[cam_id] = float(np.median(_marker_sides(all_corners)))
+        else:
+            object_ids, keypoint_ids, all_corners = self._detect_markers(gray_frame)
 
         if object_ids is not None and keypoint_ids is not None and all_corners is not None:
             if self.marker_set is not None:
@@ -0,0 +1,95 @@
+"""Constant-velocity Kalman filter for a tracked subject's crop box.
+
+OnnxTracker crops each frame to where the subject was in the previous one. A
+subject moving quickly leaves that crop, and the tracker has to fall back to a
+full-frame or sliding-window search. A BoxMotion follows the box centre and
+height with a constant-velocity model, so the crop can be placed where the
+subject is about to be instead of where it was.
+
+The search box around a prediction grows with the prediction's uncertainty.
+Process noise scales with the box height (a near subject moves more pixels
+than a far one), and it is inflated while measurements keep surprising the
+filter (a subject speeding up or turning), so the crop widens exactly when the
+constant-velocity guess is least reliable.
+"""
+
+import numpy as np
+
+# Noise standard deviations as fractions of box height, per frame.
+POSITION_NOISE = 1 / 80
+VELOCITY_NOISE = 1 / 80
+MEASUREMENT_NOISE = 1 / 80
+
+# Upper bound on the adaptive process noise multiplier.
+MAX_PROCESS_SCALE = 16.0
+
+
+class BoxMotion:
+    """Kalman filter over (cx, cy, height) and their per-frame velocities.
+
+    Call predict() once per frame before using the prediction, and update()
+    with the box measured in that frame. The three axes share no noise, so
+    each is an independent position/velocity filter and the covariance is
+    kept as three 2x2 blocks: position variance, position-velocity
+    covariance, and velocity variance, one entry per axis.
+    """
+
+    def __init__(self, cx: float, cy: float, height: float) -> None:
+        self.position = np.array([cx, cy, height], dtype=np.float64)
+        self.velocity = np.zeros(3)
+        self.var_position = np.full(3, (2 * POSITION_NOISE * height) ** 2)
+        self.cov_position_velocity = np.zeros(3)
+        self.var_velocity = np.full(3, (10 * VELOCITY_NOISE * height) ** 2)
+        self.process_scale = 1.0
+
+    @property
+    def center(self) -> tuple[float, float]:
+        return float(self.position[0]), float(self.position[1])
+
+    @property
+    def height(self) -> float:
+        return float(self.position[2])
+
+    def predict(self) -> None:
+        """Advance the state one frame."""
+        height = max(self.position[2], 1.0)
+        q_position = self.process_scale * (POSITION_NOISE * height) ** 2
+        q_velocity = self.process_scale * (VELOCITY_NOISE * height) ** 2
+
+        self.position += self.velocity
+        # P <- F P F^T + Q with F = [[1, 1], [0, 1]] per axis
+        self.var_position += 2 * self.cov_position_velocity + self.var_velocity + q_position
+        self.cov_position_velocity += self.var_velocity
+        self.var_velocity += q_velocity
+
+    def update(self, cx: float, cy: float, height: float) -> None:
+        """Correct the prediction with the box measured this frame."""
+        innovation = np.array([cx, cy, height]) - self.position
+        innovation_var = self.var_position + (MEASUREMENT_NOISE * max(height, 1.0)) ** 2
+        gain_position = self.var_position / innovation_var
+        gain_velocity = self.cov_position_velocity / innovation_var
+
+        self.position += gain_position * innovation
+        self.velocity += gain_velocity * innovation
+        # P <- (I - K H) P
+        self.var_velocity -= gain_velocity * self.cov_position_velocity
+        self.cov_position_velocity -= gain_position * self.cov_position_velocity
+        self.var_position -= gain_position * self.var_position
+
+        # Normalized innovation squared averages 3 when the model fits; scale
+        # process noise toward what the recent surprises call for.
+        nis = float(np.sum(innovation**2 / innovation_var)) / 3
+        self.process_scale = min(max(0.5 * self.process_scale + 0.5 * nis, 1.0), MAX_PROCESS_SCALE)
+
+    def search_box(self, aspect: float, n_sigma: float = 2.0) -> tuple[float, float, float, float]:
+        """(cx, cy, width, height) of a box of the given width/height aspect covering the predicted box.
+
+        The predicted box is widened by n_sigma standard deviations of the
+        centre on each side and of the height overall.
+        """
+        cx, cy, height = self.position
+        std_x, std_y, std_h = np.sqrt(self.var_position)
+        box_h = max(height, 1.0) + 2 * n_sigma * std_y + n_sigma * std_h
+        box_w = max(height, 1.0) * aspect + 2 * n_sigma * std_x + n_sigma * std_h * aspect
+        box_h = max(box_h, box_w / aspect)
+        return float(cx), float(cy), float(box_h * aspect), float(box_h)
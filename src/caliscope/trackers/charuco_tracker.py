@@ -9,12 +9,29 @@ import numpy as np
 
 from caliscope.packets import PixelFormat, PointPacket
 from caliscope.tracker import Tracker
+from caliscope.trackers.pyramid import assumed_feature_px, downscale, median_spacing, pyramid_scale, to_full_resolution
 
 logger = logging.getLogger(__name__)
 
+# Search region around the last detected board: its whole outline (projected
+# from the corners found) plus a margin on each side for motion, as a fraction
+# of the outline's extent but at least ROI_MIN_MARGIN pixels.
+ROI_MARGIN = 0.25
+ROI_MIN_MARGIN = 32
+
+# Suggested full_frame_interval for region search: frames a camera may be
+# tracked within its search region before the full frame is searched again
+# (catching a board that grew or moved beyond it). The default, 0, searches
+# the full frame every time.
+FULL_FRAME_INTERVAL = 30
+
+# With pyramid detection, the smallest square side (pixels) to detect at; its
+# marker is then about 30 px, 5 px per bit for a 4x4 dictionary.
+MIN_PYRAMID_SQUARE_PX = 40
+
 
 class CharucoTracker(Tracker):
-    def __init__(self, charuco):
+    def __init__(self, charuco, full_frame_interval: int = 0, pyramid: bool = False):
         # need camera to know resolution and to assign calibration parameters
         # to camera
         self.charuco = charuco
@@ -27,6 +44,7 @@ class CharucoTracker(Tracker):
         params = cv2.aruco.DetectorParameters()
         params.adaptiveThreshWinSizeStep = 20
 
+        self.detector_params = params
         self.detector = cv2.aruco.CharucoDetector(self.board, detectorParams=params)
 
         # for subpixel corner correction
@@ -39,34 +57,90 @@ class CharucoTracker(Tracker):
         # parallel processing guarantees distinct cam_ids per thread.
         self._last_mirrored: dict[int, bool] = {}
 
+        # Per-camera search region (x1, y1, x2, y2) around the last detected
+        # board, the corner count found then, and frames tracked in it since a
+        # full-frame search. Marker detection over a 4K frame dominates
+        # collection time; a board that moves little between frames is found
+        # in a fraction of it. Region results can differ from a full-frame
+        # search (a corner at the region edge, float32 rounding in refinement),
+        # so points depend on where tracking started. Region search is therefore
+        # opt-in: full_frame_interval > 0 (e.g. FULL_FRAME_INTERVAL) enables it.
+        self.roi_margin = ROI_MARGIN
+        self.full_frame_interval = full_frame_interval
+        self._rois: dict[int, tuple[int, int, int, int]] = {}
+        self._roi_counts: dict[int, int] = {}
+        self._roi_frames: dict[int, int] = {}
+
+        # Pyramid detection: find the board on a downscaled frame, refine the
+        # corners at full resolution. The scale comes from each camera's last
+        # square size in pixels (see trackers/pyramid.py).
+        self.pyramid = pyramid
+        self._square_px: dict[int, float] = {}
+
+    def __reduce__(self):
+        # OpenCV board and detector objects do not pickle; rebuild them from the
+        # Charuco definition (process-pool extraction ships trackers to workers).
+        return (type(self), (self.charuco, self.full_frame_interval, self.pyramid))
+
+    def reset(self, cam_id: int) -> None:
+        self._last_mirrored.pop(cam_id, None)
+        self._rois.pop(cam_id, None)
+        self._roi_counts.pop(cam_id, None)
+        self._roi_frames.pop(cam_id, None)
+        self._square_px.pop(cam_id, None)
+
     @property
     def name(self):
         return "CHARUCO"
 
+    @property
+    def config(self) -> dict[str, object]:
+        charuco = self.charuco
+        return {
+            "columns": charuco.columns,
+            "rows": charuco.rows,
+            "board_height": charuco.board_height,
+            "board_width": charuco.board_width,
+            "dictionary": charuco.dictionary,
+            "units": charuco.units,
+            "aruco_scale": charuco.aruco_scale,
+            "square_size_override_cm": charuco.square_size_override_cm,
+            "inverted": charuco.inverted,
+            "legacy_pattern": charuco.legacy_pattern,
+            "thickness_cm": charuco.thickness_cm,
+            **({"pyramid": True} if self.pyramid else {}),
+            **({"full_frame_interval": self.full_frame_interval} if self.full_frame_interval else {}),
+        }
+
     @property
     def pixel_format(self) -> PixelFormat:
         return PixelFormat.GRAY
 
     def _detect(self, frame: np.ndarray, cam_id: int = 0, rotation_count: int = 0) -> PointPacket:
         gray = frame
-        if self.charuco.inverted:
-            gray = cv2.bitwise_not(gray)
+        scale = self._pyramid_scale(cam_id, gray.shape) if self.pyramid else 1.0
 
-        # Try the orientation that worked last time for this camera
-        hint_mirrored = self._last_mirrored.get(cam_id, False)
-        try_order = [hint_mirrored, not hint_mirrored]
+        # Search around the last detection first. Fall back to the full frame when
+        # the region yields fewer corners than last time (the board may have moved
+        # out of it), and search the full frame every full_frame_interval frames.
+        found = False
+        roi = self._rois.get(cam_id)
+        if roi is not None and self._roi_frames.get(cam_id, 0) < self.full_frame_interval:
+            ids, img_loc, detected_mirrored = self._find_corners_oriented(gray, cam_id, roi, scale)
+            found = len(ids) > 0 and len(ids) >= self._roi_counts.get(cam_id, 0)
+            if found:
+                self._roi_frames[cam_id] = self._roi_frames.get(cam_id, 0) + 1
 
-        ids = np.array([], dtype=np.int32)
-        img_loc = np.empty((0, 2), dtype=np.float64)
+        if not found:
+            ids, img_loc, detected_mirrored = self._find_corners_oriented(gray, cam_id, scale=scale)
+            if len(ids) == 0 and scale < 1.0:
+                # Board too small for the reduced frame (or absent): full resolution
+                ids, img_loc, detected_mirrored = self._find_corners_oriented(gray, cam_id)
+            self._roi_frames[cam_id] = 0
 
-        detected_mirrored = False
-        for is_mirrored in try_order:
-            gray_input = cv2.flip(gray, 1) if is_mirrored else gray
-            ids, img_loc = self.find_corners_single_frame(gray_input, mirror=is_mirrored)
-            if ids.any():
-                self._last_mirrored[cam_id] = is_mirrored
-                detected_mirrored = is_mirrored
-                break
+        self._update_roi(cam_id, ids, img_loc, gray.shape[1], gray.shape[0])
+        if self.pyramid and len(ids) >= 2:
+            self._square_px[cam_id] = median_spacing(img_loc)
 
         # Identity split for a two-sided board with substrate thickness: the
         # back face is a distinct object (object_id=1) whose corners sit at
@@ -84,18 +158,116 @@ class CharucoTracker(Tracker):
             obj_loc=obj_loc,
         )
 
+    def _pyramid_scale(self, cam_id: int, frame_shape: tuple[int, ...]) -> float:
+        """Detection scale for cam_id's next frame, from its last square size (or an assumed one)."""
+        square_px = self._square_px.get(cam_id)
+        if square_px is None:
+            square_px = assumed_feature_px(frame_shape, max(self.charuco.columns, self.charuco.rows))
+        return pyramid_scale(square_px, MIN_PYRAMID_SQUARE_PX)
+
+    def _find_corners_oriented(
+        self, gray: np.ndarray, cam_id: int, roi: tuple[int, int, int, int] | None = None, scale: float = 1.0
+    ) -> tuple[np.ndarray, np.ndarray, bool]:
+        """(ids, img_loc, mirrored) from gray, trying the orientation that worked last time for cam_id first.
+
+        With roi (x1, y1, x2, y2), only that region is searched; img_loc is
+        still in full-frame coordinates. See find_corners_single_frame for scale.
+        """
+        if self.charuco.inverted:
+            gray = cv2.bitwise_not(gray)
+
+        hint_mirrored = self._last_mirrored.get(cam_id, False)
+        try_order = [hint_mirrored, not hint_mirrored]
+
+        ids = np.array([], dtype=np.int32)
+        img_loc = np.empty((0, 2), dtype=np.float64)
+
+        for is_mirrored in try_order:
+            gray_input = cv2.flip(gray, 1) if is_mirrored else gray
+            roi_input = roi
+            if roi is not None and is_mirrored:
+                x1, y1, x2, y2 = roi
+                roi_input = (gray.shape[1] - x2, y1, gray.shape[1] - x1, y2)
+            ids, img_loc = self.find_corners_single_frame(gray_input, mirror=is_mirrored, roi=roi_input, scale=scale)
+            if ids.any():
+                self._last_mirrored[cam_id] = is_mirrored
+                return ids, img_loc, is_mirrored
+
+        return ids, img_loc, False
+
+    def _update_roi(self, cam_id: int, ids: np.ndarray, img_loc: np.ndarray, frame_w: int, frame_h: int) -> None:
+        """Set cam_id's next search region around the whole board these corners belong to.
+
+        The board outline is projected through the homography fitted to the
+        corners found, so parts of the board not detected this frame (e.g.
+        just entering the view) are still searched next frame. Without enough
+        corners for a homography the region is dropped and the next frame
+        searches the full frame.
+        """
+        self._rois.pop(cam_id, None)
+        self._roi_counts.pop(cam_id, None)
+        if len(ids) < 4:
+            return
+
+        board_xy = np.asarray(self.board.getChessboardCorners(), dtype=np.float64)[ids, :2]
+        homography, _ = cv2.findHomography(board_xy, img_loc.astype(np.float64))
+        if homography is None:
+            return
+
+        columns, rows = self.board.getChessboardSize()
+        square = self.board.getSquareLength()
+        outline = np.array(
+            [[0, 0, 1], [columns * square, 0, 1], [columns * square, rows * square, 1], [0, rows * square, 1]]
+        )
+        projected = outline @ homography.T
+        if np.any(projected[:, 2] <= 0):
+            return  # outline extends behind the camera; the fit is not trustworthy
+        projected = projected[:, :2] / projected[:, 2:]
+
+        x_min, y_min = projected.min(axis=0)
+        x_max, y_max = projected.max(axis=0)
+        margin = max(self.roi_margin * max(x_max - x_min, y_max - y_min), ROI_MIN_MARGIN)
+        x1, y1 = int(max(0, x_min - margin)), int(max(0, y_min - margin))
+        x2, y2 = int(min(frame_w, np.ceil(x_max + margin))), int(min(frame_h, np.ceil(y_max + margin)))
+        if x2 - x1 < 2 or y2 - y1 < 2:
+            return
+
+        self._rois[cam_id] = (x1, y1, x2, y2)
+        self._roi_counts[cam_id] = len(ids)
+
     def get_point_name(self, keypoint_id: int) -> str:
         return str(keypoint_id)
 
     def get_connected_points(self) -> set[tuple[int, int]]:
         return self.charuco.get_connected_points()
 
-    def find_corners_single_frame(self, gray_frame, mirror):
+    def find_corners_single_frame(
+        self, gray_frame, mirror, roi: tuple[int, int, int, int] | None = None, scale: float = 1.0
+    ):
+        """(ids, img_loc) of the board in gray_frame, or in its roi (x1, y1, x2, y2) only.
+
+        With scale < 1 the board is detected on a copy downscaled by scale and
+        the corners are refined at full resolution.
+        """
         ids = np.array([], dtype=np.int32)
         img_loc = np.empty((0, 2), dtype=np.float64)
 
+        # Detect within the region only, but refine on the whole frame below so
+        # corners match a full-frame detection exactly, not just to float32 rounding.
+        region, detector = gray_frame, self.detector
+        if roi is not None:
+            x1, y1, x2, y2 = roi
+            region = gray_frame[y1:y2, x1:x2]
+            detector = self._region_detector(max(gray_frame.shape[:2]), max(x2 - x1, y2 - y1))
+        image = region if scale == 1.0 else downscale(region, scale)
+
         # detectBoard combines marker detection + charuco corner interpolation
-        _img_loc, _ids, marker_corners, marker_ids = self.detector.detectBoard(gray_frame)
+        _img_loc, _ids, marker_corners, marker_ids = detector.detectBoard(image)
+        if _ids is not None and len(_ids) > 0:
+            if image is not region:
+                _img_loc = to_full_resolution(_img_loc, image.shape, region.shape)
+            if roi is not None:
+                _img_loc = _img_loc + np.array([roi[0], roi[1]], dtype=_img_loc.dtype)
 
         if _ids is not None and len(_ids) > 0:
             # Sub-pixel refinement — occasionally errors out, so just move along if it fails
@@ -120,6 +292,21 @@ class CharucoTracker(Tracker):
 
         return ids, img_loc
 
+    def _region_detector(self, frame_size: int, region_size: int) -> cv2.aruco.CharucoDetector:
+        """Detector for a region of a frame that accepts the same marker sizes as self.detector on the frame.
+
+        Marker perimeter limits are rates of the image's larger dimension, so
+        they are rescaled from the frame to the region. A fresh detector costs
+        microseconds; sharing one and changing its parameters would race
+        between camera threads.
+        """
+        params = cv2.aruco.DetectorParameters()
+        params.adaptiveThreshWinSizeStep = self.detector_params.adaptiveThreshWinSizeStep
+        scale = frame_size / max(region_size, 1)
+        params.minMarkerPerimeterRate = self.detector_params.minMarkerPerimeterRate * scale
+        params.maxMarkerPerimeterRate = self.detector_params.maxMarkerPerimeterRate * scale
+        return cv2.aruco.CharucoDetector(self.board, detectorParams=params)
+
     def get_obj_loc(self, ids: np.ndarray, back_face: bool = False):
         """Objective position of charuco corners in a board frame of reference.
 
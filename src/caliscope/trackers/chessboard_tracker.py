@@ -13,6 +13,17 @@ test_chessboard.py orientation tests).
 
 Unlike CharucoTracker, there is no mirror search — chessboard patterns
 don't need it for intrinsic calibration (frames without detection are skipped).
+
+With pyramid detection on, the board is found on a downscaled frame and its
+corners refined at full resolution (see trackers/pyramid.py).
+
+With fast_check on, a frame whose camera showed no board in its previous frame
+first gets a CALIB_CB_FAST_CHECK search on a downscaled copy. Frames without a
+board (most of a walk-around session) fail that quick test in a fraction of the
+exhaustive search's time and are rejected. A frame that passes is searched as
+usual, so the corners reported are always those of the normal search, and the
+camera's next frames skip the check until the board is lost again. The cost is
+that a board the fast check misses is not found until a later frame passes it.
 """
 
 import logging
@@ -23,9 +34,13 @@ import numpy as np
 from caliscope.core.chessboard import Chessboard
 from caliscope.packets import PixelFormat, PointPacket
 from caliscope.tracker import Tracker
+from caliscope.trackers.pyramid import assumed_feature_px, downscale, pyramid_scale, to_full_resolution
 
 logger = logging.getLogger(__name__)
 
+# With pyramid detection or fast_check, the smallest square side (pixels) to detect at.
+MIN_PYRAMID_SQUARE_PX = 20
+
 
 def _subpix_window_half_width(corners_row_major: np.ndarray, columns: int, rows: int) -> int:
     """Sub-pixel search-window half-width derived from detected corner pitch.
@@ -40,11 +55,16 @@ def _subpix_window_half_width(corners_row_major: np.ndarray, columns: int, rows:
     clamp(floor(min_neighbor_px / 4), 2, 11); 11 stays the large-board ceiling
     so GUI-scale boards are unchanged.
     """
+    min_neighbor_px = _corner_pitch(corners_row_major, columns, rows)
+    return int(np.clip(np.floor(min_neighbor_px / 4), 2, 11))
+
+
+def _corner_pitch(corners_row_major: np.ndarray, columns: int, rows: int) -> float:
+    """Smallest distance in pixels between horizontally or vertically adjacent corners."""
     grid = corners_row_major.reshape(rows, columns, 2)
     horizontal_px = np.linalg.norm(np.diff(grid, axis=1), axis=2)
     vertical_px = np.linalg.norm(np.diff(grid, axis=0), axis=2)
-    min_neighbor_px = float(min(horizontal_px.min(), vertical_px.min()))
-    return int(np.clip(np.floor(min_neighbor_px / 4), 2, 11))
+    return float(min(horizontal_px.min(), vertical_px.min()))
 
 
 class ChessboardTracker(Tracker):
@@ -57,18 +77,29 @@ class ChessboardTracker(Tracker):
     Green visualization color distinguishes from Charuco (red/blue).
     """
 
-    def __init__(self, chessboard: Chessboard) -> None:
+    def __init__(self, chessboard: Chessboard, pyramid: bool = False, fast_check: bool = False) -> None:
         """
         Args:
             chessboard: Chessboard pattern definition (frozen dataclass)
+            pyramid: Detect on a downscaled frame, then refine corners at full resolution
+            fast_check: After a frame without the board, reject frames that fail a CALIB_CB_FAST_CHECK search
         """
         self.chessboard = chessboard
+        self.pyramid = pyramid
+        self.fast_check = fast_check
+
+        # Cameras whose last frame showed the board; the others get the fast check first
+        self._board_in_last_frame: set[int] = set()
+
+        # Square side in pixels at each camera's last detection; picks the pyramid scale
+        self._square_px: dict[int, float] = {}
 
         # OpenCV findChessboardCorners expects (columns, rows) tuple
         self._pattern_size = (chessboard.columns, chessboard.rows)
 
         # Detection flags for robustness
         self._flags = cv2.CALIB_CB_ADAPTIVE_THRESH + cv2.CALIB_CB_NORMALIZE_IMAGE + cv2.CALIB_CB_EXHAUSTIVE
+        self._fast_check_flags = cv2.CALIB_CB_ADAPTIVE_THRESH + cv2.CALIB_CB_NORMALIZE_IMAGE + cv2.CALIB_CB_FAST_CHECK
 
         # Sub-pixel refinement parameters
         self._criteria = (
@@ -79,11 +110,25 @@ class ChessboardTracker(Tracker):
         # Sub-pixel search window is derived per frame from the detected
         # corner pitch (see _subpix_window_half_width), not fixed.
 
+    def reset(self, cam_id: int) -> None:
+        self._square_px.pop(cam_id, None)
+        self._board_in_last_frame.discard(cam_id)
+
     @property
     def name(self) -> str:
         """Return tracker name for file naming."""
         return "CHESSBOARD"
 
+    @property
+    def config(self) -> dict[str, object]:
+        return {
+            "rows": self.chessboard.rows,
+            "columns": self.chessboard.columns,
+            "square_size_cm": self.chessboard.square_size_cm,
+            **({"pyramid": True} if self.pyramid else {}),
+            **({"fast_check": True} if self.fast_check else {}),
+        }
+
     @property
     def pixel_format(self) -> PixelFormat:
         return PixelFormat.GRAY
@@ -92,7 +137,18 @@ class ChessboardTracker(Tracker):
         gray = frame
 
         # Attempt corner detection
-        found, corners = cv2.findChessboardCorners(gray, self._pattern_size, flags=self._flags)
+        if self.fast_check and cam_id not in self._board_in_last_frame and not self._passes_fast_check(gray, cam_id):
+            found, corners = False, None
+        elif self.pyramid:
+            found, corners = self._find_corners_pyramid(gray, cam_id)
+        else:
+            found, corners = cv2.findChessboardCorners(gray, self._pattern_size, flags=self._flags)
+
+        if self.fast_check:
+            if found and corners is not None:
+                self._board_in_last_frame.add(cam_id)
+            else:
+                self._board_in_last_frame.discard(cam_id)
 
         if not found or corners is None:
             # Return empty PointPacket on detection failure
@@ -115,6 +171,8 @@ class ChessboardTracker(Tracker):
 
         # corners_refined shape is (N, 1, 2), flatten to (N, 2)
         img_loc = corners_refined.reshape(-1, 2)
+        if self.pyramid:
+            self._square_px[cam_id] = _corner_pitch(img_loc, self.chessboard.columns, self.chessboard.rows)
 
         # Generate point IDs: 0 to N-1 in row-major order
         n_corners = self.chessboard.rows * self.chessboard.columns
@@ -126,6 +184,45 @@ class ChessboardTracker(Tracker):
 
         return PointPacket(object_id=object_id, keypoint_id=keypoint_id, img_loc=img_loc, obj_loc=obj_loc)
 
+    def _pyramid_scale(self, cam_id: int, frame_shape: tuple[int, ...]) -> float:
+        """Detection scale for cam_id's next frame, from its last square size (or an assumed one).
+
+        The last square size is only recorded with pyramid on; otherwise the
+        scale depends on the frame size alone.
+        """
+        square_px = self._square_px.get(cam_id)
+        if square_px is None:
+            square_px = assumed_feature_px(frame_shape, max(self.chessboard.columns, self.chessboard.rows) + 1)
+        return pyramid_scale(square_px, MIN_PYRAMID_SQUARE_PX)
+
+    def _find_corners_pyramid(self, gray: np.ndarray, cam_id: int) -> tuple[bool, np.ndarray | None]:
+        """findChessboardCorners at the scale picked by _pyramid_scale, corners in full-frame pixels.
+
+        Falls back to full resolution when the reduced frame yields no board.
+        """
+        scale = self._pyramid_scale(cam_id, gray.shape)
+        if scale < 1.0:
+            small = downscale(gray, scale)
+            found, corners = cv2.findChessboardCorners(small, self._pattern_size, flags=self._flags)
+            if found and corners is not None:
+                return True, to_full_resolution(corners, small.shape, gray.shape)
+
+        return cv2.findChessboardCorners(gray, self._pattern_size, flags=self._flags)
+
+    def _passes_fast_check(self, gray: np.ndarray, cam_id: int) -> bool:
+        """True if a CALIB_CB_FAST_CHECK search at the scale picked by _pyramid_scale finds the board.
+
+        Only decides whether the frame is searched; its corners are not used.
+        """
+        scale = self._pyramid_scale(cam_id, gray.shape)
+        image = gray if scale == 1.0 else downscale(gray, scale)
+        found, _corners = cv2.findChessboardCorners(image, self._pattern_size, flags=self._fast_check_flags)
+        if not found:
+            # Forget the last square size so a board that comes back smaller is
+            # looked for at a finer scale, not skipped at a stale coarse one.
+            self._square_px.pop(cam_id, None)
+        return bool(found)
+
     def get_connected_points(self) -> set[tuple[int, int]]:
         """Point ID pairs forming the grid pattern (adjacent corners only)."""
         return self.chessboard.get_connected_points()
@@ -0,0 +1,139 @@
+"""Batches single-item inference requests from many threads into one session call.
+
+process_synchronized_recording tracks each camera in its own thread with one
+shared tracker, so an ONNX pose model sees one batch-of-one call per camera per
+sync index: small calls that compete for the same cores and leave
+onnxruntime's batch efficiency unused. An InferenceBroker sits between those
+threads and the session. Each caller submits its (1, ...) input and blocks;
+pending inputs go to the session as a single batch once every recently active
+thread is waiting, max_batch inputs are pending, or the oldest has waited
+max_wait seconds. Whichever caller closes the batch runs it and hands every
+caller its own slice of the outputs.
+
+A thread counts as active for ACTIVE_WINDOW seconds after its last request, so
+a lone caller never waits for company, and a camera that has run out of frames
+stops holding back the others once that window passes.
+
+Only models whose input has a dynamic batch axis can be batched; see
+OnnxTracker for how that is decided.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Seconds after its last request that a thread still counts as a caller worth waiting for.
+ACTIVE_WINDOW = 1.0
+
+
+@dataclass(eq=False)
+class _Request:
+    tensor: np.ndarray
+    submitted: float
+    outputs: list[np.ndarray] | None = None
+    error: BaseException | None = None
+    done: bool = False
+
+
+class InferenceBroker:
+    """Shared front for an onnxruntime session that batches concurrent run() calls.
+
+    batches_run and items_run count session calls and the inputs they carried,
+    for benchmarking how well requests are being combined.
+    """
+
+    def __init__(self, session, input_name: str, max_batch: int = 8, max_wait: float = 0.005) -> None:
+        if max_batch < 1:
+            raise ValueError(f"max_batch must be >= 1, got {max_batch}")
+        self.session = session
+        self.input_name = input_name
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batches_run = 0
+        self.items_run = 0
+
+        self._condition = threading.Condition()
+        self._pending: list[_Request] = []
+        self._last_request: dict[int, float] = {}  # thread ident -> monotonic time
+
+    def run(self, tensor: np.ndarray) -> list[np.ndarray]:
+        """Outputs of session.run(None, {input_name: tensor}) for a batch-of-one tensor.
+
+        Blocks until the batch holding this request has run. An exception
+        raised by the session is raised in every caller of that batch.
+        """
+        request = _Request(tensor, time.monotonic())
+        with self._condition:
+            self._pending.append(request)
+            self._last_request[threading.get_ident()] = request.submitted
+            self._condition.notify_all()  # this request may complete a waiting caller's batch
+
+        # Wait for this request to be run, running any batch that becomes ready meanwhile.
+        while True:
+            with self._condition:
+                while not request.done and (batch := self._take_ready_batch()) is None:
+                    self._condition.wait(self._time_to_deadline())
+                if request.done:
+                    break
+            self._run_batch(batch)
+
+        if request.error is not None:
+            raise request.error
+        assert request.outputs is not None
+        return request.outputs
+
+    def _active_callers(self, now: float) -> int:
+        """Threads that have made a request within ACTIVE_WINDOW. Caller holds the lock."""
+        for ident, last in list(self._last_request.items()):
+            if now - last > ACTIVE_WINDOW:
+                del self._last_request[ident]
+        return len(self._last_request)
+
+    def _take_ready_batch(self) -> list[_Request] | None:
+        """Remove and return up to max_batch pending requests if a batch should run now.
+
+        Caller holds the lock.
+        """
+        if not self._pending:
+            return None
+        now = time.monotonic()
+        ready = (
+            len(self._pending) >= min(self.max_batch, self._active_callers(now))
+            or now - self._pending[0].submitted >= self.max_wait
+        )
+        if not ready:
+            return None
+        batch = self._pending[: self.max_batch]
+        del self._pending[: self.max_batch]
+        return batch
+
+    def _time_to_deadline(self) -> float | None:
+        """Seconds until the oldest pending request must run, None if nothing is pending."""
+        if not self._pending:
+            return None
+        return max(0.0, self._pending[0].submitted + self.max_wait - time.monotonic())
+
+    def _run_batch(self, batch: list[_Request]) -> None:
+        """Run batch as one session call and deliver each request its slice of the outputs."""
+        outputs: list[np.ndarray] | None = None
+        error: BaseException | None = None
+        try:
+            tensor = batch[0].tensor if len(batch) == 1 else np.concatenate([r.tensor for r in batch])
+            outputs = [np.asarray(output) for output in self.session.run(None, {self.input_name: tensor})]
+        except BaseException as e:  # delivered to every caller in the batch, not just this one
+            error = e
+
+        with self._condition:
+            for i, request in enumerate(batch):
+                if outputs is not None:
+                    request.outputs = [output[i : i + 1] for output in outputs]
+                request.error = error
+                request.done = True
+            self.batches_run += 1
+            self.items_run += len(batch)
+            self._condition.notify_all()
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import rtoml
 
+from caliscope.onnx_session import SessionConfig
 from caliscope.tracker import Segment, WireFrameView
 
 logger = logging.getLogger(__name__)
@@ -32,6 +33,9 @@ class ModelCard:
     sha256: str | None = None
     extraction: str | None = None  # "zip_end2end" or "direct"
     license_url: str | None = None
+    max_batch: int | None = None  # None: batch if the ONNX input has a dynamic batch axis
+    predict_motion: bool = True  # place each crop where the subject is predicted to be (see BoxMotion)
+    session: SessionConfig = SessionConfig(cache_optimized_model=True)  # from the optional [session] section
 
     @property
     def keypoint_id_to_name(self) -> dict[int, str]:
@@ -98,6 +102,24 @@ class ModelCard:
         if not isinstance(input_size, list) or len(input_size) != 2:
             raise ValueError(f"input_size must be a 2-element list [width, height], got {input_size} in {path}")
 
+        # Validate optional max_batch (inputs per batched session call; 1 disables batching)
+        max_batch = model_section.get("max_batch")
+        if max_batch is not None and (not isinstance(max_batch, int) or max_batch < 1):
+            raise ValueError(f"max_batch must be a positive integer, got {max_batch} in {path}")
+
+        predict_motion = model_section.get("predict_motion", True)
+        if not isinstance(predict_motion, bool):
+            raise ValueError(f"predict_motion must be true or false, got {predict_motion} in {path}")
+
+        # Parse optional [session] section (onnxruntime options; see SessionConfig)
+        session_section = config.get("session", {})
+        try:
+            session = SessionConfig(**{"cache_optimized_model": True, **session_section})
+        except TypeError as e:
+            raise ValueError(f"Unknown field in [session] section of {path}: {e}") from e
+        except ValueError as e:
+            raise ValueError(f"Invalid [session] section in {path}: {e}") from e
+
         # Parse [points] section
         if "points" not in config:
             raise ValueError(f"Missing required [points] section in {path}")
@@ -172,4 +194,7 @@ class ModelCard:
             sha256=sha256,
             extraction=extraction,
             license_url=license_url,
+            max_batch=max_batch,
+            predict_motion=predict_motion,
+            session=session,
         )
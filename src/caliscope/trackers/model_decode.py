@@ -37,27 +37,50 @@ def decode_simcc(
     if simcc_x.shape[0] != 1 or simcc_y.shape[0] != 1:
         raise ValueError(f"Only batch_size=1 supported, got {simcc_x.shape[0]}")
 
+    keypoints, confidence = decode_simcc_batch(simcc_x, simcc_y, simcc_split_ratio)
+    return keypoints[0], confidence[0]
+
+
+def decode_simcc_batch(
+    simcc_x: np.ndarray,
+    simcc_y: np.ndarray,
+    simcc_split_ratio: float = 2.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Decode a batch of SimCC vectors; decode_simcc for every batch item at once.
+
+    Args:
+        simcc_x: X-axis probability vectors, shape (N, K, W_x)
+        simcc_y: Y-axis probability vectors, shape (N, K, H_y)
+        simcc_split_ratio: Scaling factor from model coordinates to pixels
+
+    Returns:
+        Tuple of (keypoints, confidence):
+        - keypoints: (N, K, 2) float32 array of (x, y) coordinates in model input space
+        - confidence: (N, K) float32 array of per-keypoint confidence scores [0, 1]
+
+    Raises:
+        ValueError: If batch or keypoint counts of the two inputs differ
+    """
+    if simcc_x.shape[0] != simcc_y.shape[0]:
+        raise ValueError(f"Batch size mismatch: simcc_x has {simcc_x.shape[0]}, simcc_y has {simcc_y.shape[0]}")
+
     if simcc_x.shape[1] != simcc_y.shape[1]:
         raise ValueError(f"Keypoint count mismatch: simcc_x has {simcc_x.shape[1]}, simcc_y has {simcc_y.shape[1]}")
 
-    # Remove batch dimension
-    simcc_x = simcc_x[0]  # (K, W_x)
-    simcc_y = simcc_y[0]  # (K, H_y)
-
     # Find peaks in each 1D distribution
-    x_indices = np.argmax(simcc_x, axis=1)  # (K,)
-    y_indices = np.argmax(simcc_y, axis=1)  # (K,)
+    x_indices = np.argmax(simcc_x, axis=-1)  # (N, K)
+    y_indices = np.argmax(simcc_y, axis=-1)  # (N, K)
 
     # Get confidence values at peaks
-    x_confidence = np.max(simcc_x, axis=1)  # (K,)
-    y_confidence = np.max(simcc_y, axis=1)  # (K,)
+    x_confidence = np.take_along_axis(simcc_x, x_indices[..., np.newaxis], axis=-1)[..., 0]  # (N, K)
+    y_confidence = np.take_along_axis(simcc_y, y_indices[..., np.newaxis], axis=-1)[..., 0]  # (N, K)
 
     # Scale indices to coordinates
     x_coords = x_indices.astype(np.float32) / simcc_split_ratio
     y_coords = y_indices.astype(np.float32) / simcc_split_ratio
 
-    # Stack into (K, 2) array
-    keypoints = np.stack([x_coords, y_coords], axis=1)
+    # Stack into (N, K, 2) array
+    keypoints = np.stack([x_coords, y_coords], axis=-1)
 
     # Overall confidence is minimum of x and y
     # SimCC outputs are raw logits that can exceed 1.0 — clamp to [0, 1]
@@ -83,54 +106,69 @@ def decode_heatmap(
         - keypoints: (K, 2) float32 array of (x, y) coordinates in heatmap space
         - confidence: (K,) float32 array of peak values [0, 1]
     """
-    K, H, W = heatmaps.shape
+    keypoints, confidence = decode_heatmap_batch(heatmaps[np.newaxis])
+    return keypoints[0], confidence[0]
+
+
+def decode_heatmap_batch(
+    heatmaps: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Decode a batch of heatmaps; decode_heatmap for every batch item at once.
+
+    Args:
+        heatmaps: Heatmap tensor, shape (N, K, H, W)
+
+    Returns:
+        Tuple of (keypoints, confidence):
+        - keypoints: (N, K, 2) float32 array of (x, y) coordinates in heatmap space
+        - confidence: (N, K) float32 array of peak values [0, 1]
+    """
+    N, K, H, W = heatmaps.shape
 
     # Flatten spatial dimensions to find argmax
-    flat_heatmaps = heatmaps.reshape(K, -1)
-    max_indices = np.argmax(flat_heatmaps, axis=1)  # (K,)
+    flat_heatmaps = heatmaps.reshape(N, K, -1)
+    max_indices = np.argmax(flat_heatmaps, axis=-1)  # (N, K)
 
     # Convert flat indices to 2D coordinates
-    y_peaks = (max_indices // W).astype(np.float32)
-    x_peaks = (max_indices % W).astype(np.float32)
+    y_int = max_indices // W
+    x_int = max_indices % W
+    y_peaks = y_int.astype(np.float32)
+    x_peaks = x_int.astype(np.float32)
 
     # Extract confidence (peak values)
-    confidence = np.max(flat_heatmaps, axis=1).astype(np.float32)
+    peak = np.take_along_axis(flat_heatmaps, max_indices[..., np.newaxis], axis=-1)[..., 0]  # (N, K)
+    confidence = peak.astype(np.float32)
 
     # Sub-pixel refinement via quadratic approximation (Taylor expansion)
-    # Only refine interior peaks (not on boundaries)
-    dx = np.zeros(K, dtype=np.float32)
-    dy = np.zeros(K, dtype=np.float32)
-
-    for k in range(K):
-        x_int = int(x_peaks[k])
-        y_int = int(y_peaks[k])
-
-        # Skip boundary peaks
-        if x_int == 0 or x_int == W - 1 or y_int == 0 or y_int == H - 1:
-            continue
-
-        hm = heatmaps[k]
-
-        # X-axis refinement: fit parabola through (x-1, x, x+1)
-        # Second derivative: f''(x) = f(x-1) - 2*f(x) + f(x+1)
-        # First derivative: f'(x) ≈ (f(x+1) - f(x-1)) / 2
-        # Offset: -f'(x) / f''(x)
-        dxx = hm[y_int, x_int - 1] - 2 * hm[y_int, x_int] + hm[y_int, x_int + 1]
-        if abs(dxx) > 1e-6:
-            dx_val = (hm[y_int, x_int - 1] - hm[y_int, x_int + 1]) / (2 * dxx)
-            dx[k] = np.clip(dx_val, -0.5, 0.5)
-
-        # Y-axis refinement: fit parabola through (y-1, y, y+1)
-        dyy = hm[y_int - 1, x_int] - 2 * hm[y_int, x_int] + hm[y_int + 1, x_int]
-        if abs(dyy) > 1e-6:
-            dy_val = (hm[y_int - 1, x_int] - hm[y_int + 1, x_int]) / (2 * dyy)
-            dy[k] = np.clip(dy_val, -0.5, 0.5)
+    # Only refine interior peaks (not on boundaries); boundary peaks read
+    # clamped neighbours below and have their offsets masked out.
+    interior = (x_int > 0) & (x_int < W - 1) & (y_int > 0) & (y_int < H - 1)
+    left = np.take_along_axis(flat_heatmaps, (max_indices - np.minimum(x_int, 1))[..., np.newaxis], axis=-1)[..., 0]
+    right = np.take_along_axis(flat_heatmaps, (max_indices + (x_int < W - 1))[..., np.newaxis], axis=-1)[..., 0]
+    up = np.take_along_axis(flat_heatmaps, (max_indices - W * np.minimum(y_int, 1))[..., np.newaxis], axis=-1)[..., 0]
+    down = np.take_along_axis(flat_heatmaps, (max_indices + W * (y_int < H - 1))[..., np.newaxis], axis=-1)[..., 0]
+
+    # Fit a parabola through (p-1, p, p+1) on each axis
+    # Second derivative: f''(p) = f(p-1) - 2*f(p) + f(p+1)
+    # First derivative: f'(p) ≈ (f(p+1) - f(p-1)) / 2
+    # Offset: -f'(p) / f''(p)
+    dx = _parabola_offset(left, peak, right, interior)
+    dy = _parabola_offset(up, peak, down, interior)
 
     # Apply refinement
     x_refined = x_peaks + dx
     y_refined = y_peaks + dy
 
-    # Stack into (K, 2) array
-    keypoints = np.stack([x_refined, y_refined], axis=1)
+    # Stack into (N, K, 2) array
+    keypoints = np.stack([x_refined, y_refined], axis=-1)
 
     return keypoints, confidence
+
+
+def _parabola_offset(before: np.ndarray, peak: np.ndarray, after: np.ndarray, refine: np.ndarray) -> np.ndarray:
+    """Sub-pixel peak offset in [-0.5, 0.5] from three samples; 0 where not refined or flat."""
+    second = before - 2 * peak + after
+    refine = refine & (np.abs(second) > 1e-6)
+    offset = np.zeros(peak.shape, dtype=np.float32)
+    offset[refine] = np.clip((before[refine] - after[refine]) / (2 * second[refine]), -0.5, 0.5)
+    return offset
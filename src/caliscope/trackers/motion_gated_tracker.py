@@ -0,0 +1,193 @@
+"""Tracker wrapper that skips detection on frames that have not changed.
+
+Static scenes (a tripod session paused between board poses, ArUco markers on
+a wall) produce long runs of nearly identical frames, and each one costs a full
+detection. MotionGatedTracker compares a small area-averaged thumbnail of every
+frame with the thumbnail of the frame its wrapped tracker last ran on. While
+no thumbnail pixel has changed by more than a threshold, the points from that
+detection are reused, optionally followed into the current frame with
+pyramidal Lucas-Kanade optical flow, and the wrapped tracker is not called.
+
+Flow always runs from the detection frame to the current one rather than frame
+to frame, so reused points do not drift; the thumbnail comparison is against
+the detection frame for the same reason, so slow changes add up until they
+trigger a new detection. Detection also reruns after max_reused frames in a
+row regardless.
+
+Frames reused and detected are counted per camera and logged by cleanup().
+"""
+
+import logging
+from dataclasses import replace
+
+import cv2
+import numpy as np
+
+from caliscope.packets import PixelFormat, PointPacket
+from caliscope.tracker import Tracker, WireFrameView
+
+logger = logging.getLogger(__name__)
+
+# Approximate thumbnail width in pixels for the frame-change test; height keeps the aspect ratio.
+THUMBNAIL_WIDTH = 96
+
+# Largest change (grey levels, 0-255) of any thumbnail pixel for a frame to count as unchanged.
+CHANGE_THRESHOLD = 6.0
+
+# Frames in a row that may reuse one detection before the wrapped tracker runs again.
+MAX_REUSED_FRAMES = 30
+
+# Lucas-Kanade window and pyramid levels for following reused points.
+FLOW_WINDOW = (21, 21)
+FLOW_LEVELS = 3
+FLOW_CRITERIA = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_COUNT, 30, 0.01)
+
+
+class MotionGatedTracker(Tracker):
+    """Runs a tracker only on frames that differ from the one it last ran on.
+
+    Name, pixel format, point names and drawing all come from the wrapped
+    tracker; config adds the gate's settings so cached points from gated and
+    ungated runs are not mixed up.
+    """
+
+    def __init__(
+        self,
+        tracker: Tracker,
+        threshold: float = CHANGE_THRESHOLD,
+        optical_flow: bool = False,
+        max_reused: int = MAX_REUSED_FRAMES,
+    ) -> None:
+        """
+        Args:
+            tracker: Tracker to run on frames that changed
+            threshold: Largest thumbnail pixel change (grey levels) still treated as no change
+            optical_flow: Follow reused points into the current frame with optical flow
+            max_reused: Frames in a row that may reuse one detection (0 disables reuse)
+        """
+        self.tracker = tracker
+        self.threshold = threshold
+        self.optical_flow = optical_flow
+        self.max_reused = max_reused
+
+        # Per camera: the frame the wrapped tracker last ran on, and its points
+        self._key_thumbnails: dict[int, np.ndarray] = {}
+        self._key_frames: dict[int, np.ndarray] = {}  # grayscale, kept only for optical flow
+        self._key_points: dict[int, PointPacket] = {}
+        self._reused_in_row: dict[int, int] = {}
+
+        self.frames_reused: dict[int, int] = {}
+        self.frames_detected: dict[int, int] = {}
+
+    @property
+    def name(self) -> str:
+        return self.tracker.name
+
+    @property
+    def config(self) -> dict[str, object]:
+        return {
+            **self.tracker.config,
+            "motion_gate_threshold": self.threshold,
+            "motion_gate_optical_flow": self.optical_flow,
+            "motion_gate_max_reused": self.max_reused,
+        }
+
+    @property
+    def pixel_format(self) -> PixelFormat:
+        return self.tracker.pixel_format
+
+    @property
+    def preferred_resolution(self) -> tuple[int, int] | None:
+        return self.tracker.preferred_resolution
+
+    @property
+    def wireframe(self) -> WireFrameView | None:
+        return self.tracker.wireframe
+
+    def _detect(self, frame: np.ndarray, cam_id: int = 0, rotation_count: int = 0) -> PointPacket:
+        thumbnail = _thumbnail(frame)
+        key_thumbnail = self._key_thumbnails.get(cam_id)
+        reused_in_row = self._reused_in_row.get(cam_id, 0)
+
+        if (
+            key_thumbnail is not None
+            and key_thumbnail.shape == thumbnail.shape
+            and reused_in_row < self.max_reused
+            and float(cv2.absdiff(thumbnail, key_thumbnail).max()) <= self.threshold
+        ):
+            self._reused_in_row[cam_id] = reused_in_row + 1
+            self.frames_reused[cam_id] = self.frames_reused.get(cam_id, 0) + 1
+            points = self._key_points[cam_id]
+            if self.optical_flow and len(points.img_loc) > 0:
+                points = self._follow(points, self._key_frames[cam_id], _gray(frame))
+            return points
+
+        points = self.tracker.get_points(frame, cam_id, rotation_count)
+        self._key_thumbnails[cam_id] = thumbnail
+        self._key_points[cam_id] = points
+        if self.optical_flow:
+            self._key_frames[cam_id] = _gray(frame)
+        self._reused_in_row[cam_id] = 0
+        self.frames_detected[cam_id] = self.frames_detected.get(cam_id, 0) + 1
+        return points
+
+    def _follow(self, points: PointPacket, key_frame: np.ndarray, frame: np.ndarray) -> PointPacket:
+        """points from key_frame moved into frame by optical flow; points the flow loses are dropped."""
+        start = np.asarray(points.img_loc, dtype=np.float32).reshape(-1, 1, 2)
+        moved, status, _error = cv2.calcOpticalFlowPyrLK(
+            key_frame, frame, start, None, winSize=FLOW_WINDOW, maxLevel=FLOW_LEVELS, criteria=FLOW_CRITERIA
+        )
+        found = status.reshape(-1) == 1
+        return replace(
+            points,
+            object_id=points.object_id[found],
+            keypoint_id=points.keypoint_id[found],
+            img_loc=moved.reshape(-1, 2)[found].astype(points.img_loc.dtype),
+            obj_loc=None if points.obj_loc is None else points.obj_loc[found],
+            confidence=None if points.confidence is None else points.confidence[found],
+        )
+
+    def get_point_name(self, keypoint_id: int) -> str:
+        return self.tracker.get_point_name(keypoint_id)
+
+    def scatter_draw_instructions(self, keypoint_id: int) -> dict:
+        return self.tracker.scatter_draw_instructions(keypoint_id)
+
+    def get_connected_points(self) -> set[tuple[int, int]]:
+        return self.tracker.get_connected_points()
+
+    def reset(self, cam_id: int) -> None:
+        self._key_thumbnails.pop(cam_id, None)
+        self._key_frames.pop(cam_id, None)
+        self._key_points.pop(cam_id, None)
+        self._reused_in_row.pop(cam_id, None)
+        self.tracker.reset(cam_id)
+
+    def set_thread_budget(self, threads: int) -> None:
+        self.tracker.set_thread_budget(threads)
+
+    def cleanup(self) -> None:
+        for cam_id in sorted(self.frames_detected):
+            reused = self.frames_reused.get(cam_id, 0)
+            total = reused + self.frames_detected[cam_id]
+            logger.info(f"Camera {cam_id}: reused points on {reused} of {total} frames ({reused / total:.0%})")
+        self.tracker.cleanup()
+
+
+def _gray(frame: np.ndarray) -> np.ndarray:
+    return frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+
+def _thumbnail(frame: np.ndarray) -> np.ndarray:
+    """frame averaged over square blocks to about THUMBNAIL_WIDTH wide (or kept, if already narrower).
+
+    The block side is a whole number of pixels and the frame is cropped to a
+    multiple of it, which keeps cv2.resize on its fast integer-ratio path
+    (several times quicker than a fractional INTER_AREA reduction).
+    """
+    height, width = frame.shape[:2]
+    block = width // THUMBNAIL_WIDTH
+    if block <= 1:
+        return frame
+    cropped = frame[: height - height % block, : width - width % block]
+    return cv2.resize(cropped, (width // block, height // block), interpolation=cv2.INTER_AREA)
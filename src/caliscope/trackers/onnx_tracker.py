@@ -5,21 +5,81 @@ Supports two model output formats:
 - Heatmap: 2D spatial probability maps
 
 Model configuration is loaded from a TOML "model card" file.
+
+When the model's input has a dynamic batch axis, concurrent calls from camera
+threads sharing one tracker are combined into batched session calls by an
+InferenceBroker.
+
+Each camera's subject is followed by a BoxMotion filter, so the next frame's
+crop is placed where the subject is predicted to be rather than where it was.
 """
 
+import dataclasses
 import logging
+import threading
+from dataclasses import dataclass
 
 import cv2
 import numpy as np
 
+from caliscope.onnx_session import SessionConfig
 from caliscope.packets import PointPacket
 from caliscope.tracker import Tracker, WireFrameView
+from caliscope.trackers.box_motion import BoxMotion
 from caliscope.trackers.helper import apply_rotation, unrotate_points
+from caliscope.trackers.inference_broker import InferenceBroker
 from caliscope.trackers.model_card import ModelCard
-from caliscope.trackers.model_decode import decode_heatmap, decode_simcc
+from caliscope.trackers.model_decode import decode_heatmap_batch, decode_simcc_batch
 
 logger = logging.getLogger(__name__)
 
+# Batch limit for models with a dynamic batch axis whose card sets no max_batch.
+DEFAULT_MAX_BATCH = 8
+
+# ImageNet normalization (pixel / 255 - mean) / std, folded into one multiply and subtract per RGB channel.
+_IMAGENET_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+_IMAGENET_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+_PIXEL_SCALE = 1.0 / (255.0 * _IMAGENET_STD)
+_PIXEL_OFFSET = _IMAGENET_MEAN / _IMAGENET_STD
+
+
+@dataclass
+class _InputBuffers:
+    """Preallocated model input for one thread: a BGR canvas and the tensor built from it."""
+
+    canvas: np.ndarray  # (H, W, 3) uint8
+    tensor: np.ndarray  # (1, 3, H, W) float32 for SimCC, (1, 1, H, W) uint8 for heatmap
+    batch_tensor: np.ndarray | None = None  # (N, ...) for batched scans, grown on demand
+
+    def batch(self, size: int) -> np.ndarray:
+        """A (size, ...) tensor like tensor, reused across calls."""
+        if self.batch_tensor is None or len(self.batch_tensor) < size:
+            self.batch_tensor = np.zeros((size, *self.tensor.shape[1:]), dtype=self.tensor.dtype)
+        return self.batch_tensor[:size]
+
+    @classmethod
+    def for_card(cls, card: ModelCard) -> "_InputBuffers":
+        height, width = card.input_height, card.input_width
+        canvas = np.zeros((height, width, 3), dtype=np.uint8)
+        if card.format == "simcc":
+            return cls(canvas, np.zeros((1, 3, height, width), dtype=np.float32))
+        return cls(canvas, np.zeros((1, 1, height, width), dtype=np.uint8))
+
+
+def _warp_region(frame: np.ndarray, box: tuple[int, int, int, int], dst: np.ndarray) -> None:
+    """Resize frame[y1:y2, x1:x2] into dst (a view) with one warpAffine, sampling as cv2.resize does.
+
+    cv2.resize aligns pixel centers, (x_dst + 0.5) = (x_src + 0.5) * fx, which
+    the translation reproduces with the crop offset folded in. Samples past the
+    frame edge replicate it, as cv2.resize does at the edges of its input.
+    """
+    x1, y1, x2, y2 = box
+    dst_h, dst_w = dst.shape[:2]
+    fx = dst_w / (x2 - x1)
+    fy = dst_h / (y2 - y1)
+    transform = np.array([[fx, 0.0, (0.5 - x1) * fx - 0.5], [0.0, fy, (0.5 - y1) * fy - 0.5]])
+    cv2.warpAffine(frame, transform, (dst_w, dst_h), dst=dst, flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+
 
 class OnnxTracker(Tracker):
     """Generic ONNX pose tracker configured via ModelCard.
@@ -28,16 +88,20 @@ class OnnxTracker(Tracker):
     First tracker to populate PointPacket.confidence field.
     """
 
-    def __init__(self, card: ModelCard) -> None:
+    def __init__(self, card: ModelCard, thread_budget: int | None = None, *, load_session: bool = True) -> None:
         """Create inference session from model card.
 
         Args:
             card: Model configuration and metadata
+            thread_budget: Most intra-op threads the session may use, on top
+                of any limit in the card's [session] section. See set_thread_budget.
+            load_session: Create the session now (default) or on first use
 
         Raises:
             FileNotFoundError: If ONNX model file doesn't exist
         """
         self.card = card
+        self.thread_budget = thread_budget
 
         # Check ONNX file exists
         if not card.onnx_exists:
@@ -56,141 +120,285 @@ class OnnxTracker(Tracker):
                 "(GUI users: pip install caliscope[gui] includes tracking.)"
             ) from e
 
-        from caliscope.onnx_session import create_inference_session
-
-        logger.info(f"Loading ONNX model: {card.model_path}")
-        self.session = create_inference_session(card.model_path)
-
-        # Get input name from model
-        self.input_name = self.session.get_inputs()[0].name
+        # Session state, filled in by _load_session. Camera threads share the
+        # tracker, so the first to need a session creates it under the lock.
+        self._session_lock = threading.Lock()
+        self._session = None
+        self._input_name = ""
+        self._max_batch = 1
+        self._broker: InferenceBroker | None = None
 
         # Tracking state: per-camera previous bounding box in post-rotation coords.
         # Keyed by cam_id to isolate state across cameras (a single tracker instance
         # is shared across all cameras by process_synchronized_recording).
         self._prev_bboxes: dict[int, tuple[int, int, int, int]] = {}
+        # With card.predict_motion: per-camera motion filter and confident keypoint count
+        self._motion: dict[int, BoxMotion] = {}
+        self._prev_counts: dict[int, int] = {}
+
+        # Per-thread preprocessing buffers (see _input_buffers)
+        self._local = threading.local()
+
+        if load_session:
+            self._load_session()
+
+    def __reduce__(self):
+        # The inference session does not pickle. A copy loads its own from the
+        # card on first use, after any set_thread_budget call in the worker.
+        return (_restore_onnx_tracker, (self.card, self.thread_budget))
+
+    @property
+    def session(self):
+        """The onnxruntime InferenceSession, created on first use if not at construction."""
+        if self._session is None:
+            self._load_session()
+        return self._session
+
+    @property
+    def input_name(self) -> str:
+        if self._session is None:
+            self._load_session()
+        return self._input_name
+
+    @property
+    def max_batch(self) -> int:
+        """Crops per session call (1: no batching). See _resolve_max_batch."""
+        if self._session is None:
+            self._load_session()
+        return self._max_batch
+
+    @property
+    def session_config(self) -> SessionConfig:
+        """The card's session options with the thread budget applied."""
+        config = self.card.session
+        if self.thread_budget is not None:
+            threads = min(config.intra_op_threads or self.thread_budget, self.thread_budget)
+            config = dataclasses.replace(config, intra_op_threads=threads)
+        return config
+
+    def _load_session(self) -> None:
+        from caliscope.onnx_session import create_inference_session
+
+        with self._session_lock:
+            if self._session is not None:
+                return
+            logger.info(f"Loading ONNX model: {self.card.model_path}")
+            session = create_inference_session(self.card.model_path, self.session_config)
+
+            # Get input name from model
+            self._input_name = session.get_inputs()[0].name
+            self._max_batch = self._resolve_max_batch(session)
+            self._broker = InferenceBroker(session, self._input_name, self._max_batch) if self._max_batch > 1 else None
+            self._session = session
 
         logger.info(
-            f"OnnxTracker initialized: {card.name}, "
-            f"format={card.format}, input_size={card.input_width}x{card.input_height}"
+            f"OnnxTracker initialized: {self.card.name}, format={self.card.format}, "
+            f"input_size={self.card.input_width}x{self.card.input_height}, max_batch={self._max_batch}, "
+            f"intra_op_threads={self.session_config.intra_op_threads or 'default'}"
         )
 
+    def _resolve_max_batch(self, session) -> int:
+        """Inputs per session call: the card's max_batch, checked against the model's batch axis.
+
+        A batch axis with a fixed size (rather than a symbolic name) cannot
+        take batches of other sizes, so batching stays off for it.
+        """
+        batch_dim = session.get_inputs()[0].shape[0]
+        dynamic = not isinstance(batch_dim, int)
+        if self.card.max_batch is None:
+            return DEFAULT_MAX_BATCH if dynamic else 1
+        if self.card.max_batch > 1 and not dynamic:
+            logger.warning(
+                f"Model card for {self.card.name} sets max_batch={self.card.max_batch}, "
+                f"but the model's batch axis is fixed at {batch_dim}; not batching"
+            )
+            return 1
+        return self.card.max_batch
+
+    def set_thread_budget(self, threads: int) -> None:
+        """Cap the session's intra-op threads; a session already created is rebuilt on next use."""
+        if threads == self.thread_budget:
+            return
+        self.thread_budget = threads
+        with self._session_lock:
+            self._session = None
+            self._broker = None
+
     @property
     def name(self) -> str:
         """Return tracker name derived from ONNX filename stem."""
         return f"ONNX_{self.card.model_path.stem}"
 
-    def _preprocess_simcc(self, frame: np.ndarray) -> tuple[np.ndarray, float, int, int]:
-        """Preprocess frame for SimCC format models (RTMPose).
+    @property
+    def config(self) -> dict[str, object]:
+        # Weights are identified by size and mtime (a re-download changes both)
+        # unless the card pins a sha256.
+        stat = self.card.model_path.stat()
+        return {
+            "format": self.card.format,
+            "input_width": self.card.input_width,
+            "input_height": self.card.input_height,
+            "confidence_threshold": self.card.confidence_threshold,
+            "sha256": self.card.sha256,
+            "model_size": stat.st_size,
+            "model_mtime_ns": stat.st_mtime_ns,
+            **({"predict_motion": False} if not self.card.predict_motion else {}),
+        }
+
+    @property
+    def preferred_resolution(self) -> tuple[int, int]:
+        # Four model inputs across: after the tier-1 crop, a person spanning a
+        # quarter of the frame height still fills the model input at this size.
+        return (4 * self.card.input_width, 4 * self.card.input_height)
 
-        Letterboxes the frame to preserve aspect ratio, then normalizes.
+    def _input_buffers(self) -> "_InputBuffers":
+        """This thread's preprocessing buffers, allocated on its first call.
+
+        Buffers are per thread because camera threads share one tracker. A
+        tensor handed out stays valid until the same thread preprocesses again.
+        """
+        buffers = getattr(self._local, "buffers", None)
+        if buffers is None:
+            buffers = _InputBuffers.for_card(self.card)
+            self._local.buffers = buffers
+        return buffers
+
+    def _preprocess_simcc(
+        self, frame: np.ndarray, box: tuple[int, int, int, int] | None = None, out: np.ndarray | None = None
+    ) -> tuple[np.ndarray, float, int, int]:
+        """Preprocess a frame region for SimCC format models (RTMPose).
+
+        Letterboxes the region to preserve aspect ratio, then normalizes.
+        Crop, resize and letterbox placement are a single warpAffine from the
+        full frame into this thread's preallocated canvas; normalization and
+        the HWC -> CHW transpose write straight into its input tensor.
         Returns the preprocessed tensor plus transform parameters needed
-        to map model-space coordinates back to original frame coordinates.
+        to map model-space coordinates back to region coordinates.
 
         Args:
             frame: BGR image from cv2.VideoCapture
+            box: (x1, y1, x2, y2) region of frame to use (default: whole frame)
+            out: (1, 3, H, W) tensor to fill instead of the thread's own (e.g. one item of a batch)
 
         Returns:
             Tuple of (preprocessed, scale, pad_x, pad_y) where:
-            - preprocessed: (1, 3, H, W) float32 tensor
-            - scale: resize scale factor applied to the original frame
+            - preprocessed: (1, 3, H, W) float32 tensor (reused; see _input_buffers)
+            - scale: resize scale factor applied to the region
             - pad_x: horizontal padding in model input pixels
             - pad_y: vertical padding in model input pixels
         """
-        src_h, src_w = frame.shape[:2]
+        x1, y1, x2, y2 = box if box is not None else (0, 0, frame.shape[1], frame.shape[0])
+        src_w, src_h = x2 - x1, y2 - y1
         dst_w, dst_h = self.card.input_width, self.card.input_height
 
-        # Compute uniform scale that fits the frame inside the model input
+        # Compute uniform scale that fits the region inside the model input
         scale = min(dst_w / src_w, dst_h / src_h)
-        scaled_w = int(src_w * scale)
-        scaled_h = int(src_h * scale)
+        scaled_w = max(int(src_w * scale), 1)
+        scaled_h = max(int(src_h * scale), 1)
 
         # Padding to center the scaled image in the model input
         pad_x = (dst_w - scaled_w) // 2
         pad_y = (dst_h - scaled_h) // 2
 
-        # Resize preserving aspect ratio, then place on black canvas
-        resized = cv2.resize(frame, (scaled_w, scaled_h), interpolation=cv2.INTER_LINEAR)
-        canvas = np.zeros((dst_h, dst_w, 3), dtype=np.uint8)
-        canvas[pad_y : pad_y + scaled_h, pad_x : pad_x + scaled_w] = resized
+        # Resize the region onto a black canvas, sampling like cv2.resize
+        buffers = self._input_buffers()
+        buffers.canvas.fill(0)
+        _warp_region(frame, (x1, y1, x2, y2), buffers.canvas[pad_y : pad_y + scaled_h, pad_x : pad_x + scaled_w])
 
-        # BGR -> RGB
-        rgb = cv2.cvtColor(canvas, cv2.COLOR_BGR2RGB)
+        # BGR -> RGB, normalize with ImageNet mean/std, and transpose (H, W, C) -> (1, C, H, W)
+        tensor = out if out is not None else buffers.tensor
+        for channel, bgr_channel in enumerate((2, 1, 0)):
+            plane = tensor[0, channel]
+            np.multiply(buffers.canvas[:, :, bgr_channel], _PIXEL_SCALE[channel], out=plane)
+            np.subtract(plane, _PIXEL_OFFSET[channel], out=plane)
 
-        # Normalize with ImageNet mean/std
-        mean = np.array([0.485, 0.456, 0.406], dtype=np.float32)
-        std = np.array([0.229, 0.224, 0.225], dtype=np.float32)
-        normalized = rgb.astype(np.float32) / 255.0
-        normalized = (normalized - mean) / std
+        return tensor, scale, pad_x, pad_y
 
-        # Transpose (H, W, C) -> (C, H, W) and add batch dimension
-        transposed = np.transpose(normalized, (2, 0, 1))  # (3, H, W)
-        batched = np.expand_dims(transposed, axis=0)  # (1, 3, H, W)
-
-        return batched, scale, pad_x, pad_y
-
-    def _preprocess_heatmap(self, frame: np.ndarray) -> np.ndarray:
-        """Preprocess frame for heatmap format models (SLEAP).
+    def _preprocess_heatmap(
+        self, frame: np.ndarray, box: tuple[int, int, int, int] | None = None, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Preprocess a frame region for heatmap format models (SLEAP).
 
         Steps:
-        1. Resize to model input size
-        2. BGR -> grayscale
-        3. Shape to (1, 1, H, W) uint8
+        1. Resize the region to model input size (one warpAffine from the full frame)
+        2. BGR -> grayscale, into the input tensor
+        3. Shape is (1, 1, H, W) uint8
 
         Args:
             frame: BGR image from cv2.VideoCapture
+            box: (x1, y1, x2, y2) region of frame to use (default: whole frame)
+            out: (1, 1, H, W) tensor to fill instead of the thread's own (e.g. one item of a batch)
 
         Returns:
-            Preprocessed array ready for inference
+            Preprocessed array ready for inference (reused; see _input_buffers)
         """
-        # Resize to model input size
-        resized = cv2.resize(frame, (self.card.input_width, self.card.input_height), interpolation=cv2.INTER_LINEAR)
-
-        # BGR -> grayscale
-        gray = cv2.cvtColor(resized, cv2.COLOR_BGR2GRAY)
-
-        # Shape to (1, 1, H, W) uint8
-        batched = np.expand_dims(np.expand_dims(gray, axis=0), axis=0)
-
-        return batched
-
-    def _infer_simcc(self, region: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
-        """Run SimCC inference on a BGR image region.
+        box = box if box is not None else (0, 0, frame.shape[1], frame.shape[0])
+        buffers = self._input_buffers()
+        tensor = out if out is not None else buffers.tensor
+        _warp_region(frame, box, buffers.canvas)
+        cv2.cvtColor(buffers.canvas, cv2.COLOR_BGR2GRAY, dst=tensor[0, 0])
+        return tensor
+
+    def _run_session(self, preprocessed: np.ndarray) -> list[np.ndarray]:
+        """Run the session on a batch-of-one input, batched with other threads' inputs when possible."""
+        session = self.session
+        broker = self._broker
+        if broker is not None:
+            return broker.run(preprocessed)
+        return session.run(None, {self._input_name: preprocessed})
+
+    def _infer_simcc(self, frame: np.ndarray, box: tuple[int, int, int, int]) -> tuple[np.ndarray, np.ndarray]:
+        """Run SimCC inference on the box region of a BGR frame.
 
         Returns keypoints in the region's coordinate space (not original frame).
         """
-        preprocessed, lb_scale, pad_x, pad_y = self._preprocess_simcc(region)
-        outputs = self.session.run(None, {self.input_name: preprocessed})
+        preprocessed, lb_scale, pad_x, pad_y = self._preprocess_simcc(frame, box)
+        outputs = self._run_session(preprocessed)
+        keypoints, confidence = self._decode_simcc_outputs(outputs, [(lb_scale, pad_x, pad_y)])
+        return keypoints[0], confidence[0]
 
+    def _decode_simcc_outputs(
+        self, outputs: list[np.ndarray], letterboxes: list[tuple[float, int, int]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(N, K, 2) keypoints in region coordinates and (N, K) confidence from batched SimCC outputs.
+
+        letterboxes holds each item's (scale, pad_x, pad_y) from _preprocess_simcc.
+        """
         if len(outputs) != 2:
             raise ValueError(f"SimCC format expects 2 outputs, got {len(outputs)}")
         simcc_x = np.asarray(outputs[0])
         simcc_y = np.asarray(outputs[1])
-        keypoints, confidence = decode_simcc(simcc_x, simcc_y)
+        keypoints, confidence = decode_simcc_batch(simcc_x, simcc_y)
 
         # Undo letterbox: subtract padding offset, then invert the scale
-        keypoints[:, 0] = (keypoints[:, 0] - pad_x) / lb_scale
-        keypoints[:, 1] = (keypoints[:, 1] - pad_y) / lb_scale
+        lb_scale, pad_x, pad_y = np.asarray(letterboxes, dtype=np.float32).T[..., np.newaxis]
+        keypoints[..., 0] = (keypoints[..., 0] - pad_x) / lb_scale
+        keypoints[..., 1] = (keypoints[..., 1] - pad_y) / lb_scale
 
         return keypoints, confidence
 
-    def _infer_heatmap(
-        self, region: np.ndarray, original_width: int, original_height: int
-    ) -> tuple[np.ndarray, np.ndarray]:
-        """Run heatmap inference on a BGR image region."""
-        preprocessed = self._preprocess_heatmap(region)
-        outputs = self.session.run(None, {self.input_name: preprocessed})
+    def _infer_heatmap(self, frame: np.ndarray, box: tuple[int, int, int, int]) -> tuple[np.ndarray, np.ndarray]:
+        """Run heatmap inference on the box region of a BGR frame."""
+        preprocessed = self._preprocess_heatmap(frame, box)
+        outputs = self._run_session(preprocessed)
+        keypoints, confidence = self._decode_heatmap_outputs(outputs, [box])
+        return keypoints[0], confidence[0]
 
+    def _decode_heatmap_outputs(
+        self, outputs: list[np.ndarray], boxes: list[tuple[int, int, int, int]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(N, K, 2) keypoints in region coordinates and (N, K) confidence from batched heatmap output."""
         if len(outputs) != 1:
             raise ValueError(f"Heatmap format expects 1 output, got {len(outputs)}")
         raw_heatmaps = np.asarray(outputs[0])
-        heatmaps = raw_heatmaps[0]
-        keypoints, confidence = decode_heatmap(heatmaps)
+        keypoints, confidence = decode_heatmap_batch(raw_heatmaps)
 
+        regions = np.asarray(boxes, dtype=np.float32)
         heatmap_height, heatmap_width = raw_heatmaps.shape[2:]
-        scale_x = float(original_width) / float(heatmap_width)
-        scale_y = float(original_height) / float(heatmap_height)
-        keypoints[:, 0] *= scale_x
-        keypoints[:, 1] *= scale_y
+        scale_x = (regions[:, 2] - regions[:, 0]) / np.float32(heatmap_width)
+        scale_y = (regions[:, 3] - regions[:, 1]) / np.float32(heatmap_height)
+        keypoints[..., 0] *= scale_x[:, np.newaxis]
+        keypoints[..., 1] *= scale_y[:, np.newaxis]
 
         return keypoints, confidence
 
@@ -202,9 +410,21 @@ class OnnxTracker(Tracker):
         Takes detected keypoints, adds padding, then expands to match the
         model's aspect ratio (3:4 portrait for RTMPose). Clamps to frame bounds.
         """
+        box = self._keypoint_box(keypoints, confidence, padding)
+        if box is None:
+            return (0, 0, frame_w, frame_h)
+        return self._clamp_box(*box, frame_w, frame_h)
+
+    def _keypoint_box(
+        self, keypoints: np.ndarray, confidence: np.ndarray, padding: float = 0.3
+    ) -> tuple[float, float, float, float] | None:
+        """(cx, cy, width, height) of the padded, aspect-ratio-correct box around confident keypoints.
+
+        Not clamped to the frame. None when no keypoint is confident.
+        """
         mask = confidence >= self.card.confidence_threshold
         if not np.any(mask):
-            return (0, 0, frame_w, frame_h)
+            return None
 
         valid_kps = keypoints[mask]
         x_min, y_min = valid_kps.min(axis=0)
@@ -236,6 +456,12 @@ class OnnxTracker(Tracker):
             # Too tall — expand width
             box_w = box_h * target_aspect
 
+        return cx, cy, box_w, box_h
+
+    def _clamp_box(
+        self, cx: float, cy: float, box_w: float, box_h: float, frame_w: int, frame_h: int
+    ) -> tuple[int, int, int, int]:
+        """Integer (x1, y1, x2, y2) of a centred box, clamped to the frame and at least 1px each way."""
         x1 = int(max(0, cx - box_w / 2))
         y1 = int(max(0, cy - box_h / 2))
         x2 = int(min(frame_w, cx + box_w / 2))
@@ -281,12 +507,11 @@ class OnnxTracker(Tracker):
         if x2 <= x1 or y2 <= y1:
             n = len(self.card.point_name_to_id)
             return np.zeros((n, 2), dtype=np.float32), np.zeros(n, dtype=np.float32)
-        crop = frame[y1:y2, x1:x2]
 
         if self.card.format == "simcc":
-            keypoints, confidence = self._infer_simcc(crop)
+            keypoints, confidence = self._infer_simcc(frame, (x1, y1, x2, y2))
         else:
-            keypoints, confidence = self._infer_heatmap(crop, x2 - x1, y2 - y1)
+            keypoints, confidence = self._infer_heatmap(frame, (x1, y1, x2, y2))
 
         # Offset from crop coords to original frame coords
         keypoints[:, 0] += x1
@@ -294,12 +519,48 @@ class OnnxTracker(Tracker):
 
         return keypoints, confidence
 
+    def _detect_in_regions(
+        self, frame: np.ndarray, boxes: list[tuple[int, int, int, int]]
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Run inference on many crop regions, max_batch per session call; keypoints in frame coords.
+
+        Boxes are preprocessed straight into one batch tensor and inferred
+        together, so a scan costs about one batched call instead of one call
+        per box. Models without a dynamic batch axis run one box at a time.
+        """
+        if self.max_batch == 1:
+            return [self._detect_in_region(frame, *box) for box in boxes]
+
+        results: list[tuple[np.ndarray, np.ndarray]] = []
+        for start in range(0, len(boxes), self.max_batch):
+            chunk = boxes[start : start + self.max_batch]
+            batch = self._input_buffers().batch(len(chunk))
+            letterboxes = []
+            for i, box in enumerate(chunk):
+                if self.card.format == "simcc":
+                    _, lb_scale, pad_x, pad_y = self._preprocess_simcc(frame, box, out=batch[i : i + 1])
+                    letterboxes.append((lb_scale, pad_x, pad_y))
+                else:
+                    self._preprocess_heatmap(frame, box, out=batch[i : i + 1])
+
+            outputs = self.session.run(None, {self.input_name: batch})
+            if self.card.format == "simcc":
+                keypoints, confidence = self._decode_simcc_outputs(outputs, letterboxes)
+            else:
+                keypoints, confidence = self._decode_heatmap_outputs(outputs, chunk)
+            keypoints += np.asarray(chunk, dtype=np.float32)[:, np.newaxis, :2]  # region -> frame coords
+            results.extend(zip(keypoints, confidence))
+        return results
+
     def _detect(self, frame: np.ndarray, cam_id: int = 0, rotation_count: int = 0) -> PointPacket:
         """Detect pose keypoints in frame using three-tier search.
 
-        Tier 1: Crop to previous detection (fast, common case)
+        Tier 1: Crop to previous detection (fast, common case), or with
+            card.predict_motion to where the camera's BoxMotion predicts the
+            subject, sized by the prediction's uncertainty
         Tier 2: Full-frame letterbox (cold start or lost tracking)
-        Tier 3: Sliding window scan (thorough search when full-frame fails)
+        Tier 3: Sliding window scan (thorough search when full-frame fails),
+            inferred as one batch when the model takes batches
 
         After any successful detection, stores the bounding box for Tier 1
         on the next frame.
@@ -319,36 +580,54 @@ class OnnxTracker(Tracker):
         keypoints: np.ndarray | None = None
         confidence: np.ndarray | None = None
         prev_bbox = self._prev_bboxes.get(cam_id)
-
-        # Tier 1: Crop to previous detection
-        if prev_bbox is not None:
+        motion = self._motion.get(cam_id) if self.card.predict_motion else None
+
+        # Tier 1: Crop to the predicted or previous detection
+        tier1: tuple[np.ndarray, np.ndarray] | None = None
+        if motion is not None:
+            motion.predict()
+            aspect = self.card.input_width / self.card.input_height
+            tier1 = self._detect_in_region(frame, *self._clamp_box(*motion.search_box(aspect), frame_w, frame_h))
+            # Accept the crop only if it kept at least half of last frame's confident
+            # keypoints; a bad prediction otherwise costs keypoints, not just time.
+            count = int(np.sum(tier1[1] >= self.card.confidence_threshold))
+            if count > 0 and 2 * count >= self._prev_counts.get(cam_id, 0):
+                keypoints, confidence = tier1
+        elif prev_bbox is not None:
             keypoints, confidence = self._detect_in_region(frame, *prev_bbox)
             if np.sum(confidence >= self.card.confidence_threshold) == 0:
                 keypoints, confidence = None, None
 
         # Tier 2: Full-frame letterbox
+        full_frame: tuple[np.ndarray, np.ndarray] | None = None
         if keypoints is None:
-            keypoints, confidence = self._detect_in_region(frame, 0, 0, frame_w, frame_h)
-            if np.sum(confidence >= self.card.confidence_threshold) == 0:
-                keypoints, confidence = None, None
-
-        # Tier 3: Sliding window scan
+            full_frame = self._detect_in_region(frame, 0, 0, frame_w, frame_h)
+            if tier1 is not None and np.sum(tier1[1] >= self.card.confidence_threshold) > np.sum(
+                full_frame[1] >= self.card.confidence_threshold
+            ):
+                full_frame = tier1  # the rejected prediction still beat the full frame
+            if np.sum(full_frame[1] >= self.card.confidence_threshold) > 0:
+                keypoints, confidence = full_frame
+
+        # Tier 3: Sliding window scan, all windows inferred as one batch
         if keypoints is None:
             best_count = 0
-            for x1, y1, x2, y2 in self._scan_positions(frame_w, frame_h):
-                kps, conf = self._detect_in_region(frame, x1, y1, x2, y2)
+            for kps, conf in self._detect_in_regions(frame, self._scan_positions(frame_w, frame_h)):
                 count = int(np.sum(conf >= self.card.confidence_threshold))
                 if count > best_count:
                     best_count = count
                     keypoints, confidence = kps, conf
-            # If scan also found nothing, use the last attempt
+            # If scan also found nothing, keep the full-frame attempt
             if keypoints is None:
-                keypoints, confidence = self._detect_in_region(frame, 0, 0, frame_w, frame_h)
+                assert full_frame is not None  # tier 3 only runs after tier 2
+                keypoints, confidence = full_frame
 
         assert confidence is not None  # All paths above assign confidence
 
         # Update tracking state for this camera
         self._prev_bboxes[cam_id] = self._bbox_from_keypoints(keypoints, confidence, frame_w, frame_h)
+        if self.card.predict_motion:
+            self._update_motion(cam_id, keypoints, confidence, tracked=tier1 is not None and keypoints is tier1[0])
 
         # Unrotate points if needed
         if rotation_count != 0:
@@ -369,6 +648,27 @@ class OnnxTracker(Tracker):
             confidence=filtered_confidence,
         )
 
+    def _update_motion(self, cam_id: int, keypoints: np.ndarray, confidence: np.ndarray, tracked: bool) -> None:
+        """Feed this frame's box to cam_id's motion filter.
+
+        tracked means the keypoints came from the predicted crop; a subject
+        found any other way has jumped, so its filter restarts from rest.
+        Losing the subject drops the filter.
+        """
+        box = self._keypoint_box(keypoints, confidence)
+        if box is None:
+            self._motion.pop(cam_id, None)
+            self._prev_counts.pop(cam_id, None)
+            return
+
+        cx, cy, _, box_h = box
+        motion = self._motion.get(cam_id)
+        if tracked and motion is not None:
+            motion.update(cx, cy, box_h)
+        else:
+            self._motion[cam_id] = BoxMotion(cx, cy, box_h)
+        self._prev_counts[cam_id] = int(np.sum(confidence >= self.card.confidence_threshold))
+
     def get_point_name(self, keypoint_id: int) -> str:
         return self.card.keypoint_id_to_name.get(keypoint_id, str(keypoint_id))
 
@@ -383,6 +683,12 @@ class OnnxTracker(Tracker):
     def wireframe(self) -> "WireFrameView | None":
         return self.card.wireframe
 
+    def reset(self, cam_id: int) -> None:
+        """Drop cam_id's previous bounding box so the next frame starts from a full-frame search."""
+        self._prev_bboxes.pop(cam_id, None)
+        self._motion.pop(cam_id, None)
+        self._prev_counts.pop(cam_id, None)
+
     def cleanup(self) -> None:
         """Release onnxruntime session resources.
 
@@ -390,6 +696,15 @@ class OnnxTracker(Tracker):
         share a single tracker instance and each calls cleanup on close).
         """
         self._prev_bboxes.clear()
-        if hasattr(self, "session"):
-            del self.session
-            logger.debug(f"OnnxTracker cleaned up: {self.card.name}")
+        self._motion.clear()
+        self._prev_counts.clear()
+        with self._session_lock:
+            if self._session is not None:
+                self._session = None
+                self._broker = None
+                logger.debug(f"OnnxTracker cleaned up: {self.card.name}")
+
+
+def _restore_onnx_tracker(card: ModelCard, thread_budget: int | None) -> OnnxTracker:
+    """Unpickle an OnnxTracker without loading its session until it is first used."""
+    return OnnxTracker(card, thread_budget, load_session=False)
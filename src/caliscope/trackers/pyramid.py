@@ -0,0 +1,64 @@
+"""Coarse-to-fine detection helpers for calibration targets in high-resolution frames.
+
+Marker and chessboard detection cost grows with pixel count, but the squares
+and markers of a calibration target in 4K footage are usually far larger than
+the detectors need. The board trackers can therefore detect on a downscaled
+copy of the frame and refine the upscaled corners at full resolution with
+cornerSubPix, which recovers full-resolution accuracy from a coarse estimate.
+
+The scale is picked per camera from the feature size (square or marker side,
+in pixels) seen in that camera's last detection: the coarsest power-of-two
+reduction that keeps the feature at least a tracker-specific minimum size.
+Before a camera's first detection the feature size is estimated from the
+frame, assuming the target spans about a quarter of its shorter side.
+"""
+
+import cv2
+import numpy as np
+
+from caliscope.tracker import rescale_points
+
+# Power-of-two reductions tried, finest first.
+PYRAMID_SCALES = (1.0, 0.5, 0.25, 0.125)
+
+# Fraction of the frame's shorter side a target is assumed to span before it has been seen.
+ASSUMED_TARGET_FRACTION = 0.25
+
+
+def pyramid_scale(feature_px: float, min_feature_px: float) -> float:
+    """Coarsest scale in PYRAMID_SCALES at which feature_px stays at least min_feature_px."""
+    chosen = PYRAMID_SCALES[0]
+    for scale in PYRAMID_SCALES:
+        if feature_px * scale < min_feature_px:
+            break
+        chosen = scale
+    return chosen
+
+
+def assumed_feature_px(frame_shape: tuple[int, ...], features_across: int) -> float:
+    """Feature size expected before any detection: the target spans ASSUMED_TARGET_FRACTION of the shorter side."""
+    return ASSUMED_TARGET_FRACTION * min(frame_shape[:2]) / max(features_across, 1)
+
+
+def downscale(image: np.ndarray, scale: float) -> np.ndarray:
+    """image resized by scale with area averaging (no aliasing of fine marker bits)."""
+    height, width = image.shape[:2]
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+def to_full_resolution(points: np.ndarray, small_shape: tuple[int, ...], full_shape: tuple[int, ...]) -> np.ndarray:
+    """float32 points (any shape ending in 2) mapped from a downscaled image back to the full-resolution one."""
+    from_size = (small_shape[1], small_shape[0])
+    to_size = (full_shape[1], full_shape[0])
+    return rescale_points(points.reshape(-1, 2), from_size, to_size).astype(np.float32).reshape(points.shape)
+
+
+def median_spacing(points: np.ndarray) -> float:
+    """Median distance from each point to its nearest neighbour (0 for fewer than two points)."""
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(points) < 2:
+        return 0.0
+    distances = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+    np.fill_diagonal(distances, np.inf)
+    return float(np.median(distances.min(axis=1)))
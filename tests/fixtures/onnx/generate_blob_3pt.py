@@ -0,0 +1,67 @@
+"""Generate a tiny ONNX model that actually localizes, for tracking moving subjects.
+
+Regenerate if this script changes: python tests/fixtures/onnx/generate_blob_3pt.py
+
+Unlike simcc_3pt.onnx, whose outputs ignore the input, blob_3pt.onnx finds
+three coloured squares: keypoint k is the top-left corner of the bright region
+in RGB channel k of its input (red = head, green = left_hand, blue =
+right_hand). simcc_x for keypoint k is the column-wise maximum of channel k,
+simcc_y the row-wise maximum, each repeated twice to match a SimCC split ratio
+of 2. After ImageNet normalization a saturated channel reads about 2.2
+(confidence clamps to 1.0) and black reads about -2.0 (confidence 0), so a
+square outside the crop is simply not detected.
+
+Input is (batch, 3, 64, 48) with a dynamic batch axis.
+
+Usage:
+    pip install onnx  # one-time, not needed for running tests
+    python tests/fixtures/onnx/generate_blob_3pt.py
+"""
+
+from pathlib import Path
+
+import onnx
+from onnx import TensorProto, helper
+
+NUM_KEYPOINTS = 3
+INPUT_W, INPUT_H = 48, 64
+
+
+def _doubled(name: str, out: str, nodes: list) -> None:
+    """Append nodes turning (N, K, L) `name` into (N, K, 2L) `out` with every entry repeated."""
+    nodes += [
+        helper.make_node("Unsqueeze", [name, "_last_axis"], [f"{name}_4d"]),
+        helper.make_node("Concat", [f"{name}_4d", f"{name}_4d"], [f"{name}_pairs"], axis=3),
+        helper.make_node("Reshape", [f"{name}_pairs", "_flat_tail"], [out]),
+    ]
+
+
+def build_model() -> onnx.ModelProto:
+    input_info = helper.make_tensor_value_info("input", TensorProto.FLOAT, ["batch", 3, INPUT_H, INPUT_W])
+    output_x_info = helper.make_tensor_value_info("simcc_x", TensorProto.FLOAT, ["batch", NUM_KEYPOINTS, INPUT_W * 2])
+    output_y_info = helper.make_tensor_value_info("simcc_y", TensorProto.FLOAT, ["batch", NUM_KEYPOINTS, INPUT_H * 2])
+
+    nodes = [
+        helper.make_node("Constant", [], ["_last_axis"], value=helper.make_tensor("a", TensorProto.INT64, [1], [3])),
+        helper.make_node(
+            "Constant", [], ["_flat_tail"], value=helper.make_tensor("t", TensorProto.INT64, [3], [0, 0, -1])
+        ),
+        # (N, 3, H, W) -> (N, 3, W): brightest value in each column, per channel
+        helper.make_node("ReduceMax", ["input"], ["_columns"], axes=[2], keepdims=0),
+        # (N, 3, H, W) -> (N, 3, H): brightest value in each row, per channel
+        helper.make_node("ReduceMax", ["input"], ["_rows"], axes=[3], keepdims=0),
+    ]
+    _doubled("_columns", "simcc_x", nodes)
+    _doubled("_rows", "simcc_y", nodes)
+
+    graph = helper.make_graph(nodes, "test_blob_3pt", [input_info], [output_x_info, output_y_info])
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 17)])
+    model.ir_version = 8
+    onnx.checker.check_model(model)
+    return model
+
+
+if __name__ == "__main__":
+    out_path = Path(__file__).parent / "blob_3pt.onnx"
+    onnx.save(build_model(), str(out_path))
+    print(f"Saved {out_path} ({out_path.stat().st_size} bytes)")
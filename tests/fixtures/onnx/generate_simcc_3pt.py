@@ -1,6 +1,7 @@
 """Generate a tiny ONNX model for testing the OnnxTracker pipeline.
 
 Generated binary SHA256: 162ec2516ca9517202fde1feb33eb8ec0535d28d086cc12d050ecfe2629586cb
+(simcc_3pt_batched.onnx: 4b7857cf2c7fe060f4ab9b2fe039e0d9e15ea6364a00187d4376dd3163bc32b8)
 Regenerate if this script changes: python tests/fixtures/onnx/generate_simcc_3pt.py
 
 Produces a constant-output SimCC model with 4 keypoints (nose, left_eye, right_eye, low_conf).
@@ -19,6 +20,10 @@ Coordinate design (for a 640x480 frame with 48x64 model input):
 low_conf has a peak logit of 0.1, producing confidence ~0.1, below the 0.3 threshold.
 This keypoint tests the confidence filtering logic.
 
+simcc_3pt_batched.onnx is the same model with a dynamic batch axis: every item
+of an (N, 3, 64, 48) input gets the same constant outputs, for the batched
+inference path.
+
 Usage:
     pip install onnx  # one-time, not needed for running tests
     python tests/fixtures/onnx/generate_simcc_3pt.py
@@ -41,11 +46,13 @@ PEAKS_Y = [64, 52, 52, 20]
 PEAK_LOGITS = [5.0, 5.0, 5.0, 0.1]  # low_conf has sub-threshold logit
 
 
-def build_model() -> onnx.ModelProto:
+def build_model(batched: bool = False) -> onnx.ModelProto:
+    batch = "batch" if batched else 1
+
     # --- Graph I/O ---
-    input_info = helper.make_tensor_value_info("input", TensorProto.FLOAT, [1, 3, INPUT_H, INPUT_W])
-    output_x_info = helper.make_tensor_value_info("simcc_x", TensorProto.FLOAT, [1, NUM_KEYPOINTS, SIMCC_X_LEN])
-    output_y_info = helper.make_tensor_value_info("simcc_y", TensorProto.FLOAT, [1, NUM_KEYPOINTS, SIMCC_Y_LEN])
+    input_info = helper.make_tensor_value_info("input", TensorProto.FLOAT, [batch, 3, INPUT_H, INPUT_W])
+    output_x_info = helper.make_tensor_value_info("simcc_x", TensorProto.FLOAT, [batch, NUM_KEYPOINTS, SIMCC_X_LEN])
+    output_y_info = helper.make_tensor_value_info("simcc_y", TensorProto.FLOAT, [batch, NUM_KEYPOINTS, SIMCC_Y_LEN])
 
     # --- Constant output data ---
     simcc_x = np.zeros((1, NUM_KEYPOINTS, SIMCC_X_LEN), dtype=np.float32)
@@ -58,21 +65,45 @@ def build_model() -> onnx.ModelProto:
     # Identity consumes the input (keeps graph valid)
     identity = helper.make_node("Identity", ["input"], ["_input_consumed"])
 
+    # Batched: broadcast the constants to the input's batch size
+    const_names = ("_simcc_x_one", "_simcc_y_one") if batched else ("simcc_x", "simcc_y")
     const_x = helper.make_node(
         "Constant",
         [],
-        ["simcc_x"],
+        [const_names[0]],
         value=helper.make_tensor("cx", TensorProto.FLOAT, simcc_x.shape, simcc_x.flatten().tolist()),
     )
     const_y = helper.make_node(
         "Constant",
         [],
-        ["simcc_y"],
+        [const_names[1]],
         value=helper.make_tensor("cy", TensorProto.FLOAT, simcc_y.shape, simcc_y.flatten().tolist()),
     )
+    nodes = [identity, const_x, const_y]
+
+    if batched:
+        nodes += [
+            helper.make_node("Shape", ["input"], ["_batch"], start=0, end=1),
+            helper.make_node(
+                "Constant",
+                [],
+                ["_x_tail"],
+                value=helper.make_tensor("tx", TensorProto.INT64, [2], [NUM_KEYPOINTS, SIMCC_X_LEN]),
+            ),
+            helper.make_node(
+                "Constant",
+                [],
+                ["_y_tail"],
+                value=helper.make_tensor("ty", TensorProto.INT64, [2], [NUM_KEYPOINTS, SIMCC_Y_LEN]),
+            ),
+            helper.make_node("Concat", ["_batch", "_x_tail"], ["_x_shape"], axis=0),
+            helper.make_node("Concat", ["_batch", "_y_tail"], ["_y_shape"], axis=0),
+            helper.make_node("Expand", ["_simcc_x_one", "_x_shape"], ["simcc_x"]),
+            helper.make_node("Expand", ["_simcc_y_one", "_y_shape"], ["simcc_y"]),
+        ]
 
     graph = helper.make_graph(
-        [identity, const_x, const_y],
+        nodes,
         "test_simcc_3pt",
         [input_info],
         [output_x_info, output_y_info],
@@ -85,7 +116,7 @@ def build_model() -> onnx.ModelProto:
 
 
 if __name__ == "__main__":
-    out_path = Path(__file__).parent / "simcc_3pt.onnx"
-    model = build_model()
-    onnx.save(model, str(out_path))
-    print(f"Saved {out_path} ({out_path.stat().st_size} bytes)")
+    for batched, file_name in ((False, "simcc_3pt.onnx"), (True, "simcc_3pt_batched.onnx")):
+        out_path = Path(__file__).parent / file_name
+        onnx.save(build_model(batched), str(out_path))
+        print(f"Saved {out_path} ({out_path.stat().st_size} bytes)")
@@ -259,6 +259,66 @@ class TestStartReconstruction:
         assert call_kwargs.kwargs["name"] == "reconstruction"
 
 
+class TestCachedImagePoints:
+    """Stage 1 reuses cached 2D points unless retracking is forced or an overlay is wanted."""
+
+    @pytest.fixture
+    def pipeline(self, monkeypatch):
+        """Replace the worker's pipeline stages with mocks; the cache always hits."""
+        from caliscope.gui.presenters import reconstruction_presenter as module
+
+        stages = MagicMock()
+        stages.load_cached_image_points.return_value = MagicMock(name="cached_points")
+        for name in ("load_cached_image_points", "process_synchronized_recording", "reconstruct_xyz"):
+            monkeypatch.setattr(module, name, getattr(stages, name))
+        monkeypatch.setattr(module, "OverlayVideoWriter", stages.OverlayVideoWriter)
+        return stages
+
+    def _run_worker(self, presenter, mock_task_manager, **kwargs):
+        presenter.select_recording("recording_1")
+        presenter.select_tracker("CHARUCO")
+        presenter.start_reconstruction(**kwargs)
+        worker = mock_task_manager.submit.call_args.args[0]
+        token = MagicMock()
+        token.is_cancelled = False
+        return worker(token, MagicMock())
+
+    def _settings(self, save_overlay: bool) -> MagicMock:
+        settings = MagicMock()
+        settings.get_save_tracked_points_video.return_value = save_overlay
+        settings.get_save_xy_points.return_value = False
+        settings.get_online_triangulation.return_value = False
+        return settings
+
+    def test_cache_hit_skips_tracking(self, presenter, mock_task_manager, registered_test_tracker, pipeline):
+        self._run_worker(presenter, mock_task_manager)
+
+        pipeline.process_synchronized_recording.assert_not_called()
+        cached = pipeline.load_cached_image_points.return_value
+        assert pipeline.reconstruct_xyz.call_args.args[0] is cached
+
+    def test_force_retrack_ignores_cache(self, presenter, mock_task_manager, registered_test_tracker, pipeline):
+        self._run_worker(presenter, mock_task_manager, force_retrack=True)
+
+        pipeline.load_cached_image_points.assert_not_called()
+        pipeline.process_synchronized_recording.assert_called_once()
+
+    def test_overlay_video_bypasses_cache(
+        self, workspace_with_recordings, camera_array, mock_task_manager, qapp, registered_test_tracker, pipeline
+    ):
+        presenter = ReconstructionPresenter(
+            workspace_dir=workspace_with_recordings,
+            camera_array=camera_array,
+            task_manager=mock_task_manager,
+            project_settings=self._settings(save_overlay=True),
+        )
+        self._run_worker(presenter, mock_task_manager)
+
+        pipeline.load_cached_image_points.assert_not_called()
+        pipeline.process_synchronized_recording.assert_called_once()
+        pipeline.OverlayVideoWriter.return_value.close.assert_called_once()
+
+
 class TestCleanup:
     """Tests for cleanup behavior."""
 
@@ -0,0 +1,78 @@
+"""Reference implementation of the frame synchronization rule.
+
+This is the original one-step-at-a-time greedy loop that
+SynchronizedTimestamps used before the mapping was vectorized. It is kept
+verbatim (apart from taking plain lists) so parity tests can check the fast
+implementation against it on arbitrary timestamp patterns.
+"""
+
+from __future__ import annotations
+
+
+def greedy_sync_mapping(frames_by_cam: dict[int, list[float]]) -> dict[int, dict[int, int | None]]:
+    """sync_index -> {cam_id: frame position or None}, stepping one sync index at a time."""
+    cam_ids = sorted(frames_by_cam.keys())
+    cursors = {cam_id: 0 for cam_id in cam_ids}
+
+    sync_map: dict[int, dict[int, int | None]] = {}
+    sync_index = 0
+
+    while any(cursors[c] < len(frames_by_cam[c]) for c in cam_ids):
+        candidates: dict[int, float] = {}
+        for cam_id in cam_ids:
+            if cursors[cam_id] < len(frames_by_cam[cam_id]):
+                candidates[cam_id] = frames_by_cam[cam_id][cursors[cam_id]]
+
+        earliest_next = {cam_id: _earliest_next_frame(cam_id, cursors, frames_by_cam) for cam_id in cam_ids}
+        latest_current = {cam_id: _latest_current_frame(cam_id, cursors, frames_by_cam) for cam_id in cam_ids}
+
+        assigned: dict[int, int | None] = {}
+        for cam_id in cam_ids:
+            if cam_id not in candidates:
+                assigned[cam_id] = None
+                continue
+
+            frame_time = candidates[cam_id]
+            if frame_time > earliest_next[cam_id]:
+                assigned[cam_id] = None
+                continue
+
+            delta_to_next = earliest_next[cam_id] - frame_time
+            delta_to_current = frame_time - latest_current[cam_id]
+            if delta_to_next < delta_to_current:
+                assigned[cam_id] = None
+                continue
+
+            assigned[cam_id] = cursors[cam_id]
+            cursors[cam_id] += 1
+
+        if any(v is not None for v in assigned.values()):
+            sync_map[sync_index] = assigned
+            sync_index += 1
+        else:
+            min_cam = min(candidates.keys(), key=lambda c: candidates[c])
+            cursors[min_cam] += 1
+
+    return sync_map
+
+
+def _earliest_next_frame(cam_id: int, cursors: dict[int, int], frames_by_cam: dict[int, list[float]]) -> float:
+    times = []
+    for c in cursors:
+        if c == cam_id:
+            continue
+        next_index = cursors[c] + 1
+        if next_index < len(frames_by_cam[c]):
+            times.append(frames_by_cam[c][next_index])
+    return min(times) if times else float("inf")
+
+
+def _latest_current_frame(cam_id: int, cursors: dict[int, int], frames_by_cam: dict[int, list[float]]) -> float:
+    times = []
+    for c in cursors:
+        if c == cam_id:
+            continue
+        current_index = cursors[c]
+        if current_index < len(frames_by_cam[c]):
+            times.append(frames_by_cam[c][current_index])
+    return max(times) if times else float("-inf")
@@ -186,6 +186,64 @@ def test_extract_image_points_frame_step():
     assert len(df_step5) < len(df_step1)
 
 
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_extract_image_points_segments_match_unsplit(backend):
+    """Tracking keyframe-aligned segments in parallel yields the same points as one pass."""
+    charuco = Charuco.from_toml(PRERECORDED_SESSION / "charuco.toml")
+    tracker = CharucoTracker(charuco)
+    video_path = PRERECORDED_SESSION / "calibration" / "intrinsic" / "cam_0.mp4"
+
+    expected = extract_image_points(video_path, 0, tracker, frame_step=2, progress=None).df
+    spy = _SpyProgressCallback()
+    actual = extract_image_points(video_path, 0, tracker, frame_step=2, progress=spy, segments=3, backend=backend).df
+
+    pd.testing.assert_frame_equal(actual[expected.columns], expected, check_dtype=False)
+    assert spy.video_completes == [0]
+    assert len(spy.frames) == spy.video_starts[0][1]
+    assert max(frames_done for _, frames_done, _ in spy.frames) == len(spy.frames)
+
+
+class _Interrupted(Exception):
+    pass
+
+
+class _InterruptingProgress(_SpyProgressCallback):
+    """Raises from on_frame after a number of frames, like a Ctrl+C mid-extraction."""
+
+    def __init__(self, stop_after: int) -> None:
+        super().__init__()
+        self.stop_after = stop_after
+
+    def on_frame(self, cam_id: int, frame_index: int, n_points: int) -> None:
+        super().on_frame(cam_id, frame_index, n_points)
+        if len(self.frames) == self.stop_after:
+            raise _Interrupted
+
+
+def test_extract_image_points_resumes_from_checkpoint(tmp_path):
+    """An interrupted extraction picks up after its last saved frame and matches an uninterrupted one."""
+    charuco = Charuco.from_toml(PRERECORDED_SESSION / "charuco.toml")
+    tracker = CharucoTracker(charuco)
+    video_path = PRERECORDED_SESSION / "calibration" / "intrinsic" / "cam_0.mp4"
+    checkpoint = tmp_path / "xy.checkpoint"
+
+    expected = extract_image_points(video_path, 0, tracker, frame_step=3, progress=None).df
+
+    with pytest.raises(_Interrupted):
+        extract_image_points(
+            video_path, 0, tracker, frame_step=3, progress=_InterruptingProgress(10), checkpoint=checkpoint
+        )
+    assert checkpoint.exists()
+
+    spy = _SpyProgressCallback()
+    actual = extract_image_points(video_path, 0, tracker, frame_step=3, progress=spy, checkpoint=checkpoint).df
+
+    pd.testing.assert_frame_equal(actual[expected.columns], expected, check_dtype=False)
+    assert spy.frames[0][1] == 11  # progress continues from where the first run stopped
+    assert spy.frames[-1][1] == spy.video_starts[0][1]
+    assert not checkpoint.exists()
+
+
 # ---------------------------------------------------------------------------
 # calibrate_intrinsics
 # ---------------------------------------------------------------------------
@@ -271,6 +329,47 @@ def test_extract_image_points_multicam_smoke(tmp_path: Path):
     assert result.df["obj_loc_x"].notna().any()
 
 
+def test_extract_image_points_multicam_process_backend(tmp_path: Path):
+    """Worker-process extraction reports the same observations and progress as threads."""
+    copy_contents_to_clean_dest(CHARUCO_SESSION, tmp_path)
+
+    extrinsic_dir = tmp_path / "calibration" / "extrinsic"
+    videos = {cam_id: extrinsic_dir / f"cam_{cam_id}.mp4" for cam_id in range(4)}
+    timestamps_path = extrinsic_dir / "timestamps.csv"
+    tracker = CharucoTracker(Charuco.from_toml(tmp_path / "charuco.toml"))
+
+    class RecordingProgress:
+        def __init__(self):
+            self.started: dict[int, int] = {}
+            self.frames: dict[int, int] = {}
+            self.completed: list[int] = []
+
+        def on_video_start(self, cam_id, total_frames):
+            self.started[cam_id] = total_frames
+
+        def on_frame(self, cam_id, frame_index, n_points):
+            self.frames[cam_id] = frame_index
+
+        def on_video_complete(self, cam_id):
+            assert self.frames[cam_id] == self.started[cam_id]
+            self.completed.append(cam_id)
+
+        def on_info(self, message):
+            pass
+
+    progress = RecordingProgress()
+    threaded = extract_image_points_multicam(videos, tracker, frame_step=10, timestamps=timestamps_path, progress=None)
+    processed = extract_image_points_multicam(
+        videos, tracker, frame_step=10, timestamps=timestamps_path, progress=progress, backend="process"
+    )
+
+    key_cols = ["sync_index", "cam_id", "object_id", "keypoint_id"]
+    expected = threaded.df.sort_values(key_cols).reset_index(drop=True)
+    actual = processed.df.sort_values(key_cols).reset_index(drop=True)
+    pd.testing.assert_frame_equal(actual[expected.columns], expected, check_dtype=False)
+    assert sorted(progress.completed) == [0, 1, 2, 3]
+
+
 def test_extract_image_points_multicam_inferred_timestamps(tmp_path: Path):
     """Multi-camera extraction infers timestamps from video metadata when no CSV is given."""
     copy_contents_to_clean_dest(CHARUCO_SESSION, tmp_path)
@@ -1,4 +1,5 @@
 import logging
+import pickle
 import pytest
 import cv2
 import numpy as np
@@ -52,6 +53,25 @@ def test_aruco_tracker_detection():
     )
 
 
+def test_aruco_tracker_survives_pickling():
+    """Process-pool extraction ships the tracker to workers; the detector is rebuilt there."""
+    fixture_dir = __root__ / "tests/sessions/post_optimization"
+    capture = cv2.VideoCapture(str(fixture_dir / "calibration/extrinsic/cam_0.mp4"))
+    success, frame = capture.read()
+    capture.release()
+    assert success, "Failed to load test frame"
+
+    tracker = ArucoTracker(dictionary=cv2.aruco.DICT_4X4_100, inverted=True)
+    copy = pickle.loads(pickle.dumps(tracker))
+
+    assert copy.config == tracker.config
+    expected = tracker.get_points(frame)
+    packet = copy.get_points(frame)
+    assert len(packet.keypoint_id) > 0
+    np.testing.assert_array_equal(packet.keypoint_id, expected.keypoint_id)
+    np.testing.assert_array_equal(packet.img_loc, expected.img_loc)
+
+
 def test_aruco_get_point_name():
     """Test minimal point name implementation."""
     tracker = ArucoTracker()
@@ -105,6 +125,66 @@ def test_aruco_point_id_mapping():
         )
 
 
+def _large_marker_frame() -> tuple[np.ndarray, dict[int, np.ndarray]]:
+    """3840x2160 frame with five ~300 px markers under perspective, and their true corners by marker id."""
+    dictionary = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_100)
+    frame = np.full((2160, 3840), 255, dtype=np.uint8)
+    rng = np.random.default_rng(0)
+    # marker image pixel edges; corner k of the marker is at these coordinates in its 600 px print
+    print_corners = np.array([[100, 100], [700, 100], [700, 700], [100, 700]], dtype=np.float32)
+    truth = {}
+    for marker_id, origin in enumerate([(600, 400), (1800, 500), (2900, 700), (900, 1300), (2200, 1400)]):
+        marker = cv2.aruco.generateImageMarker(dictionary, marker_id, 600)
+        marker = cv2.copyMakeBorder(marker, 100, 100, 100, 100, cv2.BORDER_CONSTANT, value=255)
+        side, angle = rng.uniform(250, 400), rng.uniform(-0.4, 0.4)
+        rotation = np.array([[np.cos(angle), np.sin(angle)], [-np.sin(angle), np.cos(angle)]])
+        square = np.array([[0, 0], [side, 0], [side, side], [0, side]])
+        quad = square @ rotation + origin + rng.uniform(-20, 20, (4, 2))
+        homography = cv2.getPerspectiveTransform(print_corners, quad.astype(np.float32))
+
+        warped = cv2.warpPerspective(marker, homography, (3840, 2160), borderValue=255)
+        inside = cv2.warpPerspective(np.ones_like(marker), homography, (3840, 2160)) > 0
+        frame[inside] = warped[inside]
+        # pixel-centre coordinates: the print's corner pixel edges sit half a pixel before its centres
+        truth[marker_id] = cv2.perspectiveTransform((print_corners - 0.5)[np.newaxis], homography)[0]
+
+    return cv2.GaussianBlur(frame, (5, 5), 1.2), truth
+
+
+def test_aruco_pyramid_corners_match_ground_truth():
+    """Markers found on a reduced 4K frame have refined corners at least as accurate as full resolution."""
+    frame, truth = _large_marker_frame()
+
+    full_resolution = ArucoTracker().get_points(frame)
+    tracker = ArucoTracker(pyramid=True)
+    tracker.get_points(frame)
+    assert tracker._pyramid_scale(0, frame.shape) == 0.125
+    packet = tracker.get_points(frame)
+
+    np.testing.assert_array_equal(packet.object_id, full_resolution.object_id)
+    np.testing.assert_array_equal(packet.keypoint_id, full_resolution.keypoint_id)
+
+    def errors(points):
+        true_corners = np.array([truth[int(m)][int(k)] for m, k in zip(points.object_id, points.keypoint_id)])
+        return np.linalg.norm(points.img_loc - true_corners, axis=1)
+
+    assert errors(packet).max() < 0.5
+    assert errors(packet).mean() <= errors(full_resolution).mean()
+
+
+def test_aruco_pyramid_state_is_per_camera():
+    frame, _ = _large_marker_frame()
+    tracker = ArucoTracker(pyramid=True)
+    tracker.get_points(frame, cam_id=2)
+    assert set(tracker._marker_px) == {2}
+
+    tracker.reset(2)
+    assert tracker._marker_px == {}
+    copy = pickle.loads(pickle.dumps(tracker))
+    assert copy.pyramid is True and copy.config == tracker.config
+    assert "pyramid" not in ArucoTracker().config
+
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     # test_aruco_tracker_instantiation()
@@ -0,0 +1,58 @@
+"""Tests for BoxMotion: the constant-velocity filter OnnxTracker uses to place crops."""
+
+import numpy as np
+import pytest
+
+from caliscope.trackers.box_motion import BoxMotion
+
+
+def _track(motion: BoxMotion, positions: np.ndarray, height: float = 200.0) -> list[float]:
+    """Predict then update along positions; returns each prediction's x error."""
+    errors = []
+    for x, y in positions:
+        motion.predict()
+        errors.append(motion.center[0] - x)
+        motion.update(x, y, height)
+    return errors
+
+
+def test_prediction_converges_on_constant_velocity():
+    """After a few frames the predicted centre anticipates steady motion instead of lagging a frame."""
+    positions = np.stack([300 + 25.0 * np.arange(1, 31), np.full(30, 240.0)], axis=1)
+    motion = BoxMotion(300, 240, 200)
+
+    errors = _track(motion, positions)
+
+    assert abs(errors[0]) == 25.0  # starts at rest
+    assert max(abs(e) for e in errors[-10:]) < 1.0
+    assert motion.process_scale == 1.0
+
+
+def test_search_box_widens_after_a_surprise():
+    """A reversal inflates process noise, so the next crop is larger than during steady motion."""
+    aspect = 0.75
+    steady = np.stack([300 + 20.0 * np.arange(1, 21), np.full(20, 240.0)], axis=1)
+    motion = BoxMotion(300, 240, 200)
+    _track(motion, steady)
+    motion.predict()
+    _, _, steady_w, steady_h = motion.search_box(aspect)
+    motion.update(steady[-1, 0] - 20, 240, 200)  # turned around
+
+    motion.predict()
+    cx, cy, width, height = motion.search_box(aspect)
+
+    assert motion.process_scale > 1.0
+    assert height > steady_h and width > steady_w
+    assert width / height == pytest.approx(aspect)
+
+
+def test_search_box_of_still_subject_stays_close_to_its_box():
+    """Uncertainty margins stay small for a subject that does not move."""
+    motion = BoxMotion(320, 240, 200)
+    _track(motion, np.tile([[320.0, 240.0]], (30, 1)))
+    motion.predict()
+
+    cx, cy, width, height = motion.search_box(aspect=0.75)
+
+    assert (cx, cy) == pytest.approx((320.0, 240.0))
+    assert 200 < height < 1.3 * 200
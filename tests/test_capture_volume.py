@@ -351,6 +351,24 @@ def test_rotation_invariance(axis: Literal["x", "y", "z"], tmp_path: Path):
     logger.info(f"✓ Rotation invariance test passed for {axis} axis")
 
 
+def test_scale_accuracy_keeps_full_precision_far_from_origin():
+    """Board distances are measured in float64, so a distant world origin does not change them."""
+    session_path = Path(__root__, "tests", "sessions", "post_optimization")
+    camera_array = CameraArray.from_toml(session_path / "camera_array.toml")
+    image_points = ImagePoints.from_csv(session_path / "calibration" / "extrinsic" / "CHARUCO" / "xy_CHARUCO.csv")
+    world_points = image_points.triangulate(camera_array)
+
+    shifted_df = world_points.df.copy()
+    shifted_df["x_coord"] += 5000.0  # 5 km: float32 would round coordinates to ~0.5 mm
+
+    near = CaptureVolume(camera_array, image_points, world_points).compute_volumetric_scale_accuracy()
+    far = CaptureVolume(camera_array, image_points, WorldPoints(shifted_df)).compute_volumetric_scale_accuracy()
+
+    assert len(near.frame_errors) > 0
+    assert len(far.frame_errors) == len(near.frame_errors)
+    assert far.pooled_rmse_mm == pytest.approx(near.pooled_rmse_mm, rel=1e-9)
+
+
 def test_bundle_filter(tmp_path: Path):
     """Test filtering workflow with CaptureVolume.
 
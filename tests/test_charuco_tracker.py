@@ -25,12 +25,14 @@ truth. The print-pixel to board-meters mapping is resolved empirically with the
 detector (not assumed), because the whole point is that this path is parity-sensitive.
 """
 
+import pickle
+
 import cv2
 import numpy as np
 import pytest
 
 from caliscope.core.charuco import Charuco
-from caliscope.trackers.charuco_tracker import CharucoTracker
+from caliscope.trackers.charuco_tracker import FULL_FRAME_INTERVAL, CharucoTracker
 
 # Synthetic pinhole camera: 1280x960, f=1000px, no distortion.
 IMG_SIZE = (1280, 960)
@@ -311,6 +313,157 @@ def test_mirror_hint_is_remembered_per_camera(scene):
     assert tracker._last_mirrored == {3: True, 7: False}
 
 
+def test_tracker_survives_pickling(scene):
+    """Process-pool extraction ships the tracker to workers; OpenCV objects are rebuilt there."""
+    charuco, board_img, board_w_m, board_h_m, to_px = scene
+    front_rot, front_center = _front_camera(board_w_m, board_h_m)
+    frame = _render_plane(board_img, board_w_m, board_h_m, to_px, 0.0, front_rot, front_center)
+
+    tracker = CharucoTracker(charuco)
+    expected = tracker._detect(frame, cam_id=0)
+    copy = pickle.loads(pickle.dumps(tracker))
+
+    assert copy.config == tracker.config
+    assert copy._last_mirrored == {}
+    packet = copy._detect(frame, cam_id=0)
+    np.testing.assert_array_equal(packet.keypoint_id, expected.keypoint_id)
+    np.testing.assert_array_equal(packet.img_loc, expected.img_loc)
+
+
+def _shifted(frame: np.ndarray, dx: float, dy: float) -> np.ndarray:
+    """frame translated by (dx, dy) pixels, uncovered area white like the rendered background."""
+    shift = np.array([[1.0, 0.0, dx], [0.0, 1.0, dy]])
+    return cv2.warpAffine(frame, shift, (frame.shape[1], frame.shape[0]), borderValue=255)
+
+
+def _full_frame_searches(tracker: CharucoTracker) -> list[int]:
+    """Patch tracker to record each full-frame find_corners_single_frame call; returns the record."""
+    calls: list[int] = []
+    find = tracker.find_corners_single_frame
+
+    def record(gray_frame, mirror, roi=None, scale=1.0):
+        if roi is None:
+            calls.append(1)
+        return find(gray_frame, mirror, roi, scale)
+
+    tracker.find_corners_single_frame = record  # type: ignore[method-assign]
+    return calls
+
+
+def test_region_search_matches_full_frame_detection(scene):
+    """Corners found in the region around the last board are the full-frame corners, in full-frame coordinates."""
+    charuco, board_img, board_w_m, board_h_m, to_px = scene
+    rotation, center = _front_camera(board_w_m, board_h_m)
+    frame = _render_plane(board_img, board_w_m, board_h_m, to_px, 0.0, rotation, center)
+    moved = _shifted(frame, 23.0, -17.0)
+
+    tracker = CharucoTracker(charuco, full_frame_interval=FULL_FRAME_INTERVAL)
+    full_frame = _full_frame_searches(tracker)
+    tracker._detect(frame, cam_id=0)
+    packet = tracker._detect(moved, cam_id=0)
+
+    assert len(full_frame) == 1  # only the first frame searched everywhere
+    expected = CharucoTracker(charuco)._detect(moved, cam_id=0)
+    np.testing.assert_array_equal(packet.keypoint_id, expected.keypoint_id)
+    np.testing.assert_array_equal(packet.img_loc, expected.img_loc)
+    np.testing.assert_array_equal(packet.obj_loc, expected.obj_loc)
+
+
+def test_region_miss_falls_back_to_full_frame(scene):
+    """A board that jumps out of its search region is still found by the full-frame search."""
+    charuco, board_img, board_w_m, board_h_m, to_px = scene
+    rotation, center = _front_camera(board_w_m, board_h_m)
+    frame = _render_plane(board_img, board_w_m, board_h_m, to_px, 0.0, rotation, center)
+    jumped = _shifted(frame, 420.0, 0.0)
+
+    tracker = CharucoTracker(charuco, full_frame_interval=FULL_FRAME_INTERVAL)
+    tracker._detect(frame, cam_id=0)
+    packet = tracker._detect(jumped, cam_id=0)
+
+    expected = CharucoTracker(charuco)._detect(jumped, cam_id=0)
+    assert len(packet.keypoint_id) == len(expected.keypoint_id) > 0
+    np.testing.assert_array_equal(packet.img_loc, expected.img_loc)
+    assert tracker._rois[0][0] > 420  # the region followed the board
+
+
+def test_full_frame_is_searched_every_interval(scene):
+    charuco, board_img, board_w_m, board_h_m, to_px = scene
+    rotation, center = _front_camera(board_w_m, board_h_m)
+    frame = _render_plane(board_img, board_w_m, board_h_m, to_px, 0.0, rotation, center)
+
+    tracker = CharucoTracker(charuco, full_frame_interval=3)
+    full_frame = _full_frame_searches(tracker)
+    for _ in range(9):
+        tracker._detect(frame, cam_id=0)
+
+    assert len(full_frame) == 3  # frames 0, 4, 8
+
+    tracker.reset(0)
+    tracker._detect(frame, cam_id=0)
+    assert len(full_frame) == 4
+
+    default = CharucoTracker(charuco)
+    full_frame = _full_frame_searches(default)
+    for _ in range(3):
+        default._detect(frame, cam_id=0)
+    assert len(full_frame) == 3  # region search is opt-in
+    assert "full_frame_interval" not in default.config
+    assert tracker.config["full_frame_interval"] == 3
+
+
+def _scales_searched(tracker: CharucoTracker) -> list[float]:
+    """Patch tracker to record the scale of each find_corners_single_frame call; returns the record."""
+    scales: list[float] = []
+    find = tracker.find_corners_single_frame
+
+    def record(gray_frame, mirror, roi=None, scale=1.0):
+        scales.append(scale)
+        return find(gray_frame, mirror, roi, scale)
+
+    tracker.find_corners_single_frame = record  # type: ignore[method-assign]
+    return scales
+
+
+def test_pyramid_detection_matches_full_resolution(scene):
+    """A board found on a reduced frame is refined to the full-resolution corners."""
+    charuco, board_img, board_w_m, board_h_m, to_px = scene
+    rotation, center = _front_camera(board_w_m, board_h_m)
+    frame = _render_plane(board_img, board_w_m, board_h_m, to_px, 0.0, rotation, center)
+    large = cv2.resize(frame, None, fx=3, fy=3, interpolation=cv2.INTER_CUBIC)  # 3840x2880
+
+    tracker = CharucoTracker(charuco, pyramid=True)
+    scales = _scales_searched(tracker)
+    packet = tracker._detect(large, cam_id=0)
+    packet = tracker._detect(large, cam_id=0)
+
+    assert scales[-1] == 0.25  # ~250 px squares detected at 62 px
+    expected = CharucoTracker(charuco)._detect(large, cam_id=0)
+    np.testing.assert_array_equal(packet.keypoint_id, expected.keypoint_id)
+    np.testing.assert_allclose(packet.img_loc, expected.img_loc, atol=0.01)
+
+
+def test_pyramid_falls_back_to_full_resolution(scene):
+    """A board too small for the reduced frame is still found at full resolution."""
+    charuco, board_img, board_w_m, board_h_m, to_px = scene
+    rotation, center = _front_camera(board_w_m, board_h_m)
+    frame = _render_plane(board_img, board_w_m, board_h_m, to_px, 0.0, rotation, center)
+
+    tracker = CharucoTracker(charuco, pyramid=True)
+    tracker._square_px[0] = 1000.0  # as if the board had been close to the camera
+    scales = _scales_searched(tracker)
+    packet = tracker._detect(frame, cam_id=0)
+
+    assert scales[0] == 0.125 and scales[-1] == 1.0
+    assert len(packet.keypoint_id) == 12
+    assert tracker._square_px[0] < 200
+
+    tracker.reset(0)
+    assert 0 not in tracker._square_px
+    assert pickle.loads(pickle.dumps(tracker)).pyramid is True
+    assert tracker.config["pyramid"] is True
+    assert "pyramid" not in CharucoTracker(charuco).config  # existing caches keep their fingerprint
+
+
 if __name__ == "__main__":
     from pathlib import Path
 
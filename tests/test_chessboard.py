@@ -269,6 +269,64 @@ def test_same_parity_board_orientation_flips(rows: int, columns: int):
     assert _half_turn_ordering(rows=rows, columns=columns) == "flipped"
 
 
+def test_pyramid_detection_matches_full_resolution():
+    """A board found on a reduced 4K frame is refined to the full-resolution corners."""
+    board = cv2.cvtColor(_render_board(rows_sq=7, cols_sq=10, sq_px=150), cv2.COLOR_BGR2GRAY)
+    h, w = board.shape
+    src = np.array([[0, 0], [w, 0], [w, h], [0, h]], dtype=np.float32)
+    dst = np.array([[700, 300], [2900, 420], [2800, 1900], [600, 1750]], dtype=np.float32)
+    frame = cv2.warpPerspective(board, cv2.getPerspectiveTransform(src, dst), (3840, 2160), borderValue=255)
+
+    chessboard = Chessboard(rows=6, columns=9)
+    pyramid_tracker = ChessboardTracker(chessboard, pyramid=True)
+    pyramid_tracker.get_points(frame)
+    packet = pyramid_tracker.get_points(frame)
+    expected = ChessboardTracker(chessboard).get_points(frame)
+
+    assert pyramid_tracker._pyramid_scale(0, frame.shape) == 0.125
+    np.testing.assert_array_equal(packet.keypoint_id, expected.keypoint_id)
+    np.testing.assert_allclose(packet.img_loc, expected.img_loc, atol=0.01)
+
+    pyramid_tracker.reset(0)
+    assert pyramid_tracker._square_px == {}
+
+
+def test_fast_check_matches_exhaustive_search() -> None:
+    """Frames with a board give the exhaustive search's corners; the boardless frame is rejected."""
+    frame_paths = sorted(TEST_DATA_DIR.glob("cam_*_frame_*.jpg"))
+    if not frame_paths:
+        pytest.skip(f"Test data not extracted: {TEST_DATA_DIR}")
+
+    chessboard = Chessboard(rows=6, columns=9)
+    for path in frame_paths:
+        frame = cv2.cvtColor(cv2.imread(str(path)), cv2.COLOR_BGR2GRAY)
+        expected = ChessboardTracker(chessboard).get_points(frame)
+        packet = ChessboardTracker(chessboard, fast_check=True).get_points(frame)
+
+        assert len(packet.keypoint_id) == len(expected.keypoint_id), path.name
+        np.testing.assert_array_equal(packet.img_loc, expected.img_loc)
+
+
+def test_fast_check_searches_large_frames_downscaled() -> None:
+    board = cv2.cvtColor(_render_board(rows_sq=7, cols_sq=10, sq_px=150), cv2.COLOR_BGR2GRAY)
+    frame = np.full((2160, 3840), 255, dtype=np.uint8)
+    frame[400 : 400 + board.shape[0], 900 : 900 + board.shape[1]] = board
+
+    chessboard = Chessboard(rows=6, columns=9)
+    tracker = ChessboardTracker(chessboard, fast_check=True)
+    assert tracker._pyramid_scale(0, frame.shape) == 0.5
+    packet = tracker.get_points(frame)
+    expected = ChessboardTracker(chessboard).get_points(frame)
+
+    # The downscaled fast check only admits the frame; the corners come from the normal search
+    np.testing.assert_array_equal(packet.img_loc, expected.img_loc)
+    assert tracker.config["fast_check"] is True
+    assert "fast_check" not in ChessboardTracker(chessboard).config
+    assert tracker._board_in_last_frame == {0}  # the next frame is searched as usual
+    assert len(tracker.get_points(np.full_like(frame, 255)).keypoint_id) == 0
+    assert tracker._board_in_last_frame == set()
+
+
 if __name__ == "__main__":
     debug_dir = Path(__file__).parent / "tmp"
     debug_dir.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,57 @@
+"""Tests for ExtractionCheckpoint save, load, and discard."""
+
+import numpy as np
+import pandas as pd
+
+from caliscope.core.extraction_checkpoint import ExtractionCheckpoint
+
+
+def _points(sync_index: int, obj_loc_x: list) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "sync_index": [sync_index] * len(obj_loc_x),
+            "cam_id": [0] * len(obj_loc_x),
+            "img_loc_x": np.arange(len(obj_loc_x), dtype=np.float64),
+            "obj_loc_x": obj_loc_x,
+        }
+    )
+
+
+def test_saved_points_are_loaded_by_a_new_checkpoint(tmp_path):
+    directory = tmp_path / "xy.checkpoint"
+    checkpoint = ExtractionCheckpoint(directory, "abc")
+    assert not checkpoint.resuming
+
+    checkpoint.save(_points(0, [1.0, 2.0]), completed_through=0)
+    checkpoint.save(_points(1, [None]), completed_through=3)
+    checkpoint.save(pd.DataFrame(), completed_through=5)
+
+    reopened = ExtractionCheckpoint(directory, "abc")
+    assert reopened.resuming
+    assert reopened.completed_through == 5
+
+    points = reopened.points()
+    assert points["sync_index"].tolist() == [0, 0, 1]
+    np.testing.assert_array_equal(points["obj_loc_x"], [1.0, 2.0, np.nan])
+
+
+def test_other_fingerprint_starts_over(tmp_path):
+    directory = tmp_path / "xy.checkpoint"
+    ExtractionCheckpoint(directory, "abc").save(_points(0, [1.0]), completed_through=0)
+
+    reopened = ExtractionCheckpoint(directory, "def")
+
+    assert not reopened.resuming
+    assert len(reopened.points()) == 0
+    assert not directory.exists()
+
+
+def test_clear_removes_directory(tmp_path):
+    directory = tmp_path / "xy.checkpoint"
+    checkpoint = ExtractionCheckpoint(directory, "abc")
+    checkpoint.save(_points(0, [1.0]), completed_through=0)
+
+    checkpoint.clear()
+
+    assert not directory.exists()
+    assert not ExtractionCheckpoint(directory, "abc").resuming
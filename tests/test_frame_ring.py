@@ -0,0 +1,90 @@
+"""Tests for FrameRing - preallocated frame buffers with borrow/release."""
+
+import threading
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from caliscope.recording.frame_ring import FrameRing
+
+
+def test_slots_are_preallocated_and_reused():
+    ring = FrameRing((4, 6, 3), slots=2)
+    first = ring.acquire()
+    second = ring.acquire()
+    assert first is not None and second is not None
+    assert first.array.shape == (4, 6, 3)
+    assert not np.shares_memory(first.array, second.array)
+    assert ring.free_count == 0
+
+    first.release()
+    again = ring.acquire()
+    assert again is first
+    assert np.shares_memory(again.array, first.array)
+
+
+def test_acquire_blocks_until_a_slot_is_released():
+    ring = FrameRing((2, 2), slots=1)
+    slot = ring.acquire()
+    assert slot is not None
+    assert ring.acquire(timeout=0.05) is None
+
+    releaser = threading.Timer(0.1, slot.release)
+    releaser.start()
+    start = time.perf_counter()
+    assert ring.acquire(timeout=5.0) is slot
+    assert time.perf_counter() - start >= 0.05
+    releaser.join()
+
+
+def test_slot_returns_only_after_every_holder_releases():
+    ring = FrameRing((2, 2), slots=1)
+    slot = ring.acquire()
+    assert slot is not None
+    slot.retain(2)  # lent to two consumers
+
+    slot.release()  # producer
+    slot.release()  # first consumer
+    assert ring.free_count == 0
+    slot.release()  # second consumer
+    assert ring.free_count == 1
+
+    with pytest.raises(RuntimeError):
+        slot.release()
+
+
+def test_close_wakes_blocked_acquire():
+    ring = FrameRing((2, 2), slots=1)
+    ring.acquire()
+    result = []
+    waiter = threading.Thread(target=lambda: result.append(ring.acquire()))
+    waiter.start()
+    time.sleep(0.05)
+    ring.close()
+    waiter.join(timeout=2.0)
+    assert result == [None]
+
+
+def test_ring_backed_by_shared_memory():
+    shape = (3, 5)
+    nbytes = FrameRing.nbytes_for(shape, np.uint8, slots=2)
+    shm = shared_memory.SharedMemory(create=True, size=nbytes)
+    try:
+        ring = FrameRing(shape, np.uint8, slots=2, buffer=shm.buf)
+        slot = ring.acquire()
+        assert slot is not None
+        slot.array[:] = 7
+
+        attached = np.ndarray((2, *shape), dtype=np.uint8, buffer=shm.buf)
+        assert (attached[slot.index] == 7).all()
+        del attached, slot, ring
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_invalid_slot_count_raises():
+    with pytest.raises(ValueError):
+        FrameRing((2, 2), slots=0)
@@ -1,12 +1,19 @@
 """Tests for FrameSource - forward-only video frame access."""
 
+import threading
+import time
 from collections.abc import Generator
 from pathlib import Path
 
+import cv2
 import numpy as np
 import pytest
 
+from caliscope.core.charuco import Charuco
+from caliscope.packets import PixelFormat
 from caliscope.recording.frame_source import FrameSource
+from caliscope.tracker import rescale_points
+from caliscope.trackers.charuco_tracker import CharucoTracker
 
 
 # Test video directory and camera
@@ -132,6 +139,124 @@ class TestResourceManagement:
         assert frame_source.next_frame() is None
 
 
+class TestReducedResolution:
+    """Test decoding at a target scale with coordinates mapped back to native pixels."""
+
+    @pytest.mark.parametrize("pixel_format", [PixelFormat.BGR, PixelFormat.GRAY])
+    def test_scaled_frames_carry_native_size(self, pixel_format: PixelFormat) -> None:
+        with FrameSource(TEST_VIDEO_DIR, TEST_CAM_ID, pixel_format=pixel_format, scale=0.5) as source:
+            result = source.next_frame()
+            assert result is not None
+            width, height = source.output_size
+            assert result.frame.shape[:2] == (height, width)
+            assert result.frame.flags["C_CONTIGUOUS"]
+            assert result.native_size == source.size
+            assert (width, height) == (round(source.size[0] / 2), round(source.size[1] / 2))
+
+    def test_native_scale_leaves_native_size_unset(self, frame_source: FrameSource) -> None:
+        result = frame_source.next_frame()
+        assert result is not None
+        assert result.native_size is None
+        assert frame_source.output_size == frame_source.size
+
+    def test_scaled_frame_matches_resized_native(self) -> None:
+        """Decode-time scaling should look like resizing the native frame afterwards."""
+        with (
+            FrameSource(TEST_VIDEO_DIR, TEST_CAM_ID) as native,
+            FrameSource(TEST_VIDEO_DIR, TEST_CAM_ID, scale=0.5) as reduced,
+        ):
+            full = native.next_frame()
+            small = reduced.next_frame()
+            assert full is not None and small is not None
+            expected = cv2.resize(full.frame, reduced.output_size, interpolation=cv2.INTER_LINEAR)
+            diff = np.abs(small.frame.astype(np.int16) - expected.astype(np.int16))
+            assert diff.mean() < 3.0
+
+    @pytest.mark.parametrize("scale", [0.0, -0.5, 1.5])
+    def test_invalid_scale_raises(self, scale: float) -> None:
+        with pytest.raises(ValueError):
+            FrameSource(TEST_VIDEO_DIR, TEST_CAM_ID, scale=scale)
+
+    def test_rescale_points_round_trip(self) -> None:
+        xy = np.array([[0.0, 0.0], [639.5, 359.5], [100.25, 42.0]])
+        there = rescale_points(xy, (1280, 720), (640, 360))
+        np.testing.assert_allclose(there[0], [-0.25, -0.25])  # pixel centers, not corners, line up
+        np.testing.assert_allclose(rescale_points(there, (640, 360), (1280, 720)), xy)
+
+    def test_charuco_points_return_in_native_pixels(self) -> None:
+        """Corners found on a reduced frame land where native detection puts them."""
+        tracker = CharucoTracker(Charuco.from_toml(TEST_VIDEO_DIR.parents[1] / "charuco.toml"))
+        assert tracker.frame_scale((3840, 2160)) == 1.0  # board trackers keep native resolution
+
+        offsets = []
+        with (
+            FrameSource(TEST_VIDEO_DIR, TEST_CAM_ID, pixel_format=PixelFormat.GRAY) as native,
+            FrameSource(TEST_VIDEO_DIR, TEST_CAM_ID, pixel_format=PixelFormat.GRAY, scale=0.75) as reduced,
+        ):
+            while (full := native.next_frame()) is not None:
+                small = reduced.next_frame()
+                assert small is not None
+                expected = tracker.get_points(full.frame)
+                found = tracker.get_points(small.frame, native_size=small.native_size)
+                native_by_id = dict(zip(expected.keypoint_id.tolist(), expected.img_loc))
+                for keypoint_id, xy in zip(found.keypoint_id.tolist(), found.img_loc):
+                    if keypoint_id in native_by_id:
+                        offsets.append(xy - native_by_id[keypoint_id])
+
+        offsets_array = np.array(offsets)
+        assert len(offsets_array) > 100
+        assert np.all(np.abs(offsets_array.mean(axis=0)) < 0.25)  # no systematic shift from the mapping
+        assert np.median(np.abs(offsets_array)) < 0.5
+
+
+class TestFrameRing:
+    """Decoding into a preallocated FrameRing."""
+
+    @pytest.mark.parametrize(
+        ("pixel_format", "scale"),
+        [(PixelFormat.BGR, 1.0), (PixelFormat.BGR, 0.5), (PixelFormat.GRAY, 1.0), (PixelFormat.GRAY, 0.5)],
+    )
+    def test_ring_frames_match_allocated_frames(self, pixel_format: PixelFormat, scale: float) -> None:
+        with (
+            FrameSource(TEST_VIDEO_DIR, TEST_CAM_ID, pixel_format=pixel_format, scale=scale) as plain,
+            FrameSource(TEST_VIDEO_DIR, TEST_CAM_ID, pixel_format=pixel_format, scale=scale, ring_slots=2) as ringed,
+        ):
+            for _ in range(5):
+                expected = plain.next_frame()
+                packet = ringed.next_frame()
+                assert expected is not None and packet is not None
+                assert packet.frame_slot is not None
+                assert packet.native_size == expected.native_size
+                np.testing.assert_array_equal(packet.frame, expected.frame)
+                packet.release()
+
+    def test_buffers_are_reused(self) -> None:
+        with FrameSource(TEST_VIDEO_DIR, TEST_CAM_ID, ring_slots=2) as source:
+            seen = []
+            for _ in range(4):
+                packet = source.next_frame()
+                assert packet is not None
+                seen.append(packet.frame.__array_interface__["data"][0])
+                packet.release()
+        assert len(set(seen)) <= 2
+
+    def test_close_unblocks_full_ring(self) -> None:
+        source = FrameSource(TEST_VIDEO_DIR, TEST_CAM_ID, ring_slots=1)
+        held = source.next_frame()
+        assert held is not None
+
+        result = []
+        reader = threading.Thread(target=lambda: result.append(source.next_frame()))
+        reader.start()
+        time.sleep(0.1)
+        assert reader.is_alive()  # waiting for the held buffer
+
+        source.close()
+        reader.join(timeout=2.0)
+        assert result == [None]
+        held.release()
+
+
 class TestInvalidInput:
     """Test handling of invalid inputs."""
 
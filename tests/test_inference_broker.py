@@ -0,0 +1,80 @@
+"""Tests for InferenceBroker: batching concurrent requests and handing back each caller's slice."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from caliscope.trackers.inference_broker import InferenceBroker
+
+
+class _DoublingSession:
+    """Stands in for an onnxruntime session: one output, twice the input, plus a record of batch sizes."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.batch_sizes: list[int] = []
+        self.fail = fail
+
+    def run(self, output_names, inputs):
+        tensor = inputs["input"]
+        self.batch_sizes.append(len(tensor))
+        if self.fail:
+            raise RuntimeError("session failed")
+        return [tensor * 2]
+
+
+def _run_concurrently(broker: InferenceBroker, values: list[float]) -> dict[float, np.ndarray]:
+    barrier = threading.Barrier(len(values))
+    results: dict[float, np.ndarray] = {}
+
+    def call(value: float) -> None:
+        barrier.wait()
+        results[value] = broker.run(np.full((1, 3), value, dtype=np.float32))[0]
+
+    threads = [threading.Thread(target=call, args=(value,)) for value in values]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+    return results
+
+
+def test_single_caller_runs_without_waiting():
+    session = _DoublingSession()
+    broker = InferenceBroker(session, "input", max_batch=8, max_wait=60.0)
+
+    output = broker.run(np.ones((1, 3), dtype=np.float32))
+
+    np.testing.assert_array_equal(output[0], np.full((1, 3), 2.0))
+    assert session.batch_sizes == [1]
+
+
+def test_each_caller_gets_its_own_slice():
+    session = _DoublingSession()
+    broker = InferenceBroker(session, "input", max_batch=8, max_wait=0.5)
+    values = [1.0, 2.0, 3.0, 4.0]
+
+    _run_concurrently(broker, values)  # lets the broker learn there are four callers
+    results = _run_concurrently(broker, values)
+
+    for value in values:
+        np.testing.assert_array_equal(results[value], np.full((1, 3), 2 * value))
+    assert session.batch_sizes[-1] == 4
+    assert broker.items_run == 8
+
+
+def test_batches_never_exceed_max_batch():
+    session = _DoublingSession()
+    broker = InferenceBroker(session, "input", max_batch=2, max_wait=0.5)
+
+    results = _run_concurrently(broker, [1.0, 2.0, 3.0, 4.0, 5.0])
+
+    assert len(results) == 5
+    assert max(session.batch_sizes) <= 2
+
+
+def test_session_error_reaches_caller():
+    broker = InferenceBroker(_DoublingSession(fail=True), "input")
+
+    with pytest.raises(RuntimeError, match="session failed"):
+        broker.run(np.ones((1, 3), dtype=np.float32))
@@ -7,7 +7,7 @@ synthetic data (no ONNX dependency).
 import numpy as np
 import pytest
 
-from caliscope.trackers.model_decode import decode_heatmap, decode_simcc
+from caliscope.trackers.model_decode import decode_heatmap, decode_heatmap_batch, decode_simcc, decode_simcc_batch
 
 
 def test_decode_simcc_recovers_known_peak():
@@ -96,6 +96,101 @@ def test_decode_heatmap_subpixel_refinement():
     assert confidence[0] > 0.95
 
 
+def _reference_decode_simcc(simcc_x: np.ndarray, simcc_y: np.ndarray, split_ratio: float = 2.0):
+    """The original per-item SimCC decode, for parity checks."""
+    x_indices = np.argmax(simcc_x[0], axis=1)
+    y_indices = np.argmax(simcc_y[0], axis=1)
+    keypoints = np.stack(
+        [x_indices.astype(np.float32) / split_ratio, y_indices.astype(np.float32) / split_ratio], axis=1
+    )
+    confidence = np.clip(np.minimum(np.max(simcc_x[0], axis=1), np.max(simcc_y[0], axis=1)), 0.0, 1.0)
+    return keypoints, confidence.astype(np.float32)
+
+
+def _reference_decode_heatmap(heatmaps: np.ndarray):
+    """The original per-keypoint loop heatmap decode, for parity checks."""
+    K, H, W = heatmaps.shape
+    flat_heatmaps = heatmaps.reshape(K, -1)
+    max_indices = np.argmax(flat_heatmaps, axis=1)
+    y_peaks = (max_indices // W).astype(np.float32)
+    x_peaks = (max_indices % W).astype(np.float32)
+    confidence = np.max(flat_heatmaps, axis=1).astype(np.float32)
+
+    dx = np.zeros(K, dtype=np.float32)
+    dy = np.zeros(K, dtype=np.float32)
+    for k in range(K):
+        x_int, y_int = int(x_peaks[k]), int(y_peaks[k])
+        if x_int == 0 or x_int == W - 1 or y_int == 0 or y_int == H - 1:
+            continue
+        hm = heatmaps[k]
+        dxx = hm[y_int, x_int - 1] - 2 * hm[y_int, x_int] + hm[y_int, x_int + 1]
+        if abs(dxx) > 1e-6:
+            dx[k] = np.clip((hm[y_int, x_int - 1] - hm[y_int, x_int + 1]) / (2 * dxx), -0.5, 0.5)
+        dyy = hm[y_int - 1, x_int] - 2 * hm[y_int, x_int] + hm[y_int + 1, x_int]
+        if abs(dyy) > 1e-6:
+            dy[k] = np.clip((hm[y_int - 1, x_int] - hm[y_int + 1, x_int]) / (2 * dyy), -0.5, 0.5)
+
+    return np.stack([x_peaks + dx, y_peaks + dy], axis=1), confidence
+
+
+def _random_heatmaps(rng: np.random.Generator, n: int, k: int, h: int, w: int) -> np.ndarray:
+    """Gaussian blobs at random sub-pixel centres (some on the border), plus noise and flat maps."""
+    yy, xx = np.mgrid[0:h, 0:w].astype(np.float32)
+    centres = rng.uniform([-1, -1], [w, h], size=(n, k, 2)).astype(np.float32)
+    heatmaps = np.exp(
+        -((xx - centres[..., 0, None, None]) ** 2 + (yy - centres[..., 1, None, None]) ** 2) / (2 * 1.5**2)
+    )
+    heatmaps += rng.normal(0, 0.01, heatmaps.shape)
+    heatmaps[0, 0] = 0.0  # flat map: peak at the origin, no refinement
+    return heatmaps.astype(np.float32)
+
+
+def test_decode_simcc_batch_matches_per_item_decode():
+    """Batched SimCC decode equals decoding each item alone, bit for bit."""
+    rng = np.random.default_rng(3)
+    simcc_x = rng.normal(0, 0.5, (5, 17, 384)).astype(np.float32)
+    simcc_y = rng.normal(0, 0.5, (5, 17, 512)).astype(np.float32)
+
+    keypoints, confidence = decode_simcc_batch(simcc_x, simcc_y)
+
+    assert keypoints.shape == (5, 17, 2) and keypoints.dtype == np.float32
+    assert confidence.shape == (5, 17) and confidence.dtype == np.float32
+    for i in range(5):
+        expected_keypoints, expected_confidence = _reference_decode_simcc(simcc_x[i : i + 1], simcc_y[i : i + 1])
+        np.testing.assert_array_equal(keypoints[i], expected_keypoints)
+        np.testing.assert_array_equal(confidence[i], expected_confidence)
+        single_keypoints, single_confidence = decode_simcc(simcc_x[i : i + 1], simcc_y[i : i + 1])
+        np.testing.assert_array_equal(single_keypoints, expected_keypoints)
+        np.testing.assert_array_equal(single_confidence, expected_confidence)
+
+
+def test_decode_simcc_rejects_mismatched_inputs():
+    with pytest.raises(ValueError, match="batch_size=1"):
+        decode_simcc(np.zeros((2, 3, 8)), np.zeros((2, 3, 8)))
+    with pytest.raises(ValueError, match="Batch size mismatch"):
+        decode_simcc_batch(np.zeros((2, 3, 8)), np.zeros((1, 3, 8)))
+    with pytest.raises(ValueError, match="Keypoint count mismatch"):
+        decode_simcc_batch(np.zeros((2, 3, 8)), np.zeros((2, 4, 8)))
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_decode_heatmap_batch_matches_loop_decode(dtype):
+    """Vectorized heatmap decode equals the per-keypoint loop, bit for bit, borders included."""
+    heatmaps = _random_heatmaps(np.random.default_rng(5), 4, 26, 64, 48).astype(dtype)
+
+    keypoints, confidence = decode_heatmap_batch(heatmaps)
+
+    assert keypoints.shape == (4, 26, 2) and keypoints.dtype == np.float32
+    assert confidence.shape == (4, 26) and confidence.dtype == np.float32
+    for i in range(4):
+        expected_keypoints, expected_confidence = _reference_decode_heatmap(heatmaps[i])
+        np.testing.assert_array_equal(keypoints[i], expected_keypoints)
+        np.testing.assert_array_equal(confidence[i], expected_confidence)
+        single_keypoints, single_confidence = decode_heatmap(heatmaps[i])
+        np.testing.assert_array_equal(single_keypoints, expected_keypoints)
+        np.testing.assert_array_equal(single_confidence, expected_confidence)
+
+
 if __name__ == "__main__":
     """Debug harness for manual inspection of decode functions."""
     print("=" * 60)
@@ -0,0 +1,129 @@
+"""Tests for MotionGatedTracker: detection skipped on frames that have not changed."""
+
+import logging
+import pickle
+
+import cv2
+import numpy as np
+import pytest
+
+from caliscope.trackers.aruco_tracker import ArucoTracker
+from caliscope.trackers.motion_gated_tracker import MotionGatedTracker
+
+FRAME_W, FRAME_H = 640, 480
+
+
+def _marker_frame(dx: float = 0.0, dy: float = 0.0, noise_seed: int | None = None) -> np.ndarray:
+    """Gray frame with four 120 px ArUco markers shifted by (dx, dy), optionally with sensor noise (sigma 2)."""
+    dictionary = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_100)
+    frame = np.full((FRAME_H, FRAME_W), 255, dtype=np.uint8)
+    for marker_id, (x, y) in enumerate([(80, 60), (400, 60), (80, 290), (400, 290)]):
+        frame[y : y + 120, x : x + 120] = cv2.aruco.generateImageMarker(dictionary, marker_id, 120)
+    frame = cv2.GaussianBlur(frame, (5, 5), 1.0)
+    if dx or dy:
+        shift = np.array([[1.0, 0.0, dx], [0.0, 1.0, dy]])
+        frame = cv2.warpAffine(frame, shift, (FRAME_W, FRAME_H), flags=cv2.INTER_CUBIC, borderValue=255)
+    if noise_seed is not None:
+        noise = np.random.default_rng(noise_seed).normal(0.0, 2.0, frame.shape)
+        frame = np.clip(frame + noise, 0, 255).astype(np.uint8)
+    return frame
+
+
+class _CountingTracker(ArucoTracker):
+    """ArucoTracker that counts detections."""
+
+    detections = 0
+
+    def _detect(self, frame, cam_id=0, rotation_count=0):
+        self.detections += 1
+        return super()._detect(frame, cam_id, rotation_count)
+
+
+def test_unchanged_frames_reuse_points():
+    """A static scene with sensor noise is detected once; later frames get the same points."""
+    inner = _CountingTracker()
+    tracker = MotionGatedTracker(inner)
+
+    packets = [tracker.get_points(_marker_frame(noise_seed=seed)) for seed in range(5)]
+
+    assert inner.detections == 1
+    assert tracker.frames_detected == {0: 1} and tracker.frames_reused == {0: 4}
+    assert len(packets[0].keypoint_id) == 16
+    for packet in packets[1:]:
+        np.testing.assert_array_equal(packet.img_loc, packets[0].img_loc)
+
+
+def test_changed_frame_is_detected_again():
+    inner = _CountingTracker()
+    tracker = MotionGatedTracker(inner)
+
+    tracker.get_points(_marker_frame())
+    moved = tracker.get_points(_marker_frame(dx=6.0))
+
+    assert inner.detections == 2
+    np.testing.assert_array_equal(moved.img_loc, ArucoTracker().get_points(_marker_frame(dx=6.0)).img_loc)
+
+
+def test_optical_flow_follows_small_motion():
+    """With a loose threshold, reused points follow the scene instead of staying where it was."""
+    expected = ArucoTracker(pyramid=True).get_points(_marker_frame(dx=2.0, dy=-1.0))
+    static = MotionGatedTracker(ArucoTracker(pyramid=True), threshold=120)
+    flow = MotionGatedTracker(ArucoTracker(pyramid=True), threshold=120, optical_flow=True)
+
+    for tracker in (static, flow):
+        tracker.get_points(_marker_frame())
+    reused = static.get_points(_marker_frame(dx=2.0, dy=-1.0))
+    followed = flow.get_points(_marker_frame(dx=2.0, dy=-1.0))
+
+    assert static.frames_reused == flow.frames_reused == {0: 1}
+    np.testing.assert_array_equal(followed.keypoint_id, expected.keypoint_id)
+    assert np.abs(reused.img_loc - expected.img_loc).max() > 0.9
+    np.testing.assert_allclose(followed.img_loc, expected.img_loc, atol=0.1)
+
+
+def test_detection_reruns_after_max_reused_frames():
+    inner = _CountingTracker()
+    tracker = MotionGatedTracker(inner, max_reused=3)
+    frame = _marker_frame()
+
+    for _ in range(9):
+        tracker.get_points(frame)
+
+    assert inner.detections == 3  # frames 0, 4, 8
+
+
+def test_cameras_are_gated_independently():
+    inner = _CountingTracker()
+    tracker = MotionGatedTracker(inner)
+    frame = _marker_frame()
+
+    tracker.get_points(frame, cam_id=0)
+    tracker.get_points(frame, cam_id=1)
+    tracker.get_points(frame, cam_id=1)
+    assert inner.detections == 2
+
+    tracker.reset(1)
+    tracker.get_points(frame, cam_id=1)
+    tracker.get_points(frame, cam_id=0)
+    assert inner.detections == 3
+    assert tracker.frames_reused == {1: 1, 0: 1}
+
+
+def test_wrapper_takes_identity_from_wrapped_tracker(caplog: pytest.LogCaptureFixture):
+    inner = ArucoTracker(inverted=True)
+    tracker = MotionGatedTracker(inner, optical_flow=True)
+
+    assert tracker.name == inner.name
+    assert tracker.pixel_format == inner.pixel_format
+    assert tracker.get_point_name(3) == inner.get_point_name(3)
+    assert tracker.config["inverted"] is True
+    assert tracker.config["motion_gate_optical_flow"] is True
+
+    copy = pickle.loads(pickle.dumps(tracker))
+    assert copy.config == tracker.config
+
+    tracker.get_points(_marker_frame())
+    tracker.get_points(_marker_frame())
+    with caplog.at_level(logging.INFO, logger="caliscope.trackers.motion_gated_tracker"):
+        tracker.cleanup()
+    assert "reused points on 1 of 2 frames" in caplog.text
@@ -0,0 +1,58 @@
+"""Tests for create_inference_session options and the optimized graph cache."""
+
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("onnxruntime", reason="requires caliscope[tracking]")
+
+from caliscope.onnx_session import SessionConfig, create_inference_session, optimized_model_path
+
+FIXTURE_MODEL = Path(__file__).parent / "fixtures" / "onnx" / "simcc_3pt.onnx"
+
+
+def test_session_applies_thread_options():
+    config = SessionConfig(intra_op_threads=1, inter_op_threads=1, execution_mode="parallel")
+    session = create_inference_session(FIXTURE_MODEL, config)
+
+    options = session.get_session_options()
+    assert options.intra_op_num_threads == 1
+    assert options.inter_op_num_threads == 1
+
+
+def test_optimized_graph_is_cached_and_reused(tmp_path):
+    model_path = tmp_path / FIXTURE_MODEL.name
+    shutil.copy(FIXTURE_MODEL, model_path)
+    config = SessionConfig(cache_optimized_model=True)
+    frame = np.zeros((1, 3, 64, 48), dtype=np.float32)
+
+    first = create_inference_session(model_path, config)
+    cached = list(tmp_path.glob("simcc_3pt.optimized-*.onnx"))
+    assert len(cached) == 1
+    cache_mtime = cached[0].stat().st_mtime_ns
+
+    second = create_inference_session(model_path, config)
+    assert cached[0].stat().st_mtime_ns == cache_mtime  # reused, not rebuilt
+    assert not list(tmp_path.glob("*.tmp"))
+    for a, b in zip(first.run(None, {"input": frame}), second.run(None, {"input": frame})):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_cache_key_follows_model_file(tmp_path):
+    model_path = tmp_path / FIXTURE_MODEL.name
+    shutil.copy(FIXTURE_MODEL, model_path)
+    before = optimized_model_path(model_path, ["CPUExecutionProvider"])
+
+    model_path.write_bytes(model_path.read_bytes() + b"\0")  # a re-download changes size and mtime
+
+    assert optimized_model_path(model_path, ["CPUExecutionProvider"]) != before
+
+
+@pytest.mark.parametrize(
+    "options", [{"execution_mode": "eager"}, {"graph_optimization": "maximum"}, {"intra_op_threads": 0}]
+)
+def test_invalid_options_rejected(options):
+    with pytest.raises(ValueError):
+        SessionConfig(**options)
@@ -12,8 +12,12 @@ Expected frame coordinates for a 640x480 input (see generate_simcc_3pt.py):
     low_conf:  (66.7, 120.0)   — filtered out (confidence ~0.1 < 0.3 threshold)
 """
 
+import dataclasses
+import pickle
+import threading
 from pathlib import Path
 
+import cv2
 import numpy as np
 import pytest
 
@@ -100,6 +104,284 @@ def test_onnx_tracker_wireframe():
     assert wf.segments[0].point_B == "right_eye"
 
 
+def test_onnx_tracker_reset_forgets_only_that_camera():
+    """reset() drops one camera's previous bbox, so its next frame starts from a full-frame search."""
+    tracker = _load_tracker()
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    tracker.get_points(frame, cam_id=2)
+    tracker.get_points(frame, cam_id=3)
+    assert set(tracker._prev_bboxes) == {2, 3}
+
+    tracker.reset(2)
+    assert set(tracker._prev_bboxes) == {3}
+
+
+def test_onnx_tracker_survives_pickling():
+    """A pickled tracker (as shipped to worker processes) loads its own session from the card."""
+    tracker = _load_tracker()
+    copy = pickle.loads(pickle.dumps(tracker))
+
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    np.testing.assert_array_equal(copy.get_points(frame).img_loc, tracker.get_points(frame).img_loc)
+
+
+def test_onnx_tracker_batches_only_dynamic_batch_models():
+    """A fixed batch axis never batches, even when the card asks; a dynamic one follows the card."""
+    assert _load_tracker()._broker is None
+
+    card = ModelCard.from_toml(FIXTURE_DIR / "simcc_3pt.toml", models_dir=FIXTURE_DIR)
+    assert OnnxTracker(dataclasses.replace(card, max_batch=4))._broker is None
+
+    batched = OnnxTracker(ModelCard.from_toml(FIXTURE_DIR / "simcc_3pt_batched.toml", models_dir=FIXTURE_DIR))
+    assert batched._broker is not None
+    assert batched.max_batch == 4
+
+
+def test_onnx_tracker_batches_concurrent_cameras():
+    """Camera threads sharing a tracker get their own results from combined session calls."""
+    card = ModelCard.from_toml(FIXTURE_DIR / "simcc_3pt_batched.toml", models_dir=FIXTURE_DIR)
+    tracker = OnnxTracker(card)
+    assert tracker._broker is not None
+    tracker._broker.max_wait = 1.0  # batch on arrival of every camera, not on the deadline
+
+    n_cameras, n_frames = 4, 5
+    barrier = threading.Barrier(n_cameras)
+    results: dict[int, list[np.ndarray]] = {cam_id: [] for cam_id in range(n_cameras)}
+
+    def track(cam_id: int) -> None:
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        for _ in range(n_frames):
+            barrier.wait()
+            results[cam_id].append(tracker.get_points(frame, cam_id=cam_id).img_loc)
+
+    threads = [threading.Thread(target=track, args=(cam_id,)) for cam_id in range(n_cameras)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    unbatched = _load_tracker()
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    expected = [unbatched.get_points(frame).img_loc for _ in range(n_frames)]  # later frames crop to the bbox
+    for cam_id in range(n_cameras):
+        assert len(results[cam_id]) == n_frames
+        for img_loc, expected_loc in zip(results[cam_id], expected):
+            np.testing.assert_array_equal(img_loc, expected_loc)
+    assert tracker._broker.items_run == n_cameras * n_frames
+    assert tracker._broker.batches_run < tracker._broker.items_run
+
+
+def test_model_card_session_section(tmp_path):
+    """[session] options reach the tracker's session; a thread budget caps intra-op threads further."""
+    card_text = (FIXTURE_DIR / "simcc_3pt.toml").read_text()
+    card_text = card_text.replace(
+        "[points]", "[session]\nintra_op_threads = 2\ncache_optimized_model = false\n\n[points]"
+    )
+    (tmp_path / "card.toml").write_text(card_text)
+    card = ModelCard.from_toml(tmp_path / "card.toml", models_dir=FIXTURE_DIR)
+    assert card.session.intra_op_threads == 2
+    assert not card.session.cache_optimized_model
+
+    tracker = OnnxTracker(card)
+    assert tracker.session.get_session_options().intra_op_num_threads == 2
+
+    tracker.set_thread_budget(1)
+    assert tracker.session.get_session_options().intra_op_num_threads == 1
+
+
+def test_model_card_rejects_unknown_session_option(tmp_path):
+    card_text = (FIXTURE_DIR / "simcc_3pt.toml").read_text()
+    (tmp_path / "card.toml").write_text(card_text.replace("[points]", "[session]\nthreads = 2\n\n[points]"))
+
+    with pytest.raises(ValueError, match="session"):
+        ModelCard.from_toml(tmp_path / "card.toml", models_dir=FIXTURE_DIR)
+
+
+def test_unpickled_tracker_defers_session_until_used():
+    """Worker copies apply their thread budget before creating a session, so only one is ever built."""
+    copy = pickle.loads(pickle.dumps(_load_tracker()))
+    assert copy._session is None
+
+    copy.set_thread_budget(1)
+    copy.get_points(np.zeros((480, 640, 3), dtype=np.uint8))
+    assert copy.session.get_session_options().intra_op_num_threads == 1
+
+
+def _reference_simcc_input(region: np.ndarray, dst_w: int, dst_h: int) -> np.ndarray:
+    """Letterbox, RGB, ImageNet-normalized (1, 3, H, W) input built step by step with cv2.resize."""
+    scale = min(dst_w / region.shape[1], dst_h / region.shape[0])
+    scaled_w, scaled_h = int(region.shape[1] * scale), int(region.shape[0] * scale)
+    pad_x, pad_y = (dst_w - scaled_w) // 2, (dst_h - scaled_h) // 2
+    canvas = np.zeros((dst_h, dst_w, 3), dtype=np.uint8)
+    canvas[pad_y : pad_y + scaled_h, pad_x : pad_x + scaled_w] = cv2.resize(region, (scaled_w, scaled_h))
+    rgb = cv2.cvtColor(canvas, cv2.COLOR_BGR2RGB).astype(np.float32) / 255.0
+    normalized = (rgb - np.array([0.485, 0.456, 0.406])) / np.array([0.229, 0.224, 0.225])
+    return normalized.transpose(2, 0, 1)[np.newaxis].astype(np.float32)
+
+
+@pytest.mark.parametrize("box", [(0, 0, 640, 480), (100, 40, 260, 400), (500, 300, 640, 480)])
+def test_preprocess_simcc_matches_resize_and_normalize(box):
+    """The fused warpAffine preprocessing matches crop, resize, letterbox and normalize done separately."""
+    tracker = _load_tracker()
+    frame = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+    x1, y1, x2, y2 = box
+
+    tensor, _, _, _ = tracker._preprocess_simcc(frame, box)
+    expected = _reference_simcc_input(frame[y1:y2, x1:x2], tracker.card.input_width, tracker.card.input_height)
+
+    # warpAffine and resize round differently by at most one gray level
+    np.testing.assert_allclose(tensor, expected, atol=1.01 / (255 * 0.224))
+    assert np.abs(tensor - expected).mean() < 0.005
+
+
+def test_preprocess_heatmap_matches_resize_and_gray():
+    card = ModelCard.from_toml(FIXTURE_DIR / "simcc_3pt.toml", models_dir=FIXTURE_DIR)
+    tracker = OnnxTracker(dataclasses.replace(card, format="heatmap"), load_session=False)
+    frame = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+
+    tensor = tracker._preprocess_heatmap(frame, (100, 40, 260, 400))
+    region = cv2.resize(frame[40:400, 100:260], (card.input_width, card.input_height))
+    expected = cv2.cvtColor(region, cv2.COLOR_BGR2GRAY)[np.newaxis, np.newaxis]
+
+    assert tensor.shape == expected.shape and tensor.dtype == np.uint8
+    assert np.abs(tensor.astype(int) - expected.astype(int)).max() <= 1
+
+
+def test_preprocess_reuses_buffers_per_thread():
+    """Each thread fills its own preallocated tensor; repeat calls on a thread do not allocate."""
+    tracker = _load_tracker()
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    first, _, _, _ = tracker._preprocess_simcc(frame)
+    again, _, _, _ = tracker._preprocess_simcc(frame, (0, 0, 320, 480))
+    assert again is first
+
+    other: list[np.ndarray] = []
+    thread = threading.Thread(target=lambda: other.append(tracker._preprocess_simcc(frame)[0]))
+    thread.start()
+    thread.join()
+    assert other[0] is not first
+
+
+class _CountingSession:
+    """Passes run() through to an onnxruntime session, counting calls."""
+
+    def __init__(self, session) -> None:
+        self.session = session
+        self.calls = 0
+
+    def run(self, *args, **kwargs):
+        self.calls += 1
+        return self.session.run(*args, **kwargs)
+
+
+def test_scan_windows_are_inferred_in_batches():
+    """The sliding-window scan runs max_batch windows per session call, matching per-window results."""
+    card = ModelCard.from_toml(FIXTURE_DIR / "simcc_3pt_batched.toml", models_dir=FIXTURE_DIR)
+    tracker = OnnxTracker(card)
+    counting = _CountingSession(tracker.session)
+    tracker._session = counting
+
+    rng = np.random.default_rng(7)
+    frame = rng.integers(0, 256, (480, 1920, 3), dtype=np.uint8)
+    boxes = tracker._scan_positions(1920, 480)
+    assert len(boxes) > tracker.max_batch
+
+    results = tracker._detect_in_regions(frame, boxes)
+    assert counting.calls == -(-len(boxes) // tracker.max_batch)
+
+    unbatched = _load_tracker()
+    for box, (keypoints, confidence) in zip(boxes, results):
+        expected_keypoints, expected_confidence = unbatched._detect_in_region(frame, *box)
+        np.testing.assert_allclose(keypoints, expected_keypoints, atol=1e-4)
+        np.testing.assert_allclose(confidence, expected_confidence, atol=1e-6)
+
+
+def test_scan_without_confident_window_keeps_full_frame_attempt():
+    """When no tier finds a confident keypoint, the result is the full-frame attempt, not a rerun."""
+    card = ModelCard.from_toml(FIXTURE_DIR / "simcc_3pt_batched.toml", models_dir=FIXTURE_DIR)
+    tracker = OnnxTracker(dataclasses.replace(card, confidence_threshold=1.1))
+    counting = _CountingSession(tracker.session)
+    tracker._session = counting
+    tracker._broker = None  # route single-item calls through the counted session too
+
+    frame = np.zeros((480, 1920, 3), dtype=np.uint8)
+    packet = tracker.get_points(frame)
+
+    n_windows = len(tracker._scan_positions(1920, 480))
+    assert counting.calls == 1 + -(-n_windows // tracker.max_batch)
+    assert len(packet.keypoint_id) == 0
+
+
+def _blob_frame(x: int, y: int) -> np.ndarray:
+    """Frame with blob_3pt's three coloured squares around (x, y)."""
+    frame = np.zeros((480, 960, 3), dtype=np.uint8)
+    for channel, (dx, dy) in zip((2, 1, 0), ((0, -80), (-70, 40), (70, 40))):
+        frame[y + dy : y + dy + 24, x + dx : x + dx + 24, channel] = 255
+    return frame
+
+
+@pytest.mark.parametrize("predict_motion", [False, True])
+def test_motion_prediction_keeps_fast_subject_in_crop(predict_motion):
+    """A subject moving 40 px/frame escapes last frame's box; the predicted crop keeps up with it."""
+    card = ModelCard.from_toml(FIXTURE_DIR / "blob_3pt.toml", models_dir=FIXTURE_DIR)
+    tracker = OnnxTracker(dataclasses.replace(card, predict_motion=predict_motion))
+    full_frame = (0, 0, 960, 480)
+    regions: list[tuple[int, int, int, int]] = []
+    detect_in_region = tracker._detect_in_region
+
+    def record(frame, *box):
+        regions.append(box)
+        return detect_in_region(frame, *box)
+
+    tracker._detect_in_region = record  # type: ignore[method-assign]
+
+    complete = 0
+    for x in range(150, 800, 40):
+        complete += len(tracker.get_points(_blob_frame(x, 240)).keypoint_id) == 3
+    full_frame_searches = regions.count(full_frame) - 1  # the first frame always searches the full frame
+
+    if predict_motion:
+        assert full_frame_searches == 0
+        assert complete == len(range(150, 800, 40))
+        assert set(tracker._motion) == {0}
+    else:
+        assert full_frame_searches > 0 and complete < len(range(150, 800, 40))
+        assert tracker._motion == {}
+
+
+def test_reset_drops_motion_state():
+    card = ModelCard.from_toml(FIXTURE_DIR / "blob_3pt.toml", models_dir=FIXTURE_DIR)
+    tracker = OnnxTracker(card)
+    for cam_id in (0, 1):
+        tracker.get_points(_blob_frame(300, 240), cam_id=cam_id)
+
+    tracker.reset(0)
+
+    assert set(tracker._motion) == {1}
+    assert set(tracker._prev_counts) == {1}
+
+
+def test_disabling_motion_prediction_changes_config():
+    card = ModelCard.from_toml(FIXTURE_DIR / "blob_3pt.toml", models_dir=FIXTURE_DIR)
+    predicted = OnnxTracker(card, load_session=False).config
+    unpredicted = OnnxTracker(dataclasses.replace(card, predict_motion=False), load_session=False).config
+
+    assert "predict_motion" not in predicted  # cached points from before the option stay valid
+    assert unpredicted == {**predicted, "predict_motion": False}
+
+
+def test_model_card_rejects_non_bool_predict_motion(tmp_path):
+    text = (
+        (FIXTURE_DIR / "blob_3pt.toml")
+        .read_text()
+        .replace("input_size = [48, 64]", 'input_size = [48, 64]\npredict_motion = "yes"')
+    )
+    card_path = tmp_path / "card.toml"
+    card_path.write_text(text)
+    with pytest.raises(ValueError, match="predict_motion"):
+        ModelCard.from_toml(card_path, models_dir=FIXTURE_DIR)
+
+
 if __name__ == "__main__":
     debug_dir = Path(__file__).parent / "tmp"
     debug_dir.mkdir(parents=True, exist_ok=True)
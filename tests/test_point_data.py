@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -161,6 +162,81 @@ def test_worldpoints_from_csv_with_frame_time(tmp_path: Path):
     assert "frame_time" in xyz_data.df.columns
 
 
+def test_view_shares_buffers_without_copy(valid_xy_df, valid_xyz_df):
+    xy_data = ImagePoints(valid_xy_df)
+    xyz_data = WorldPoints(valid_xyz_df)
+
+    assert np.shares_memory(xy_data.view["img_loc_x"].to_numpy(), xy_data._df["img_loc_x"].to_numpy())
+    assert np.shares_memory(xyz_data.view["x_coord"].to_numpy(), xyz_data._df["x_coord"].to_numpy())
+    assert not np.shares_memory(xyz_data.df["x_coord"].to_numpy(), xyz_data.view["x_coord"].to_numpy())
+    pd.testing.assert_frame_equal(xy_data.view, xy_data.df)
+
+    # Adding a column to the view must not leak into the container
+    view = xyz_data.view
+    view["scratch"] = 1.0
+    assert "scratch" not in xyz_data.view.columns
+
+
+def test_from_validated_preserves_data_and_index_range(valid_xy_df, valid_xyz_df):
+    xy_data = ImagePoints(valid_xy_df)
+    xyz_data = WorldPoints(valid_xyz_df)
+
+    xy_trusted = ImagePoints._from_validated(xy_data.df)
+    xyz_trusted = WorldPoints._from_validated(xyz_data.df)
+
+    pd.testing.assert_frame_equal(xy_trusted.df, xy_data.df)
+    pd.testing.assert_frame_equal(xyz_trusted.df, xyz_data.df)
+    assert (xyz_trusted.min_index, xyz_trusted.max_index) == (0, 2)
+
+
+def test_compact_image_points_validate_and_round_trip(valid_xy_df, tmp_path: Path):
+    xy_data = ImagePoints(valid_xy_df)
+    compact = xy_data.compact()
+
+    assert not xy_data.is_compact
+    assert compact.is_compact
+    assert compact.view["cam_id"].dtype == np.int16
+    assert compact.view["img_loc_x"].dtype == np.float32
+    # Validation accepts narrow dtypes without widening them back
+    assert ImagePoints(compact.df).is_compact
+
+    csv_path = tmp_path / "compact_xy.csv"
+    xy_data.to_csv(csv_path)
+    loaded = ImagePoints.from_csv(csv_path, compact=True)
+    assert loaded.is_compact
+    np.testing.assert_allclose(loaded.view["img_loc_x"], valid_xy_df["img_loc_x"], rtol=1e-6)
+
+
+def test_worldpoints_dense_matches_long_form():
+    df = pd.DataFrame(
+        {
+            "sync_index": [0, 0, 2, -1],
+            "object_id": [0, 0, 0, 1],
+            "keypoint_id": [3, 1, 3, 0],
+            "x_coord": [1.0, 2.0, 3.0, 4.0],
+            "y_coord": [1.5, 2.5, 3.5, 4.5],
+            "z_coord": [0.1, 0.2, 0.3, 0.4],
+            "frame_time": [0.0, 0.0, 0.066, np.nan],
+        }
+    )
+    dense = WorldPoints(df).dense
+
+    assert dense.xyz.shape == (3, 3, 3)
+    assert dense.xyz.dtype == np.float32
+    assert dense.sync_indices.tolist() == [-1, 0, 2]
+    assert dense.point_keys.tolist() == [[0, 1], [0, 3], [1, 0]]
+    assert dense.dynamic_sync_indices.tolist() == [0, 2]
+
+    for row in df.itertuples():
+        frame = dense.frame(row.sync_index)
+        column = dense.key_to_column[(row.object_id, row.keypoint_id)]
+        np.testing.assert_allclose(frame[column], [row.x_coord, row.y_coord, row.z_coord], rtol=1e-6)
+
+    assert np.isnan(dense.frame(2)[dense.key_to_column[(0, 1)]]).all()
+    assert np.isnan(dense.frame(99)).all()
+    assert dense.static_xyz is not None
+
+
 if __name__ == "__main__":
     import tempfile
 
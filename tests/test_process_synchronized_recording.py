@@ -4,17 +4,24 @@ Verifies the batch processing function correctly extracts 2D landmarks
 from synchronized multi-camera video recordings.
 """
 
+import time
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from caliscope.cameras.camera_array import CameraArray
 from caliscope.core.charuco import Charuco
+from caliscope.core.extraction_checkpoint import ExtractionCheckpoint
+from caliscope.core.point_data import SyncIndexTriangulator
 from caliscope.core.process_synchronized_recording import (
     FrameData,
     get_initial_thumbnails,
     process_synchronized_recording,
 )
+from caliscope.recording import frame_source
+from caliscope.recording.frame_ring import FrameRing
 from caliscope.recording.synchronized_timestamps import SynchronizedTimestamps
 from caliscope.task_manager.cancellation import CancellationToken
 from caliscope.trackers.charuco_tracker import CharucoTracker
@@ -165,6 +172,29 @@ class TestProcessSynchronizedRecording:
                 assert frame_data.frame is not None
                 assert frame_data.frame.ndim in (2, 3)  # grayscale or BGR depending on tracker
 
+    def test_online_triangulation_matches_batch(self, cameras, tracker, synced_timestamps):
+        """Per-sync-index triangulation during tracking equals triangulating the result afterwards."""
+        camera_array = CameraArray.from_toml(TEST_SESSION / "camera_array.toml")
+        triangulator = SyncIndexTriangulator(camera_array)
+
+        image_points = process_synchronized_recording(
+            RECORDING_DIR,
+            cameras,
+            tracker,
+            synced_timestamps,
+            subsample=50,
+            triangulator=triangulator,
+        )
+
+        key_cols = ["sync_index", "object_id", "keypoint_id"]
+        online = triangulator.world_points().df.sort_values(key_cols).reset_index(drop=True)
+        batch = image_points.triangulate(camera_array).df.sort_values(key_cols).reset_index(drop=True)
+
+        assert len(online) > 0
+        pd.testing.assert_frame_equal(online[key_cols], batch[key_cols])
+        coords = ["x_coord", "y_coord", "z_coord", "frame_time"]
+        np.testing.assert_allclose(online[coords].to_numpy(), batch[coords].to_numpy(), atol=1e-9)
+
 
 class TestCancellation:
     """Tests for cancellation support."""
@@ -193,6 +223,219 @@ class TestCancellation:
         assert len(frames_seen) < 20  # Would be many more without cancellation
 
 
+class _SpyRing(FrameRing):
+    """FrameRing that records every instance and counts acquired slots."""
+
+    instances: list["_SpyRing"] = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.acquired = 0
+        _SpyRing.instances.append(self)
+
+    def acquire(self, timeout=None):
+        slot = super().acquire(timeout)
+        if slot is not None:
+            self.acquired += 1
+        return slot
+
+
+@pytest.fixture
+def spy_rings(monkeypatch):
+    """Collect the frame rings the camera workers decode into."""
+    _SpyRing.instances = []
+    monkeypatch.setattr(frame_source, "FrameRing", _SpyRing)
+    return _SpyRing.instances
+
+
+class TestFrameRing:
+    """Camera workers decode into frame rings that the consumer returns after on_frame_data."""
+
+    def test_every_slot_returned_after_run(self, cameras, tracker, synced_timestamps, spy_rings):
+        def slow_callback(sync_index: int, data: dict[int, FrameData]) -> None:
+            time.sleep(0.005)
+
+        process_synchronized_recording(
+            RECORDING_DIR, cameras, tracker, synced_timestamps, subsample=1, on_frame_data=slow_callback
+        )
+
+        assert len(spy_rings) == len(cameras)
+        for ring in spy_rings:
+            assert ring.acquired > ring.slot_count  # buffers were reused
+            assert ring.free_count == ring.slot_count
+
+    def test_slow_callback_throttles_decoding(self, cameras, tracker, synced_timestamps, spy_rings):
+        """While on_frame_data holds the first frames, each decoder stops once its ring is full."""
+        decoded_while_blocked: list[int] = []
+
+        def blocking_callback(sync_index: int, data: dict[int, FrameData]) -> None:
+            if not decoded_while_blocked:
+                time.sleep(0.5)
+                decoded_while_blocked.extend(ring.acquired for ring in spy_rings)
+
+        process_synchronized_recording(
+            RECORDING_DIR, cameras, tracker, synced_timestamps, subsample=1, on_frame_data=blocking_callback
+        )
+
+        assert decoded_while_blocked
+        for ring, decoded in zip(spy_rings, decoded_while_blocked):
+            assert decoded <= ring.slot_count
+            assert ring.acquired > ring.slot_count
+            assert ring.free_count == ring.slot_count
+
+    def test_failing_callback_returns_slots(self, cameras, tracker, synced_timestamps, spy_rings):
+        def failing_callback(sync_index: int, data: dict[int, FrameData]) -> None:
+            if sync_index > 0:
+                raise RuntimeError("display failed")
+
+        with pytest.raises(RuntimeError, match="display failed"):
+            process_synchronized_recording(
+                RECORDING_DIR, cameras, tracker, synced_timestamps, subsample=1, on_frame_data=failing_callback
+            )
+
+        for ring in spy_rings:
+            assert ring.free_count == ring.slot_count
+
+    @pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+    def test_failing_tracker_returns_slots(self, cameras, tracker, synced_timestamps, spy_rings, monkeypatch):
+        get_points = tracker.get_points
+        calls = 0
+
+        def flaky_get_points(frame, cam_id, *args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if cam_id == 0 and calls > 10:
+                raise RuntimeError("tracker failed")
+            return get_points(frame, cam_id, *args, **kwargs)
+
+        monkeypatch.setattr(tracker, "get_points", flaky_get_points)
+        process_synchronized_recording(RECORDING_DIR, cameras, tracker, synced_timestamps, subsample=1)
+
+        for ring in spy_rings:
+            assert ring.free_count == ring.slot_count
+
+
+class TestProcessBackend:
+    """backend="process": tracking in worker processes, same results as threads."""
+
+    def test_matches_thread_backend(self, cameras, tracker, synced_timestamps):
+        camera_array = CameraArray.from_toml(TEST_SESSION / "camera_array.toml")
+        triangulators = {backend: SyncIndexTriangulator(camera_array) for backend in ("thread", "process")}
+        progress: list[tuple[int, int]] = []
+
+        results = {
+            backend: process_synchronized_recording(
+                RECORDING_DIR,
+                cameras,
+                tracker,
+                synced_timestamps,
+                subsample=10,
+                triangulator=triangulators[backend],
+                on_progress=(lambda i, n: progress.append((i, n))) if backend == "process" else None,
+                backend=backend,
+            ).df
+            for backend in ("thread", "process")
+        }
+
+        key_cols = ["sync_index", "cam_id", "object_id", "keypoint_id"]
+        thread = results["thread"].sort_values(key_cols).reset_index(drop=True)
+        process = results["process"].sort_values(key_cols).reset_index(drop=True)
+        assert len(thread) > 0
+        pd.testing.assert_frame_equal(process[thread.columns], thread, check_dtype=False)
+
+        world_cols = ["sync_index", "object_id", "keypoint_id"]
+        thread_world = triangulators["thread"].world_points().df.sort_values(world_cols).reset_index(drop=True)
+        process_world = triangulators["process"].world_points().df.sort_values(world_cols).reset_index(drop=True)
+        assert len(process_world) > 0
+        pd.testing.assert_frame_equal(process_world, thread_world)
+
+        total = len(synced_timestamps.sync_indices[::10])
+        assert progress[-1] == (total, total)
+        assert [i for i, _ in progress] == sorted(i for i, _ in progress)
+
+    def test_cancellation_stops_workers(self, cameras, tracker, synced_timestamps):
+        token = CancellationToken()
+        token.cancel()
+
+        image_points = process_synchronized_recording(
+            RECORDING_DIR, cameras, tracker, synced_timestamps, token=token, backend="process"
+        )
+
+        assert len(image_points.df) == 0
+
+    def test_rejects_frame_callback(self, cameras, tracker, synced_timestamps):
+        with pytest.raises(ValueError, match="on_frame_data"):
+            process_synchronized_recording(
+                RECORDING_DIR,
+                cameras,
+                tracker,
+                synced_timestamps,
+                on_frame_data=lambda sync_index, data: None,
+                backend="process",
+            )
+
+
+class TestCheckpoint:
+    """checkpoint=: a stopped run resumes after the last saved sync index."""
+
+    def test_resume_matches_uninterrupted(self, cameras, tracker, synced_timestamps, tmp_path):
+        checkpoint = tmp_path / "xy.checkpoint"
+        expected = process_synchronized_recording(RECORDING_DIR, cameras, tracker, synced_timestamps, subsample=3).df
+
+        token = CancellationToken()
+
+        def cancel_after_five(done: int, total: int) -> None:
+            if done == 5:
+                token.cancel()
+
+        process_synchronized_recording(
+            RECORDING_DIR,
+            cameras,
+            tracker,
+            synced_timestamps,
+            subsample=3,
+            on_progress=cancel_after_five,
+            token=token,
+            checkpoint=checkpoint,
+        )
+        assert checkpoint.exists()
+
+        progress: list[int] = []
+        seen: list[int] = []
+        actual = process_synchronized_recording(
+            RECORDING_DIR,
+            cameras,
+            tracker,
+            synced_timestamps,
+            subsample=3,
+            on_progress=lambda done, total: progress.append(done),
+            on_frame_data=lambda sync_index, frame_data: seen.append(sync_index),
+            checkpoint=checkpoint,
+        ).df
+
+        key_cols = ["sync_index", "cam_id", "object_id", "keypoint_id"]
+        expected = expected.sort_values(key_cols).reset_index(drop=True)
+        actual = actual.sort_values(key_cols).reset_index(drop=True)
+        assert len(expected) > 0
+        pd.testing.assert_frame_equal(actual[expected.columns], expected, check_dtype=False)
+        assert progress[0] == 5  # the cancelled sync index was not saved, so it is redone
+        assert seen[0] == synced_timestamps.sync_indices[::3][4]  # frame data starts where the run resumed
+        assert not checkpoint.exists()
+
+    def test_other_extraction_checkpoint_is_discarded(self, cameras, tracker, synced_timestamps, tmp_path):
+        checkpoint = tmp_path / "xy.checkpoint"
+        stale = ExtractionCheckpoint(checkpoint, fingerprint="another recording")
+        stale.save(pd.DataFrame({"sync_index": [0]}), completed_through=40)
+
+        image_points = process_synchronized_recording(
+            RECORDING_DIR, cameras, tracker, synced_timestamps, subsample=10, checkpoint=checkpoint
+        )
+
+        assert image_points.df["sync_index"].min() == 0
+        assert image_points.df["sync_index"].max() > 0
+        assert not checkpoint.exists()
+
+
 class TestGetInitialThumbnails:
     """Tests for get_initial_thumbnails function."""
 
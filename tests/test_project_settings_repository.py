@@ -22,6 +22,15 @@ def test_refine_intrinsics_persists(tmp_path: Path) -> None:
     assert reloaded.get_refine_intrinsics() is True
 
 
+def test_online_triangulation_defaults_false_and_persists(tmp_path: Path) -> None:
+    settings_path = tmp_path / "project_settings.toml"
+    repo = ProjectSettingsRepository(settings_path)
+    assert repo.get_online_triangulation() is False
+
+    repo.set_online_triangulation(True)
+    assert ProjectSettingsRepository(settings_path).get_online_triangulation() is True
+
+
 def test_origin_object_id_defaults_none(tmp_path: Path) -> None:
     repo = ProjectSettingsRepository(tmp_path / "project_settings.toml")
     assert repo.get_origin_object_id() is None
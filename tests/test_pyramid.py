@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from caliscope.trackers.pyramid import assumed_feature_px, downscale, median_spacing, pyramid_scale, to_full_resolution
+
+
+@pytest.mark.parametrize(
+    "feature_px, expected",
+    [(30.0, 1.0), (40.0, 1.0), (80.0, 0.5), (170.0, 0.25), (320.0, 0.125), (5000.0, 0.125)],
+)
+def test_pyramid_scale_keeps_feature_above_minimum(feature_px, expected):
+    assert pyramid_scale(feature_px, 40) == expected
+
+
+def test_assumed_feature_px_spans_quarter_of_shorter_side():
+    assert assumed_feature_px((2160, 3840), features_across=9) == pytest.approx(60.0)
+
+
+def test_points_map_back_to_full_resolution():
+    """A pixel centre in the downscaled image maps to the centre of the block it averages."""
+    image = np.zeros((2160, 3840), dtype=np.uint8)
+    small = downscale(image, 0.25)
+    assert small.shape == (540, 960)
+
+    points = np.array([[[0.0, 0.0]], [[10.0, 20.0]]], dtype=np.float32)
+    full = to_full_resolution(points, small.shape, image.shape)
+    assert full.shape == points.shape and full.dtype == np.float32
+    np.testing.assert_allclose(full.reshape(-1, 2), [[1.5, 1.5], [41.5, 81.5]])
+
+
+def test_median_spacing_is_grid_pitch():
+    xs, ys = np.meshgrid(np.arange(5) * 12.0, np.arange(4) * 12.0)
+    grid = np.stack([xs.ravel(), ys.ravel()], axis=1)
+    assert median_spacing(grid) == pytest.approx(12.0)
+    assert median_spacing(grid[:1]) == 0.0
@@ -0,0 +1,185 @@
+"""Tests for SeekableFrameSource - random frame access via a keyframe index sidecar."""
+
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from caliscope.packets import FramePacket
+from caliscope.recording.frame_source import FrameSource
+from caliscope.recording.seekable_frame_source import KeyframeIndex, SeekableFrameSource, keyframe_index_path
+
+TEST_VIDEO_DIR = Path(__file__).parent / "sessions/4_cam_recording/calibration/extrinsic"
+TEST_CAM_ID = 0
+H264_VIDEO = Path(__file__).parent / "sessions/h264_extrinsic/cam_0.mp4"
+
+
+@pytest.fixture
+def video_dir(tmp_path: Path) -> Path:
+    """Copy of the test video so sidecars are written outside the repo."""
+    shutil.copy(TEST_VIDEO_DIR / f"cam_{TEST_CAM_ID}.mp4", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(scope="module")
+def forward_frames() -> list[FramePacket]:
+    """Every frame of the test video, read forward."""
+    frames = []
+    with FrameSource(TEST_VIDEO_DIR, TEST_CAM_ID) as source:
+        while (packet := source.next_frame()) is not None:
+            frames.append(packet)
+    return frames
+
+
+def test_get_frame_matches_forward_decode(video_dir: Path, forward_frames: list[FramePacket]) -> None:
+    """Random jumps (backward, forward, across and within GOPs) return the same pixels."""
+    last = len(forward_frames) - 1
+    with SeekableFrameSource(video_dir, TEST_CAM_ID) as source:
+        assert source.keyframe_index.frame_count == len(forward_frames)
+        for i in [last, 5, 13, 12, 11, 0, 30, 31, last]:
+            packet = source.get_frame(i)
+            assert packet is not None
+            assert packet.frame_index == i
+            assert packet.frame_time == forward_frames[i].frame_time
+            np.testing.assert_array_equal(packet.frame, forward_frames[i].frame)
+
+
+def test_next_frame_continues_after_get_frame(video_dir: Path) -> None:
+    with SeekableFrameSource(video_dir, TEST_CAM_ID) as source:
+        source.get_frame(20)
+        packet = source.next_frame()
+        assert packet is not None
+        assert packet.frame_index == 21
+
+
+def test_get_frame_out_of_range_returns_none(video_dir: Path) -> None:
+    with SeekableFrameSource(video_dir, TEST_CAM_ID) as source:
+        assert source.get_frame(-1) is None
+        assert source.get_frame(source.keyframe_index.frame_count) is None
+
+
+def test_sparse_wanted_indices_match_forward_source(video_dir: Path, forward_frames: list[FramePacket]) -> None:
+    """Seeking past keyframes yields the same frames as decoding through them."""
+    wanted = {3, 30, 31, 45}
+    indices = []
+    with SeekableFrameSource(video_dir, TEST_CAM_ID, wanted_indices=wanted) as source:
+        while (packet := source.next_frame()) is not None:
+            indices.append(packet.frame_index)
+            np.testing.assert_array_equal(packet.frame, forward_frames[packet.frame_index].frame)
+    assert indices == sorted(wanted)
+
+
+def test_wanted_indices_past_end_are_ignored(video_dir: Path) -> None:
+    with SeekableFrameSource(video_dir, TEST_CAM_ID) as source:
+        frame_count = source.keyframe_index.frame_count
+
+    wanted = {frame_count - 1, frame_count, frame_count + 5}
+    with SeekableFrameSource(video_dir, TEST_CAM_ID, wanted_indices=wanted) as source:
+        packet = source.next_frame()
+        assert packet is not None
+        assert packet.frame_index == frame_count - 1
+        assert source.next_frame() is None
+
+
+def test_concurrent_sidecar_saves_leave_a_valid_index(video_dir: Path) -> None:
+    video_path = video_dir / f"cam_{TEST_CAM_ID}.mp4"
+    stat = video_path.stat()
+    index = KeyframeIndex.build(video_path)
+    sidecar = keyframe_index_path(video_path)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: index._save(sidecar, stat.st_size, stat.st_mtime_ns), range(32)))
+
+    with np.load(sidecar) as stored:
+        np.testing.assert_array_equal(stored["pts"], index.pts)
+    assert list(video_dir.glob("*.tmp")) == []
+
+
+def test_sidecar_written_and_reused(video_dir: Path) -> None:
+    video_path = video_dir / f"cam_{TEST_CAM_ID}.mp4"
+    sidecar = keyframe_index_path(video_path)
+
+    built = KeyframeIndex.load_or_build(video_path)
+    assert sidecar.exists()
+    written_at = sidecar.stat().st_mtime_ns
+
+    loaded = KeyframeIndex.load_or_build(video_path)
+    assert sidecar.stat().st_mtime_ns == written_at
+    np.testing.assert_array_equal(loaded.pts, built.pts)
+    np.testing.assert_array_equal(loaded.keyframes, built.keyframes)
+    assert loaded.keyframes[0] == 0
+
+
+def test_sidecar_invalidated_when_video_changes(video_dir: Path) -> None:
+    video_path = video_dir / f"cam_{TEST_CAM_ID}.mp4"
+    sidecar = keyframe_index_path(video_path)
+    KeyframeIndex.load_or_build(video_path)
+
+    # Poison the stored pts; a stale sidecar must not be trusted.
+    with np.load(sidecar) as stored:
+        contents = dict(stored)
+    contents["pts"] = contents["pts"] + 1
+    with open(sidecar, "wb") as f:
+        np.savez(f, **contents)
+
+    stat = video_path.stat()
+    os.utime(video_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    rebuilt = KeyframeIndex.load_or_build(video_path)
+    np.testing.assert_array_equal(rebuilt.pts, KeyframeIndex.build(video_path).pts)
+
+
+def test_corrupt_sidecar_is_rebuilt(video_dir: Path) -> None:
+    video_path = video_dir / f"cam_{TEST_CAM_ID}.mp4"
+    keyframe_index_path(video_path).write_bytes(b"not an npz")
+
+    index = KeyframeIndex.load_or_build(video_path)
+    assert index.frame_count > 0
+
+
+@pytest.mark.parametrize("step", [2, 5, 30])
+def test_sparse_sampling_with_b_frames_matches_forward(tmp_path: Path, step: int) -> None:
+    """Non-reference frames dropped on the way to a target must not corrupt the target."""
+    shutil.copy(H264_VIDEO, tmp_path / "cam_0.mp4")
+    forward = []
+    with FrameSource(tmp_path, 0) as source:
+        while (packet := source.next_frame()) is not None:
+            forward.append(packet.frame)
+
+    wanted = set(range(1, len(forward), step))
+    indices = []
+    with SeekableFrameSource(tmp_path, 0, wanted_indices=wanted) as source:
+        while (packet := source.next_frame()) is not None:
+            indices.append(packet.frame_index)
+            np.testing.assert_array_equal(packet.frame, forward[packet.frame_index])
+    assert indices == sorted(wanted)
+
+
+@pytest.mark.parametrize("step", [1, 3])
+def test_split_starts_each_run_on_its_own_keyframe(tmp_path: Path, step: int) -> None:
+    shutil.copy(H264_VIDEO, tmp_path / "cam_0.mp4")
+    index = KeyframeIndex.build(tmp_path / "cam_0.mp4")
+    frames = np.arange(0, index.frame_count, step)
+
+    runs = index.split(frames, 4)
+
+    assert len(runs) == 4
+    np.testing.assert_array_equal(np.concatenate(runs), frames)
+    for previous, run in zip(runs, runs[1:]):
+        # The decoder for run starts at this keyframe, past everything previous needed.
+        assert index.keyframe_for(int(run[0])) > previous[-1]
+
+
+def test_split_is_limited_by_keyframes(video_dir: Path) -> None:
+    index = KeyframeIndex.build(video_dir / f"cam_{TEST_CAM_ID}.mp4")
+    frames = np.arange(index.frame_count)
+
+    runs = index.split(frames, 100)
+
+    assert len(runs) == len(index.keyframes)
+    assert [int(run[0]) for run in runs] == index.keyframes.tolist()
+    assert index.split(frames, 1)[0].tolist() == frames.tolist()
+    assert index.split(np.array([], dtype=np.int64), 4) == []
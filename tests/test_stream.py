@@ -55,5 +55,52 @@ def test_streamer():
     streamer.close()
 
 
+def test_streamer_with_frame_ring():
+    """Subscribers release ring-backed frames; playback reuses the same buffers."""
+    recording_directory = Path(__root__, "tests", "sessions", "post_monocal", "calibration", "extrinsic")
+
+    streamer = create_streamer(video_directory=recording_directory, cam_id=1, ring_slots=2)
+    frame_q = Queue()
+    streamer.subscribe(frame_q)
+    streamer.start()
+
+    buffers = set()
+    frame_count = 0
+    while True:
+        tracked_frame = frame_q.get()
+        if tracked_frame.frame is None:
+            break
+        assert tracked_frame.frame_slot is not None
+        buffers.add(tracked_frame.frame.__array_interface__["data"][0])
+        frame_count += 1
+        tracked_frame.release()
+
+    streamer.close()
+    assert frame_count > 2
+    assert len(buffers) <= 2
+
+
+def test_streamer_waits_for_released_frames():
+    """A subscriber holding every ring buffer stalls playback until it releases them."""
+    recording_directory = Path(__root__, "tests", "sessions", "post_monocal", "calibration", "extrinsic")
+
+    streamer = create_streamer(video_directory=recording_directory, cam_id=1, ring_slots=2)
+    frame_q = Queue()
+    streamer.subscribe(frame_q)
+    streamer.start()
+
+    sleep(0.5)
+    assert frame_q.qsize() == 2  # every buffer is on loan; the decoder is waiting
+
+    held = [frame_q.get(), frame_q.get()]
+    for tracked_frame in held:
+        tracked_frame.release()
+    next_frame = frame_q.get(timeout=5.0)
+    assert next_frame.frame_index > held[-1].frame_index
+
+    next_frame.release()
+    streamer.close()
+
+
 if __name__ == "__main__":
     test_streamer()
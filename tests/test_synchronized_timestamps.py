@@ -8,10 +8,12 @@ import shutil
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from caliscope.recording.synchronized_timestamps import SynchronizedTimestamps
+from tests.oracle_sync_mapping import greedy_sync_mapping
 
 # ---------------------------------------------------------------------------
 # Test sessions
@@ -142,7 +144,7 @@ class TestSyncAlgorithm:
         from caliscope.recording.frame_timestamps import FrameTimestamps
 
         frame_times = {i: float(i) / 30.0 for i in range(10)}
-        ft = FrameTimestamps(MappingProxyType(frame_times))
+        ft = FrameTimestamps.from_mapping(frame_times)
         camera_timestamps = MappingProxyType({0: ft, 1: ft, 2: ft})
 
         synced = SynchronizedTimestamps(camera_timestamps)
@@ -153,6 +155,51 @@ class TestSyncAlgorithm:
             assert synced.frame_for(si, 1) == si
             assert synced.frame_for(si, 2) == si
 
+    @pytest.mark.parametrize("seed", range(6))
+    def test_matches_reference_greedy_on_irregular_timing(self, seed: int):
+        """Vectorized mapping equals the one-step-at-a-time reference on messy recordings.
+
+        Covers dropped frames, jitter, staggered starts/stops, mixed frame rates,
+        and duplicated timestamps.
+        """
+        rng = np.random.default_rng(seed)
+        frames_by_cam: dict[int, list[float]] = {}
+        for cam_id in [0, 2, 3, 5][: 1 + seed % 4]:
+            fps = rng.choice([30.0, 30.0, 29.97, 25.0, 60.0])
+            start = rng.uniform(0.0, 0.5)
+            n_frames = int(rng.integers(200, 1500))
+            times = start + np.arange(n_frames) / fps + rng.normal(0.0, 0.1 / fps, n_frames)
+            kept = rng.random(n_frames) > rng.choice([0.0, 0.02, 0.2])
+            times = np.sort(times[kept])
+            if seed % 2:
+                times = np.round(times, 2)  # coarse clocks produce exact ties
+            frames_by_cam[cam_id] = times.tolist()
+
+        assert self._mapping(frames_by_cam) == greedy_sync_mapping(frames_by_cam)
+
+    @pytest.mark.parametrize(
+        "frames_by_cam",
+        [
+            {0: [0.0, 1.0, 2.0]},
+            {0: [0.0, 1.0, 2.0], 1: []},
+            {0: [0.0, 0.0, 1.0], 1: [0.0, 1.0, 1.0]},
+            {0: [0.0, 1.0], 1: [0.5, 1.5], 2: [1.0, 2.0]},
+            {0: [5.0, 6.0, 7.0], 1: [0.0, 1.0, 2.0]},
+            {0: [0.0, 0.5, 1.0, 1.5, 2.0], 1: [0.0, 1.0, 2.0]},
+        ],
+    )
+    def test_matches_reference_greedy_on_edge_cases(self, frames_by_cam: dict[int, list[float]]):
+        assert self._mapping(frames_by_cam) == greedy_sync_mapping(frames_by_cam)
+
+    def _mapping(self, frames_by_cam: dict[int, list[float]]) -> dict[int, dict[int, int | None]]:
+        from types import MappingProxyType
+
+        from caliscope.recording.frame_timestamps import FrameTimestamps
+
+        cams = {cam_id: FrameTimestamps.from_mapping(dict(enumerate(times))) for cam_id, times in frames_by_cam.items()}
+        synced = SynchronizedTimestamps(MappingProxyType(cams))
+        return {si: {c: synced.frame_for(si, c) for c in synced.cam_ids} for si in synced.sync_indices}
+
 
 # ---------------------------------------------------------------------------
 # from_videos
@@ -366,6 +413,76 @@ if __name__ == "__main__":
     print("  Algorithm test passed (run pytest for full verification)")
 
 
+# ---------------------------------------------------------------------------
+# Array storage and bulk accessors
+# ---------------------------------------------------------------------------
+
+
+class TestArrayStorage:
+    """frame_table and the bulk accessors agree with the scalar API."""
+
+    def test_bulk_accessors_match_scalar_api(self):
+        synced = SynchronizedTimestamps.from_csv(RECORDING_DIR_1)
+        table = synced.frame_table
+
+        assert table.dtype == np.int32
+        assert table.shape == (len(synced.sync_indices), len(synced.cam_ids))
+        assert not table.flags.writeable
+
+        for cam_id in synced.cam_ids:
+            frame_indices = synced.frames_for(cam_id)
+            times = synced.times_for(cam_id, frame_indices)
+            for sync_index in synced.sync_indices:
+                frame_index = synced.frame_for(sync_index, cam_id)
+                if frame_index is None:
+                    assert frame_indices[sync_index] == -1
+                    assert np.isnan(times[sync_index])
+                else:
+                    assert frame_indices[sync_index] == frame_index
+                    assert times[sync_index] == synced.time_for(cam_id, frame_index)
+
+    def test_frames_for_selected_sync_indices(self):
+        synced = SynchronizedTimestamps.from_csv(EXTRINSIC_DIR)
+        selected = synced.sync_indices[::3]
+        np.testing.assert_array_equal(synced.frames_for(0, selected), synced.frames_for(0)[::3])
+
+    def test_unknown_sync_index_raises(self):
+        synced = SynchronizedTimestamps.from_csv(EXTRINSIC_DIR)
+        with pytest.raises(KeyError):
+            synced.frame_for(-1, 0)
+        with pytest.raises(KeyError):
+            synced.frame_for(len(synced.sync_indices), 0)
+
+    def test_frame_indices_keep_camera_start_offset(self):
+        """A camera whose indices start past 0 reports its own frame indices."""
+        from types import MappingProxyType
+
+        from caliscope.recording.frame_timestamps import FrameTimestamps
+
+        late = FrameTimestamps.from_mapping({10 + i: i / 30.0 for i in range(5)})
+        early = FrameTimestamps.from_mapping({i: i / 30.0 for i in range(5)})
+        synced = SynchronizedTimestamps(MappingProxyType({0: early, 1: late}))
+
+        np.testing.assert_array_equal(synced.frames_for(1), [10, 11, 12, 13, 14])
+        assert synced.time_for(1, 12) == pytest.approx(2 / 30.0)
+        assert late.last_frame_index == 14
+        assert list(late.frame_times) == list(range(10, 15))
+
+    def test_frame_timestamps_reject_gaps(self):
+        from caliscope.recording.frame_timestamps import FrameTimestamps
+
+        with pytest.raises(ValueError):
+            FrameTimestamps.from_mapping({0: 0.0, 2: 0.1})
+
+    def test_frame_timestamps_out_of_range(self):
+        from caliscope.recording.frame_timestamps import FrameTimestamps
+
+        ft = FrameTimestamps.inferred(fps=10.0, frame_count=3)
+        with pytest.raises(KeyError):
+            ft.get_time(3)
+        np.testing.assert_array_equal(ft.get_times(np.array([-1, 0, 2, 3])), [np.nan, 0.0, 0.2, np.nan])
+
+
 # ---------------------------------------------------------------------------
 # mean_fps
 # ---------------------------------------------------------------------------
@@ -379,7 +496,7 @@ class TestMeanFps:
 
         from caliscope.recording.frame_timestamps import FrameTimestamps
 
-        cams = {cam_id: FrameTimestamps(MappingProxyType(dict(times))) for cam_id, times in camera_frame_times.items()}
+        cams = {cam_id: FrameTimestamps.from_mapping(dict(times)) for cam_id, times in camera_frame_times.items()}
         return SynchronizedTimestamps(MappingProxyType(cams))
 
     def test_derives_rate_from_span(self):
@@ -1,10 +1,14 @@
 """Tests for video_utils.read_video_properties (PyAV backend)."""
 
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
-from caliscope.recording.video_utils import read_video_properties
+from caliscope.recording.video_utils import read_video_properties, video_probe_path
 
 EXTRINSIC_DIR = Path(__file__).parent / "sessions" / "4_cam_recording" / "calibration" / "extrinsic"
 
@@ -48,6 +52,62 @@ class TestReadVideoProperties:
             assert abs(fps - fps_values[0]) < 0.1
 
 
+class TestProbeCache:
+    """Probe results are cached beside the video and invalidated when it changes."""
+
+    @pytest.fixture
+    def video_path(self, tmp_path: Path) -> Path:
+        shutil.copy(EXTRINSIC_DIR / "cam_0.mp4", tmp_path)
+        return tmp_path / "cam_0.mp4"
+
+    def _poison_cache(self, video_path: Path) -> None:
+        """Change the cached frame_count so a cache hit is observable."""
+        sidecar = video_probe_path(video_path)
+        stored = json.loads(sidecar.read_text())
+        stored["frame_count"] = 12345
+        sidecar.write_text(json.dumps(stored))
+
+    def test_cache_written_and_reused(self, video_path: Path):
+        probed = read_video_properties(video_path)
+        assert video_probe_path(video_path).exists()
+
+        self._poison_cache(video_path)
+        assert read_video_properties(video_path)["frame_count"] == 12345
+        assert read_video_properties(video_path, use_cache=False) == probed
+
+    def test_cache_invalidated_when_video_changes(self, video_path: Path):
+        probed = read_video_properties(video_path)
+        self._poison_cache(video_path)
+
+        stat = video_path.stat()
+        os.utime(video_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert read_video_properties(video_path) == probed
+
+    def test_corrupt_cache_is_ignored(self, video_path: Path):
+        probed = read_video_properties(video_path)
+        video_probe_path(video_path).write_text("{not json")
+
+        assert read_video_properties(video_path) == probed
+
+    def test_concurrent_probes_write_one_valid_cache(self, video_path: Path):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: read_video_properties(video_path), range(32)))
+
+        assert all(result == results[0] for result in results)
+        stored = json.loads(video_probe_path(video_path).read_text())
+        assert stored["frame_count"] == results[0]["frame_count"]
+        assert list(video_path.parent.glob("*.tmp")) == []
+
+    def test_failed_probe_is_not_cached(self, tmp_path: Path):
+        fake_video = tmp_path / "cam_0.mp4"
+        fake_video.write_text("this is not a video file")
+
+        with pytest.raises(ValueError):
+            read_video_properties(fake_video)
+        assert not video_probe_path(fake_video).exists()
+
+
 if __name__ == "__main__":
     debug_dir = Path(__file__).parent / "tmp"
     debug_dir.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,114 @@
+"""Tests for reuse of cached 2D points across reconstruction runs."""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from caliscope.core.chessboard import Chessboard
+from caliscope.core.point_data import ImagePoints
+from caliscope.reconstruction.xy_cache import (
+    fingerprint_path,
+    load_cached_image_points,
+    save_image_points,
+    tracking_fingerprint,
+)
+from caliscope.trackers.chessboard_tracker import ChessboardTracker
+
+CAM_IDS = [0, 1]
+
+
+def _make_recording(recording_dir: Path) -> None:
+    recording_dir.mkdir(parents=True, exist_ok=True)
+    for cam_id in CAM_IDS:
+        (recording_dir / f"cam_{cam_id}.mp4").write_bytes(b"not really a video" * (cam_id + 1))
+
+
+def _image_points() -> ImagePoints:
+    return ImagePoints(
+        pd.DataFrame(
+            {
+                "sync_index": [0, 0],
+                "cam_id": [0, 1],
+                "object_id": [0, 0],
+                "keypoint_id": [3, 3],
+                "img_loc_x": [10.0, 20.0],
+                "img_loc_y": [11.0, 21.0],
+            }
+        )
+    )
+
+
+def test_matching_fingerprint_reuses_points(tmp_path: Path):
+    recording_dir = tmp_path / "recording"
+    _make_recording(recording_dir)
+    tracker = ChessboardTracker(Chessboard(rows=6, columns=9))
+    tracker_dir = recording_dir / tracker.name
+    tracker_dir.mkdir()
+
+    fingerprint = tracking_fingerprint(recording_dir, CAM_IDS, tracker)
+    save_image_points(_image_points(), tracker_dir, tracker.name, fingerprint)
+
+    # Same videos, same tracker configuration -> cache hit
+    again = tracking_fingerprint(recording_dir, CAM_IDS, ChessboardTracker(Chessboard(rows=6, columns=9)))
+    cached = load_cached_image_points(tracker_dir, tracker.name, again)
+    assert cached is not None
+    pd.testing.assert_frame_equal(cached.df, _image_points().df)
+
+
+def test_tracker_config_change_invalidates(tmp_path: Path):
+    recording_dir = tmp_path / "recording"
+    _make_recording(recording_dir)
+    tracker = ChessboardTracker(Chessboard(rows=6, columns=9))
+    tracker_dir = recording_dir / tracker.name
+    tracker_dir.mkdir()
+    save_image_points(_image_points(), tracker_dir, tracker.name, tracking_fingerprint(recording_dir, CAM_IDS, tracker))
+
+    other = ChessboardTracker(Chessboard(rows=6, columns=9, square_size_cm=2.5))
+    assert (
+        load_cached_image_points(tracker_dir, tracker.name, tracking_fingerprint(recording_dir, CAM_IDS, other)) is None
+    )
+
+
+def test_video_change_invalidates(tmp_path: Path):
+    recording_dir = tmp_path / "recording"
+    _make_recording(recording_dir)
+    tracker = ChessboardTracker(Chessboard(rows=6, columns=9))
+    tracker_dir = recording_dir / tracker.name
+    tracker_dir.mkdir()
+    save_image_points(_image_points(), tracker_dir, tracker.name, tracking_fingerprint(recording_dir, CAM_IDS, tracker))
+
+    video = recording_dir / "cam_1.mp4"
+    stat = video.stat()
+    os.utime(video, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    fingerprint = tracking_fingerprint(recording_dir, CAM_IDS, tracker)
+    assert load_cached_image_points(tracker_dir, tracker.name, fingerprint) is None
+
+
+def test_timestamps_change_invalidates(tmp_path: Path):
+    recording_dir = tmp_path / "recording"
+    _make_recording(recording_dir)
+    tracker = ChessboardTracker(Chessboard(rows=6, columns=9))
+    tracker_dir = recording_dir / tracker.name
+    tracker_dir.mkdir()
+    save_image_points(_image_points(), tracker_dir, tracker.name, tracking_fingerprint(recording_dir, CAM_IDS, tracker))
+
+    # A timestamps.csv written after tracking changes the sync mapping
+    (recording_dir / "timestamps.csv").write_text("sync_index,cam_id,frame_time\n", encoding="utf-8")
+
+    fingerprint = tracking_fingerprint(recording_dir, CAM_IDS, tracker)
+    assert load_cached_image_points(tracker_dir, tracker.name, fingerprint) is None
+
+
+def test_missing_fingerprint_is_a_miss(tmp_path: Path):
+    recording_dir = tmp_path / "recording"
+    _make_recording(recording_dir)
+    tracker = ChessboardTracker(Chessboard(rows=6, columns=9))
+    tracker_dir = recording_dir / tracker.name
+    tracker_dir.mkdir()
+    fingerprint = tracking_fingerprint(recording_dir, CAM_IDS, tracker)
+    save_image_points(_image_points(), tracker_dir, tracker.name, fingerprint)
+
+    fingerprint_path(tracker_dir, tracker.name).unlink()
+    assert load_cached_image_points(tracker_dir, tracker.name, fingerprint) is None
@@ -104,6 +104,26 @@ def test_image_points_to_world_points(tmp_path: Path):
     xyz_recalculated.to_csv(output_path)
 
 
+def test_compact_image_points_triangulate_like_full_precision():
+    """Compact (int32/float32) tables load smaller and triangulate to the same points."""
+    xy_path = CHARUCO_DATA_DIR / "xy_CHARUCO.csv"
+    camera_array = CameraArray.from_toml(POST_OPT_SESSION / "camera_array.toml")
+
+    full = ImagePoints.from_csv(xy_path)
+    compact = ImagePoints.from_csv(xy_path, compact=True)
+
+    assert compact.is_compact
+    assert compact.view.memory_usage(deep=True).sum() < full.view.memory_usage(deep=True).sum()
+
+    key_cols = ["sync_index", "object_id", "keypoint_id"]
+    full_xyz = full.triangulate(camera_array).df.sort_values(key_cols).reset_index(drop=True)
+    compact_xyz = compact.triangulate(camera_array).df.sort_values(key_cols).reset_index(drop=True)
+
+    assert full_xyz[key_cols].equals(compact_xyz[key_cols])
+    coords = ["x_coord", "y_coord", "z_coord"]
+    assert (full_xyz[coords] - compact_xyz[coords]).abs().max().max() < 1e-4
+
+
 if __name__ == "__main__":
     import caliscope.logger
 